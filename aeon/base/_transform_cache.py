@@ -0,0 +1,133 @@
+"""Cache of the transforms of a collection shared between estimators and fits.
+
+Estimators with a ``memory`` parameter fit and apply their transformers through
+these functions. The transforms are cached with ``joblib.Memory``, keyed by a hash of
+the transformer, including its parameters or fitted state, and of the data, so that
+estimators fitted on the same collection in different processes or on different
+days load the transforms computed by the first instead of recomputing them.
+
+Parameters that only change how the transform is run, such as ``n_jobs``, are not
+part of the key. Fits of transformers with a time contract depend on the time taken,
+so they are never cached.
+"""
+
+from numba.core.dispatcher import Dispatcher
+from sklearn.utils.validation import check_memory
+
+from aeon.utils.validation import check_n_jobs
+
+# attributes that do not change the output of a transformer
+_EXECUTION_ATTRIBUTES = [
+    "n_jobs",
+    "_n_jobs",
+    "parallel_backend",
+    "verbose",
+    "time_limit_in_minutes",
+]
+
+
+def _fit_transform_one(transformer, X, y, key):
+    Xt = transformer.fit_transform(X, y)
+    return Xt, transformer
+
+
+def _transform_one(transformer, X, key):
+    return transformer.transform(X)
+
+
+def _cache_key(transformer):
+    # Hashes of numba functions differ between processes, so they are replaced by
+    # the name of the python function they compile
+    return type(transformer), {
+        name: (
+            f"{value.py_func.__module__}.{value.py_func.__qualname__}"
+            if isinstance(value, Dispatcher)
+            else value
+        )
+        for name, value in vars(transformer).items()
+        if name not in _EXECUTION_ATTRIBUTES
+    }
+
+
+def _set_execution_params(cached, transformer):
+    # A transformer loaded from the cache runs with the jobs of the one it replaces
+    # rather than those of the fit that cached it
+    for name in ["n_jobs", "parallel_backend"]:
+        if hasattr(transformer, name):
+            setattr(cached, name, getattr(transformer, name))
+    if hasattr(cached, "_n_jobs") and hasattr(transformer, "n_jobs"):
+        cached._n_jobs = check_n_jobs(transformer.n_jobs)
+
+
+def _is_cacheable(transformer, memory):
+    if getattr(memory, "location", None) is None:
+        return False
+    # A transformer with an unset random_state gives a different result each fit
+    params = transformer.get_params()
+    return all(
+        value is not None
+        for name, value in params.items()
+        if name == "random_state" or name.endswith("__random_state")
+    )
+
+
+def _fit_transform_cached(transformer, X, y=None, memory=None):
+    """Fit a transformer and transform X, loading the result from memory if cached.
+
+    Parameters
+    ----------
+    transformer : transformer
+        The unfitted transformer. It is fitted in place if the result is not cached.
+    X : np.ndarray
+        The data to fit and transform.
+    y : np.ndarray or None, default=None
+        The target passed to ``fit_transform``.
+    memory : str, joblib.Memory or None, default=None
+        Where to cache the result. If a string is given, it is the path to the cache
+        directory. If None, or the transformer has a time contract, the result is
+        not cached.
+
+    Returns
+    -------
+    Xt : np.ndarray
+        The transformed data.
+    transformer : transformer
+        The fitted transformer, a copy of the input transformer if the result was
+        loaded from the cache.
+    """
+    memory = check_memory(memory)
+    # The fit of a time contracted transformer depends on the time it takes
+    contracted = (getattr(transformer, "time_limit_in_minutes", None) or 0) > 0
+    if contracted or not _is_cacheable(transformer, memory):
+        return _fit_transform_one(transformer, X, y, None)
+    Xt, fitted = memory.cache(_fit_transform_one, ignore=["transformer"])(
+        transformer, X, y, _cache_key(transformer)
+    )
+    _set_execution_params(fitted, transformer)
+    return Xt, fitted
+
+
+def _transform_cached(transformer, X, memory=None):
+    """Transform X with a fitted transformer, loading the result from memory if cached.
+
+    Parameters
+    ----------
+    transformer : transformer
+        The fitted transformer.
+    X : np.ndarray
+        The data to transform.
+    memory : str, joblib.Memory or None, default=None
+        Where to cache the result. If a string is given, it is the path to the cache
+        directory. If None, the result is not cached.
+
+    Returns
+    -------
+    Xt : np.ndarray
+        The transformed data.
+    """
+    memory = check_memory(memory)
+    if not _is_cacheable(transformer, memory):
+        return _transform_one(transformer, X, None)
+    return memory.cache(_transform_one, ignore=["transformer"])(
+        transformer, X, _cache_key(transformer)
+    )
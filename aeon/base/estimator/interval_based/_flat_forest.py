@@ -0,0 +1,241 @@
+"""Flat array representation of the fitted trees of an interval forest.
+
+The nodes of the fitted trees of all estimators are stored in a single set of
+arrays, with each node split on a column of the features extracted for the whole
+forest rather than of the input of its own estimator. A compiled traversal then
+predicts with every tree for a batch of cases at once, without assembling the input
+of each estimator or calling the predict method of each tree.
+
+Supported trees are scikit-learn decision trees and ContinuousIntervalTree.
+"""
+
+import numpy as np
+from joblib import Parallel, delayed
+from numba import njit, prange
+from sklearn.tree import BaseDecisionTree
+
+from aeon.base.estimator.interval_based._interval_features import _fallback_features
+from aeon.classification.sklearn import ContinuousIntervalTree
+from aeon.distances._utils import _run_with_n_jobs
+
+
+def _flatten_forest(estimators, estimator_plans, n_fused, n_outputs, classification):
+    """Export the fitted trees of an interval forest to flat node arrays.
+
+    Parameters
+    ----------
+    estimators : list of shape (n_estimators) of BaseEstimator
+        The fitted trees.
+    estimator_plans : list of shape (n_estimators) of tuple
+        The per estimator output of _interval_feature_plan.
+    n_fused : int
+        The number of fused kernel features.
+    n_outputs : int
+        The number of classes, or 1 for regression.
+    classification : bool
+        Whether the trees are classifiers or regressors.
+
+    Returns
+    -------
+    flat_forest : tuple or None
+        The feature, threshold, children (left, right and missing value) and output
+        value of each node, the root node of each tree, whether each tree compares
+        features in single precision, and the features of the forest extracted
+        outside the fused kernel as (fallback, columns) tuples. None if any of the
+        estimators is not a supported tree.
+    """
+    features = []
+    thresholds = []
+    children = []
+    values = []
+    roots = []
+    single_precision = []
+    # nodes split on features extracted outside the kernel are mapped to their
+    # forest column once all of these features are known
+    extras = {}
+    unmapped = []
+
+    n_nodes = 0
+    for i, (tree, plan) in enumerate(zip(estimators, estimator_plans)):
+        nodes = _tree_nodes(tree, n_outputs, classification)
+        if nodes is None:
+            return None
+        feature, threshold, child, value, single = nodes
+
+        offsets, positions, columns, fallbacks = plan
+        col_map = np.full(offsets[-1], -1, dtype=np.int64)
+        col_map[offsets[positions]] = columns
+        fallback_idx = {fallback[0]: j for j, fallback in enumerate(fallbacks)}
+
+        for k in np.flatnonzero(feature >= 0):
+            f = feature[k]
+            if f >= col_map.shape[0]:
+                return None
+            elif col_map[f] >= 0:
+                feature[k] = col_map[f]
+            else:
+                pos = int(np.searchsorted(offsets, f, side="right")) - 1
+                if pos not in fallback_idx:
+                    return None
+                key = (i, fallback_idx[pos])
+                within = f - offsets[pos]
+                extras.setdefault(key, set()).add(within)
+                unmapped.append((n_nodes + k, key, within))
+
+        child[child >= 0] += n_nodes
+        features.append(feature)
+        thresholds.append(threshold)
+        children.append(child)
+        values.append(value)
+        roots.append(n_nodes)
+        single_precision.append(single)
+        n_nodes += feature.shape[0]
+
+    features = np.concatenate(features)
+    extra_features = []
+    extra_columns = {}
+    n_columns = n_fused
+    for (i, j), within in extras.items():
+        within = np.array(sorted(within), dtype=np.int64)
+        extra_features.append((estimator_plans[i][3][j], within))
+        for w in within:
+            extra_columns[(i, j, w)] = n_columns
+            n_columns += 1
+    for node, key, within in unmapped:
+        features[node] = extra_columns[(*key, within)]
+
+    return (
+        features,
+        np.concatenate(thresholds),
+        np.vstack(children),
+        np.vstack(values),
+        np.array(roots, dtype=np.int64),
+        np.array(single_precision, dtype=np.bool_),
+        extra_features,
+    )
+
+
+def _flat_forest_features(Xt, fused, extra_features, n_jobs, parallel_backend):
+    """Add the features used by the trees but not extracted by the fused kernel."""
+    if len(extra_features) == 0:
+        return fused
+
+    extra = Parallel(n_jobs=n_jobs, backend=parallel_backend, prefer="threads")(
+        delayed(_fallback_features)(Xt, fallback) for fallback, _ in extra_features
+    )
+    return np.hstack(
+        [fused] + [v[:, within] for v, (_, within) in zip(extra, extra_features)]
+    )
+
+
+def _predict_flat_forest(X, flat_forest, n_jobs):
+    """Sum the output of all trees for each case of the forest features X."""
+    return _run_with_n_jobs(
+        n_jobs,
+        _flat_forest_kernel,
+        np.ascontiguousarray(X, dtype=np.float64),
+        *flat_forest[:-1],
+    )
+
+
+def _tree_nodes(tree, n_outputs, classification):
+    if isinstance(tree, BaseDecisionTree):
+        t = tree.tree_
+        if classification:
+            value = t.value[:, 0, :]
+            if value.shape[1] != n_outputs:
+                return None
+            # predict_proba normalises the leaf values
+            normalizer = value.sum(axis=1, keepdims=True)
+            normalizer[normalizer == 0] = 1
+            value = value / normalizer
+        else:
+            if t.n_outputs != 1:
+                return None
+            value = t.value[:, 0, :1]
+
+        if hasattr(t, "missing_go_to_left"):
+            missing = np.where(t.missing_go_to_left, t.children_left, t.children_right)
+        else:
+            missing = t.children_right
+
+        return (
+            np.where(t.feature >= 0, t.feature, -1).astype(np.int64),
+            t.threshold.astype(np.float64),
+            np.stack((t.children_left, t.children_right, missing), axis=1).astype(
+                np.int64
+            ),
+            np.asarray(value, dtype=np.float64),
+            # scikit-learn trees predict on float32 input
+            True,
+        )
+    elif isinstance(tree, ContinuousIntervalTree) and classification:
+        if tree.n_classes_ != n_outputs:
+            return None
+        elif tree.n_classes_ == 1:
+            return (
+                np.full(1, -1, dtype=np.int64),
+                np.zeros(1),
+                np.full((1, 3), -1, dtype=np.int64),
+                np.ones((1, 1)),
+                False,
+            )
+
+        feature = []
+        threshold = []
+        child = []
+        value = []
+        nodes = [tree._root]
+        k = 0
+        while k < len(nodes):
+            node = nodes[k]
+            if node.best_split > -1:
+                feature.append(node.best_split)
+                threshold.append(node.best_threshold)
+                child.append([len(nodes), len(nodes) + 1, len(nodes) + 2])
+                value.append(np.zeros(n_outputs))
+                nodes.extend(node.children)
+            else:
+                feature.append(-1)
+                threshold.append(0)
+                child.append([-1, -1, -1])
+                value.append(node.leaf_distribution)
+            k += 1
+
+        return (
+            np.array(feature, dtype=np.int64),
+            np.array(threshold, dtype=np.float64),
+            np.array(child, dtype=np.int64),
+            np.array(value, dtype=np.float64),
+            False,
+        )
+
+    return None
+
+
+# no fastmath, missing values must follow the same branch as in the trees
+@njit(cache=True, parallel=True)
+def _flat_forest_kernel(
+    X, features, thresholds, children, values, roots, single_precision
+):
+    output = np.zeros((X.shape[0], values.shape[1]))
+
+    for i in prange(X.shape[0]):
+        for t in range(roots.shape[0]):
+            node = roots[t]
+            while features[node] >= 0:
+                x = X[i, features[node]]
+                if single_precision[t]:
+                    x = np.float64(np.float32(x))
+
+                if x <= thresholds[node]:
+                    node = children[node, 0]
+                elif x > thresholds[node]:
+                    node = children[node, 1]
+                else:
+                    node = children[node, 2]
+
+            for k in range(values.shape[1]):
+                output[i, k] += values[node, k]
+
+    return output
@@ -0,0 +1,330 @@
+"""Fused extraction of the interval features of every estimator in a forest.
+
+Interval forests extract the same kind of summary statistics from hundreds of
+intervals per tree. Transforming each interval of each tree separately repeats the
+Python overhead of every transformer call and the sums over overlapping intervals.
+Instead, the (start, end, dilation, channel, feature) tuples of all trees are
+collected once after fit, and the statistics supported here are computed for all of
+them in a single compiled pass over the cases. Mean, standard deviation and slope
+of undilated intervals use prefix sums of each series shared by all intervals.
+
+Features the kernel does not support, such as transformers or other functions, are
+still extracted through the interval transformers.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+from aeon.distances._utils import _run_with_n_jobs
+from aeon.transformations.base import BaseTransformer
+from aeon.transformations.collection import SupervisedIntervals
+from aeon.utils.numba.stats import (
+    iqr,
+    mean,
+    numba_max,
+    numba_min,
+    row_iqr,
+    row_mean,
+    row_median,
+    row_numba_max,
+    row_numba_min,
+    row_quantile25,
+    row_quantile75,
+    row_slope,
+    row_std,
+    slope,
+    std,
+)
+
+# interval features computed by the kernel, the index is the kernel feature id
+_FUSED_FEATURES = (
+    row_mean,
+    row_std,
+    row_slope,
+    row_numba_min,
+    row_numba_max,
+    row_median,
+    row_quantile25,
+    row_quantile75,
+    row_iqr,
+)
+
+
+def _interval_feature_plan(intervals, Xt):
+    """Map the interval features of all estimators to the fused kernel.
+
+    Parameters
+    ----------
+    intervals : list of shape (n_estimators) of list of interval transformers
+        The fitted RandomIntervals or SupervisedIntervals of each estimator, one
+        per series representation.
+    Xt : list of 3D np.ndarray
+        The train data for each series representation. Only the first case is
+        used, to find the output width of transformer features.
+
+    Returns
+    -------
+    kernel_params : list of shape (n_series) of tuple of 1D np.ndarray
+        The starts, ends, dimensions, dilations, feature ids and output columns of
+        the kernel features extracted from each series representation.
+    n_fused : int
+        The number of kernel output columns.
+    estimator_plans : list of shape (n_estimators) of tuple
+        For each estimator, the column offsets of each interval output in the
+        estimator input, the positions and kernel columns of the kernel features,
+        and the features extracted outside the kernel as (position, series,
+        transformer or None for functions, arguments) tuples.
+    """
+    kernel_params = [[[] for _ in range(6)] for _ in range(len(Xt))]
+    n_fused = 0
+    estimator_plans = []
+
+    for est_intervals in intervals:
+        widths = []
+        positions = []
+        columns = []
+        fallbacks = []
+
+        for r, selector in enumerate(est_intervals):
+            transformer_widths = {}
+            for idx, start, end, dim, feature, dilation, keep in _interval_entries(
+                selector
+            ):
+                pos = len(widths)
+                if isinstance(feature, BaseTransformer):
+                    if keep is not None:
+                        widths.append(len(keep))
+                    else:
+                        # the output width only depends on the transformer
+                        # parameters, so is found once for each of the features
+                        # of the interval transformer using the first case
+                        f = idx % len(selector._features)
+                        if f not in transformer_widths:
+                            transformer_widths[f] = np.reshape(
+                                selector._transform_interval(Xt[r][:1], idx, None),
+                                (1, -1),
+                            ).shape[1]
+                        widths.append(transformer_widths[f])
+
+                    if keep is None or any(keep):
+                        fallbacks.append(
+                            (
+                                pos,
+                                r,
+                                feature,
+                                (
+                                    dim,
+                                    start,
+                                    end,
+                                    dilation,
+                                    keep,
+                                    selector.transformer_feature_skip,
+                                ),
+                            )
+                        )
+                    continue
+
+                widths.append(1)
+                if keep is not None and not keep:
+                    continue
+
+                feature_id = _fused_feature_id(feature)
+                if feature_id is None:
+                    fallbacks.append(
+                        (pos, r, None, (feature, dim, start, end, dilation))
+                    )
+                else:
+                    for i, v in enumerate(
+                        (start, end, dim, dilation, feature_id, n_fused)
+                    ):
+                        kernel_params[r][i].append(v)
+                    positions.append(pos)
+                    columns.append(n_fused)
+                    n_fused += 1
+
+        offsets = np.zeros(len(widths) + 1, dtype=np.int64)
+        np.cumsum(widths, out=offsets[1:])
+        estimator_plans.append(
+            (
+                offsets,
+                np.array(positions, dtype=np.int64),
+                np.array(columns, dtype=np.int64),
+                fallbacks,
+            )
+        )
+
+    kernel_params = [
+        tuple(np.array(p, dtype=np.int64) for p in params) for params in kernel_params
+    ]
+    return kernel_params, n_fused, estimator_plans
+
+
+def _fused_interval_features(Xt, kernel_params, n_fused, n_jobs):
+    """Extract all kernel features of all estimators into one array."""
+    out = np.zeros((Xt[0].shape[0], n_fused))
+
+    for r, params in enumerate(kernel_params):
+        if params[0].shape[0] > 0:
+            _run_with_n_jobs(
+                n_jobs,
+                _interval_features_kernel,
+                np.ascontiguousarray(Xt[r], dtype=np.float64),
+                *params,
+                out,
+            )
+
+    return out
+
+
+def _estimator_interval_features(Xt, fused, estimator_plan):
+    """Assemble the input of one estimator from the kernel output and fallbacks."""
+    offsets, positions, columns, fallbacks = estimator_plan
+
+    interval_features = np.zeros((Xt[0].shape[0], offsets[-1]))
+    interval_features[:, offsets[positions]] = fused[:, columns]
+    for fallback in fallbacks:
+        pos = fallback[0]
+        interval_features[:, offsets[pos] : offsets[pos + 1]] = _fallback_features(
+            Xt, fallback
+        )
+
+    return interval_features
+
+
+def _fallback_features(Xt, fallback):
+    """Transform a single interval feature not supported by the fused kernel."""
+    _, r, transformer, args = fallback
+    if transformer is None:
+        feature, dim, start, end, dilation = args
+        v = feature(Xt[r][:, dim, start:end:dilation])
+    else:
+        # as in RandomIntervals, only transform the features used if possible
+        dim, start, end, dilation, keep, transformer_feature_skip = args
+        if keep is not None:
+            for n in transformer_feature_skip:
+                if hasattr(transformer, n):
+                    setattr(transformer, n, keep)
+                    break
+        v = transformer.transform(
+            np.expand_dims(Xt[r][:, dim, start:end:dilation], axis=1)
+        )
+    return np.reshape(v, (Xt[r].shape[0], -1))
+
+
+def _interval_entries(selector):
+    # yields the index, interval, feature and whether to transform it for each
+    # output of the interval transformer, matching the order of its transform
+    if isinstance(selector, SupervisedIntervals):
+        for idx, (start, end, dim, feature) in enumerate(selector.intervals_):
+            yield idx, start, end, dim, feature, 1, selector._transform_features[idx]
+        return
+
+    keeps = None
+    if selector._transform_features is not None:
+        keeps = []
+        count = 0
+        for _ in range(selector.n_intervals_):
+            for feature in selector._features:
+                if isinstance(feature, BaseTransformer):
+                    nf = feature.n_transformed_features
+                    keeps.append(selector._transform_features[count : count + nf])
+                    count += nf
+                else:
+                    keeps.append(selector._transform_features[count])
+                    count += 1
+
+    for idx, (start, end, dim, feature, dilation) in enumerate(selector.intervals_):
+        yield (
+            idx,
+            start,
+            end,
+            dim,
+            feature,
+            dilation,
+            None if keeps is None else keeps[idx],
+        )
+
+
+def _fused_feature_id(feature):
+    for i, f in enumerate(_FUSED_FEATURES):
+        if feature is f:
+            return i
+    return None
+
+
+@njit(fastmath=True, cache=True, parallel=True)
+def _interval_features_kernel(
+    X, starts, ends, dims, dilations, feature_ids, columns, out
+):
+    n_instances, n_channels, n_timepoints = X.shape
+
+    for i in prange(n_instances):
+        # prefix sums of each channel centred on its mean, the sum of the values
+        # and squared values and the sum of the values multiplied by their index
+        means = np.zeros(n_channels)
+        sums = np.zeros((n_channels, n_timepoints + 1))
+        sq_sums = np.zeros((n_channels, n_timepoints + 1))
+        idx_sums = np.zeros((n_channels, n_timepoints + 1))
+        for c in range(n_channels):
+            means[c] = mean(X[i, c])
+            for t in range(n_timepoints):
+                v = X[i, c, t] - means[c]
+                sums[c, t + 1] = sums[c, t] + v
+                sq_sums[c, t + 1] = sq_sums[c, t] + v * v
+                idx_sums[c, t + 1] = idx_sums[c, t] + t * v
+
+        for j in range(starts.shape[0]):
+            d = dims[j]
+            out[i, columns[j]] = _interval_feature(
+                X[i, d],
+                sums[d],
+                sq_sums[d],
+                idx_sums[d],
+                means[d],
+                starts[j],
+                ends[j],
+                dilations[j],
+                feature_ids[j],
+            )
+
+
+@njit(fastmath=True, cache=True)
+def _interval_feature(
+    x, sums, sq_sums, idx_sums, x_mean, start, end, dilation, feature_id
+):
+    if dilation == 1 and feature_id <= 2:
+        n = end - start
+        s = sums[end] - sums[start]
+        if feature_id == 0:
+            return x_mean + s / n
+        elif feature_id == 1:
+            m = s / n
+            var = (sq_sums[end] - sq_sums[start]) / n - m * m
+            return var**0.5 if var > 0 else 0.0
+        else:
+            # slope is the same for the centred series, indices start from 0
+            sum_x = n * (n - 1) / 2
+            sum_xx = n * (n - 1) * (2 * n - 1) / 6
+            sum_xy = idx_sums[end] - idx_sums[start] - start * s
+            denom = sum_x * sum_x - n * sum_xx
+            return 0.0 if denom == 0 else (sum_x * s - n * sum_xy) / denom
+
+    interval = x[start:end:dilation]
+    if feature_id == 0:
+        return mean(interval)
+    elif feature_id == 1:
+        return std(interval)
+    elif feature_id == 2:
+        return slope(interval)
+    elif feature_id == 3:
+        return numba_min(interval)
+    elif feature_id == 4:
+        return numba_max(interval)
+    elif feature_id == 5:
+        return np.quantile(interval, 0.5)
+    elif feature_id == 6:
+        return np.quantile(interval, 0.25)
+    elif feature_id == 7:
+        return np.quantile(interval, 0.75)
+    else:
+        return iqr(interval)
@@ -16,6 +16,17 @@ from sklearn.tree import BaseDecisionTree, DecisionTreeClassifier, DecisionTreeR
 from sklearn.utils import check_random_state
 
 from aeon.base._base import _clone_estimator
+from aeon.base._transform_cache import _fit_transform_cached, _transform_cached
+from aeon.base.estimator.interval_based._flat_forest import (
+    _flat_forest_features,
+    _flatten_forest,
+    _predict_flat_forest,
+)
+from aeon.base.estimator.interval_based._interval_features import (
+    _estimator_interval_features,
+    _fused_interval_features,
+    _interval_feature_plan,
+)
 from aeon.classification.sklearn import ContinuousIntervalTree
 from aeon.transformations.base import BaseTransformer
 from aeon.transformations.collection import RandomIntervals, SupervisedIntervals
@@ -127,6 +138,11 @@ class BaseIntervalForest(metaclass=ABCMeta):
     save_transformed_data : bool, default=False
         Save the data transformed in fit for use in _get_train_preds and
         _get_train_probs.
+    memory : str, joblib.Memory or None, default=None
+        Used to cache the series_transformers output of fit and predict. If a string
+        is given, it is the path to the caching directory. Estimators given the same
+        memory reuse the transformed series of a collection computed by any of them.
+        If None, no caching is performed.
     random_state : int, RandomState instance or None, default=None
         If `int`, random_state is the seed used by the random number generator;
         If `RandomState` instance, random_state is the random number generator;
@@ -152,9 +168,11 @@ class BaseIntervalForest(metaclass=ABCMeta):
     total_intervals_ : int
         Total number of intervals per tree from all representations.
     estimators_ : list of shape (n_estimators) of BaseEstimator
-        The collections of estimators trained in fit.
+        The collections of estimators trained in fit. None after
+        compact_estimators is called.
     intervals_ : list of shape (n_estimators) of BaseTransformer
-        Stores the interval extraction transformer for all estimators.
+        Stores the interval extraction transformer for all estimators. None after
+        compact_estimators is called.
     transformed_data_ : list of shape (n_estimators) of ndarray with shape
     (n_instances_ ,total_intervals * att_subsample_size)
         The transformed dataset for all estimators. Only saved when
@@ -187,6 +205,7 @@ class BaseIntervalForest(metaclass=ABCMeta):
         time_limit_in_minutes=None,
         contract_max_n_estimators=500,
         save_transformed_data=False,
+        memory=None,
         random_state=None,
         n_jobs=1,
         parallel_backend=None,
@@ -204,6 +223,7 @@ class BaseIntervalForest(metaclass=ABCMeta):
         self.time_limit_in_minutes = time_limit_in_minutes
         self.contract_max_n_estimators = contract_max_n_estimators
         self.save_transformed_data = save_transformed_data
+        self.memory = memory
         self.random_state = random_state
         self.n_jobs = n_jobs
         self.parallel_backend = parallel_backend
@@ -254,7 +274,8 @@ class BaseIntervalForest(metaclass=ABCMeta):
         # clone series_transformers if it is a transformer and transform the input data
         elif _is_transformer(self.series_transformers):
             t = _clone_estimator(self.series_transformers, random_state=rng)
-            Xt = [t.fit_transform(X, y)]
+            Xt, t = _fit_transform_cached(t, X, y, memory=self.memory)
+            Xt = [Xt]
             self._series_transformers = [t]
         # clone each series_transformers transformer and include the base series if None
         # is in the list
@@ -268,7 +289,8 @@ class BaseIntervalForest(metaclass=ABCMeta):
                     self._series_transformers.append(None)
                 elif _is_transformer(transformer):
                     t = _clone_estimator(transformer, random_state=rng)
-                    Xt.append(t.fit_transform(X, y))
+                    Xt_t, t = _fit_transform_cached(t, X, y, memory=self.memory)
+                    Xt.append(Xt_t)
                     self._series_transformers.append(t)
                 else:
                     raise ValueError(
@@ -735,11 +757,28 @@ class BaseIntervalForest(metaclass=ABCMeta):
                 self.transformed_data_,
             ) = zip(*fit)
 
+        # collect the intervals and features of all estimators to extract them
+        # together in predict
+        self._interval_plan = _interval_feature_plan(self.intervals_, Xt)
+
+        # store the trees as flat arrays to predict with all of them at once if
+        # the base estimator is a supported tree
+        self._flat_forest = _flatten_forest(
+            self.estimators_,
+            self._interval_plan[2],
+            self._interval_plan[1],
+            self.n_classes_ if is_classifier(self) else 1,
+            is_classifier(self),
+        )
+
         return self
 
     def _predict(self, X):
         if is_regressor(self):
-            Xt = self._predict_setup(X)
+            Xt, fused = self._predict_setup(X)
+
+            if self._flat_forest is not None:
+                return self._predict_flat(Xt, fused)[:, 0] / self._n_estimators
 
             y_preds = Parallel(
                 n_jobs=self._n_jobs,
@@ -748,8 +787,8 @@ class BaseIntervalForest(metaclass=ABCMeta):
             )(
                 delayed(self._predict_for_estimator)(
                     Xt,
-                    self.estimators_[i],
-                    self.intervals_[i],
+                    fused,
+                    i,
                     predict_proba=False,
                 )
                 for i in range(self._n_estimators)
@@ -762,15 +801,18 @@ class BaseIntervalForest(metaclass=ABCMeta):
             )
 
     def _predict_proba(self, X):
-        Xt = self._predict_setup(X)
+        Xt, fused = self._predict_setup(X)
+
+        if self._flat_forest is not None:
+            return self._predict_flat(Xt, fused) / self._n_estimators
 
         y_probas = Parallel(
             n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
         )(
             delayed(self._predict_for_estimator)(
                 Xt,
-                self.estimators_[i],
-                self.intervals_[i],
+                fused,
+                i,
                 predict_proba=True,
             )
             for i in range(self._n_estimators)
@@ -994,16 +1036,20 @@ class BaseIntervalForest(metaclass=ABCMeta):
             if transformer is None:
                 Xt.append(X)
             elif _is_transformer(transformer):
-                Xt.append(transformer.transform(X))
+                Xt.append(_transform_cached(transformer, X, memory=self.memory))
 
-        return Xt
+        # extract the features of all estimators supported by the fused kernel in
+        # a single pass
+        kernel_params, n_fused, _ = self._interval_plan
+        fused = _fused_interval_features(Xt, kernel_params, n_fused, self._n_jobs)
 
-    def _predict_for_estimator(self, Xt, estimator, intervals, predict_proba=False):
-        interval_features = np.empty((Xt[0].shape[0], 0))
+        return Xt, fused
 
-        for r in range(len(Xt)):
-            f = intervals[r].transform(Xt[r])
-            interval_features = np.hstack((interval_features, f))
+    def _predict_for_estimator(self, Xt, fused, idx, predict_proba=False):
+        estimator = self.estimators_[idx]
+        interval_features = _estimator_interval_features(
+            Xt, fused, self._interval_plan[2][idx]
+        )
 
         if isinstance(self.replace_nan, str) and self.replace_nan.lower() == "nan":
             interval_features = np.nan_to_num(
@@ -1023,6 +1069,56 @@ class BaseIntervalForest(metaclass=ABCMeta):
         else:
             return estimator.predict(interval_features)
 
+    def _predict_flat(self, Xt, fused):
+        interval_features = _flat_forest_features(
+            Xt, fused, self._flat_forest[-1], self._n_jobs, self.parallel_backend
+        )
+
+        if isinstance(self.replace_nan, str) and self.replace_nan.lower() == "nan":
+            interval_features = np.nan_to_num(
+                interval_features, False, np.nan, np.nan, np.nan
+            )
+        elif isinstance(self.replace_nan, (int, float)):
+            interval_features = np.nan_to_num(
+                interval_features,
+                False,
+                self.replace_nan,
+                self.replace_nan,
+                self.replace_nan,
+            )
+
+        return _predict_flat_forest(interval_features, self._flat_forest, self._n_jobs)
+
+    def compact_estimators(self):
+        """Discard the fitted trees and interval transformers after fit.
+
+        Predictions are made using a flat array representation of the trees created
+        in fit, which is smaller to store and pickle. Only the transformers
+        extracting interval features used by the trees are kept. Afterwards
+        estimators_ and intervals_ are None.
+
+        Only available if the base estimator is a scikit-learn decision tree or a
+        ContinuousIntervalTree.
+
+        Returns
+        -------
+        self :
+            Reference to self.
+        """
+        self.check_is_fitted()
+
+        if getattr(self, "_flat_forest", None) is None:
+            raise ValueError(
+                "compact_estimators requires the base estimator to be a scikit-learn "
+                "decision tree or a ContinuousIntervalTree."
+            )
+
+        self.estimators_ = None
+        self.intervals_ = None
+        self._interval_plan = self._interval_plan[:2] + (None,)
+
+        return self
+
     def _get_train_preds(self, X, y) -> np.ndarray:
         n_instances = self._train_est_setup(X, y)
 
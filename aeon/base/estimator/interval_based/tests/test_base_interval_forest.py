@@ -1,21 +1,42 @@
 """Tests for the BaseIntervalForest class."""
 
+import pickle
+from copy import deepcopy
+
 import numpy as np
 import pytest
 from sklearn.pipeline import make_pipeline
 from sklearn.tree import DecisionTreeClassifier
 
 from aeon.base._base import _clone_estimator
+from aeon.base.estimator.interval_based._interval_features import (
+    _estimator_interval_features,
+    _fused_interval_features,
+    _interval_feature_plan,
+)
 from aeon.classification.interval_based._interval_forest import IntervalForestClassifier
 from aeon.classification.sklearn import ContinuousIntervalTree
+from aeon.regression.interval_based import IntervalForestRegressor
 from aeon.transformations.collection import (
     AutocorrelationFunctionTransformer,
     Catch22,
+    RandomIntervals,
     SevenNumberSummaryTransformer,
 )
 from aeon.transformations.series.func_transform import FunctionTransformer
 from aeon.utils._testing.collection import make_3d_test_data
-from aeon.utils.numba.stats import row_mean, row_numba_min
+from aeon.utils.numba.stats import (
+    row_iqr,
+    row_mean,
+    row_median,
+    row_numba_max,
+    row_numba_min,
+    row_ppv,
+    row_quantile25,
+    row_quantile75,
+    row_slope,
+    row_std,
+)
 
 
 @pytest.mark.parametrize(
@@ -254,3 +275,130 @@ def test_interval_features():
     est.fit(X, y)
     assert est._interval_function == [True]
     assert est._interval_transformer == [True]
+
+
+@pytest.mark.parametrize("n_channels", [1, 2])
+def test_fused_interval_features(n_channels):
+    """Test the fused interval features match the interval transformers."""
+    X, y = make_3d_test_data(n_channels=n_channels, n_timepoints=20, random_state=0)
+
+    est = IntervalForestClassifier(
+        n_estimators=3,
+        n_intervals=4,
+        interval_features=[
+            row_mean,
+            row_std,
+            row_slope,
+            row_median,
+            row_iqr,
+            Catch22(features=["DN_HistogramMode_5", "DN_HistogramMode_10"]),
+            row_ppv,
+        ],
+        series_transformers=[None, FunctionTransformer(np.log1p)],
+        random_state=0,
+    )
+    est.fit(X, y)
+
+    Xt, fused = est._predict_setup(X)
+    for i in range(est._n_estimators):
+        expected = np.hstack(
+            [est.intervals_[i][r].transform(Xt[r]) for r in range(len(Xt))]
+        )
+        np.testing.assert_array_almost_equal(
+            _estimator_interval_features(Xt, fused, est._interval_plan[2][i]),
+            expected,
+        )
+
+
+def test_fused_interval_features_dilation():
+    """Test the fused interval features for dilated intervals."""
+    X, _ = make_3d_test_data(n_channels=2, n_timepoints=30, random_state=0)
+
+    rit = RandomIntervals(
+        n_intervals=10,
+        features=[
+            row_mean,
+            row_std,
+            row_slope,
+            row_numba_min,
+            row_numba_max,
+            row_median,
+            row_quantile25,
+            row_quantile75,
+            row_iqr,
+        ],
+        dilation=[1, 2, 3],
+        random_state=0,
+    )
+    expected = rit.fit_transform(X)
+
+    kernel_params, n_fused, plans = _interval_feature_plan([[rit]], [X])
+    fused = _fused_interval_features([X], kernel_params, n_fused, 1)
+
+    assert n_fused == expected.shape[1]
+    np.testing.assert_array_almost_equal(
+        _estimator_interval_features([X], fused, plans[0]), expected
+    )
+
+
+@pytest.mark.parametrize(
+    "base_estimator",
+    [None, ContinuousIntervalTree()],
+)
+def test_flat_forest(base_estimator):
+    """Test predictions from the flat forest match the fitted trees."""
+    X, y = make_3d_test_data(n_cases=20, n_timepoints=20, random_state=0)
+
+    est = IntervalForestClassifier(
+        base_estimator=base_estimator,
+        n_estimators=5,
+        n_intervals=3,
+        interval_features=[
+            row_mean,
+            Catch22(features=["DN_HistogramMode_5", "CO_f1ecac"]),
+            row_ppv,
+        ],
+        random_state=0,
+    )
+    est.fit(X, y)
+    assert est._flat_forest is not None
+
+    trees = deepcopy(est)
+    trees._flat_forest = None
+    np.testing.assert_array_almost_equal(est.predict_proba(X), trees.predict_proba(X))
+
+    est.compact_estimators()
+    assert est.estimators_ is None and est.intervals_ is None
+    est = pickle.loads(pickle.dumps(est))
+    np.testing.assert_array_almost_equal(est.predict_proba(X), trees.predict_proba(X))
+
+
+def test_flat_forest_regression():
+    """Test regression predictions from the flat forest match the fitted trees."""
+    X, y = make_3d_test_data(
+        n_cases=20, n_timepoints=20, regression_target=True, random_state=0
+    )
+
+    est = IntervalForestRegressor(n_estimators=5, n_intervals=3, random_state=0)
+    est.fit(X, y)
+    assert est._flat_forest is not None
+
+    trees = deepcopy(est)
+    trees._flat_forest = None
+    np.testing.assert_array_almost_equal(est.predict(X), trees.predict(X))
+
+
+def test_flat_forest_unsupported_estimator():
+    """Test estimators which are not trees are not flattened."""
+    X, y = make_3d_test_data()
+
+    est = IntervalForestClassifier(
+        base_estimator=make_pipeline(DecisionTreeClassifier()),
+        n_estimators=2,
+        n_intervals=2,
+    )
+    est.fit(X, y)
+
+    assert est._flat_forest is None
+    with pytest.raises(ValueError, match="compact_estimators"):
+        est.compact_estimators()
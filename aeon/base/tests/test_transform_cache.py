@@ -0,0 +1,88 @@
+"""Tests for the cache of collection transforms."""
+
+import numpy as np
+from joblib import Memory
+from sklearn.preprocessing import FunctionTransformer
+
+from aeon.base._transform_cache import _fit_transform_cached, _transform_cached
+from aeon.classification.convolution_based import Arsenal
+from aeon.classification.interval_based import DrCIFClassifier
+from aeon.transformations.collection.convolution_based import Rocket
+from aeon.transformations.collection.shapelet_based import RandomShapeletTransform
+from aeon.utils._testing.collection import make_3d_test_data
+
+n_calls = 0
+
+
+def _count_calls(X):
+    global n_calls
+    n_calls += 1
+    return X * 2
+
+
+def test_transform_cache(tmp_path):
+    """Test transforms are loaded from the cache for the same transformer and X."""
+    global n_calls
+    n_calls = 0
+    X, _ = make_3d_test_data(n_cases=5, n_timepoints=10, random_state=0)
+    memory = Memory(location=str(tmp_path), verbose=0)
+
+    Xt, t = _fit_transform_cached(FunctionTransformer(_count_calls), X, memory=memory)
+    np.testing.assert_array_equal(Xt, X * 2)
+    assert n_calls == 1
+    Xt2, _ = _fit_transform_cached(FunctionTransformer(_count_calls), X, memory=memory)
+    np.testing.assert_array_equal(Xt, Xt2)
+    assert n_calls == 1
+    _fit_transform_cached(FunctionTransformer(_count_calls), X + 1, memory=memory)
+    assert n_calls == 2
+
+    np.testing.assert_array_equal(_transform_cached(t, X, memory=memory), X * 2)
+    _transform_cached(t, X, memory=memory)
+    assert n_calls == 3
+
+    # without a random_state the transform is different for every fit
+    Xt, _ = _fit_transform_cached(Rocket(num_kernels=10), X, memory=memory)
+    Xt2, _ = _fit_transform_cached(Rocket(num_kernels=10), X, memory=memory)
+    assert not np.array_equal(Xt, Xt2)
+    Xt, _ = _fit_transform_cached(
+        Rocket(num_kernels=10, random_state=0), X, memory=str(tmp_path)
+    )
+    Xt2, _ = _fit_transform_cached(
+        Rocket(num_kernels=10, random_state=0), X, memory=str(tmp_path)
+    )
+    np.testing.assert_array_equal(Xt, Xt2)
+
+
+def test_transform_cache_execution_params(tmp_path):
+    """Test the jobs are not part of the key and contracted fits are not cached."""
+    X, y = make_3d_test_data(n_cases=5, n_timepoints=10, random_state=0)
+    memory = Memory(location=str(tmp_path), verbose=0)
+
+    rocket = Rocket(num_kernels=10, random_state=0)
+    Xt, t = _fit_transform_cached(rocket, X, memory=memory)
+    assert t is rocket
+    rocket = Rocket(num_kernels=10, random_state=0, n_jobs=2)
+    Xt2, t = _fit_transform_cached(rocket, X, memory=memory)
+    np.testing.assert_array_equal(Xt, Xt2)
+    # loaded from the cache, with the jobs of the replaced transformer
+    assert t is not rocket
+    assert t.n_jobs == 2 and t._n_jobs == 2
+
+    for _ in range(2):
+        st = RandomShapeletTransform(
+            max_shapelets=3, time_limit_in_minutes=0.01, random_state=0
+        )
+        _, t = _fit_transform_cached(st, X, y, memory=memory)
+        assert t is st
+
+
+def test_estimators_with_memory(tmp_path):
+    """Test estimators give the same results with and without the cache."""
+    X, y = make_3d_test_data(n_cases=10, n_timepoints=12, random_state=0)
+    for cls in [DrCIFClassifier, Arsenal]:
+        params = cls.get_test_params()
+        expected = cls(**params, random_state=0).fit(X, y).predict_proba(X)
+        for _ in range(2):
+            clf = cls(**params, memory=str(tmp_path), random_state=0).fit(X, y)
+            np.testing.assert_array_almost_equal(clf.predict_proba(X), expected)
+    assert any(tmp_path.iterdir())
@@ -16,6 +16,7 @@ from sklearn.preprocessing import StandardScaler
 from sklearn.utils import check_random_state
 
 from aeon.base._base import _clone_estimator
+from aeon.base._transform_cache import _fit_transform_cached, _transform_cached
 from aeon.classification.base import BaseClassifier
 from aeon.transformations.collection.convolution_based import (
     MiniRocket,
@@ -56,6 +57,11 @@ class Arsenal(BaseClassifier):
         Max number of estimators when time_limit_in_minutes is set.
     save_transformed_data : bool, default=False
         Save the data transformed in fit for use in _get_train_probs.
+    memory : str, joblib.Memory or None, default=None
+        Used to cache the ROCKET transforms of fit and predict. If a string is given,
+        it is the path to the caching directory. Only used if random_state is set, as
+        the kernels are otherwise different for every fit. If None, no caching is
+        performed.
     n_jobs : int, default=1
         The number of jobs to run in parallel for both `fit` and `predict`.
         ``-1`` means using all processors.
@@ -129,6 +135,7 @@ class Arsenal(BaseClassifier):
         time_limit_in_minutes=0.0,
         contract_max_n_estimators=100,
         save_transformed_data=False,
+        memory=None,
         n_jobs=1,
         random_state=None,
     ):
@@ -140,6 +147,7 @@ class Arsenal(BaseClassifier):
         self.time_limit_in_minutes = time_limit_in_minutes
         self.contract_max_n_estimators = contract_max_n_estimators
         self.save_transformed_data = save_transformed_data
+        self.memory = memory
 
         self.random_state = random_state
         self.n_jobs = n_jobs
@@ -368,7 +376,7 @@ class Arsenal(BaseClassifier):
         return results
 
     def _fit_estimator(self, rocket, X, y):
-        transformed_x = rocket.fit_transform(X)
+        transformed_x, rocket = _fit_transform_cached(rocket, X, memory=self.memory)
         scaler = StandardScaler(with_mean=False)
         scaler.fit(transformed_x, y)
         ridge = RidgeClassifierCV(alphas=np.logspace(-3, 3, 10))
@@ -379,7 +387,8 @@ class Arsenal(BaseClassifier):
         ]
 
     def _predict_proba_for_estimator(self, X, classifier, idx):
-        preds = classifier.predict(X)
+        transformed_x = _transform_cached(classifier[0], X, memory=self.memory)
+        preds = classifier[1:].predict(transformed_x)
         weights = np.zeros((X.shape[0], self.n_classes_))
         for i in range(X.shape[0]):
             weights[i, self._class_dictionary[preds[i]]] += self.weights_[idx]
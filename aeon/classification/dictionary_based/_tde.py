@@ -419,6 +419,8 @@ class TemporalDictionaryEnsemble(BaseClassifier):
         sums = np.zeros((X.shape[0], self.n_classes_))
 
         for n, clf in enumerate(self.estimators_):
+            # n_jobs may have changed since fit
+            clf.n_jobs = self._n_jobs
             preds = clf.predict(X)
             for i in range(0, X.shape[0]):
                 sums[i, self._class_dictionary[preds[i]]] += self.weights_[n]
@@ -878,6 +880,9 @@ class IndividualTDE(BaseClassifier):
             The predicted class labels shape = (n_instances).
         """
         num_cases = X.shape[0]
+        # n_jobs may have changed since fit
+        for transformer in self._transformers:
+            transformer.n_jobs = self._n_jobs
 
         if self.n_dims_ > 1:
             words = (
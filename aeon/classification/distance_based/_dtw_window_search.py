@@ -0,0 +1,165 @@
+"""Leave-one-out nearest neighbours under DTW for a grid of windows.
+
+Tuning the window of a 1-NN DTW classifier by leave-one-out cross-validation finds
+the nearest neighbour of every train case under every window. Searched one window
+at a time most of these DTW computations are redundant, as in [1]_:
+
+- a DTW distance with a window is the same for every larger window, and also for
+  every smaller window down to the largest deviation from the diagonal of its
+  warping path. The windows are visited from largest to smallest and one DTW
+  computation gives the distance for all the windows its path fits in;
+- a DTW distance with a window is no smaller than with any larger window, so a
+  computation abandoned above the nearest neighbour distance of one window is a
+  lower bound for the smaller windows, as is LB_Kim for all windows;
+- the candidates of each case are visited in order of Euclidean distance, the
+  distance with no warping, so the nearest neighbour distances used to abandon the
+  computations are small early.
+
+References
+----------
+.. [1] Tan C.W., Herrmann M., Forestier G., Webb G.I. and Petitjean F. Efficient
+   search of the best warping window for dynamic time warping. In proceedings of
+   the 2018 SIAM International Conference on Data Mining, pp. 225-233.
+"""
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+from aeon.distances._lower_bounds import _lb_kim
+from aeon.distances._squared import _univariate_squared_distance
+from aeon.distances._utils import _run_with_n_jobs
+
+
+def _dtw_loocv_accuracies(X, y, windows, n_jobs=1):
+    """Find the leave-one-out 1-NN DTW accuracy of X for each window.
+
+    The nearest neighbour of each case is found with the same windows as
+    :func:`aeon.distances.dtw_distance`, breaking ties by the lowest index.
+
+    Parameters
+    ----------
+    X : np.ndarray of shape (n_cases, n_channels, n_timepoints)
+        The equal length train series.
+    y : np.ndarray of shape (n_cases,)
+        The class labels.
+    windows : list of float
+        The windows as a proportion of the series length, between 0 and 1.
+    n_jobs : int, default=1
+        The number of threads used to search the nearest neighbours of the cases.
+
+    Returns
+    -------
+    np.ndarray of shape (len(windows),)
+        The proportion of cases with the same class as their nearest neighbour for
+        each window.
+    """
+    n_timepoints = X.shape[2]
+    # The radius of the window as in create_bounding_band, the same for all the
+    # windows of at least the series length
+    radii = np.array(
+        [
+            min(math.floor(((window * (n_timepoints / 100)) * 100)), n_timepoints - 1)
+            for window in windows
+        ],
+        dtype=np.int64,
+    )
+    unique_radii, inverse = np.unique(radii, return_inverse=True)
+    neighbours = _run_with_n_jobs(
+        n_jobs, _dtw_loocv_neighbours, X.astype(np.float64), unique_radii
+    )
+    y = np.asarray(y)
+    accuracies = (y[neighbours] == y[:, np.newaxis]).mean(axis=0)
+    return accuracies[inverse]
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _dtw_loocv_neighbours(X: np.ndarray, radii: np.ndarray) -> np.ndarray:
+    neighbours = np.zeros((X.shape[0], radii.shape[0]), dtype=np.int64)
+    for i in prange(X.shape[0]):
+        neighbours[i] = _dtw_case_neighbours(X, i, radii)
+    return neighbours
+
+
+@njit(cache=True, fastmath=True)
+def _dtw_case_neighbours(X: np.ndarray, i: int, radii: np.ndarray) -> np.ndarray:
+    n_cases = X.shape[0]
+    n_radii = radii.shape[0]
+    euclidean = np.zeros(n_cases)
+    for j in range(n_cases):
+        for t in range(X.shape[2]):
+            euclidean[j] += _univariate_squared_distance(X[i, :, t], X[j, :, t])
+    best = np.full(n_radii, np.inf)
+    best_j = np.full(n_radii, n_cases)
+    for j in np.argsort(euclidean, kind="mergesort"):
+        if j == i:
+            continue
+        lb = _lb_kim(X[i], X[j])
+        k = n_radii - 1
+        while k >= 0:
+            if lb > best[k]:
+                k -= 1
+                continue
+            dist, deviation, abandoned = _dtw_radius_distance(
+                X[i], X[j], radii[k], best[k]
+            )
+            if abandoned:
+                lb = max(lb, dist)
+                k -= 1
+                continue
+            # The distance is the same for the smaller radii its path fits in
+            while k >= 0 and radii[k] >= deviation:
+                if dist < best[k] or (dist == best[k] and j < best_j[k]):
+                    best[k] = dist
+                    best_j[k] = j
+                k -= 1
+            lb = dist
+    return best_j
+
+
+@njit(cache=True, fastmath=True)
+def _dtw_radius_distance(
+    x: np.ndarray, y: np.ndarray, radius: int, upper_bound: float
+) -> tuple:
+    # Two rows DTW over a Sakoe-Chiba band of equal length series, as _dtw_distance,
+    # keeping for each cell the smallest deviation from the diagonal of the optimal
+    # paths reaching it. Returns the distance, the deviation of its path and False,
+    # or a lower bound of the distance, 0 and True if it is abandoned. The flag is
+    # returned as comparisons with infinity are not reliable with fastmath.
+    size = x.shape[1]
+    prev = np.full(size + 1, np.inf)
+    curr = np.full(size + 1, np.inf)
+    prev_dev = np.zeros(size + 1, dtype=np.int64)
+    curr_dev = np.zeros(size + 1, dtype=np.int64)
+    prev[0] = 0.0
+    prev_start, prev_end = 0, 1
+    curr_start, curr_end = 0, 0
+    for i in range(size):
+        curr[curr_start:curr_end] = np.inf
+        start = max(0, i - radius)
+        end = min(size, i + radius + 1)
+        row_min = np.inf
+        for j in range(start, end):
+            cost = prev[j]
+            deviation = prev_dev[j]
+            if prev[j + 1] < cost or (
+                prev[j + 1] == cost and prev_dev[j + 1] < deviation
+            ):
+                cost = prev[j + 1]
+                deviation = prev_dev[j + 1]
+            if curr[j] < cost or (curr[j] == cost and curr_dev[j] < deviation):
+                cost = curr[j]
+                deviation = curr_dev[j]
+            curr[j + 1] = _univariate_squared_distance(x[:, i], y[:, j]) + cost
+            curr_dev[j + 1] = max(deviation, abs(i - j))
+            row_min = min(row_min, curr[j + 1])
+        if row_min > upper_bound:
+            return row_min, 0, True
+        prev, curr = curr, prev
+        prev_dev, curr_dev = curr_dev, prev_dev
+        prev_start, curr_start = start + 1, prev_start
+        prev_end, curr_end = end + 1, prev_end
+    if prev[size] > upper_bound:
+        return prev[size], 0, True
+    return prev[size], prev_dev[size], False
@@ -14,12 +14,14 @@ from sklearn.metrics import accuracy_score
 from sklearn.model_selection import (
     GridSearchCV,
     LeaveOneOut,
+    ParameterSampler,
     RandomizedSearchCV,
     StratifiedShuffleSplit,
     cross_val_predict,
 )
 
 from aeon.classification.base import BaseClassifier
+from aeon.classification.distance_based._dtw_window_search import _dtw_loocv_accuracies
 from aeon.classification.distance_based._time_series_neighbors import (
     KNeighborsTimeSeriesClassifier,
 )
@@ -252,22 +254,49 @@ class ElasticEnsemble(BaseClassifier):
                         f"Currently evaluating {self._distance_measures[dm]}"
                     )
 
+            param_options = ElasticEnsemble._get_100_param_options(
+                self._distance_measures[dm], X
+            )
+            # DTW and DDTW windows of equal length series are searched for all the
+            # options at once, sharing the distances between windows
+            window_search = this_measure == "dtw" and isinstance(
+                param_train_to_use, np.ndarray
+            )
+            if window_search:
+                if self.proportion_of_param_options == 1:
+                    candidates = param_options["distance_params"]
+                else:
+                    # The same options as sampled by RandomizedSearchCV
+                    candidates = [
+                        params["distance_params"]
+                        for params in ParameterSampler(
+                            param_options,
+                            n_iter=100 * self.proportion_of_param_options,
+                            random_state=rand,
+                        )
+                    ]
+                accs = _dtw_loocv_accuracies(
+                    param_train_to_use,
+                    param_train_y,
+                    [params["window"] for params in candidates],
+                    n_jobs=self._n_jobs,
+                )
+                best_params = candidates[int(np.argmax(accs))]
             # If 100 parameter options are being considered per measure,
             # use a GridSearchCV
-            if self.proportion_of_param_options == 1:
+            elif self.proportion_of_param_options == 1:
                 grid = GridSearchCV(
                     estimator=KNeighborsTimeSeriesClassifier(
                         distance=this_measure, n_neighbors=1
                     ),
-                    param_grid=ElasticEnsemble._get_100_param_options(
-                        self._distance_measures[dm], X
-                    ),
+                    param_grid=param_options,
                     cv=LeaveOneOut(),
                     scoring="accuracy",
                     n_jobs=self._n_jobs,
                     verbose=self.verbose,
                 )
                 grid.fit(param_train_to_use, param_train_y)
+                best_params = grid.best_params_["distance_params"]
 
             # Else, used RandomizedSearchCV to randomly sample parameter
             # options for each measure
@@ -276,9 +305,7 @@ class ElasticEnsemble(BaseClassifier):
                     estimator=KNeighborsTimeSeriesClassifier(
                         distance=this_measure, n_neighbors=1
                     ),
-                    param_distributions=ElasticEnsemble._get_100_param_options(
-                        self._distance_measures[dm], X
-                    ),
+                    param_distributions=param_options,
                     n_iter=100 * self.proportion_of_param_options,
                     cv=LeaveOneOut(),
                     scoring="accuracy",
@@ -287,9 +314,21 @@ class ElasticEnsemble(BaseClassifier):
                     verbose=self.verbose,
                 )
                 grid.fit(param_train_to_use, param_train_y)
+                best_params = grid.best_params_["distance_params"]
 
             if self.majority_vote:
                 acc = 1
+            # the train accuracy of the best window was found in the search if it
+            # used all the train data
+            elif window_search and param_train_to_use is full_train_to_use:
+                acc = accs[int(np.argmax(accs))]
+            elif window_search:
+                acc = _dtw_loocv_accuracies(
+                    full_train_to_use,
+                    y,
+                    [best_params["window"]],
+                    n_jobs=self._n_jobs,
+                )[0]
             # once the best parameter option has been estimated on the
             # training data, perform a final pass with this parameter option
             # to get the individual predictions with cross_cal_predict (
@@ -300,7 +339,7 @@ class ElasticEnsemble(BaseClassifier):
                 best_model = KNeighborsTimeSeriesClassifier(
                     n_neighbors=1,
                     distance=this_measure,
-                    distance_params=grid.best_params_["distance_params"],
+                    distance_params=best_params,
                     n_jobs=self._n_jobs,
                 )
                 preds = cross_val_predict(
@@ -318,7 +357,7 @@ class ElasticEnsemble(BaseClassifier):
             best_model = KNeighborsTimeSeriesClassifier(
                 n_neighbors=1,
                 distance=this_measure,
-                distance_params=grid.best_params_["distance_params"],
+                distance_params=best_params,
             )
             best_model.fit(full_train_to_use, y)
             end_build_time = time.time()
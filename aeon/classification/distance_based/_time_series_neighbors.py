@@ -11,7 +11,7 @@ __all__ = ["KNeighborsTimeSeriesClassifier"]
 import numpy as np
 
 from aeon.classification.base import BaseClassifier
-from aeon.distances import get_distance_function
+from aeon.distances import get_distance_function, nearest_neighbors
 
 WEIGHTS_SUPPORTED = ["uniform", "distance"]
 
@@ -43,12 +43,11 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         if callable, must be of signature (X: np.ndarray, X2: np.ndarray) -> np.ndarray
     distance_params : dict, default = None
         Dictionary for metric parameters for the case that distance is a str.
-    n_jobs : int, default = None
-        The number of parallel jobs to run for neighbors search.
-        ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context.
-        ``-1`` means using all processors. See :term:`Glossary <n_jobs>`
+    n_jobs : int, default = 1
+        The number of parallel jobs to run for neighbors search. The distances
+        between the test and training cases are computed in parallel over the test
+        cases. ``-1`` means using all processors. See :term:`Glossary <n_jobs>`
         for more details.
-        Parameter for compatibility purposes, still unimplemented.
 
     Examples
     --------
@@ -66,6 +65,7 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         "capability:multivariate": True,
         "capability:unequal_length": True,
         "X_inner_mtype": ["np-list", "numpy3D"],
+        "capability:multithreading": True,
         "algorithm_type": "distance",
     }
 
@@ -109,6 +109,8 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         """
         if isinstance(self.distance, str):
             self.metric_ = get_distance_function(metric=self.distance)
+        else:
+            self.metric_ = self.distance
 
         self.X_ = X
         self.classes_, self.y_ = np.unique(y, return_inverse=True)
@@ -133,13 +135,11 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         """
         self.check_is_fitted()
 
+        distances, idx = self._kneighbors(X, self.n_neighbors)
+        weights = self._weights(distances)
         preds = np.zeros((len(X), len(self.classes_)))
         for i in range(len(X)):
-            idx, weights = self._kneighbors(X[i])
-            for id, w in zip(idx, weights):
-                predicted_class = self.y_[id]
-                preds[i, predicted_class] += w
-
+            np.add.at(preds[i], self.y_[idx[i]], weights[i])
             preds[i] = preds[i] / np.sum(preds[i])
 
         return preds
@@ -162,42 +162,122 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         """
         self.check_is_fitted()
 
+        distances, idx = self._kneighbors(X, self.n_neighbors)
+        weights = self._weights(distances)
         preds = np.empty(len(X), dtype=self.classes_.dtype)
         for i in range(len(X)):
             scores = np.zeros(len(self.classes_))
-            idx, weights = self._kneighbors(X[i])
-            for id, w in zip(idx, weights):
-                predicted_class = self.y_[id]
-                scores[predicted_class] += w
-
+            np.add.at(scores, self.y_[idx[i]], weights[i])
             preds[i] = self.classes_[np.argmax(scores)]
 
         return preds
 
-    def _kneighbors(self, X):
-        """Find the K-neighbors of a point.
+    def kneighbors(self, X, n_neighbors=None, return_distance=True):
+        """Find the K-neighbors of each series in X.
 
-        Returns indices and weights of each point.
+        Parameters
+        ----------
+        X : 3D np.ndarray
+            Input data, any number of channels, equal length series of shape ``(
+            n_instances, n_channels, n_timepoints)``
+            or 2D np.array (univariate, equal length series) of shape
+            ``(n_instances, n_timepoints)``
+            or list of numpy arrays (any number of channels, unequal length series)
+            of shape ``[n_instances]``, 2D np.array ``(n_channels, n_timepoints_i)``,
+            where ``n_timepoints_i`` is length of series ``i``
+            other types are allowed and converted into one of the above.
+        n_neighbors : int or None, default=None
+            Number of neighbours to find for each series. If None, ``n_neighbors``
+            passed to the constructor is used.
+        return_distance : bool, default=True
+            Whether or not to return the distances.
+
+        Returns
+        -------
+        neigh_dist : np.ndarray of shape (n_instances, n_neighbors)
+            Distances to the nearest training series, in increasing order. Only
+            present if ``return_distance=True``.
+        neigh_ind : np.ndarray of shape (n_instances, n_neighbors)
+            Indices of the nearest training series.
+
+        Examples
+        --------
+        >>> from aeon.datasets import load_unit_test
+        >>> from aeon.classification.distance_based import (
+        ...     KNeighborsTimeSeriesClassifier
+        ... )
+        >>> X_train, y_train = load_unit_test(split="train")
+        >>> X_test, y_test = load_unit_test(split="test")
+        >>> classifier = KNeighborsTimeSeriesClassifier(distance="euclidean")
+        >>> classifier.fit(X_train, y_train)
+        KNeighborsTimeSeriesClassifier(...)
+        >>> neigh_dist, neigh_ind = classifier.kneighbors(X_test[:2], n_neighbors=3)
+        >>> neigh_ind
+        array([[2, 1, 5],
+               [0, 5, 4]])
+        """
+        self.check_is_fitted()
+        if n_neighbors is None:
+            n_neighbors = self.n_neighbors
+        if n_neighbors < 1 or n_neighbors > len(self.X_):
+            raise ValueError(
+                f"n_neighbors must be between 1 and the number of training cases "
+                f"({len(self.X_)}), but found {n_neighbors}"
+            )
+        X = self._preprocess_collection(X)
+        distances, idx = self._kneighbors(X, n_neighbors)
+        # Order the neighbours of each series from nearest to furthest
+        order = np.argsort(distances, axis=1, kind="stable")
+        idx = np.take_along_axis(idx, order, axis=1)
+        if return_distance:
+            return np.take_along_axis(distances, order, axis=1), idx
+        return idx
+
+    def _kneighbors(self, X, n_neighbors):
+        """Find the K-neighbors of each series in a collection.
 
         Parameters
         ----------
         X : 3D np.ndarray of shape = (n_cases, n_channels, n_timepoints) or list of
-        shape[n_cases] of 2D arrays shape (n_channels,n_timepoints_i)
+        shape [n_cases] of 2D arrays shape (n_channels,n_timepoints_i)
                 If the series are all equal length, a numpy3D will be passed. If
                 unequal, a list of 2D numpy arrays is passed, which may have
                 different lengths.
+        n_neighbors : int
+            Number of neighbours to find for each series.
 
         Returns
         -------
-        ind : array
-            Indices of the nearest points in the population matrix.
-        ws : array
-            Array representing the weights of each neighbor.
+        distances : np.ndarray of shape (n_cases, n_neighbors)
+            Distances to the nearest training series, in no particular order.
+        ind : np.ndarray of shape (n_cases, n_neighbors)
+            Indices of the nearest training series.
         """
+        if (
+            isinstance(self.distance, str)
+            and isinstance(X, np.ndarray)
+            and isinstance(self.X_, np.ndarray)
+            and X.shape[1:] == self.X_.shape[1:]
+        ):
+            # Searched with lower bounds and early abandoning for the metrics that
+            # support it, and with the numba pairwise functions otherwise, in
+            # parallel over the test cases.
+            return nearest_neighbors(
+                X,
+                self.X_,
+                n_neighbors,
+                metric=self.distance,
+                n_jobs=self._n_jobs,
+                **self._distance_params,
+            )
+
         distances = np.array(
             [
-                self.metric_(X, self.X_[j], **self._distance_params)
-                for j in range(len(self.X_))
+                [
+                    self.metric_(x, self.X_[j], **self._distance_params)
+                    for j in range(len(self.X_))
+                ]
+                for x in X
             ]
         )
 
@@ -206,22 +286,24 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         # They might not be ordered within themselves,
         # but it is not necessary and partitioning is
         # O(n) while sorting is O(nlogn)
-        closest_idx = np.argpartition(distances, self.n_neighbors)
-        closest_idx = closest_idx[: self.n_neighbors]
+        closest_idx = np.argpartition(
+            distances, min(n_neighbors, len(self.X_) - 1), axis=1
+        )
+        closest_idx = closest_idx[:, :n_neighbors]
+        return np.take_along_axis(distances, closest_idx, axis=1), closest_idx
 
+    def _weights(self, distances):
+        """Return the weights of the neighbours at the given distances."""
         if self.weights == "distance":
-            ws = distances[closest_idx]
-            ws = ws**2
+            ws = distances**2
 
             # Using epsilon ~= 0 to avoid division by zero
-            ws = 1 / (ws + np.finfo(float).eps)
+            return 1 / (ws + np.finfo(float).eps)
         elif self.weights == "uniform":
-            ws = np.repeat(1.0, self.n_neighbors)
+            return np.ones(distances.shape)
         else:
             raise Exception(f"Invalid kNN weights: {self.weights}")
 
-        return closest_idx, ws
-
     @classmethod
     def get_test_params(cls, parameter_set="default"):
         """Return testing parameter settings for the estimator.
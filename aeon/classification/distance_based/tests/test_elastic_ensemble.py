@@ -1,8 +1,14 @@
 """Tests for ElasticEnsemble."""
 import numpy as np
 import pytest
+from sklearn.model_selection import GridSearchCV, LeaveOneOut
 
-from aeon.classification.distance_based import ElasticEnsemble
+from aeon.classification.distance_based import (
+    ElasticEnsemble,
+    KNeighborsTimeSeriesClassifier,
+)
+from aeon.classification.distance_based._dtw_window_search import _dtw_loocv_accuracies
+from aeon.utils._testing.collection import make_3d_test_data
 
 DISTANCE = [
     "lcss",
@@ -66,3 +72,22 @@ def test_proportion_train_in_param_finding():
     ee.get_metric_params()
     with pytest.raises(NotImplementedError, match="EE does not currently support:"):
         ElasticEnsemble._get_100_param_options("FOO")
+
+
+@pytest.mark.parametrize("n_channels", [1, 2])
+def test_dtw_loocv_accuracies(n_channels):
+    """Test the window search gives the leave-one-out accuracies of a grid search."""
+    X, y = make_3d_test_data(
+        n_cases=12, n_channels=n_channels, n_timepoints=20, random_state=0
+    )
+    windows = [x / 100 for x in range(100)]
+    grid = GridSearchCV(
+        KNeighborsTimeSeriesClassifier(distance="dtw"),
+        param_grid={"distance_params": [{"window": w} for w in windows]},
+        cv=LeaveOneOut(),
+        scoring="accuracy",
+    )
+    grid.fit(X, y)
+    np.testing.assert_array_equal(
+        _dtw_loocv_accuracies(X, y, windows), grid.cv_results_["mean_test_score"]
+    )
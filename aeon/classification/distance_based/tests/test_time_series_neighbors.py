@@ -1,10 +1,12 @@
 """Tests for KNeighborsTimeSeriesClassifier."""
+import numpy as np
 import pytest
 
 from aeon.classification.distance_based._time_series_neighbors import (
     KNeighborsTimeSeriesClassifier,
 )
 from aeon.datasets import load_unit_test
+from aeon.distances import get_distance_function
 
 distance_functions = [
     "euclidean",
@@ -74,3 +76,60 @@ def test_knn_bounding_matrix(distance_key):
         if pred[j] == y_test[j]:
             correct = correct + 1
     assert correct == expected_correct_window[distance_key]
+
+
+@pytest.mark.parametrize(
+    "distance_params", [None, {"window": 0.1}, {"itakura_max_slope": 0.5}]
+)
+@pytest.mark.parametrize("n_neighbors", [1, 3])
+def test_knn_lower_bound_pruning(distance_params, n_neighbors):
+    """Test pruning DTW neighbours with lower bounds does not change predictions."""
+    X_train, y_train = load_unit_test(split="train")
+    X_test, _ = load_unit_test(split="test")
+    knn = KNeighborsTimeSeriesClassifier(
+        distance="dtw",
+        distance_params=distance_params,
+        n_neighbors=n_neighbors,
+        weights="distance",
+    )
+    knn.fit(X_train, y_train)
+    pruned = knn.predict_proba(X_test)
+    # Callable distances are computed in full for every pair
+    knn = KNeighborsTimeSeriesClassifier(
+        distance=get_distance_function("dtw"),
+        distance_params=distance_params,
+        n_neighbors=n_neighbors,
+        weights="distance",
+    )
+    knn.fit(X_train, y_train)
+    np.testing.assert_array_almost_equal(pruned, knn.predict_proba(X_test))
+
+
+@pytest.mark.parametrize("distance_key", ["euclidean", "dtw", "msm"])
+def test_kneighbors(distance_key):
+    """Test kneighbors matches a brute force search."""
+    X_train, y_train = load_unit_test(split="train")
+    X_test, _ = load_unit_test(split="test")
+    X_test = X_test[:5]
+    distance = get_distance_function(distance_key)
+    expected = np.array([[distance(x, y) for y in X_train] for x in X_test])
+    expected_ind = np.argsort(expected, axis=1, kind="stable")[:, :4]
+
+    knn = KNeighborsTimeSeriesClassifier(distance=distance_key, n_jobs=2)
+    knn.fit(X_train, y_train)
+    neigh_dist, neigh_ind = knn.kneighbors(X_test, n_neighbors=4)
+    np.testing.assert_array_equal(neigh_ind, expected_ind)
+    np.testing.assert_array_almost_equal(
+        neigh_dist, np.take_along_axis(expected, expected_ind, axis=1)
+    )
+    np.testing.assert_array_equal(
+        knn.kneighbors(X_test, return_distance=False)[:, 0], expected_ind[:, 0]
+    )
+
+    # Callables and unequal length series are searched one pair at a time
+    knn = KNeighborsTimeSeriesClassifier(distance=distance, n_neighbors=4)
+    knn.fit(list(X_train), y_train)
+    neigh_dist, neigh_ind = knn.kneighbors(list(X_test))
+    np.testing.assert_array_equal(neigh_ind, expected_ind)
+    with pytest.raises(ValueError, match="n_neighbors must be between"):
+        knn.kneighbors(X_test, n_neighbors=len(X_train) + 1)
@@ -49,6 +49,10 @@ class HIVECOTEV1(BaseClassifier):
     cboss_params : dict or None, default=None
         Parameters for the ContractableBOSS module. If None, uses the default
         parameters.
+    memory : str, joblib.Memory or None, default=None
+        Used to cache the shapelet transforms of the STC component. If a string is
+        given, it is the path to the caching directory. If None, no caching is
+        performed.
     verbose : int, default=0
         Level of output printed to the console (for information only).
     random_state : int, RandomState instance or None, default=None
@@ -116,6 +120,7 @@ class HIVECOTEV1(BaseClassifier):
         tsf_params=None,
         rise_params=None,
         cboss_params=None,
+        memory=None,
         verbose=0,
         random_state=None,
         n_jobs=1,
@@ -125,6 +130,7 @@ class HIVECOTEV1(BaseClassifier):
         self.tsf_params = tsf_params
         self.rise_params = rise_params
         self.cboss_params = cboss_params
+        self.memory = memory
         self.verbose = verbose
         self.random_state = random_state
         self.n_jobs = n_jobs
@@ -189,6 +195,7 @@ class HIVECOTEV1(BaseClassifier):
         self._stc = ShapeletTransformClassifier(
             **self._stc_params,
             save_transformed_data=True,
+            memory=self.memory,
             random_state=self.random_state,
             n_jobs=self._n_jobs,
         )
@@ -7,9 +7,11 @@ representations, using the weighted probabilistic CAWPE as an ensemble controlle
 __author__ = ["MatthewMiddlehurst"]
 __all__ = ["HIVECOTEV2"]
 
-from datetime import datetime
+import math
+import time
 
 import numpy as np
+from joblib import Parallel, delayed
 from sklearn.metrics import accuracy_score
 from sklearn.utils import check_random_state
 
@@ -44,9 +46,19 @@ class HIVECOTEV2(BaseClassifier):
         Time contract to limit build time in minutes, overriding
         n_estimators/n_parameter_samples for each component.
         Default of 0 means n_estimators/n_parameter_samples for each component is used.
+        Two thirds of the contract are shared between fitting the components and the
+        rest is left for their train estimates. Each component is given a share of
+        the fitting time left when it starts, so time unused by components that
+        finish early goes to those that start after them.
     save_component_probas : bool, default=False
         When predict/predict_proba is called, save each HIVE-COTEV2 component
         probability predictions in component_probas.
+    memory : str, joblib.Memory or None, default=None
+        Used to cache the transforms of the STC, DrCIF and Arsenal components, unless
+        a memory is set in their parameters. If a string is given, it is the path to
+        the caching directory. Refitting with the same memory, for example on the
+        same train data with a different TDE configuration, loads the transforms
+        computed in previous fits. If None, no caching is performed.
     verbose : int, default=0
         Level of output printed to the console (for information only).
     random_state : int, RandomState instance or None, default=None
@@ -56,12 +68,13 @@ class HIVECOTEV2(BaseClassifier):
         by `np.random`.
     n_jobs : int, default=1
         The number of jobs to run in parallel for both `fit` and `predict`.
-        ``-1`` means using all processors.
+        ``-1`` means using all processors. In `fit` up to four components are fitted
+        concurrently, each with an equal share of the jobs.
     parallel_backend : str, ParallelBackendBase instance or None, default=None
-        Specify the parallelisation backend implementation in joblib for Catch22,
-        if None a 'prefer' value of "threads" is used by default.
-        Valid options are "loky", "multiprocessing", "threading" or a custom backend.
-        See the joblib Parallel documentation for more details.
+        Specify the parallelisation backend implementation in joblib used to fit the
+        components concurrently, if None the joblib default of "loky" worker
+        processes is used. Valid options are "loky", "multiprocessing", "threading"
+        or a custom backend. See the joblib Parallel documentation for more details.
 
     Attributes
     ----------
@@ -114,6 +127,7 @@ class HIVECOTEV2(BaseClassifier):
         tde_params=None,
         time_limit_in_minutes=0,
         save_component_probas=False,
+        memory=None,
         verbose=0,
         random_state=None,
         n_jobs=1,
@@ -125,6 +139,7 @@ class HIVECOTEV2(BaseClassifier):
         self.tde_params = tde_params
         self.time_limit_in_minutes = time_limit_in_minutes
         self.save_component_probas = save_component_probas
+        self.memory = memory
         self.verbose = verbose
         self.random_state = random_state
         self.n_jobs = n_jobs
@@ -191,110 +206,69 @@ class HIVECOTEV2(BaseClassifier):
                 "randomly_selected_params": HIVECOTEV2._DEFAULT_RAND_PARAMS,
             }
 
-        # If we are contracting split the contract time between each algorithm
-        if self.time_limit_in_minutes > 0:
-            # Leave 1/3 for train estimates
-            ct = self.time_limit_in_minutes / 6
-            self._stc_params["time_limit_in_minutes"] = ct
-            self._drcif_params["time_limit_in_minutes"] = ct
-            self._arsenal_params["time_limit_in_minutes"] = ct
-            self._tde_params["time_limit_in_minutes"] = ct
-
-        # Build STC
-        self._stc = ShapeletTransformClassifier(
-            **self._stc_params,
-            save_transformed_data=True,
-            random_state=self.random_state,
-            n_jobs=self._n_jobs,
-        )
-        self._stc.fit(X, y)
-
-        if self.verbose > 0:
-            print("STC ", datetime.now().strftime("%H:%M:%S %d/%m/%Y"))  # noqa
-
-        # Find STC weight using train set estimate
-        train_probs = self._stc._get_train_probs(X, y)
-        train_preds = self._stc.classes_[np.argmax(train_probs, axis=1)]
-        self.stc_weight_ = accuracy_score(y, train_preds) ** 4
-
-        if self.verbose > 0:
-            print(  # noqa
-                "STC train estimate ",
-                datetime.now().strftime("%H:%M:%S %d/%m/%Y"),
-            )
-            print("STC weight = " + str(self.stc_weight_))  # noqa
-
-        # Build DrCIF
-        self._drcif = DrCIFClassifier(
-            **self._drcif_params,
-            save_transformed_data=True,
-            random_state=self.random_state,
-            n_jobs=self._n_jobs,
-        )
-        self._drcif.fit(X, y)
-
-        if self.verbose > 0:
-            print("DrCIF ", datetime.now().strftime("%H:%M:%S %d/%m/%Y"))  # noqa
-
-        # Find DrCIF weight using train set estimate
-        train_probs = self._drcif._get_train_probs(X, y)
-        train_preds = self._drcif.classes_[np.argmax(train_probs, axis=1)]
-        self.drcif_weight_ = accuracy_score(y, train_preds) ** 4
-
-        if self.verbose > 0:
-            print(  # noqa
-                "DrCIF train estimate ",
-                datetime.now().strftime("%H:%M:%S %d/%m/%Y"),
-            )
-            print("DrCIF weight = " + str(self.drcif_weight_))  # noqa
-
-        # Build Arsenal
-        self._arsenal = Arsenal(
-            **self._arsenal_params,
-            save_transformed_data=True,
-            random_state=self.random_state,
-            n_jobs=self._n_jobs,
-        )
-        self._arsenal.fit(X, y)
-
-        if self.verbose > 0:
-            print("Arsenal ", datetime.now().strftime("%H:%M:%S %d/%m/%Y"))  # noqa
-
-        # Find Arsenal weight using train set estimate
-        train_probs = self._arsenal._get_train_probs(X, y)
-        train_preds = self._arsenal.classes_[np.argmax(train_probs, axis=1)]
-        self.arsenal_weight_ = accuracy_score(y, train_preds) ** 4
-
-        if self.verbose > 0:
-            print(  # noqa
-                "Arsenal train estimate ",
-                datetime.now().strftime("%H:%M:%S %d/%m/%Y"),
-            )
-            print("Arsenal weight = " + str(self.arsenal_weight_))  # noqa
-
-        # Build TDE
-        self._tde = TemporalDictionaryEnsemble(
-            **self._tde_params,
-            save_train_predictions=True,
-            random_state=self.random_state,
-            n_jobs=self._n_jobs,
-        )
-        self._tde.fit(X, y)
-
-        if self.verbose > 0:
-            print("TDE ", datetime.now().strftime("%H:%M:%S %d/%m/%Y"))  # noqa
-
-        # Find TDE weight using train set estimate
-        train_probs = self._tde._get_train_probs(X, y, train_estimate_method="loocv")
-        train_preds = self._tde.classes_[np.argmax(train_probs, axis=1)]
-        self.tde_weight_ = accuracy_score(y, train_preds) ** 4
-
-        if self.verbose > 0:
-            print(  # noqa
-                "TDE train estimate ",
-                datetime.now().strftime("%H:%M:%S %d/%m/%Y"),
-            )
-            print("TDE weight = " + str(self.tde_weight_))  # noqa
+        components = [
+            ("STC", ShapeletTransformClassifier, self._stc_params),
+            ("DrCIF", DrCIFClassifier, self._drcif_params),
+            ("Arsenal", Arsenal, self._arsenal_params),
+            ("TDE", TemporalDictionaryEnsemble, self._tde_params),
+        ]
+        n_workers = min(len(components), self._n_jobs)
+        # Share the jobs between the components fitted at the same time, the first
+        # components get the remainder
+        component_n_jobs = [
+            max(1, self._n_jobs // n_workers + (i < self._n_jobs % n_workers))
+            for i in range(len(components))
+        ]
+        # If we are contracting leave 1/3 for train estimates
+        fit_deadline = time.time() + self.time_limit_in_minutes * 60 * 2 / 3
+
+        def _component_jobs():
+            # joblib advances this generator when a worker is free, so each contract
+            # is set from the time left when the component starts
+            for i, (name, cls, params) in enumerate(components):
+                params = dict(params)
+                if self.time_limit_in_minutes > 0:
+                    # The components yet to start run in waves of n_workers
+                    waves = math.ceil((len(components) - i) / n_workers)
+                    params["time_limit_in_minutes"] = max(
+                        (fit_deadline - time.time()) / 60 / waves, 1e-3
+                    )
+                if name == "TDE":
+                    params["save_train_predictions"] = True
+                else:
+                    params["save_transformed_data"] = True
+                    params.setdefault("memory", self.memory)
+                estimator = cls(
+                    **params,
+                    random_state=self.random_state,
+                    n_jobs=component_n_jobs[i],
+                )
+                yield delayed(_fit_component)(estimator, X, y)
+
+        fitted = Parallel(
+            n_jobs=n_workers,
+            backend=self.parallel_backend,
+            pre_dispatch="n_jobs",
+            batch_size=1,
+        )(_component_jobs())
+        # The fitted components read n_jobs when they predict, so predict with all
+        # of the jobs
+        for estimator, _, _, _ in fitted:
+            estimator.n_jobs = self.n_jobs
+
+        self._stc, self.stc_weight_ = fitted[0][:2]
+        self._drcif, self.drcif_weight_ = fitted[1][:2]
+        self._arsenal, self.arsenal_weight_ = fitted[2][:2]
+        self._tde, self.tde_weight_ = fitted[3][:2]
+
+        for (name, _, _), (_, weight, fit_time, estimate_time) in zip(
+            components, fitted
+        ):
+            if self.verbose > 0:
+                print(  # noqa
+                    f"{name} fit in {fit_time:.2f}s, train estimate in "
+                    f"{estimate_time:.2f}s, weight = {weight}"
+                )
 
         return self
 
@@ -458,3 +432,18 @@ class HIVECOTEV2(BaseClassifier):
                     "randomly_selected_params": 1,
                 },
             }
+
+
+def _fit_component(estimator, X, y):
+    """Fit a HIVE-COTE 2.0 component and find its weight from a train estimate."""
+    start = time.time()
+    estimator.fit(X, y)
+    fit_time = time.time() - start
+
+    if isinstance(estimator, TemporalDictionaryEnsemble):
+        train_probs = estimator._get_train_probs(X, y, train_estimate_method="loocv")
+    else:
+        train_probs = estimator._get_train_probs(X, y)
+    train_preds = estimator.classes_[np.argmax(train_probs, axis=1)]
+    weight = accuracy_score(y, train_preds) ** 4
+    return estimator, weight, fit_time, time.time() - start - fit_time
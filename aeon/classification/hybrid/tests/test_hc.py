@@ -1,9 +1,10 @@
 """Tests for HC1."""
+import numpy as np
 import pytest
 
 from aeon.classification.hybrid import HIVECOTEV1, HIVECOTEV2
 from aeon.tests._config import PR_TESTING
-from aeon.utils._testing.collection import make_2d_test_data
+from aeon.utils._testing.collection import make_2d_test_data, make_3d_test_data
 
 
 @pytest.mark.skipif(PR_TESTING, reason="slow test, run overnight only")
@@ -54,3 +55,28 @@ def test_hc2():
     HIVECOTEV2._DEFAULT_N_PARA_SAMPLES = 250
     HIVECOTEV2._DEFAULT_MAX_ENSEMBLE_SIZE = 50
     HIVECOTEV2._DEFAULT_RAND_PARAMS = 50
+
+
+@pytest.mark.skipif(PR_TESTING, reason="slow test, run overnight only")
+def test_hc2_concurrent_components():
+    """Test HC2 fits the same components concurrently, and within a contract."""
+    X, y = make_3d_test_data(n_cases=20, n_timepoints=12, n_labels=2)
+    params = HIVECOTEV2.get_test_params()
+    hc2 = HIVECOTEV2(**params, random_state=0).fit(X, y)
+    hc2_concurrent = HIVECOTEV2(**params, random_state=0, n_jobs=4).fit(X, y)
+    # the components are fitted with a share of the jobs, and predict with all
+    for component in ["_stc", "_drcif", "_arsenal", "_tde"]:
+        assert getattr(hc2_concurrent, component).n_jobs == 4
+    assert hc2.tde_weight_ == hc2_concurrent.tde_weight_
+    np.testing.assert_array_equal(hc2.predict_proba(X), hc2_concurrent.predict_proba(X))
+    assert hc2_concurrent._stc._transformer.n_jobs == 4
+    assert hc2_concurrent._tde.estimators_[0].n_jobs == 4
+
+    hc2 = HIVECOTEV2(
+        **HIVECOTEV2.get_test_params(parameter_set="contracting"), n_jobs=2
+    )
+    hc2.time_limit_in_minutes = 0.1
+    hc2.fit(X, y)
+    assert 0 < hc2._stc.time_limit_in_minutes <= 0.1 * 2 / 3
+    assert hc2._stc_params["contract_max_n_shapelet_samples"] == 5
+    assert "time_limit_in_minutes" not in hc2._stc_params
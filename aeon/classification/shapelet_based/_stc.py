@@ -11,6 +11,7 @@ import numpy as np
 from sklearn.model_selection import cross_val_predict
 
 from aeon.base._base import _clone_estimator
+from aeon.base._transform_cache import _fit_transform_cached, _transform_cached
 from aeon.classification.base import BaseClassifier
 from aeon.classification.sklearn import RotationForestClassifier
 from aeon.transformations.collection.shapelet_based import RandomShapeletTransform
@@ -60,6 +61,11 @@ class ShapeletTransformClassifier(BaseClassifier):
     save_transformed_data : bool, default=False
         Save the data transformed in fit in ``transformed_data_`` for use in
         ``_get_train_probs``.
+    memory : str, joblib.Memory or None, default=None
+        Used to cache the shapelet transforms of ``fit`` and ``predict``. If a string
+        is given, it is the path to the caching directory. Only used if
+        ``random_state`` is set, as the shapelets are otherwise different for every
+        fit. If None, no caching is performed.
     n_jobs : int, default=1
         The number of jobs to run in parallel for both ``fit`` and ``predict``.
         `-1` means using all processors.
@@ -145,6 +151,7 @@ class ShapeletTransformClassifier(BaseClassifier):
         time_limit_in_minutes=0,
         contract_max_n_shapelet_samples=np.inf,
         save_transformed_data=False,
+        memory=None,
         n_jobs=1,
         batch_size=100,
         random_state=None,
@@ -158,6 +165,7 @@ class ShapeletTransformClassifier(BaseClassifier):
         self.time_limit_in_minutes = time_limit_in_minutes
         self.contract_max_n_shapelet_samples = contract_max_n_shapelet_samples
         self.save_transformed_data = save_transformed_data
+        self.memory = memory
 
         self.random_state = random_state
         self.batch_size = batch_size
@@ -233,7 +241,9 @@ class ShapeletTransformClassifier(BaseClassifier):
         if m is not None and self.time_limit_in_minutes > 0:
             self._estimator.time_limit_in_minutes = self._classifier_limit_in_minutes
 
-        X_t = self._transformer.fit_transform(X, y)
+        X_t, self._transformer = _fit_transform_cached(
+            self._transformer, X, y, memory=self.memory
+        )
 
         if self.save_transformed_data:
             self.transformed_data_ = X_t
@@ -255,7 +265,7 @@ class ShapeletTransformClassifier(BaseClassifier):
         y : array-like, shape = [n_instances]
             Predicted class labels.
         """
-        X_t = self._transformer.transform(X)
+        X_t = self._predict_transform(X)
 
         return self._estimator.predict(X_t)
 
@@ -272,7 +282,7 @@ class ShapeletTransformClassifier(BaseClassifier):
         y : array-like, shape = [n_instances, n_classes_]
             Predicted probabilities using the ordering in classes_.
         """
-        X_t = self._transformer.transform(X)
+        X_t = self._predict_transform(X)
 
         m = getattr(self._estimator, "predict_proba", None)
         if callable(m):
@@ -284,6 +294,16 @@ class ShapeletTransformClassifier(BaseClassifier):
                 dists[i, np.where(self.classes_ == preds[i])] = 1
             return dists
 
+    def _predict_transform(self, X):
+        # n_jobs may have changed since fit, the transformer and estimator predict
+        # with the current value
+        self._transformer.n_jobs = self._n_jobs
+        m = getattr(self._estimator, "n_jobs", None)
+        if m is not None:
+            self._estimator.n_jobs = self._n_jobs
+
+        return _transform_cached(self._transformer, X, memory=self.memory)
+
     def _get_train_probs(self, X, y) -> np.ndarray:
         self.check_is_fitted()
         X, y = check_X_y(X, y, coerce_to_pandas=True)
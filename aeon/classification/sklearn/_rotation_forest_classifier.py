@@ -317,7 +317,7 @@ class RotationForestClassifier(BaseEstimator):
         # normalise the data.
         X = (X - self._min) / self._ptp
 
-        y_probas = Parallel(n_jobs=self._n_jobs, prefer="threads")(
+        y_probas = Parallel(n_jobs=check_n_jobs(self.n_jobs), prefer="threads")(
             delayed(self._predict_proba_for_estimator)(
                 X,
                 self.estimators_[i],
@@ -5,6 +5,7 @@ __all__ = [
     "TimeSeriesCLARA",
     "TimeSeriesCLARANS",
     "TimeSeriesKMeans",
+    "TimeSeriesMiniBatchKMeans",
 ]
 __author__ = ["chrisholder", "TonyBagnall"]
 
@@ -13,3 +14,4 @@ from aeon.clustering.clara import TimeSeriesCLARA
 from aeon.clustering.clarans import TimeSeriesCLARANS
 from aeon.clustering.k_means import TimeSeriesKMeans
 from aeon.clustering.k_medoids import TimeSeriesKMedoids
+from aeon.clustering.mini_batch_k_means import TimeSeriesMiniBatchKMeans
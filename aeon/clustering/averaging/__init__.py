@@ -1,4 +1,12 @@
 """Time series averaging metrics."""
-__all__ = ["elastic_barycenter_average", "mean_average", "_resolve_average_callable"]
+__all__ = [
+    "elastic_barycenter_average",
+    "mean_average",
+    "subgradient_barycenter_average",
+    "_resolve_average_callable",
+]
 from aeon.clustering.averaging._averaging import _resolve_average_callable, mean_average
 from aeon.clustering.averaging._barycenter_averaging import elastic_barycenter_average
+from aeon.clustering.averaging._subgradient_averaging import (
+    subgradient_barycenter_average,
+)
@@ -6,6 +6,9 @@ from typing import Callable, Dict
 import numpy as np
 
 from aeon.clustering.averaging._barycenter_averaging import elastic_barycenter_average
+from aeon.clustering.averaging._subgradient_averaging import (
+    subgradient_barycenter_average,
+)
 
 
 def mean_average(X: np.ndarray, **kwargs) -> np.ndarray:
@@ -29,6 +32,7 @@ def mean_average(X: np.ndarray, **kwargs) -> np.ndarray:
 _AVERAGE_DICT = {
     "mean": mean_average,
     "ba": elastic_barycenter_average,
+    "subgradient": subgradient_barycenter_average,
 }
 
 
@@ -41,8 +45,8 @@ def _resolve_average_callable(
     ----------
     averaging_method: str or Callable, default='mean'
         Averaging method to compute the average of a cluster. Any of the following
-        strings are valid: ['mean']. If a Callable is provided must take the form
-        Callable[[np.ndarray], np.ndarray].
+        strings are valid: ['mean', 'ba', 'subgradient']. If a Callable is provided
+        must take the form Callable[[np.ndarray], np.ndarray].
 
     Returns
     -------
@@ -1,9 +1,9 @@
 __author__ = ["chrisholder"]
 
-from typing import Tuple
+from typing import Callable, Tuple
 
 import numpy as np
-from numba import njit
+from numba import config, njit, prange
 
 from aeon.distances import (
     adtw_alignment_path,
@@ -19,6 +19,16 @@ from aeon.distances import (
     wddtw_alignment_path,
     wdtw_alignment_path,
 )
+from aeon.distances._bounding_matrix import create_bounding_band
+from aeon.distances._ddtw import average_of_slope
+from aeon.distances._nearest_neighbors import _average_of_slope_3d
+from aeon.distances._utils import _run_with_n_jobs
+from aeon.utils.validation import check_n_jobs
+
+# Distances whose cost matrix is the DTW recursion, possibly on the derivatives, with
+# a weight on the squared distance or a penalty on warping steps. Their alignments
+# are computed in a reused buffer rather than through the alignment path functions.
+_DTW_FAMILY = ["dtw", "ddtw", "wdtw", "wddtw", "adtw"]
 
 
 def _medoids(
@@ -33,12 +43,7 @@ def _medoids(
     if precomputed_pairwise_distance is None:
         precomputed_pairwise_distance = pairwise_distance(X, metric=distance, **kwargs)
 
-    x_size = X.shape[0]
-    distance_matrix = np.zeros((x_size, x_size))
-    for j in range(x_size):
-        for k in range(x_size):
-            distance_matrix[j, k] = precomputed_pairwise_distance[j, k]
-    return X[np.argmin(sum(distance_matrix))]
+    return X[np.argmin(np.asarray(precomputed_pairwise_distance).sum(axis=0))]
 
 
 def elastic_barycenter_average(
@@ -48,12 +53,20 @@ def elastic_barycenter_average(
     tol=1e-5,
     precomputed_medoids_pairwise_distance: np.ndarray = None,
     verbose: bool = False,
+    weights: np.ndarray = None,
+    init_barycenter: np.ndarray = None,
+    n_jobs: int = 1,
     **kwargs,
 ) -> np.ndarray:
     """Compute the barycenter average of time series using a elastic distance.
 
     This implements an adapted version of 'petitjean' (original) DBA algorithm [1]_.
 
+    The alignments of each update are computed in parallel, each thread summing the
+    aligned points of its share of the time series. For the dtw, ddtw, wdtw, wddtw
+    and adtw distances the cost matrices are computed in a buffer allocated once per
+    thread, and the alignment paths are followed in place rather than built as lists.
+
     Parameters
     ----------
     X: np.ndarray, of shape (n_instances, n_channels, n_timepoints) or
@@ -76,6 +89,16 @@ def elastic_barycenter_average(
         Precomputed medoids pairwise.
     verbose: bool, default=False
         Boolean that controls the verbosity.
+    weights: np.ndarray of shape (n_instances,), default=None
+        Weight of each time series in the average. The aligned points of each time
+        series count ``weights[i]`` times in the update of the barycenter. If None,
+        all time series have a weight of 1.
+    init_barycenter: np.ndarray of shape (n_channels, n_timepoints), default=None
+        Barycenter to start the updates from. If None, the medoid of X is used.
+    n_jobs : int, default=1
+        The number of jobs to run in parallel. If -1, then the number of jobs is set
+        to the number of CPU cores. If 1, then the function is executed in a single
+        thread. If greater than 1, then the function is executed in parallel.
     **kwargs
         Keyword arguments to pass to the distance metric.
 
@@ -93,20 +116,34 @@ def elastic_barycenter_average(
     if len(X) <= 1:
         return X
 
-    # center = X.mean(axis=0)
-    center = _medoids(
-        X,
-        distance=distance,
-        precomputed_pairwise_distance=precomputed_medoids_pairwise_distance,
-        **kwargs,
-    )
+    if distance not in VALID_BA_METRICS and distance != "adtw":
+        raise ValueError("Metric parameter invalid")
+    if weights is None:
+        weights = np.ones(len(X))
+    else:
+        weights = np.asarray(weights, dtype=float)
+        if weights.shape != (len(X),):
+            raise ValueError(
+                f"weights must be of shape ({len(X)},), but found shape "
+                f"{weights.shape}"
+            )
 
+    if init_barycenter is None:
+        center = _medoids(
+            X,
+            distance=distance,
+            precomputed_pairwise_distance=precomputed_medoids_pairwise_distance,
+            **kwargs,
+        )
+    else:
+        center = np.array(init_barycenter, dtype=float)
+
+    alignment_sums = _alignment_sums_function(X, distance, n_jobs, **kwargs)
     cost_prev = np.inf
-    if distance == "wdtw" or distance == "wddtw":
-        if "g" not in kwargs:
-            kwargs["g"] = 0.05
     for i in range(max_iters):
-        center, cost = _ba_update(center, X, distance, **kwargs)
+        alignment, sum, cost = alignment_sums(center, weights)
+        center = _average_alignment(center, alignment, sum)
+        cost = cost / X.shape[2]
         if abs(cost_prev - cost) < tol:
             break
         elif cost_prev < cost:
@@ -119,6 +156,79 @@ def elastic_barycenter_average(
     return center
 
 
+def _alignment_sums_function(
+    X: np.ndarray, distance: str, n_jobs: int, **kwargs
+) -> Callable:
+    """Return a function summing the points of X aligned to each point of a center.
+
+    The returned function takes a center, the weights of the series and optionally
+    the indices of the series of X to align, and returns the weighted sum of the
+    points aligned to each point of the center, the weighted sum of the number of
+    points aligned to it and the weighted alignment cost.
+    """
+    if distance == "wdtw" or distance == "wddtw":
+        if "g" not in kwargs:
+            kwargs["g"] = 0.05
+    # Each thread sums the alignments of a chunk of the series
+    n_chunks = min(check_n_jobs(n_jobs), config.NUMBA_NUM_THREADS, len(X))
+
+    if distance not in _DTW_FAMILY:
+
+        def alignment_sums(center, weights, indices=None):
+            _X = X if indices is None else X[indices]
+            return _run_with_n_jobs(
+                n_jobs,
+                _ba_alignment_sums,
+                center,
+                _X,
+                weights,
+                n_chunks,
+                distance,
+                **kwargs,
+            )
+
+        return alignment_sums
+
+    # The derivatives of X, the band and the cost matrix buffers do not change
+    # between updates
+    derivative = distance == "ddtw" or distance == "wddtw"
+    X_path = _average_of_slope_3d(X) if derivative else X
+    path_length = X_path.shape[2]
+    starts, ends = create_bounding_band(
+        path_length,
+        path_length,
+        kwargs.get("window"),
+        kwargs.get("itakura_max_slope"),
+    )
+    if distance == "wdtw" or distance == "wddtw":
+        weight_vector = _wdtw_weight_vector(path_length, kwargs["g"])
+    else:
+        weight_vector = np.ones(path_length)
+    warp_penalty = kwargs.get("warp_penalty", 1.0) if distance == "adtw" else 0.0
+    cost_buffers = np.full((n_chunks, path_length + 1, path_length + 1), np.inf)
+
+    def alignment_sums(center, weights, indices=None):
+        center_path = average_of_slope(center) if derivative else center
+        _X = X if indices is None else X[indices]
+        _X_path = X_path if indices is None else X_path[indices]
+        return _run_with_n_jobs(
+            n_jobs,
+            _dtw_family_alignment_sums,
+            center,
+            center_path,
+            _X,
+            _X_path,
+            weights,
+            starts,
+            ends,
+            weight_vector,
+            warp_penalty,
+            cost_buffers,
+        )
+
+    return alignment_sums
+
+
 VALID_BA_METRICS = [
     "dtw",
     "ddtw",
@@ -132,10 +242,12 @@ VALID_BA_METRICS = [
 ]
 
 
-@njit(cache=True, fastmath=True)
-def _ba_update(
+@njit(cache=True, fastmath=True, parallel=True)
+def _ba_alignment_sums(
     center: np.ndarray,
     X: np.ndarray,
+    weights: np.ndarray,
+    n_chunks: int,
     distance: str = "dtw",
     window: float = None,
     g: float = 0.0,
@@ -147,46 +259,193 @@ def _ba_update(
     descriptor: str = "identity",
     reach: int = 30,
     warp_penalty: float = 1.0,
-) -> Tuple[np.ndarray, float]:
+) -> Tuple[np.ndarray, np.ndarray, float]:
     X_size, X_dims, X_timepoints = X.shape
-    sum = np.zeros(X_timepoints)
-    alignment = np.zeros((X_dims, X_timepoints))
-    cost = 0.0
-    for i in range(X_size):
-        curr_ts = X[i]
-        if distance == "dtw":
-            curr_alignment, _ = dtw_alignment_path(curr_ts, center, window)
-        elif distance == "ddtw":
-            curr_alignment, _ = ddtw_alignment_path(curr_ts, center, window)
-        elif distance == "wdtw":
-            curr_alignment, _ = wdtw_alignment_path(curr_ts, center, window, g)
-        elif distance == "wddtw":
-            curr_alignment, _ = wddtw_alignment_path(curr_ts, center, window, g)
-        elif distance == "erp":
-            curr_alignment, _ = erp_alignment_path(curr_ts, center, window, g)
-        elif distance == "edr":
-            curr_alignment, _ = edr_alignment_path(curr_ts, center, window, epsilon)
-        elif distance == "twe":
-            curr_alignment, _ = twe_alignment_path(curr_ts, center, window, nu, lmbda)
-        elif distance == "msm":
-            curr_alignment, _ = msm_alignment_path(
-                curr_ts, center, window, independent, c
+    # Each chunk of series has its own sums, added together at the end
+    sums = np.zeros((n_chunks, X_timepoints))
+    alignments = np.zeros((n_chunks, X_dims, X_timepoints))
+    costs = np.zeros(n_chunks)
+    for chunk in prange(n_chunks):
+        for i in range(chunk, X_size, n_chunks):
+            curr_ts = X[i]
+            if distance == "dtw":
+                curr_alignment, _ = dtw_alignment_path(curr_ts, center, window)
+            elif distance == "ddtw":
+                curr_alignment, _ = ddtw_alignment_path(curr_ts, center, window)
+            elif distance == "wdtw":
+                curr_alignment, _ = wdtw_alignment_path(curr_ts, center, window, g)
+            elif distance == "wddtw":
+                curr_alignment, _ = wddtw_alignment_path(curr_ts, center, window, g)
+            elif distance == "erp":
+                curr_alignment, _ = erp_alignment_path(curr_ts, center, window, g)
+            elif distance == "edr":
+                curr_alignment, _ = edr_alignment_path(curr_ts, center, window, epsilon)
+            elif distance == "twe":
+                curr_alignment, _ = twe_alignment_path(
+                    curr_ts, center, window, nu, lmbda
+                )
+            elif distance == "msm":
+                curr_alignment, _ = msm_alignment_path(
+                    curr_ts, center, window, independent, c
+                )
+            elif distance == "shape_dtw":
+                curr_alignment, _ = shape_dtw_alignment_path(
+                    curr_ts, center, window=window, descriptor=descriptor, reach=reach
+                )
+            else:
+                # The distance is checked before the update, a raise in the prange
+                # loop would stop it from running in parallel.
+                curr_alignment, _ = adtw_alignment_path(
+                    curr_ts, center, window=window, warp_penalty=warp_penalty
+                )
+            for j, k in curr_alignment:
+                alignments[chunk, :, k] += weights[i] * curr_ts[:, j]
+                sums[chunk, k] += weights[i]
+                costs[chunk] += weights[i] * squared_distance(
+                    curr_ts[:, j], center[:, k]
+                )
+
+    return _reduce_chunks(alignments, sums, costs)
+
+
+@njit(cache=True, parallel=True)
+def _dtw_family_alignment_sums(
+    center: np.ndarray,
+    center_path: np.ndarray,
+    X: np.ndarray,
+    X_path: np.ndarray,
+    weights: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    weight_vector: np.ndarray,
+    warp_penalty: float,
+    cost_buffers: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    # The alignment is found on X_path and center_path, the derivatives for ddtw and
+    # wddtw, and applied to X and center. No fastmath, as the buffers hold infinite
+    # costs outside the band.
+    X_size, X_dims, X_timepoints = X.shape
+    n_chunks = cost_buffers.shape[0]
+    sums = np.zeros((n_chunks, X_timepoints))
+    alignments = np.zeros((n_chunks, X_dims, X_timepoints))
+    costs = np.zeros(n_chunks)
+    for chunk in prange(n_chunks):
+        cost_matrix = cost_buffers[chunk]
+        for i in range(chunk, X_size, n_chunks):
+            _dtw_family_cost_matrix(
+                X_path[i],
+                center_path,
+                starts,
+                ends,
+                weight_vector,
+                warp_penalty,
+                cost_matrix,
             )
-        elif distance == "shape_dtw":
-            curr_alignment, _ = shape_dtw_alignment_path(
-                curr_ts, center, window=window, descriptor=descriptor, reach=reach
+            costs[chunk] += _accumulate_min_return_path(
+                cost_matrix,
+                X[i],
+                center,
+                weights[i],
+                alignments[chunk],
+                sums[chunk],
             )
-        elif distance == "adtw":
-            curr_alignment, _ = adtw_alignment_path(
-                curr_ts, center, window=window, warp_penalty=warp_penalty
+
+    return _reduce_chunks(alignments, sums, costs)
+
+
+@njit(cache=True)
+def _dtw_family_cost_matrix(
+    x: np.ndarray,
+    y: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    weight_vector: np.ndarray,
+    warp_penalty: float,
+    cost_matrix: np.ndarray,
+) -> None:
+    # Fills the cells in the band of cost_matrix, of shape (x_size + 1, y_size + 1),
+    # the cells outside it are left infinite.
+    cost_matrix[0, 0] = 0.0
+    for i in range(x.shape[1]):
+        for j in range(starts[i], ends[i]):
+            squared = 0.0
+            for c in range(x.shape[0]):
+                difference = x[c, i] - y[c, j]
+                squared += difference * difference
+            cost_matrix[i + 1, j + 1] = squared * weight_vector[abs(i - j)] + min(
+                cost_matrix[i, j + 1] + warp_penalty,
+                cost_matrix[i + 1, j] + warp_penalty,
+                cost_matrix[i, j],
             )
+
+
+@njit(cache=True)
+def _accumulate_min_return_path(
+    cost_matrix: np.ndarray,
+    x: np.ndarray,
+    center: np.ndarray,
+    weight: float,
+    alignment: np.ndarray,
+    sums: np.ndarray,
+) -> float:
+    # Follows the same path as compute_min_return_path on cost_matrix[1:, 1:], adding
+    # the aligned points of x to alignment rather than building a list of the path.
+    i = cost_matrix.shape[0] - 2
+    j = cost_matrix.shape[1] - 2
+    cost = 0.0
+    while True:
+        alignment[:, j] += weight * x[:, i]
+        sums[j] += weight
+        cost += weight * squared_distance(x[:, i], center[:, j])
+        if i == 0 and j == 0:
+            break
+        if i == 0:
+            j -= 1
+        elif j == 0:
+            i -= 1
         else:
-            # When numba version > 0.57 add more informative error with what metric
-            # was passed.
-            raise ValueError("Metric parameter invalid")
-        for j, k in curr_alignment:
-            alignment[:, k] += curr_ts[:, j]
-            sum[k] += 1
-            cost += squared_distance(curr_ts[:, j], center[:, k])
-
-    return alignment / sum, cost / X_timepoints
+            diagonal = cost_matrix[i, j]
+            up = cost_matrix[i, j + 1]
+            left = cost_matrix[i + 1, j]
+            if diagonal <= up and diagonal <= left:
+                i, j = i - 1, j - 1
+            elif up <= left:
+                i -= 1
+            else:
+                j -= 1
+    return cost
+
+
+@njit(cache=True, fastmath=True)
+def _reduce_chunks(
+    alignments: np.ndarray, sums: np.ndarray, costs: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    alignment = alignments[0].copy()
+    sum = sums[0].copy()
+    cost = costs[0]
+    for chunk in range(1, alignments.shape[0]):
+        alignment += alignments[chunk]
+        sum += sums[chunk]
+        cost += costs[chunk]
+    return alignment, sum, cost
+
+
+@njit(cache=True, fastmath=True)
+def _average_alignment(
+    center: np.ndarray, alignment: np.ndarray, sum: np.ndarray
+) -> np.ndarray:
+    new_center = center.copy()
+    for k in range(center.shape[1]):
+        # The last two points are not aligned by the derivative distances, they keep
+        # their value rather than becoming nan.
+        if sum[k] > 0:
+            new_center[:, k] = alignment[:, k] / sum[k]
+    return new_center
+
+
+@njit(cache=True, fastmath=True)
+def _wdtw_weight_vector(n_timepoints: int, g: float) -> np.ndarray:
+    # The weights of _wdtw_cost_matrix for series of n_timepoints
+    return np.array(
+        [1 / (1 + np.exp(-g * (i - n_timepoints / 2))) for i in range(0, n_timepoints)]
+    )
@@ -0,0 +1,142 @@
+"""Stochastic subgradient barycenter averaging."""
+
+from typing import Union
+
+import numpy as np
+from numpy.random import RandomState
+from sklearn.utils import check_random_state
+
+from aeon.clustering.averaging._barycenter_averaging import (
+    VALID_BA_METRICS,
+    _alignment_sums_function,
+)
+
+
+def subgradient_barycenter_average(
+    X: np.ndarray,
+    distance: str = "dtw",
+    max_iters: int = 30,
+    tol=1e-5,
+    batch_size: int = 1,
+    initial_step_size: float = 0.05,
+    final_step_size: float = 0.005,
+    init_barycenter: np.ndarray = None,
+    random_state: Union[int, RandomState] = None,
+    verbose: bool = False,
+    n_jobs: int = 1,
+    **kwargs,
+) -> np.ndarray:
+    """Compute the barycenter average of time series with stochastic subgradients.
+
+    This implements the stochastic subgradient (SSG) method of Schultz and Jain [1]_,
+    with mini-batches. Where DBA [2]_ aligns every time series to the barycenter in
+    each update, SSG moves the barycenter after each random batch of ``batch_size``
+    time series along the subgradient of their mean squared distance to it. The step
+    size decreases linearly from ``initial_step_size`` to ``final_step_size`` over
+    the passes over X. For large collections far fewer passes over X are needed than
+    DBA updates, and the barycenter is not initialised from the medoid of X, which
+    needs all the pairwise distances.
+
+    Parameters
+    ----------
+    X: np.ndarray, of shape (n_instances, n_channels, n_timepoints) or
+            (n_instances, n_timepoints)
+        A collection of time series instances to take the average from.
+    distance: str, default='dtw'
+        String defining the distance to use for averaging. Distance to
+        compute similarity between time series. A list of valid strings for metrics
+        can be found in the documentation form
+        :func:`aeon.distances.get_distance_function`.
+    max_iters: int, default=30
+        Maximum number of passes over X.
+    tol : float (default: 1e-5)
+        Tolerance to use for early stopping: if the change in the cost of a pass
+        over X is lower than this value, the updates stop.
+    batch_size: int, default=1
+        Number of time series used to compute each subgradient. Larger batches give
+        less noisy updates and are aligned in parallel with ``n_jobs`` threads.
+    initial_step_size: float, default=0.05
+        Step size of the first pass over X.
+    final_step_size: float, default=0.005
+        Step size of the last pass over X.
+    init_barycenter: np.ndarray of shape (n_channels, n_timepoints), default=None
+        Barycenter to start the updates from. If None, a random time series of X is
+        used.
+    random_state : int or np.random.RandomState instance or None, default=None
+        Determines the random initial barycenter and the order of the time series.
+    verbose: bool, default=False
+        Boolean that controls the verbosity.
+    n_jobs : int, default=1
+        The number of jobs to run in parallel. If -1, then the number of jobs is set
+        to the number of CPU cores. If 1, then the function is executed in a single
+        thread. If greater than 1, then the function is executed in parallel.
+    **kwargs
+        Keyword arguments to pass to the distance metric.
+
+    Returns
+    -------
+    np.ndarray of shape (n_channels, n_timepoints)
+        Time series that is the average of the collection of instances provided.
+
+    Raises
+    ------
+    ValueError
+        If distance is not a valid barycenter averaging distance.
+        If batch_size is less than 1.
+
+    References
+    ----------
+    .. [1] D. Schultz & B. Jain. Nonsmooth analysis and subgradient methods for
+       averaging in dynamic time warping spaces. Pattern Recognition, 2018, Vol. 74,
+       pp. 340-358.
+    .. [2] F. Petitjean, A. Ketterlin & P. Gancarski. A global averaging method
+       for dynamic time warping, with applications to clustering. Pattern
+       Recognition, Elsevier, 2011, Vol. 44, Num. 3, pp. 678-693
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.clustering.averaging import subgradient_barycenter_average
+    >>> X = np.random.RandomState(0).random_sample(size=(20, 1, 10))
+    >>> subgradient_barycenter_average(X, random_state=0).shape
+    (1, 10)
+    """
+    if len(X) <= 1:
+        return X
+
+    if distance not in VALID_BA_METRICS and distance != "adtw":
+        raise ValueError("Metric parameter invalid")
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, but found {batch_size}")
+    if X.ndim == 2:
+        X = X.reshape((X.shape[0], 1, X.shape[1]))
+    rng = check_random_state(random_state)
+
+    if init_barycenter is None:
+        center = X[rng.randint(len(X))].astype(float)
+    else:
+        center = np.array(init_barycenter, dtype=float)
+
+    alignment_sums = _alignment_sums_function(X, distance, n_jobs, **kwargs)
+    step_sizes = np.linspace(initial_step_size, final_step_size, max_iters)
+    cost_prev = np.inf
+    for i in range(max_iters):
+        cost = 0.0
+        order = rng.permutation(len(X))
+        for start in range(0, len(X), batch_size):
+            batch = order[start : start + batch_size]
+            alignment, sum, batch_cost = alignment_sums(
+                center, np.ones(len(batch)), batch
+            )
+            # Subgradient of the mean squared distance of the batch to the center
+            subgradient = 2 * (sum * center - alignment) / len(batch)
+            center = center - step_sizes[i] * subgradient
+            cost += batch_cost
+        cost = cost / X.shape[2]
+        if abs(cost_prev - cost) < tol:
+            break
+        cost_prev = cost
+
+        if verbose:
+            print(f"[SSG aeon] epoch {i}, cost {cost}")  # noqa: T001, T201
+    return center
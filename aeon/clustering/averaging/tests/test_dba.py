@@ -1,7 +1,14 @@
 """Tests for DBA."""
 import numpy as np
+import pytest
 
 from aeon.clustering.averaging import elastic_barycenter_average
+from aeon.clustering.averaging._barycenter_averaging import (
+    _ba_alignment_sums,
+    _dtw_family_alignment_sums,
+    _wdtw_weight_vector,
+)
+from aeon.distances import create_bounding_band
 from aeon.distances.tests._utils import create_test_distance_numpy
 
 expected_dba = np.array(
@@ -163,3 +170,70 @@ def test_elastic_dba_variations():
 
         assert isinstance(average_ts, np.ndarray)
         assert average_ts.shape == X_train[0].shape
+
+
+def test_weighted_dba():
+    """Test weights and the initial barycenter of elastic barycenter averaging."""
+    X_train = create_test_distance_numpy(10, 2, 10)
+
+    # Integer weights are the same as repeating the series
+    weights = np.array([1, 2, 1, 3, 1, 1, 2, 1, 1, 1])
+    init = X_train[0]
+    np.testing.assert_array_almost_equal(
+        elastic_barycenter_average(X_train, weights=weights, init_barycenter=init),
+        elastic_barycenter_average(
+            np.repeat(X_train, weights, axis=0), init_barycenter=init
+        ),
+    )
+    # A series with a weight of zero has no effect on the average
+    np.testing.assert_array_almost_equal(
+        elastic_barycenter_average(
+            X_train, weights=np.append(np.zeros(1), np.ones(9)), init_barycenter=init
+        ),
+        elastic_barycenter_average(X_train[1:], init_barycenter=init),
+    )
+    with pytest.raises(ValueError, match="weights must be of shape"):
+        elastic_barycenter_average(X_train, weights=np.ones(3))
+
+
+@pytest.mark.parametrize("distance", ["dtw", "wdtw", "adtw"])
+@pytest.mark.parametrize("window", [None, 0.2])
+def test_dtw_family_ba_update(distance, window):
+    """Test the buffered alignments of the DTW family match the alignment paths."""
+    X = create_test_distance_numpy(10, 2, 15, random_state=2).cumsum(axis=-1)
+    weights = np.arange(1, 11, dtype=float)
+    center = X[0]
+    kwargs = {"window": window, "g": 0.05, "warp_penalty": 1.0}
+    starts, ends = create_bounding_band(15, 15, window)
+    if distance == "wdtw":
+        weight_vector = _wdtw_weight_vector(15, 0.05)
+    else:
+        weight_vector = np.ones(15)
+    expected = _ba_alignment_sums(center, X, weights, 1, distance, **kwargs)
+    for n_chunks in [1, 3]:
+        alignment, sum, cost = _dtw_family_alignment_sums(
+            center,
+            center,
+            X,
+            X,
+            weights,
+            starts,
+            ends,
+            weight_vector,
+            1.0 if distance == "adtw" else 0.0,
+            np.full((n_chunks, 16, 16), np.inf),
+        )
+        np.testing.assert_array_almost_equal(alignment, expected[0])
+        np.testing.assert_array_almost_equal(sum, expected[1])
+        assert np.isclose(cost, expected[2])
+
+
+def test_derivative_dba():
+    """Test the points not aligned by derivative distances keep their value."""
+    X = create_test_distance_numpy(10, 2, 15, random_state=2)
+    for distance in ["ddtw", "wddtw"]:
+        average_ts = elastic_barycenter_average(
+            X, distance=distance, init_barycenter=X[0]
+        )
+        assert not np.any(np.isnan(average_ts))
+        np.testing.assert_array_equal(average_ts[:, -2:], X[0, :, -2:])
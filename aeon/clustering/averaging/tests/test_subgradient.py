@@ -0,0 +1,98 @@
+"""Tests for stochastic subgradient barycenter averaging."""
+import numpy as np
+import pytest
+
+from aeon.clustering import TimeSeriesKMeans
+from aeon.clustering.averaging import (
+    elastic_barycenter_average,
+    subgradient_barycenter_average,
+)
+from aeon.distances import dtw_distance
+
+
+def _shifted_sines(n_instances, random_state=0):
+    rng = np.random.RandomState(random_state)
+    t = np.linspace(0, 6, 40)
+    return np.array(
+        [
+            np.sin(t + rng.uniform(-0.5, 0.5))[np.newaxis] + rng.randn(1, 40) * 0.1
+            for _ in range(n_instances)
+        ]
+    )
+
+
+@pytest.mark.parametrize("batch_size", [1, 8])
+def test_subgradient_barycenter_average(batch_size):
+    """Test the subgradient barycenter is as close to the series as DBA."""
+    X = _shifted_sines(60)
+
+    def mean_distance(center):
+        return np.mean([dtw_distance(x, center) for x in X])
+
+    average_ts = subgradient_barycenter_average(
+        X, batch_size=batch_size, random_state=1
+    )
+    assert average_ts.shape == X[0].shape
+    assert mean_distance(average_ts) < 1.05 * mean_distance(
+        elastic_barycenter_average(X)
+    )
+    assert mean_distance(average_ts) < mean_distance(X.mean(axis=0))
+    np.testing.assert_array_equal(
+        average_ts,
+        subgradient_barycenter_average(X, batch_size=batch_size, random_state=1),
+    )
+
+
+def test_subgradient_kmeans():
+    """Test k-means with subgradient averaging is reproducible."""
+    X = np.concatenate([_shifted_sines(10, 0), _shifted_sines(10, 1) + 3])
+    average_params = {"max_iters": 5}
+    kmeans = [
+        TimeSeriesKMeans(
+            n_clusters=2,
+            distance="dtw",
+            averaging_method="subgradient",
+            average_params=average_params,
+            n_init=1,
+            random_state=0,
+        ).fit(X)
+        for _ in range(2)
+    ]
+    assert average_params == {"max_iters": 5}
+    labels = kmeans[0].labels_
+    assert len(np.unique(labels[:10])) == 1 and len(np.unique(labels[10:])) == 1
+    assert labels[0] != labels[10]
+    np.testing.assert_array_equal(
+        kmeans[0].cluster_centers_, kmeans[1].cluster_centers_
+    )
+
+
+def test_subgradient_kmeans_n_jobs():
+    """Test k-means with subgradient averaging does not depend on n_jobs."""
+    X = np.concatenate([_shifted_sines(10, i) + 2 * i for i in range(3)])
+    kmeans = [
+        TimeSeriesKMeans(
+            n_clusters=3,
+            distance="dtw",
+            averaging_method="subgradient",
+            average_params={"max_iters": 5},
+            n_init=4,
+            random_state=0,
+            n_jobs=n_jobs,
+        ).fit(X)
+        for n_jobs in [1, 2]
+    ]
+    assert kmeans[0].inertia_ == kmeans[1].inertia_
+    np.testing.assert_array_equal(kmeans[0].labels_, kmeans[1].labels_)
+    np.testing.assert_array_equal(
+        kmeans[0].cluster_centers_, kmeans[1].cluster_centers_
+    )
+
+
+def test_subgradient_errors():
+    """Test the errors raised by subgradient barycenter averaging."""
+    X = _shifted_sines(5)
+    with pytest.raises(ValueError, match="batch_size must be"):
+        subgradient_barycenter_average(X, batch_size=0)
+    with pytest.raises(ValueError, match="Metric parameter invalid"):
+        subgradient_barycenter_average(X, distance="euclidean")
@@ -98,6 +98,11 @@ class TimeSeriesCLARANS(TimeSeriesKMedoids):
     Data (AALTD 2023).
     """
 
+    _tags = {
+        "capability:multivariate": True,
+        "capability:multithreading": False,
+    }
+
     def __init__(
         self,
         n_clusters: int = 8,
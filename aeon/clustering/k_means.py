@@ -4,13 +4,21 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import Callable, Union
 
 import numpy as np
+from joblib import Parallel, delayed
 from numpy.random import RandomState
 from sklearn.utils import check_random_state
 
 from aeon.clustering.averaging import _resolve_average_callable
 from aeon.clustering.averaging._barycenter_averaging import VALID_BA_METRICS
 from aeon.clustering.base import BaseClusterer
-from aeon.distances import pairwise_distance
+from aeon.distances import get_distance_function, nearest_neighbors, pairwise_distance
+
+# Metrics that satisfy the triangle inequality when the warping is not constrained,
+# so the distances to the centres can be bounded as the centres move.
+_TRIANGLE_METRICS = ["msm", "twe", "erp"]
+# Metrics with lower bounds to prune the search for the closest centre. The lock-step
+# distances are cheap enough that all distances to the centres are computed.
+_LOWER_BOUND_METRICS = ["dtw", "ddtw", "adtw"]
 
 
 class EmptyClusterError(Exception):
@@ -35,6 +43,13 @@ class TimeSeriesKMeans(BaseClusterer):
     ShapeDBA [4]_ (Shape DTW DBA) and MBA (Msm DBA) [5]_ have shown signicant
     performance benefits.
 
+    The assignment of series to centres avoids most distance computations when the
+    distance allows it. For the independent msm, twe and erp distances without a
+    window, which satisfy the triangle inequality, bounds on the distances to the
+    centres are kept between iterations as in Elkan's k-means [6]_. For the dtw, ddtw
+    and adtw distances the closest centre is found with lower bounds and early
+    abandoning, see :func:`aeon.distances.nearest_neighbors`.
+
     Parameters
     ----------
     n_clusters : int, default=8
@@ -72,12 +87,16 @@ class TimeSeriesKMeans(BaseClusterer):
         Determines random number generation for centroid initialization.
     averaging_method : str or Callable, default='mean'
         Averaging method to compute the average of a cluster. Any of the following
-        strings are valid: ['mean', 'ba']. If a Callable is provided must take the form
-        Callable[[np.ndarray], np.ndarray].
-        If you specify 'ba' then by default the distance measure used will be the same
-        as the distance measure used for clustering. If you wish to use a different
-        distance measure you can specify it by passing {"distance": "dtw"} as
-        averaging_params.
+        strings are valid: ['mean', 'ba', 'subgradient']. If a Callable is provided
+        must take the form Callable[[np.ndarray], np.ndarray].
+        'subgradient' is a stochastic subgradient barycenter average, see
+        :func:`aeon.clustering.averaging.subgradient_barycenter_average`, which is
+        faster than 'ba' for large clusters. It uses random_state unless one is
+        passed in average_params.
+        If you specify 'ba' or 'subgradient' then by default the distance measure used
+        will be the same as the distance measure used for clustering. If you wish to
+        use a different distance measure you can specify it by passing
+        {"distance": "dtw"} as averaging_params.
     average_params : dict, default=None
         Dictionary containing kwargs for averaging_method. See documentation of
         aeon.clustering.averaging and aeon.distances for more details. NOTE: if you
@@ -90,6 +109,21 @@ class TimeSeriesKMeans(BaseClusterer):
         wanted to specify a window for DTW you would pass
         distance_params={"window": 0.2}. See documentation of aeon.distances for more
         details.
+    n_jobs : int, default=1
+        The number of jobs to run the ``n_init`` restarts in parallel.
+        ``-1`` means using all processors.
+    parallel_backend : str, ParallelBackendBase instance or None, default=None
+        Specify the parallelisation backend implementation in joblib, if None the
+        joblib default "loky" is used, which runs the restarts in separate processes
+        and shares X with them as a read-only memory map. Valid options are "loky",
+        "multiprocessing", "threading" or a custom backend. See the joblib Parallel
+        documentation for more details.
+    early_abandon_iter : int or None, default=None
+        If not None, a restart is abandoned once it has run ``early_abandon_iter``
+        iterations and its inertia is greater than the best inertia of the restarts
+        already finished. With ``n_jobs`` greater than 1, the restarts are run in
+        batches of ``n_jobs`` and are compared to the best inertia of the previous
+        batches. If None, all restarts are run to convergence.
 
     Attributes
     ----------
@@ -130,6 +164,10 @@ class TimeSeriesKMeans(BaseClusterer):
     ..[5] Lloyd, S. P. (1982). Least squares quantization in pcm. IEEE Trans. Inf.
     Theory, 28:129–136.
 
+    .. [6] Elkan, C. (2003). Using the triangle inequality to accelerate k-means. In
+    proceedings of the 20th International Conference on Machine Learning
+    (pp. 147-153).
+
     Examples
     --------
     >>> import numpy as np
@@ -143,6 +181,7 @@ class TimeSeriesKMeans(BaseClusterer):
 
     _tags = {
         "capability:multivariate": True,
+        "capability:multithreading": True,
     }
 
     def __init__(
@@ -158,6 +197,9 @@ class TimeSeriesKMeans(BaseClusterer):
         averaging_method: Union[str, Callable[[np.ndarray], np.ndarray]] = "ba",
         distance_params: dict = None,
         average_params: dict = None,
+        n_jobs: int = 1,
+        parallel_backend=None,
+        early_abandon_iter: int = None,
     ):
         self.init_algorithm = init_algorithm
         self.distance = distance
@@ -169,6 +211,9 @@ class TimeSeriesKMeans(BaseClusterer):
         self.distance_params = distance_params
         self.average_params = average_params
         self.averaging_method = averaging_method
+        self.n_jobs = n_jobs
+        self.parallel_backend = parallel_backend
+        self.early_abandon_iter = early_abandon_iter
 
         self.cluster_centers_ = None
         self.labels_ = None
@@ -180,28 +225,54 @@ class TimeSeriesKMeans(BaseClusterer):
         self._fit_method = None
         self._averaging_method = None
         self._average_params = None
+        self._bounded_assignment = False
 
         super(TimeSeriesKMeans, self).__init__(n_clusters)
 
     def _fit(self, X: np.ndarray, y=None):
         self._check_params(X)
 
+        # The initial centres are drawn before the restarts are dispatched, so the
+        # restarts do not share the random state and the result does not depend on
+        # n_jobs.
+        initial_centres = [self._initial_centres(X) for _ in range(self.n_init)]
+        # As are the seeds of the random states of the subgradient averages, one
+        # for each restart.
+        average_seeds = [None] * self.n_init
+        if (
+            self.averaging_method == "subgradient"
+            and "random_state" not in self._average_params
+        ):
+            average_seeds = self._random_state.randint(
+                np.iinfo(np.int32).max, size=self.n_init
+            )
+        batch_size = self.n_init
+        if self.early_abandon_iter is not None:
+            batch_size = self._n_jobs
+
         best_centers = None
         best_inertia = np.inf
         best_labels = None
         best_iters = self.max_iter
 
-        for _ in range(self.n_init):
-            try:
-                labels, centers, inertia, n_iters = self._fit_one_init(X)
-                if inertia < best_inertia:
-                    best_centers = centers
-                    best_labels = labels
-                    best_inertia = inertia
-                    best_iters = n_iters
-            except EmptyClusterError:
-                if self.verbose:
-                    print("Resumed because of empty cluster")  # noqa: T001, T201
+        with Parallel(n_jobs=self._n_jobs, backend=self.parallel_backend) as parallel:
+            for i in range(0, self.n_init, batch_size):
+                results = parallel(
+                    delayed(self._fit_restart)(X, centres, best_inertia, seed)
+                    for centres, seed in zip(
+                        initial_centres[i : i + batch_size],
+                        average_seeds[i : i + batch_size],
+                    )
+                )
+                for result in results:
+                    if result is None:
+                        continue
+                    labels, centers, inertia, n_iters = result
+                    if inertia < best_inertia:
+                        best_centers = centers
+                        best_labels = labels
+                        best_inertia = inertia
+                        best_iters = n_iters
 
         if best_labels is None:
             self._is_fitted = False
@@ -217,19 +288,50 @@ class TimeSeriesKMeans(BaseClusterer):
         self.cluster_centers_ = best_centers
         self.n_iter_ = best_iters
 
-    def _fit_one_init(self, X: np.ndarray) -> tuple:
+    def _initial_centres(self, X: np.ndarray) -> np.ndarray:
         if isinstance(self._init_algorithm, Callable):
-            cluster_centres = self._init_algorithm(X)
-        else:
-            cluster_centres = self._init_algorithm
+            return self._init_algorithm(X)
+        # The centres are updated in place, so each restart needs its own copy
+        return self._init_algorithm.copy()
+
+    def _fit_restart(
+        self,
+        X: np.ndarray,
+        cluster_centres: np.ndarray,
+        best_inertia: float,
+        average_seed: int = None,
+    ):
+        average_params = self._average_params
+        if average_seed is not None:
+            # Each average of the restart draws new batches from its random state
+            average_params = {
+                **average_params,
+                "random_state": np.random.RandomState(average_seed),
+            }
+        try:
+            return self._fit_one_init(X, cluster_centres, best_inertia, average_params)
+        except EmptyClusterError:
+            if self.verbose:
+                print("Resumed because of empty cluster")  # noqa: T001, T201
+            return None
+
+    def _fit_one_init(
+        self,
+        X: np.ndarray,
+        cluster_centres: np.ndarray,
+        best_inertia: float = np.inf,
+        average_params: dict = None,
+    ) -> tuple:
+        if average_params is None:
+            average_params = self._average_params
         prev_inertia = np.inf
         prev_labels = None
+        lower_bounds = None
         for i in range(self.max_iter):
-            curr_pw = pairwise_distance(
-                X, cluster_centres, metric=self.distance, **self._distance_params
+            curr_labels, curr_distances, lower_bounds = self._assign_clusters(
+                X, cluster_centres, prev_labels, lower_bounds
             )
-            curr_labels = curr_pw.argmin(axis=1)
-            curr_inertia = curr_pw.min(axis=1).sum()
+            curr_inertia = curr_distances.sum()
 
             if np.unique(curr_labels).size < self.n_clusters:
                 raise EmptyClusterError
@@ -237,6 +339,18 @@ class TimeSeriesKMeans(BaseClusterer):
             if self.verbose:
                 print("%.3f" % curr_inertia, end=" --> ")  # noqa: T001, T201
 
+            if (
+                self.early_abandon_iter is not None
+                and i >= self.early_abandon_iter
+                and curr_inertia > best_inertia
+            ):
+                if self.verbose:
+                    print(  # noqa: T001, T201
+                        f"Abandoned at iteration {i}, inertia {curr_inertia} is "
+                        f"greater than the best inertia {best_inertia}."
+                    )
+                return None
+
             change_in_centres = np.abs(prev_inertia - curr_inertia)
             prev_inertia = curr_inertia
             prev_labels = curr_labels
@@ -245,9 +359,14 @@ class TimeSeriesKMeans(BaseClusterer):
                 break
 
             # Compute new cluster centres
+            prev_centres = cluster_centres.copy()
             for j in range(self.n_clusters):
                 cluster_centres[j] = self._averaging_method(
-                    X[curr_labels == j], **self._average_params
+                    X[curr_labels == j], **average_params
+                )
+            if lower_bounds is not None:
+                lower_bounds = self._move_lower_bounds(
+                    prev_centres, cluster_centres, lower_bounds
                 )
 
             if self.verbose is True:
@@ -260,17 +379,124 @@ class TimeSeriesKMeans(BaseClusterer):
 
     def _predict(self, X: np.ndarray, y=None) -> np.ndarray:
         if isinstance(self.distance, str):
-            pairwise_matrix = pairwise_distance(
+            # Only the closest centre is needed, so most distances can be pruned
+            return nearest_neighbors(
                 X, self.cluster_centers_, metric=self.distance, **self._distance_params
+            )[1][:, 0]
+        pairwise_matrix = pairwise_distance(
+            X,
+            self.cluster_centers_,
+            metric=self.distance,
+            **self._distance_params,
+        )
+        return pairwise_matrix.argmin(axis=1)
+
+    def _assign_clusters(
+        self,
+        X: np.ndarray,
+        cluster_centres: np.ndarray,
+        prev_labels: np.ndarray,
+        lower_bounds: np.ndarray,
+    ) -> tuple:
+        """Assign each series to its closest centre.
+
+        For the metrics in ``_TRIANGLE_METRICS`` the assignment follows Elkan. Each
+        series keeps a lower bound on its distance to each centre, lowered by the
+        distance the centre moves in each iteration. The distance of a series to
+        its own centre is always computed, so the inertia is exact, but the distance
+        to another centre is only computed if it is greater than the lower bound for
+        that centre and than half the distance between the two centres. For the
+        metrics with lower bounds, such as DTW, the closest centre is found with
+        :func:`aeon.distances.nearest_neighbors`.
+
+        Returns
+        -------
+        labels : np.ndarray of shape (n_instances,)
+            Index of the closest centre of each series.
+        distances : np.ndarray of shape (n_instances,)
+            Distance of each series to its closest centre.
+        lower_bounds : np.ndarray of shape (n_instances, n_clusters) or None
+            Lower bounds on the distance of each series to each centre, None if the
+            metric does not use bounds.
+        """
+        if self._bounded_assignment:
+            if prev_labels is None:
+                pairwise_matrix = pairwise_distance(
+                    X, cluster_centres, metric=self.distance, **self._distance_params
+                )
+                return (
+                    pairwise_matrix.argmin(axis=1),
+                    pairwise_matrix.min(axis=1),
+                    pairwise_matrix,
+                )
+            labels = prev_labels.copy()
+            distances = np.zeros(X.shape[0])
+            for j in range(self.n_clusters):
+                in_cluster = labels == j
+                distances[in_cluster] = self._distances_to_centre(
+                    X[in_cluster], cluster_centres[j]
+                )
+            lower_bounds[np.arange(X.shape[0]), labels] = distances
+
+            # A centre c can only be closer to x than its own centre a if
+            # d(a, c) < 2 * d(x, a), by the triangle inequality.
+            half_centre_distances = (
+                pairwise_distance(
+                    cluster_centres, metric=self.distance, **self._distance_params
+                )
+                / 2
             )
-        else:
-            pairwise_matrix = pairwise_distance(
-                X,
-                self.cluster_centers_,
-                metric=self.distance,
-                **self._distance_params,
+            np.fill_diagonal(half_centre_distances, np.inf)
+            to_check = distances > half_centre_distances.min(axis=1)[labels]
+            for j in range(self.n_clusters):
+                check = (
+                    to_check
+                    & (labels != j)
+                    & (distances > lower_bounds[:, j])
+                    & (distances > half_centre_distances[labels, j])
+                )
+                if not np.any(check):
+                    continue
+                check = np.where(check)[0]
+                centre_distances = self._distances_to_centre(
+                    X[check], cluster_centres[j]
+                )
+                lower_bounds[check, j] = centre_distances
+                closer = centre_distances < distances[check]
+                labels[check[closer]] = j
+                distances[check[closer]] = centre_distances[closer]
+            return labels, distances, lower_bounds
+        if isinstance(self.distance, str) and self.distance in _LOWER_BOUND_METRICS:
+            distances, indices = nearest_neighbors(
+                X, cluster_centres, metric=self.distance, **self._distance_params
             )
-        return pairwise_matrix.argmin(axis=1)
+            return indices[:, 0], distances[:, 0], None
+        pairwise_matrix = pairwise_distance(
+            X, cluster_centres, metric=self.distance, **self._distance_params
+        )
+        return pairwise_matrix.argmin(axis=1), pairwise_matrix.min(axis=1), None
+
+    def _distances_to_centre(self, X: np.ndarray, centre: np.ndarray) -> np.ndarray:
+        return pairwise_distance(
+            X, centre[np.newaxis], metric=self.distance, **self._distance_params
+        )[:, 0]
+
+    def _move_lower_bounds(
+        self,
+        prev_centres: np.ndarray,
+        cluster_centres: np.ndarray,
+        lower_bounds: np.ndarray,
+    ) -> np.ndarray:
+        # By the triangle inequality, the distance of a series to a centre falls by
+        # at most the distance the centre moved.
+        distance_function = get_distance_function(self.distance)
+        shifts = np.array(
+            [
+                distance_function(prev, curr, **self._distance_params)
+                for prev, curr in zip(prev_centres, cluster_centres)
+            ]
+        )
+        return np.maximum(lower_bounds - shifts, 0)
 
     def _check_params(self, X: np.ndarray) -> None:
         self._random_state = check_random_state(self.random_state)
@@ -303,7 +529,7 @@ class TimeSeriesKMeans(BaseClusterer):
         if self.average_params is None:
             self._average_params = {}
         else:
-            self._average_params = self.average_params
+            self._average_params = dict(self.average_params)
 
         # Add the distance to average params
         if "distance" not in self._average_params:
@@ -316,6 +542,18 @@ class TimeSeriesKMeans(BaseClusterer):
 
         self._averaging_method = _resolve_average_callable(self.averaging_method)
 
+        self._bounded_assignment = (
+            self.n_clusters > 1
+            and isinstance(self.distance, str)
+            and self.distance in _TRIANGLE_METRICS
+            and self._distance_params.get("window") is None
+            and self._distance_params.get("itakura_max_slope") is None
+            # Dependent msm does not satisfy the triangle inequality
+            and (
+                self.distance != "msm" or self._distance_params.get("independent", True)
+            )
+        )
+
         if self.n_clusters > X.shape[0]:
             raise ValueError(
                 f"n_clusters ({self.n_clusters}) cannot be larger than "
@@ -5,12 +5,14 @@ import warnings
 from typing import Callable, Tuple, Union
 
 import numpy as np
+from joblib import Parallel, delayed
+from numba import njit
 from numpy.random import RandomState
 from sklearn.exceptions import ConvergenceWarning
 from sklearn.utils import check_random_state
 
 from aeon.clustering.base import BaseClusterer
-from aeon.distances import get_distance_function, pairwise_distance
+from aeon.distances import get_distance_function, nearest_neighbors, pairwise_distance
 
 
 class TimeSeriesKMedoids(BaseClusterer):
@@ -62,15 +64,17 @@ class TimeSeriesKMedoids(BaseClusterer):
         ['alternate', 'pam'].
         Alternate applies lloyds method to k-medoids and is faster but less accurate
         than PAM.
-        PAM is implemented using the fastpam1 algorithm which gives the same output
-        as PAM but is faster.
+        PAM is implemented using the FasterPAM algorithm [6]_, which evaluates all
+        the swaps with a non-medoid in one pass over the data and applies the best of
+        them as soon as it reduces the total deviation, rather than searching every
+        (medoid, non-medoid) pair before making each swap.
     n_init : int, default=10
         Number of times the k-medoids algorithm will be run with different
         centroid seeds. The final result will be the best output of n_init
         consecutive runs in terms of inertia.
     max_iter : int, default=300
         Maximum number of iterations of the k-medoids algorithm for a single
-        run.
+        run. For PAM an iteration is a pass over every non-medoid as a swap candidate.
     tol : float, default=1e-6
         Relative tolerance with regards to Frobenius norm of the difference
         in the cluster centers of two consecutive iterations to declare
@@ -81,6 +85,29 @@ class TimeSeriesKMedoids(BaseClusterer):
         Determines random number generation for centroid initialization.
     distance_params: dict, default=None
         Dictionary containing kwargs for the distance metric being used.
+    precomputed_pairwise_distance_file : str or None, default=None
+        Path to a .npy file of the distance matrix between the series passed to
+        ``fit``, of shape ``(n_instances, n_instances)``, for example one written by
+        :func:`aeon.distances.blocked_pairwise_distance`. If provided, the file is
+        opened as a read-only memory map in ``fit`` and the distances between
+        training series are read from it instead of being computed, so one matrix
+        can be reused across clustering runs without loading it into memory. It
+        must be computed with the same ``distance`` and ``distance_params``.
+    n_jobs : int, default=1
+        The number of jobs to run the ``n_init`` restarts in parallel.
+        ``-1`` means using all processors.
+    parallel_backend : str, ParallelBackendBase instance or None, default=None
+        Specify the parallelisation backend implementation in joblib, if None the
+        joblib default "loky" is used, which runs the restarts in separate processes
+        and shares X and the distance matrix with them as read-only memory maps.
+        Valid options are "loky", "multiprocessing", "threading" or a custom backend.
+        See the joblib Parallel documentation for more details.
+    early_abandon_iter : int or None, default=None
+        If not None, a restart is abandoned once it has run ``early_abandon_iter``
+        iterations and its inertia is greater than the best inertia of the restarts
+        already finished. With ``n_jobs`` greater than 1, the restarts are run in
+        batches of ``n_jobs`` and are compared to the best inertia of the previous
+        batches. If None, all restarts are run to convergence.
 
     Attributes
     ----------
@@ -116,6 +143,10 @@ class TimeSeriesKMedoids(BaseClusterer):
     In proceedings of the 8th Workshop on Advanced Analytics and Learning on Temporal
     Data (AALTD 2023).
 
+    .. [6] Schubert, Erich & Rousseeuw, Peter. (2021). Fast and eager k-medoids
+    clustering: O(k) runtime improvement of the PAM, CLARA, and CLARANS algorithms.
+    Information Systems. 101. 101804. 10.1016/j.is.2021.101804.
+
     Examples
     --------
     >>> from aeon.clustering import TimeSeriesKMedoids
@@ -138,6 +169,7 @@ class TimeSeriesKMedoids(BaseClusterer):
 
     _tags = {
         "capability:multivariate": True,
+        "capability:multithreading": True,
     }
 
     def __init__(
@@ -152,6 +184,10 @@ class TimeSeriesKMedoids(BaseClusterer):
         verbose: bool = False,
         random_state: Union[int, RandomState] = None,
         distance_params: dict = None,
+        precomputed_pairwise_distance_file: str = None,
+        n_jobs: int = 1,
+        parallel_backend=None,
+        early_abandon_iter: int = None,
     ):
         self.init_algorithm = init_algorithm
         self.distance = distance
@@ -162,6 +198,10 @@ class TimeSeriesKMedoids(BaseClusterer):
         self.random_state = random_state
         self.distance_params = distance_params
         self.method = method
+        self.precomputed_pairwise_distance_file = precomputed_pairwise_distance_file
+        self.n_jobs = n_jobs
+        self.parallel_backend = parallel_backend
+        self.early_abandon_iter = early_abandon_iter
 
         self.cluster_centers_ = None
         self.labels_ = None
@@ -180,39 +220,97 @@ class TimeSeriesKMedoids(BaseClusterer):
     def _fit(self, X: np.ndarray, y=None):
         self._check_params(X)
 
+        n_init = self.n_init
+        if isinstance(self.init_algorithm, str) and self.init_algorithm == "build":
+            n_init = 1
+        if self.method == "pam":
+            # PAM needs every distance, they are computed once for all restarts
+            X_index = np.arange(X.shape[0], dtype=int)
+            self._compute_pairwise(X, X_index, X_index)
+
+        # The initial medoids are drawn before the restarts are dispatched, so the
+        # restarts do not share the random state and the result does not depend on
+        # n_jobs.
+        initial_medoids = [self._initial_medoids(X) for _ in range(n_init)]
+        batch_size = n_init
+        if self.early_abandon_iter is not None:
+            batch_size = self._n_jobs
+
         best_centers = None
         best_inertia = np.inf
         best_labels = None
         best_iters = self.max_iter
 
-        for _ in range(self.n_init):
-            labels, centers, inertia, n_iters = self._fit_method(X)
-            if inertia < best_inertia:
-                best_centers = centers
-                best_labels = labels
-                best_inertia = inertia
-                best_iters = n_iters
+        # The distance cache is passed to the restarts as an argument rather than
+        # through self, so process based backends can share it as a memory map.
+        distance_cache = self._distance_cache
+        self._distance_cache = None
+        try:
+            with Parallel(
+                n_jobs=self._n_jobs, backend=self.parallel_backend
+            ) as parallel:
+                for i in range(0, n_init, batch_size):
+                    results = parallel(
+                        delayed(self._fit_restart)(
+                            X, distance_cache, medoids, best_inertia
+                        )
+                        for medoids in initial_medoids[i : i + batch_size]
+                    )
+                    for result in results:
+                        if result is None:
+                            continue
+                        labels, centers, inertia, n_iters = result
+                        if inertia < best_inertia:
+                            best_centers = centers
+                            best_labels = labels
+                            best_inertia = inertia
+                            best_iters = n_iters
+        finally:
+            self._distance_cache = distance_cache
 
         self.labels_ = best_labels
         self.inertia_ = best_inertia
         self.cluster_centers_ = best_centers
         self.n_iter_ = best_iters
 
+    def _initial_medoids(self, X: np.ndarray) -> np.ndarray:
+        if isinstance(self._init_algorithm, Callable):
+            return self._init_algorithm(X)
+        return self._init_algorithm
+
+    def _fit_restart(
+        self,
+        X: np.ndarray,
+        distance_cache: np.ndarray,
+        medoids: np.ndarray,
+        best_inertia: float,
+    ):
+        if (
+            self.method == "alternate"
+            and not distance_cache.flags.writeable
+            and self.precomputed_pairwise_distance_file is None
+        ):
+            # A memory mapped cache of a process based backend, the restart fills
+            # its own copy. The cache of pam is complete and only read.
+            distance_cache = np.array(distance_cache)
+        self._distance_cache = distance_cache
+        return self._fit_method(X, medoids, best_inertia)
+
     def _score(self, X, y=None):
         return -self.inertia_
 
     def _predict(self, X: np.ndarray, y=None) -> np.ndarray:
         if isinstance(self.distance, str):
-            pairwise_matrix = pairwise_distance(
+            # Only the closest medoid is needed, so most distances can be pruned
+            return nearest_neighbors(
                 X, self.cluster_centers_, metric=self.distance, **self._distance_params
-            )
-        else:
-            pairwise_matrix = pairwise_distance(
-                X,
-                self.cluster_centers_,
-                self._distance_callable,
-                **self._distance_params,
-            )
+            )[1][:, 0]
+        pairwise_matrix = pairwise_distance(
+            X,
+            self.cluster_centers_,
+            self._distance_callable,
+            **self._distance_params,
+        )
         return pairwise_matrix.argmin(axis=1)
 
     def _compute_new_cluster_centers(
@@ -224,171 +322,118 @@ class TimeSeriesKMedoids(BaseClusterer):
             new_center_indexes.append(self._compute_medoids(X, curr_indexes))
         return np.array(new_center_indexes)
 
-    def _compute_distance(self, X: np.ndarray, first_index: int, second_index: int):
-        # Check cache
-        if np.isfinite(self._distance_cache[first_index, second_index]):
-            return self._distance_cache[first_index, second_index]
-        if np.isfinite(self._distance_cache[second_index, first_index]):
-            return self._distance_cache[second_index, first_index]
-        dist = self._distance_callable(
-            X[first_index], X[second_index], **self._distance_params
-        )
-        # Update cache
-        self._distance_cache[first_index, second_index] = dist
-        self._distance_cache[second_index, first_index] = dist
-        return dist
-
     def _compute_pairwise(
         self, X: np.ndarray, first_indexes: np.ndarray, second_indexes: np.ndarray
     ):
-        x_size = len(first_indexes)
-        y_size = len(second_indexes)
-        distance_matrix = np.zeros((x_size, y_size))
-        for i in range(x_size):
-            curr_i_index = first_indexes[i]
-            for j in range(y_size):
-                distance_matrix[i, j] = self._compute_distance(
-                    X, curr_i_index, second_indexes[j]
-                )
+        distance_matrix = np.asarray(
+            self._distance_cache[np.ix_(first_indexes, second_indexes)]
+        )
+        if self.precomputed_pairwise_distance_file is not None:
+            return distance_matrix
+        # Only rows with a distance not yet in the cache are computed, in one call to
+        # the pairwise distance functions rather than one call per pair.
+        missing = ~np.all(np.isfinite(distance_matrix), axis=1)
+        if not np.any(missing):
+            return distance_matrix
+        rows = first_indexes[missing]
+        if np.array_equal(rows, second_indexes):
+            distances = pairwise_distance(
+                X[rows], metric=self.distance, **self._distance_params
+            )
+        else:
+            distances = pairwise_distance(
+                X[rows],
+                X[second_indexes],
+                metric=self.distance,
+                **self._distance_params,
+            )
+        distance_matrix[missing] = distances
+        self._distance_cache[np.ix_(rows, second_indexes)] = distances
+        self._distance_cache[np.ix_(second_indexes, rows)] = distances.T
         return distance_matrix
 
     def _compute_medoids(self, X: np.ndarray, indexes: np.ndarray):
         distance_matrix = self._compute_pairwise(X, indexes, indexes)
         return indexes[np.argmin(sum(distance_matrix))]
 
-    def _pam_fit(self, X: np.ndarray):
-        old_inertia = np.inf
+    def _pam_fit(
+        self, X: np.ndarray, medoids_idxs: np.ndarray, best_inertia: float = np.inf
+    ):
         n_instances = X.shape[0]
-
-        if isinstance(self._init_algorithm, Callable):
-            medoids_idxs = self._init_algorithm(X)
+        X_index = np.arange(n_instances, dtype=int)
+        distance_matrix = self._compute_pairwise(X, X_index, X_index)
+        medoids_idxs = np.array(medoids_idxs, dtype=np.int64)
+        if self.early_abandon_iter is not None and (
+            self.early_abandon_iter < self.max_iter
+        ):
+            # The swaps only depend on the current medoids, so the search can be
+            # stopped to check the inertia and then resumed.
+            medoids_idxs, n_iter, converged = _faster_pam(
+                distance_matrix, medoids_idxs, self.early_abandon_iter, self.tol
+            )
+            if not converged:
+                inertia = distance_matrix[:, medoids_idxs].min(axis=1).sum()
+                if inertia > best_inertia:
+                    if self.verbose:
+                        print(  # noqa: T001, T201
+                            f"Abandoned at iteration {n_iter}, inertia {inertia} is "
+                            f"greater than the best inertia {best_inertia}."
+                        )
+                    return None
+                medoids_idxs, n_resumed, converged = _faster_pam(
+                    distance_matrix,
+                    medoids_idxs,
+                    self.max_iter - self.early_abandon_iter,
+                    self.tol,
+                )
+                n_iter += n_resumed
         else:
-            medoids_idxs = self._init_algorithm
-        not_medoid_idxs = np.arange(n_instances, dtype=int)
-        distance_matrix = self._compute_pairwise(X, not_medoid_idxs, not_medoid_idxs)
-        distance_closest_medoid, distance_second_closest_medoid = np.sort(
-            distance_matrix[medoids_idxs], axis=0
-        )[[0, 1]]
-        not_medoid_idxs = np.delete(np.arange(n_instances, dtype=int), medoids_idxs)
-
-        for i in range(self.max_iter):
-            # Initialize best cost change and the associated swap couple.
-            old_medoid_idxs = np.copy(medoids_idxs)
-            best_cost_change = self._compute_optimal_swaps(
-                distance_matrix,
-                medoids_idxs,
-                not_medoid_idxs,
-                distance_closest_medoid,
-                distance_second_closest_medoid,
+            medoids_idxs, n_iter, converged = _faster_pam(
+                distance_matrix, medoids_idxs, self.max_iter, self.tol
             )
-
-            inertia = np.inf
-            # If one of the swap decrease the objective, return that swap.
-            if best_cost_change is not None and best_cost_change[2] < 0:
-                first, second, _ = best_cost_change
-                medoids_idxs[medoids_idxs == first] = second
-                distance_closest_medoid, distance_second_closest_medoid = np.sort(
-                    distance_matrix[medoids_idxs], axis=0
-                )[[0, 1]]
-                inertia = np.sum(distance_closest_medoid)
-
-            if np.all(old_medoid_idxs == medoids_idxs):
-                if self.verbose:
-                    print(  # noqa: T001, T201
-                        f"Converged at iteration {i}: strict convergence."
-                    )
-                break
-            if np.abs(old_inertia - inertia) < self.tol:
-                if self.verbose:
-                    print(  # noqa: T001, T201
-                        f"Converged at iteration {i}: inertia less than tol."
-                    )
-                break
-            old_inertia = inertia
-            if i == self.max_iter - 1:
-                warnings.warn(
-                    "Maximum number of iteration reached before "
-                    "convergence. Consider increasing max_iter to "
-                    "improve the fit.",
-                    ConvergenceWarning,
-                    stacklevel=1,
+        if converged:
+            if self.verbose:
+                print(  # noqa: T001, T201
+                    f"Converged at iteration {n_iter - 1}: no swap reduces the "
+                    f"inertia by more than tol."
                 )
-            if self.verbose is True:
-                print(f"Iteration {i}, inertia {inertia}.")  # noqa: T001, T201
+        else:
+            warnings.warn(
+                "Maximum number of iteration reached before "
+                "convergence. Consider increasing max_iter to "
+                "improve the fit.",
+                ConvergenceWarning,
+                stacklevel=1,
+            )
 
         labels, inertia = self._assign_clusters(X, medoids_idxs)
         centers = X[medoids_idxs]
 
-        return labels, centers, inertia, i + 1
+        return labels, centers, inertia, n_iter
 
-    def _compute_optimal_swaps(
+    def _alternate_fit(
         self,
-        distance_matrix: np.ndarray,
-        medoids_idxs: np.ndarray,
-        not_medoid_idxs: np.ndarray,
-        distance_closest_medoid: np.ndarray,
-        distance_second_closest_medoid: np.ndarray,
-    ):
-        best_cost_change = (1, 1, 0.0)
-        sample_size = len(distance_matrix)
-        not_medoid_shape = sample_size - self.n_clusters
-
-        for i in range(not_medoid_shape):
-            id_i = not_medoid_idxs[i]
-            for j in range(self.n_clusters):
-                id_j = medoids_idxs[j]
-                cost_change = 0.0
-                for k in range(not_medoid_shape):
-                    id_k = not_medoid_idxs[k]
-                    cluster_i_bool = (
-                        distance_matrix[id_j, id_k] == distance_closest_medoid[id_k]
-                    )
-
-                    if (
-                        cluster_i_bool
-                        and distance_matrix[id_i, id_k]
-                        < distance_second_closest_medoid[id_k]
-                    ):
-                        cost_change += (
-                            distance_matrix[id_k, id_i] - distance_closest_medoid[id_k]
-                        )
-                    elif (
-                        cluster_i_bool
-                        and distance_matrix[id_i, id_k]
-                        >= distance_second_closest_medoid[id_k]
-                    ):
-                        cost_change += (
-                            distance_second_closest_medoid[id_k]
-                            - distance_closest_medoid[id_k]
-                        )
-                    elif distance_matrix[id_j, id_k] != distance_closest_medoid[
-                        id_k
-                    ] and (distance_matrix[id_k, id_i] < distance_closest_medoid[id_k]):
-                        cost_change += (
-                            distance_matrix[id_k, id_i] - distance_closest_medoid[id_k]
-                        )
-
-                if distance_matrix[id_i, id_j] < distance_second_closest_medoid[id_j]:
-                    cost_change += distance_matrix[id_j, id_i]
-                else:
-                    cost_change += distance_second_closest_medoid[id_j]
-
-                if cost_change < best_cost_change[2]:
-                    best_cost_change = (id_j, id_i, cost_change)
-        if best_cost_change[2] < 0:
-            return best_cost_change
-        else:
-            return None
-
-    def _alternate_fit(self, X) -> Tuple[np.ndarray, np.ndarray, float, int]:
-        cluster_center_indexes = self._init_algorithm
-        if isinstance(self._init_algorithm, Callable):
-            cluster_center_indexes = self._init_algorithm(X)
+        X: np.ndarray,
+        cluster_center_indexes: np.ndarray,
+        best_inertia: float = np.inf,
+    ) -> Tuple[np.ndarray, np.ndarray, float, int]:
         old_inertia = np.inf
         old_indexes = None
         for i in range(self.max_iter):
             indexes, inertia = self._assign_clusters(X, cluster_center_indexes)
 
+            if (
+                self.early_abandon_iter is not None
+                and i >= self.early_abandon_iter
+                and inertia > best_inertia
+            ):
+                if self.verbose:
+                    print(  # noqa: T001, T201
+                        f"Abandoned at iteration {i}, inertia {inertia} is "
+                        f"greater than the best inertia {best_inertia}."
+                    )
+                return None
+
             if np.abs(old_inertia - inertia) < self.tol:
                 break
             old_inertia = inertia
@@ -453,7 +498,17 @@ class TimeSeriesKMedoids(BaseClusterer):
                 f"n_instances ({X.shape[0]})"
             )
         self._distance_callable = get_distance_function(metric=self.distance)
-        self._distance_cache = np.full((X.shape[0], X.shape[0]), np.inf)
+        if self.precomputed_pairwise_distance_file is not None:
+            distances = np.load(self.precomputed_pairwise_distance_file, mmap_mode="r")
+            if distances.shape != (X.shape[0], X.shape[0]):
+                raise ValueError(
+                    f"precomputed_pairwise_distance_file must contain a matrix of "
+                    f"shape {(X.shape[0], X.shape[0])}, but found shape "
+                    f"{distances.shape}"
+                )
+            self._distance_cache = distances
+        else:
+            self._distance_cache = np.full((X.shape[0], X.shape[0]), np.inf)
 
         if self.method == "alternate":
             self._fit_method = self._alternate_fit
@@ -481,9 +536,12 @@ class TimeSeriesKMedoids(BaseClusterer):
         indexes = [initial_center_idx]
 
         for _ in range(1, self.n_clusters):
-            pw_dist = pairwise_distance(
-                X, X[indexes], metric=self.distance, **self._distance_params
-            )
+            if self.precomputed_pairwise_distance_file is not None:
+                pw_dist = np.asarray(self._distance_cache[:, indexes])
+            else:
+                pw_dist = pairwise_distance(
+                    X, X[indexes], metric=self.distance, **self._distance_params
+                )
             min_distances = pw_dist.min(axis=1)
             probabilities = min_distances / min_distances.sum()
             next_center_idx = self._random_state.choice(X.shape[0], p=probabilities)
@@ -500,36 +558,7 @@ class TimeSeriesKMedoids(BaseClusterer):
         X_index = np.arange(n_instances, dtype=int)
         distance_matrix = self._compute_pairwise(X, X_index, X_index)
 
-        medoid_idxs = np.zeros(self.n_clusters, dtype=int)
-        not_medoid_idxs = np.arange(n_instances, dtype=int)
-
-        medoid_idxs[0] = np.argmin(np.sum(distance_matrix, axis=1))
-        not_medoid_idxs = np.delete(not_medoid_idxs, medoid_idxs[0])
-
-        n_medoids_current = 1
-        Dj = distance_matrix[medoid_idxs[0]].copy()
-        new_medoid = (0, 0)
-
-        for _ in range(self.n_clusters - 1):
-            cost_change_max = 0
-            for i in range(n_instances - n_medoids_current):
-                id_i = not_medoid_idxs[i]
-                cost_change = 0
-                for j in range(n_instances - n_medoids_current):
-                    id_j = not_medoid_idxs[j]
-                    cost_change += max(0, Dj[id_j] - distance_matrix[id_i, id_j])
-                if cost_change >= cost_change_max:
-                    cost_change_max = cost_change
-                    new_medoid = (id_i, i)
-
-            medoid_idxs[n_medoids_current] = new_medoid[0]
-            n_medoids_current += 1
-            not_medoid_idxs = np.delete(not_medoid_idxs, new_medoid[1])
-
-            for id_j in range(n_instances):
-                Dj[id_j] = min(Dj[id_j], distance_matrix[id_j, new_medoid[0]])
-
-        return np.array(medoid_idxs)
+        return _pam_build(distance_matrix, self.n_clusters)
 
     @classmethod
     def get_test_params(cls, parameter_set="default"):
@@ -561,3 +590,130 @@ class TimeSeriesKMedoids(BaseClusterer):
             "random_state": 1,
             "method": "alternate",
         }
+
+
+@njit(cache=True)
+def _nearest_medoids(
+    distance_matrix: np.ndarray,
+    medoids: np.ndarray,
+    nearest: np.ndarray,
+    distance_nearest: np.ndarray,
+    distance_second: np.ndarray,
+    removal_loss: np.ndarray,
+):
+    # Find the closest and second closest medoid of every series, and the increase
+    # in total deviation if each medoid was removed.
+    removal_loss[:] = 0.0
+    for o in range(distance_matrix.shape[0]):
+        nearest[o] = 0
+        distance_nearest[o] = np.inf
+        distance_second[o] = np.inf
+        for i in range(medoids.shape[0]):
+            dist = distance_matrix[medoids[i], o]
+            if dist < distance_nearest[o]:
+                distance_second[o] = distance_nearest[o]
+                distance_nearest[o] = dist
+                nearest[o] = i
+            elif dist < distance_second[o]:
+                distance_second[o] = dist
+        removal_loss[nearest[o]] += distance_second[o] - distance_nearest[o]
+
+
+@njit(cache=True)
+def _faster_pam(
+    distance_matrix: np.ndarray, medoids: np.ndarray, max_iter: int, tol: float
+) -> Tuple[np.ndarray, int, bool]:
+    # FasterPAM swap phase. For a candidate xc the change in total deviation of
+    # swapping it with each medoid is found in a single pass over the series, and the
+    # best swap is applied straight away if it reduces the total deviation by more
+    # than tol. No fastmath, as with one medoid the second distances are infinite.
+    n_instances = distance_matrix.shape[0]
+    n_clusters = medoids.shape[0]
+    medoids = medoids.copy()
+    if n_clusters == 1:
+        # There is no second closest medoid to move to, so the removal loss is
+        # infinite. The best medoid is the series with the smallest total deviation.
+        deviation = distance_matrix.sum(axis=0)
+        best = np.argmin(deviation)
+        if deviation[best] < deviation[medoids[0]] - tol:
+            medoids[0] = best
+        return medoids, 1, True
+    is_medoid = np.zeros(n_instances, dtype=np.bool_)
+    is_medoid[medoids] = True
+    nearest = np.zeros(n_instances, dtype=np.int64)
+    distance_nearest = np.zeros(n_instances)
+    distance_second = np.zeros(n_instances)
+    removal_loss = np.zeros(n_clusters)
+    _nearest_medoids(
+        distance_matrix,
+        medoids,
+        nearest,
+        distance_nearest,
+        distance_second,
+        removal_loss,
+    )
+
+    delta = np.zeros(n_clusters)
+    for n_iter in range(1, max_iter + 1):
+        n_swaps = 0
+        for xc in range(n_instances):
+            if is_medoid[xc]:
+                continue
+            delta[:] = removal_loss
+            # Change in deviation of the series moving to xc from their medoid
+            shared = 0.0
+            for o in range(n_instances):
+                dist = distance_matrix[o, xc]
+                if dist < distance_nearest[o]:
+                    shared += dist - distance_nearest[o]
+                    delta[nearest[o]] += distance_nearest[o] - distance_second[o]
+                elif dist < distance_second[o]:
+                    delta[nearest[o]] += dist - distance_second[o]
+            best = np.argmin(delta)
+            if delta[best] + shared < -tol:
+                is_medoid[medoids[best]] = False
+                is_medoid[xc] = True
+                medoids[best] = xc
+                _nearest_medoids(
+                    distance_matrix,
+                    medoids,
+                    nearest,
+                    distance_nearest,
+                    distance_second,
+                    removal_loss,
+                )
+                n_swaps += 1
+        if n_swaps == 0:
+            return medoids, n_iter, True
+    return medoids, max_iter, False
+
+
+@njit(cache=True, fastmath=True)
+def _pam_build(distance_matrix: np.ndarray, n_clusters: int) -> np.ndarray:
+    # Greedily add the series that most reduces the total deviation as a medoid.
+    n_instances = distance_matrix.shape[0]
+    medoid_idxs = np.zeros(n_clusters, dtype=np.int64)
+    is_medoid = np.zeros(n_instances, dtype=np.bool_)
+    medoid_idxs[0] = np.argmin(distance_matrix.sum(axis=1))
+    is_medoid[medoid_idxs[0]] = True
+    Dj = distance_matrix[medoid_idxs[0]].copy()
+
+    for n_medoids_current in range(1, n_clusters):
+        cost_change_max = 0.0
+        new_medoid = 0
+        for id_i in range(n_instances):
+            if is_medoid[id_i]:
+                continue
+            cost_change = 0.0
+            for id_j in range(n_instances):
+                if not is_medoid[id_j]:
+                    cost_change += max(0.0, Dj[id_j] - distance_matrix[id_i, id_j])
+            if cost_change >= cost_change_max:
+                cost_change_max = cost_change
+                new_medoid = id_i
+        medoid_idxs[n_medoids_current] = new_medoid
+        is_medoid[new_medoid] = True
+        for id_j in range(n_instances):
+            Dj[id_j] = min(Dj[id_j], distance_matrix[id_j, new_medoid])
+
+    return medoid_idxs
@@ -0,0 +1,272 @@
+"""Time series mini-batch kmeans."""
+from typing import Callable, Union
+
+import numpy as np
+from numpy.random import RandomState
+
+from aeon.clustering.averaging import elastic_barycenter_average
+from aeon.clustering.k_means import TimeSeriesKMeans
+
+
+class TimeSeriesMiniBatchKMeans(TimeSeriesKMeans):
+    """Time series mini-batch K-means clustering implementation.
+
+    Mini-batch K-means [1]_ updates the cluster centres from small random batches of
+    the time series rather than from the whole collection in each iteration. Each
+    centre keeps a count of the series assigned to it so far, and is moved towards
+    the series of a batch assigned to it by a weighted average of the centre, with
+    the weight of its count, and the new series. With the 'ba' averaging method the
+    weighted average is an elastic barycenter average [2]_ started from the centre.
+
+    The collection is never held in memory as a whole when ``partial_fit`` is called
+    on successive batches, for example read with
+    :func:`aeon.datasets.load_from_tsfile_in_batches`, so arbitrarily large
+    collections can be clustered in bounded memory.
+
+    Parameters
+    ----------
+    n_clusters : int, default=8
+        The number of clusters to form as well as the number of centroids to generate.
+    init_algorithm : str or np.ndarray, default='random'
+        Random is the default and simply chooses k time series at random as
+        centroids. Kmeans++ is slower but often more accurate than random. First
+        simply chooses the first k time series as centroids. If a np.ndarray is
+        provided it must be of shape (n_clusters, n_channels, n_timepoints) and
+        contains the time series to use as centroids. With ``partial_fit`` the
+        centroids are chosen from the first batch.
+    distance : str or Callable, default='msm'
+        Distance metric to compute similarity between time series. A list of valid
+        strings for metrics can be found in the documentation for
+        :func:`aeon.distances.get_distance_function`. If a callable is passed it must be
+        a function that takes two 2d numpy arrays as input and returns a float.
+    batch_size : int, default=100
+        Number of time series in each batch of ``fit``.
+    max_iter : int, default=100
+        Maximum number of passes over the collection in ``fit``.
+    tol : float, default=1e-6
+        Tolerance on the change in inertia between two consecutive passes over the
+        collection to declare convergence.
+    verbose : bool, default=False
+        Verbosity mode.
+    random_state : int or np.random.RandomState instance or None, default=None
+        Determines random number generation for centroid initialization and the
+        order of the batches.
+    averaging_method : str, default='ba'
+        Averaging method to update the centres, one of 'mean' or 'ba'. If you specify
+        'ba' then by default the distance measure used will be the same as the
+        distance measure used for clustering.
+    distance_params : dict, default=None
+        Dictionary containing kwargs for the distance being used. For example if you
+        wanted to specify a window for DTW you would pass
+        distance_params={"window": 0.2}. See documentation of aeon.distances for more
+        details.
+    average_params : dict, default=None
+        Dictionary containing kwargs for averaging_method. See documentation of
+        aeon.clustering.averaging and aeon.distances for more details.
+
+    Attributes
+    ----------
+    cluster_centers_ : 3d np.ndarray
+        Array of shape (n_clusters, n_channels, n_timepoints))
+        Time series that represent each of the cluster centers.
+    labels_ : 1d np.ndarray
+        1d array of shape (n_instance,)
+        Labels that is the index each time series belongs to, for the collection
+        passed to ``fit`` or the last batch passed to ``partial_fit``.
+    inertia_ : float
+        Sum of distances of samples to their closest cluster center, for the
+        collection passed to ``fit`` or the last batch passed to ``partial_fit``.
+    n_iter_ : int
+        Number of passes over the collection run by ``fit``.
+    n_steps_ : int
+        Number of batches the centres have been updated from.
+    counts_ : 1d np.ndarray
+        Number of time series each centre has been updated from.
+
+    References
+    ----------
+    .. [1] Sculley, D. (2010). Web-scale k-means clustering. In proceedings of the
+    19th international conference on World wide web (pp. 1177-1178).
+
+    .. [2] F. Petitjean, A. Ketterlin & P. Gancarski. A global averaging method
+    for dynamic time warping, with applications to clustering. Pattern
+    Recognition, Elsevier, 2011, Vol. 44, Num. 3, pp. 678-693
+
+    Examples
+    --------
+    >>> import os
+    >>> import aeon
+    >>> from aeon.clustering import TimeSeriesMiniBatchKMeans
+    >>> from aeon.datasets import load_from_tsfile_in_batches
+    >>> path = os.path.join(
+    ...     os.path.dirname(aeon.__file__), "datasets/data/UnitTest/UnitTest_TRAIN.ts"
+    ... )
+    >>> clst = TimeSeriesMiniBatchKMeans(
+    ...     n_clusters=2, distance="dtw", random_state=0
+    ... )
+    >>> for X, _ in load_from_tsfile_in_batches(path, batch_size=8):
+    ...     clst = clst.partial_fit(X)
+    >>> clst.n_steps_
+    3
+    >>> preds = clst.predict(X)
+    """
+
+    _tags = {
+        "capability:multivariate": True,
+        "capability:multithreading": False,
+    }
+
+    def __init__(
+        self,
+        n_clusters: int = 8,
+        init_algorithm: Union[str, np.ndarray] = "random",
+        distance: Union[str, Callable] = "msm",
+        batch_size: int = 100,
+        max_iter: int = 100,
+        tol: float = 1e-6,
+        verbose: bool = False,
+        random_state: Union[int, RandomState] = None,
+        averaging_method: str = "ba",
+        distance_params: dict = None,
+        average_params: dict = None,
+    ):
+        self.batch_size = batch_size
+
+        self.n_steps_ = 0
+        self.counts_ = None
+
+        super(TimeSeriesMiniBatchKMeans, self).__init__(
+            n_clusters=n_clusters,
+            init_algorithm=init_algorithm,
+            distance=distance,
+            n_init=1,
+            max_iter=max_iter,
+            tol=tol,
+            verbose=verbose,
+            random_state=random_state,
+            averaging_method=averaging_method,
+            distance_params=distance_params,
+            average_params=average_params,
+        )
+
+    def partial_fit(self, X, y=None):
+        """Update the cluster centres from a single batch of time series.
+
+        The first call chooses the initial centres from X, so it must contain at
+        least ``n_clusters`` time series.
+
+        Parameters
+        ----------
+        X : 3D np.array (any number of channels, equal length series)
+                of shape (n_instances, n_channels, n_timepoints)
+            or 2D np.array (univariate, equal length series)
+                of shape (n_instances, n_timepoints)
+            other types are allowed and converted into one of the above.
+        y: ignored, exists for API consistency reasons.
+
+        Returns
+        -------
+        self:
+            Fitted estimator.
+        """
+        X = self._preprocess_collection(X)
+        if self.cluster_centers_ is None:
+            self._check_params(X)
+            self.cluster_centers_ = self._initial_centres(X)
+            self.counts_ = np.zeros(self.n_clusters)
+            self.n_steps_ = 0
+        self._update_centres(X)
+        self.labels_, distances, _ = self._assign_clusters(
+            X, self.cluster_centers_, None, None
+        )
+        self.inertia_ = distances.sum()
+        self._is_fitted = True
+        return self
+
+    def _fit(self, X: np.ndarray, y=None):
+        self._check_params(X)
+        self.cluster_centers_ = self._initial_centres(X)
+        self.counts_ = np.zeros(self.n_clusters)
+        self.n_steps_ = 0
+
+        prev_inertia = np.inf
+        for i in range(self.max_iter):
+            order = self._random_state.permutation(X.shape[0])
+            for start in range(0, X.shape[0], self.batch_size):
+                self._update_centres(X[order[start : start + self.batch_size]])
+
+            labels, distances, _ = self._assign_clusters(
+                X, self.cluster_centers_, None, None
+            )
+            inertia = distances.sum()
+            if self.verbose:
+                print(f"Iteration {i}, inertia {inertia}.")  # noqa: T001, T201
+            if np.abs(prev_inertia - inertia) < self.tol:
+                break
+            prev_inertia = inertia
+
+        self.labels_ = labels
+        self.inertia_ = inertia
+        self.n_iter_ = i + 1
+
+    def _update_centres(self, X: np.ndarray) -> None:
+        labels, _, _ = self._assign_clusters(X, self.cluster_centers_, None, None)
+        for j in range(self.n_clusters):
+            members = X[labels == j]
+            if len(members) == 0:
+                continue
+            centre = self.cluster_centers_[j]
+            count = self.counts_[j]
+            if self.averaging_method == "mean":
+                self.cluster_centers_[j] = (count * centre + members.sum(axis=0)) / (
+                    count + len(members)
+                )
+            else:
+                # The centre stands in for the count series it was averaged from
+                self.cluster_centers_[j] = elastic_barycenter_average(
+                    np.concatenate((centre[np.newaxis], members)),
+                    weights=np.concatenate(([count], np.ones(len(members)))),
+                    init_barycenter=centre,
+                    **self._average_params,
+                )
+            self.counts_[j] += len(members)
+        self.n_steps_ += 1
+
+    def _check_params(self, X: np.ndarray) -> None:
+        super(TimeSeriesMiniBatchKMeans, self)._check_params(X)
+        if self.averaging_method not in ["mean", "ba"]:
+            raise ValueError(
+                f"averaging_method must be 'mean' or 'ba', but found "
+                f"{self.averaging_method}"
+            )
+        if self.batch_size < 1:
+            raise ValueError(
+                f"batch_size must be at least 1, but found {self.batch_size}"
+            )
+
+    @classmethod
+    def get_test_params(cls, parameter_set="default"):
+        """Return testing parameter settings for the estimator.
+
+        Parameters
+        ----------
+        parameter_set : str, default="default"
+            Name of the set of test parameters to return, for use in tests. If no
+            special parameters are defined for a value, will return `"default"` set.
+
+
+        Returns
+        -------
+        params : dict or list of dict, default={}
+            Parameters to create testing instances of the class
+            Each dict are parameters to construct an "interesting" test instance, i.e.,
+            `MyClass(**params)` or `MyClass(**params[i])` creates a valid test instance.
+            `create_test_instance` uses the first (or only) dictionary in `params`
+        """
+        return {
+            "n_clusters": 2,
+            "distance": "euclidean",
+            "batch_size": 4,
+            "max_iter": 2,
+            "random_state": 0,
+        }
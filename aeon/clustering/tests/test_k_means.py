@@ -6,7 +6,7 @@ from sklearn.utils import check_random_state
 
 from aeon.clustering.k_means import TimeSeriesKMeans
 from aeon.datasets import load_basic_motions, load_gunpoint
-from aeon.distances import euclidean_distance
+from aeon.distances import euclidean_distance, get_distance_function
 from aeon.utils.validation._dependencies import _check_estimator_deps
 
 expected_results = {
@@ -297,9 +297,12 @@ def test_means_init():
         distance="euclidean",
         n_clusters=num_clusters,
     )
+    expected_init_centres = custom_init_centres.copy()
     kmeans.fit(X_train)
 
-    assert np.array_equal(kmeans.cluster_centers_, custom_init_centres)
+    # The centres are updated from a copy of the manual init centres
+    assert np.array_equal(custom_init_centres, expected_init_centres)
+    assert not np.array_equal(kmeans.cluster_centers_, custom_init_centres)
 
 
 def test_custom_distance_params():
@@ -314,3 +317,61 @@ def test_custom_distance_params():
         data, distance="msm", distance_params={"window": 0.2}
     )
     assert not np.array_equal(default_dist, custom_params_dist)
+
+
+def test_kmeans_n_jobs_and_early_abandon():
+    """Test parallel restarts match sequential ones and abandoning restarts."""
+    X_train, _ = load_gunpoint(split="train")
+    X_train = X_train[:20]
+    params = {
+        "n_clusters": 3,
+        "distance": "euclidean",
+        "averaging_method": "mean",
+        "n_init": 4,
+        "random_state": 1,
+    }
+
+    expected = TimeSeriesKMeans(**params).fit(X_train)
+    kmeans = TimeSeriesKMeans(n_jobs=2, **params).fit(X_train)
+    np.testing.assert_array_equal(kmeans.labels_, expected.labels_)
+    np.testing.assert_array_equal(kmeans.cluster_centers_, expected.cluster_centers_)
+    assert kmeans.inertia_ == expected.inertia_
+
+    # The first restart is never abandoned, so the result is at least as good
+    first = TimeSeriesKMeans(**{**params, "n_init": 1}).fit(X_train)
+    for n_jobs in [1, 2]:
+        kmeans = TimeSeriesKMeans(early_abandon_iter=1, n_jobs=n_jobs, **params)
+        kmeans.fit(X_train)
+        assert kmeans.inertia_ <= first.inertia_
+        assert kmeans.inertia_ >= expected.inertia_
+
+
+@pytest.mark.parametrize(
+    "distance, distance_params, bounded",
+    [
+        ("msm", None, True),
+        ("msm", {"independent": False}, False),
+        ("erp", None, True),
+        ("dtw", None, False),
+    ],
+)
+def test_kmeans_pruned_assignment(distance, distance_params, bounded):
+    """Test the bounded and pruned assignments match the full assignment."""
+    rng = np.random.RandomState(0)
+    X = np.concatenate([rng.randn(15, 2, 20).cumsum(axis=-1) + o for o in [0, 5, 10]])
+    params = {
+        "n_clusters": 3,
+        "averaging_method": "mean",
+        "n_init": 1,
+        "random_state": 2,
+        "distance_params": distance_params,
+    }
+    kmeans = TimeSeriesKMeans(distance=distance, **params).fit(X)
+    # With a callable all distances to the centres are computed
+    expected = TimeSeriesKMeans(distance=get_distance_function(distance), **params).fit(
+        X
+    )
+    assert kmeans._bounded_assignment == bounded
+    np.testing.assert_array_equal(kmeans.labels_, expected.labels_)
+    np.testing.assert_almost_equal(kmeans.inertia_, expected.inertia_)
+    assert kmeans.n_iter_ == expected.n_iter_
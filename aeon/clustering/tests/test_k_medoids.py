@@ -1,11 +1,15 @@
 """Tests for time series k-medoids."""
+import itertools
+import os
+import tempfile
+
 import numpy as np
 from sklearn import metrics
 from sklearn.utils import check_random_state
 
 from aeon.clustering.k_medoids import TimeSeriesKMedoids
 from aeon.datasets import load_basic_motions, load_gunpoint
-from aeon.distances import euclidean_distance
+from aeon.distances import blocked_pairwise_distance, euclidean_distance
 
 
 def test_kmedoids_uni():
@@ -56,7 +60,7 @@ def _pam_uni_medoids(X_train, y_train, X_test, y_test):
     assert test_score == 0.5777777777777777
     assert train_score == 0.4222222222222222
     assert np.isclose(kmedoids.inertia_, 5.0087431726326646)
-    assert kmedoids.n_iter_ == 3
+    assert kmedoids.n_iter_ == 2
     assert np.array_equal(kmedoids.labels_, [0, 2, 2, 5, 4, 5, 6, 7, 1, 3])
     assert isinstance(kmedoids.cluster_centers_, np.ndarray)
     for val in proba:
@@ -186,9 +190,9 @@ def test_medoids_init():
     kmedoids_build_result = kmedoids._pam_build_center_initializer(X_train)
     check_value_in_every_cluster(num_clusters, kmedoids_build_result)
 
-    # Test setting manual init centres
+    # Test setting manual init centres, which are already optimal so PAM keeps them
     num_clusters = 8
-    custom_init_centres = np.array([1, 2, 3, 4, 5, 6, 7, 8])
+    custom_init_centres = np.array([0, 1, 3, 4, 6, 7, 8, 9])
     kmedoids = TimeSeriesKMedoids(
         random_state=1,
         n_init=1,
@@ -228,3 +232,98 @@ def test_custom_distance_params():
         data, distance="msm", distance_params={"window": 0.2}
     )
     assert not np.array_equal(default_dist, custom_params_dist)
+
+
+def test_kmedoids_precomputed_pairwise_distance():
+    """Test k-medoids with a distance matrix written to disk in blocks."""
+    X_train, _ = load_gunpoint(split="train")
+    X_train = X_train[:20]
+
+    for method in ["pam", "alternate"]:
+        expected = TimeSeriesKMedoids(
+            n_clusters=3, distance="dtw", method=method, n_init=2, random_state=1
+        ).fit(X_train)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "distances.npy")
+            blocked_pairwise_distance(X_train, metric="dtw", out=path, block_size=7)
+            kmedoids = TimeSeriesKMedoids(
+                n_clusters=3,
+                distance="dtw",
+                method=method,
+                n_init=2,
+                random_state=1,
+                precomputed_pairwise_distance_file=path,
+            ).fit(X_train)
+            np.testing.assert_array_equal(kmedoids.labels_, expected.labels_)
+            np.testing.assert_almost_equal(kmedoids.inertia_, expected.inertia_)
+            # only the path is a parameter, cloning does not copy the matrix
+            assert kmedoids.get_params()["precomputed_pairwise_distance_file"] == path
+            del kmedoids
+
+
+def test_pam_optimal_swaps():
+    """Test PAM finds the optimal medoids of a small problem from any start."""
+    X = np.random.RandomState(0).randn(9, 1, 10)
+    distances = np.array([[euclidean_distance(x, y) for y in X] for x in X])
+    optimal = min(
+        distances[:, list(medoids)].min(axis=1).sum()
+        for medoids in itertools.combinations(range(len(X)), 3)
+    )
+    for init in itertools.combinations(range(len(X)), 3):
+        kmedoids = TimeSeriesKMedoids(
+            n_clusters=3,
+            init_algorithm=np.array(init),
+            distance="euclidean",
+            n_init=1,
+        ).fit(X)
+        assert np.isclose(kmedoids.inertia_, optimal)
+
+
+def test_pam_one_cluster():
+    """Test PAM finds the medoid of the whole collection with one cluster."""
+    X = np.random.RandomState(0).randn(20, 1, 10).cumsum(axis=-1)
+    distances = np.array([[euclidean_distance(x, y) for y in X] for x in X])
+    for init in ["random", "first", "build"]:
+        kmedoids = TimeSeriesKMedoids(
+            n_clusters=1,
+            init_algorithm=init,
+            distance="euclidean",
+            n_init=1,
+            random_state=1,
+        ).fit(X)
+        np.testing.assert_array_equal(kmedoids.labels_, np.zeros(20))
+        np.testing.assert_array_equal(
+            kmedoids.cluster_centers_, X[[np.argmin(distances.sum(axis=0))]]
+        )
+        assert np.isclose(kmedoids.inertia_, distances.sum(axis=0).min())
+
+
+def test_kmedoids_n_jobs_and_early_abandon():
+    """Test parallel restarts match sequential ones and abandoning restarts."""
+    X_train, _ = load_gunpoint(split="train")
+    X_train = X_train[:30]
+
+    for method in ["pam", "alternate"]:
+        params = {
+            "n_clusters": 4,
+            "distance": "euclidean",
+            "method": method,
+            "n_init": 4,
+            "random_state": 1,
+        }
+        expected = TimeSeriesKMedoids(**params).fit(X_train)
+        kmedoids = TimeSeriesKMedoids(n_jobs=2, **params).fit(X_train)
+        np.testing.assert_array_equal(kmedoids.labels_, expected.labels_)
+        np.testing.assert_array_equal(
+            kmedoids.cluster_centers_, expected.cluster_centers_
+        )
+        assert kmedoids.inertia_ == expected.inertia_
+
+        # The first restart is never abandoned, so the result is at least as good
+        first = TimeSeriesKMedoids(**{**params, "n_init": 1}).fit(X_train)
+        for n_jobs in [1, 2]:
+            kmedoids = TimeSeriesKMedoids(
+                early_abandon_iter=1, n_jobs=n_jobs, **params
+            ).fit(X_train)
+            assert kmedoids.inertia_ <= first.inertia_
+            assert kmedoids.inertia_ >= expected.inertia_
@@ -0,0 +1,103 @@
+"""Tests for time series mini-batch k-means."""
+import numpy as np
+import pytest
+
+from aeon.clustering import TimeSeriesKMeans, TimeSeriesMiniBatchKMeans
+from aeon.datasets import load_gunpoint
+
+
+def _cluster_data():
+    rng = np.random.RandomState(0)
+    return np.concatenate(
+        [rng.randn(20, 1, 20) * 0.2 + np.sin(np.arange(20) / 3 + o) for o in [0, 2, 4]]
+    )
+
+
+@pytest.mark.parametrize("averaging_method", ["mean", "ba"])
+def test_mini_batch_kmeans(averaging_method):
+    """Test mini-batch k-means finds the clusters of well separated data."""
+    X = _cluster_data()
+    y = np.repeat(np.arange(3), 20)
+    mbkmeans = TimeSeriesMiniBatchKMeans(
+        n_clusters=3,
+        distance="dtw",
+        averaging_method=averaging_method,
+        batch_size=10,
+        max_iter=5,
+        random_state=1,
+        distance_params={"window": 0.1},
+    ).fit(X)
+    kmeans = TimeSeriesKMeans(
+        n_clusters=3,
+        distance="dtw",
+        averaging_method=averaging_method,
+        n_init=1,
+        random_state=1,
+        distance_params={"window": 0.1},
+    ).fit(X)
+
+    assert mbkmeans.cluster_centers_.shape == (3, 1, 20)
+    assert mbkmeans.counts_.sum() == X.shape[0] * mbkmeans.n_iter_
+    assert mbkmeans.n_steps_ == 6 * mbkmeans.n_iter_
+    # Each cluster is found, as by k-means
+    for labels in [mbkmeans.labels_, kmeans.labels_]:
+        assert len(np.unique(labels[y == 0])) == 1
+        assert len(np.unique(labels)) == 3
+        assert all(len(np.unique(labels[y == i])) == 1 for i in range(3))
+    np.testing.assert_array_equal(mbkmeans.predict(X), mbkmeans.labels_)
+    assert mbkmeans.inertia_ < 1.5 * kmeans.inertia_
+
+
+def test_mini_batch_kmeans_partial_fit():
+    """Test the mean centres of partial_fit are the running means of the batches."""
+    X_train, _ = load_gunpoint(split="train")
+    mbkmeans = TimeSeriesMiniBatchKMeans(
+        n_clusters=2,
+        distance="euclidean",
+        averaging_method="mean",
+        init_algorithm="first",
+    )
+    members = [[], []]
+    for start in range(0, 40, 10):
+        batch = X_train[start : start + 10]
+        if start == 0:
+            centres = batch[:2].copy()
+        labels = np.argmin(
+            [[np.sum((x - c) ** 2) for c in centres] for x in batch], axis=1
+        )
+        for j in range(2):
+            members[j].extend(batch[labels == j])
+            centres[j] = np.mean(members[j], axis=0)
+        mbkmeans.partial_fit(batch)
+        np.testing.assert_array_almost_equal(mbkmeans.cluster_centers_, centres)
+
+    assert mbkmeans.n_steps_ == 4
+    assert mbkmeans.counts_.sum() == 40
+    assert mbkmeans.labels_.shape == (10,)
+
+
+def test_mini_batch_kmeans_refit():
+    """Test the steps and counts are not carried over when fitting again."""
+    X = _cluster_data()
+    mbkmeans = TimeSeriesMiniBatchKMeans(
+        n_clusters=3, batch_size=10, max_iter=3, random_state=0
+    )
+    for data in [X, X[:40]]:
+        mbkmeans.fit(data)
+        n_batches = int(np.ceil(data.shape[0] / 10))
+        assert mbkmeans.n_steps_ == n_batches * mbkmeans.n_iter_
+        assert mbkmeans.counts_.sum() == data.shape[0] * mbkmeans.n_iter_
+
+    mbkmeans.partial_fit(X[:10])
+    assert mbkmeans.n_steps_ == n_batches * mbkmeans.n_iter_ + 1
+
+
+def test_mini_batch_kmeans_errors():
+    """Test the errors raised by mini-batch k-means."""
+    X = _cluster_data()
+    with pytest.raises(ValueError, match="averaging_method must be"):
+        TimeSeriesMiniBatchKMeans(averaging_method=np.mean, n_clusters=2).fit(X)
+    with pytest.raises(ValueError, match="batch_size must be"):
+        TimeSeriesMiniBatchKMeans(batch_size=0, n_clusters=2).fit(X)
+    with pytest.raises(ValueError, match="n_clusters"):
+        TimeSeriesMiniBatchKMeans(n_clusters=5).partial_fit(X[:3])
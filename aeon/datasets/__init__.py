@@ -3,13 +3,16 @@
 __all__ = [
     # Load/download functions
     "load_from_tsfile",
+    "load_from_tsfile_in_batches",
     "load_from_tsf_file",
+    "load_from_tsf_file_in_batches",
     "load_from_arff_file",
     "load_from_tsv_file",
     "load_classification",
     "load_forecasting",
     "load_regression",
     "download_all_regression",
+    "download_datasets",
     # Write functions
     "write_to_tsfile",
     "write_results_to_uea_format",
@@ -56,11 +59,14 @@ from aeon.datasets._data_generators import (
 )
 from aeon.datasets._data_loaders import (
     download_all_regression,
+    download_datasets,
     load_classification,
     load_forecasting,
     load_from_arff_file,
     load_from_tsf_file,
+    load_from_tsf_file_in_batches,
     load_from_tsfile,
+    load_from_tsfile_in_batches,
     load_from_tsv_file,
     load_regression,
 )
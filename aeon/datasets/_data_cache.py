@@ -0,0 +1,116 @@
+"""Binary cache of the time series loaded from text files.
+
+The arrays loaded from a file ``<dir>/<stem>.<ext>`` are saved next to it as
+``<dir>/<stem>_<key>.npy``, one .npy file per array so that they can be memory
+mapped, with a ``<dir>/<stem>_cache.json`` file of meta data that is written last.
+The cache is valid while the size and modification time of the source file recorded
+in the json file are unchanged.
+"""
+
+import json
+import os
+import tempfile
+import warnings
+
+import numpy as np
+
+# Increment when the arrays stored for a file change, to invalidate old caches
+CACHE_VERSION = 1
+
+
+def _cache_path(source, key):
+    stem = os.path.splitext(source)[0]
+    if key is None:
+        return stem + "_cache.json"
+    return f"{stem}_{key}.npy"
+
+
+def _source_stamp(source):
+    stat = os.stat(source)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _atomic_write(path, write):
+    # Write to a temporary file in the same directory and rename it, so that
+    # concurrent loads never see a partially written file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            write(file)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def read_cache(source, mmap_mode=None):
+    """Read the arrays cached for a source file.
+
+    Parameters
+    ----------
+    source : str
+        Path of the text file the arrays were loaded from.
+    mmap_mode : None or str{"r", "r+", "c"}, default=None
+        Memory map the arrays with this mode of ``np.load`` instead of reading them
+        into memory.
+
+    Returns
+    -------
+    arrays : dict or None
+        The arrays saved with ``write_cache`` by key, or None if there is no cache
+        for the current version of the source file.
+    meta_data : dict or None
+        The meta data saved with ``write_cache``, or None if there is no cache.
+    """
+    try:
+        with open(_cache_path(source, None), "r", encoding="utf-8") as file:
+            info = json.load(file)
+        if info["version"] != CACHE_VERSION or info["source"] != _source_stamp(source):
+            return None, None
+        arrays = {
+            key: np.load(
+                _cache_path(source, key), mmap_mode=mmap_mode, allow_pickle=False
+            )
+            for key in info["keys"]
+        }
+    except (OSError, ValueError, KeyError):
+        return None, None
+    return arrays, info["meta_data"]
+
+
+def write_cache(source, arrays, meta_data):
+    """Save the arrays loaded from a source file next to it.
+
+    Failures to write, for example to a read only directory, raise a warning and
+    leave no cache behind.
+
+    Parameters
+    ----------
+    source : str
+        Path of the text file the arrays were loaded from.
+    arrays : dict of np.ndarray
+        The arrays to save by key. Keys must be valid in file names and the arrays
+        must not be of object dtype.
+    meta_data : dict
+        JSON serialisable meta data returned with the arrays by ``read_cache``.
+    """
+    info = {
+        "version": CACHE_VERSION,
+        "source": _source_stamp(source),
+        "keys": list(arrays.keys()),
+        "meta_data": meta_data,
+    }
+    try:
+        for key, array in arrays.items():
+            _atomic_write(
+                _cache_path(source, key),
+                lambda file, array=array: np.save(file, array, allow_pickle=False),
+            )
+        _atomic_write(
+            _cache_path(source, None),
+            lambda file: file.write(json.dumps(info).encode("utf-8")),
+        )
+    except (OSError, ValueError) as e:
+        warnings.warn(
+            f"Could not write the cache of {source}: {e}", UserWarning, stacklevel=3
+        )
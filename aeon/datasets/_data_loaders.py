@@ -1,15 +1,19 @@
+import hashlib
+import itertools
 import os
 import shutil
 import tempfile
 import urllib
+import warnings
 import zipfile
-from datetime import datetime
 from distutils.util import strtobool
 from urllib.request import urlretrieve
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 
+from aeon.datasets._data_cache import read_cache, write_cache
 from aeon.datasets._dataframe_loaders import DIRNAME, MODULE
 from aeon.datasets.dataset_collections import (
     list_downloaded_tsc_tsr_datasets,
@@ -19,13 +23,16 @@ from aeon.datatypes import MTYPE_LIST_HIERARCHICAL, convert
 
 __all__ = [  # Load functions
     "load_from_tsfile",
+    "load_from_tsfile_in_batches",
     "load_from_tsf_file",
+    "load_from_tsf_file_in_batches",
     "load_from_arff_file",
     "load_from_tsv_file",
     "load_classification",
     "load_forecasting",
     "load_regression",
     "download_all_regression",
+    "download_datasets",
 ]
 
 
@@ -125,24 +132,120 @@ def _load_data(file, meta_data, replace_missing_vals_with="NaN"):
 
     """
     data = []
+    y_values = []
+    for X, y in _iter_data(file, meta_data, replace_missing_vals_with):
+        if meta_data["equallength"]:
+            data.append(X)
+        else:
+            data.extend(X)
+        y_values.append(y)
+    if not y_values:
+        return np.array(data), np.asarray([]), meta_data
+    if meta_data["equallength"]:
+        data = data[0] if len(data) == 1 else np.concatenate(data)
+    return data, np.concatenate(y_values), meta_data
+
+
+def _iter_data(file, meta_data, replace_missing_vals_with="NaN", batch_size=1000):
+    """Parse the data section of a .ts file in batches of cases.
+
+    Each batch of lines is parsed with a single ``np.fromstring`` call when the
+    series are of equal length, writing straight into a
+    ``(n_lines, n_channels, series_length)`` array. Batches that do not match the
+    shape of the first case, or contain values that cannot be parsed, are parsed
+    again one value at a time so the error raised names the offending case.
+
+    Parameters
+    ----------
+    file : stream, input file to read data from, assume no comments or header info
+    meta_data : dict.
+        with meta data in the file header loaded with _load_header_info
+    replace_missing_vals_with : string, default="NaN"
+        missing values in the file are replaced with this value
+    batch_size : int, default=1000
+        maximum number of cases in each batch
+
+    Yields
+    ------
+    X : np.ndarray or list[np.ndarray].
+        numpy array of shape (n_lines, n_channels, series_length) if the series are
+        equal length, list of numpy arrays of shape (n_channels, n_timepoints)
+        otherwise
+    y : np.ndarray.
+        numpy array of strings: the class/target variable values, empty if the file
+        has no labels
+    """
+    labelled = meta_data["classlabel"] or meta_data["targetlabel"]
     n_cases = 0
-    n_channels = 0  # Assumed the same for all
-    current_channels = 0
-    series_length = 0
+    shape = None
+    while True:
+        lines = list(itertools.islice(file, batch_size))
+        if not lines:
+            return
+        lines = [
+            line.strip().lower().replace("?", replace_missing_vals_with)
+            for line in lines
+        ]
+        if shape is None:
+            # The number of channels and, for equal length, the series length are
+            # those of the first case
+            first = lines[0].split(":")
+            n_channels = len(first) - 1 if labelled else len(first)
+            series_length = len(first[0].split(","))
+            shape = (n_channels, series_length)
+        parsed = None
+        if meta_data["equallength"] and (not meta_data["univariate"] or n_channels < 2):
+            parsed = _parse_equal_length_lines(lines, labelled, *shape)
+        if parsed is None:
+            parsed = _parse_lines(lines, meta_data, n_cases, *shape)
+        n_cases += len(lines)
+        yield parsed
+
+
+def _parse_equal_length_lines(lines, labelled, n_channels, series_length):
+    """Parse lines of equal length cases, or return None if they do not match."""
+    if labelled:
+        parts = [line.rpartition(":") for line in lines]
+        values = [part[0] if part[1] else None for part in parts]
+        y_values = [part[2] for part in parts]
+    else:
+        values = lines
+        y_values = []
+    # Every channel of every case must have series_length values, otherwise the
+    # values of the batch cannot be reshaped to the cases.
+    for case in values:
+        if case is None:
+            return None
+        channels = case.split(":")
+        if len(channels) != n_channels:
+            return None
+        for channel in channels:
+            if channel.count(",") != series_length - 1:
+                return None
+    text = ",".join(values).replace(":", ",")
+    try:
+        with warnings.catch_warnings():
+            # Values that cannot be parsed only warn in np.fromstring
+            warnings.simplefilter("error", DeprecationWarning)
+            X = np.fromstring(text, sep=",")
+    except (DeprecationWarning, ValueError):
+        return None
+    if X.shape[0] != len(lines) * n_channels * series_length:
+        return None
+    return X.reshape((len(lines), n_channels, series_length)), np.asarray(y_values)
+
+
+def _parse_lines(lines, meta_data, n_cases, n_channels, series_length):
+    """Parse lines one case at a time, checking them against the meta data."""
+    data = []
     y_values = []
-    for line in file:
-        line = line.strip().lower()
-        line = line.replace("?", replace_missing_vals_with)
+    for line in lines:
         channels = line.split(":")
         n_cases += 1
         current_channels = len(channels)
         if meta_data["classlabel"] or meta_data["targetlabel"]:
             current_channels -= 1
-        if n_cases == 1:  # Find n_channels and length  from first if not unequal
-            n_channels = current_channels
-            if meta_data["equallength"]:
-                series_length = len(channels[0].split(","))
-        else:
+        if n_cases > 1:
             if current_channels != n_channels:
                 raise IOError(
                     f"Inconsistent number of dimensions in case {n_cases}. "
@@ -161,21 +264,20 @@ def _load_data(file, meta_data, replace_missing_vals_with="NaN"):
         np_case = np.zeros(shape=(n_channels, current_length))
         for i in range(0, n_channels):
             single_channel = channels[i].strip()
-            data_series = single_channel.split(",")
-            data_series = [float(x) for x in data_series]
+            data_series = np.array(single_channel.split(","), dtype=np.float64)
             if len(data_series) != current_length:
                 raise IOError(
                     f"Unequal length series, in case {n_cases} meta "
                     f"data specifies all equal {series_length} but saw "
                     f"{len(single_channel)}"
                 )
-            np_case[i] = np.array(data_series)
+            np_case[i] = data_series
         data.append(np_case)
         if meta_data["classlabel"] or meta_data["targetlabel"]:
             y_values.append(channels[n_channels])
     if meta_data["equallength"]:
         data = np.array(data)
-    return data, np.asarray(y_values), meta_data
+    return data, np.asarray(y_values)
 
 
 def load_from_tsfile(
@@ -228,7 +330,7 @@ def load_from_tsfile(
 
     # if equal load to 3D numpy
     if meta_data["equallength"]:
-        data = np.array(data)
+        data = np.asarray(data)
         if return_type == "numpy2D" and meta_data["univariate"]:
             data = data.squeeze()
     # If regression problem, convert y to float
@@ -239,6 +341,141 @@ def load_from_tsfile(
     return data, y
 
 
+def load_from_tsfile_in_batches(
+    full_file_path_and_name,
+    batch_size=1000,
+    replace_missing_vals_with="NaN",
+    return_type="auto",
+):
+    """Load a .ts file as a stream of batches of cases.
+
+    Only one batch of cases is held in memory at a time, so files larger than
+    memory can be used to train estimators that learn incrementally.
+
+    Parameters
+    ----------
+    full_file_path_and_name : string
+        full path of the file to load, .ts extension is assumed.
+    batch_size : int, default=1000
+        maximum number of cases in each batch. The last batch may be smaller.
+    replace_missing_vals_with : string, default="NaN"
+        missing values in the file are replaced with this value
+    return_type : string, default = "auto"
+        data type to convert to.
+        If "auto", yields numpy3D for equal length and list of numpy2D for unequal.
+        If "numpy2D", will squash a univariate equal length into a numpy2D (n_cases,
+        n_timepoints).
+
+    Yields
+    ------
+    X : Union[np.ndarray,list]
+        time series data of the batch, np.ndarray (batch_size, n_channels,
+        series_length) if equal length time series, list of [batch_size] np.ndarray
+        (n_channels, n_timepoints) if unequal length series.
+    y : target variable of the batch, np.ndarray of string or float
+
+    Raises
+    ------
+    IOError if the load fails.
+
+    Examples
+    --------
+    >>> import os
+    >>> import aeon
+    >>> from aeon.datasets import load_from_tsfile_in_batches
+    >>> path = os.path.join(
+    ...     os.path.dirname(aeon.__file__), "datasets/data/UnitTest/UnitTest_TRAIN.ts"
+    ... )
+    >>> for X, y in load_from_tsfile_in_batches(path, batch_size=8):
+    ...     print(X.shape, y.shape)
+    (8, 1, 24) (8,)
+    (8, 1, 24) (8,)
+    (4, 1, 24) (4,)
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, but found {batch_size}")
+    if not full_file_path_and_name.endswith(".ts"):
+        full_file_path_and_name = full_file_path_and_name + ".ts"
+    with open(full_file_path_and_name, "r", encoding="utf-8") as file:
+        meta_data = _load_header_info(file)
+        for X, y in _iter_data(file, meta_data, replace_missing_vals_with, batch_size):
+            if (
+                meta_data["equallength"]
+                and return_type == "numpy2D"
+                and meta_data["univariate"]
+            ):
+                X = X.reshape((X.shape[0], X.shape[2]))
+            if meta_data["targetlabel"]:
+                y = y.astype(float)
+            yield X, y
+
+
+def _load_tsfile_cached(full_file_path_and_name, cache=False, mmap_mode=None):
+    """Load a .ts file with load_from_tsfile, through the binary cache if cache.
+
+    Unequal length series are cached concatenated along the time axis, and split
+    back into a list of views when loaded.
+    """
+    if cache:
+        arrays, meta_data = read_cache(full_file_path_and_name, mmap_mode=mmap_mode)
+        if arrays is not None:
+            X = arrays["X"]
+            if not meta_data["equallength"]:
+                X = np.split(X, np.cumsum(arrays["lengths"])[:-1], axis=1)
+            return X, arrays["y"], meta_data
+
+    X, y, meta_data = load_from_tsfile(full_file_path_and_name, return_meta_data=True)
+    if cache and len(X) > 0:
+        if meta_data["equallength"]:
+            arrays = {"X": X, "y": y}
+        else:
+            arrays = {
+                "X": np.concatenate(X, axis=1),
+                "lengths": np.array([x.shape[1] for x in X]),
+                "y": y,
+            }
+        write_cache(full_file_path_and_name, arrays, meta_data)
+    return X, y, meta_data
+
+
+def _load_tsf_cached(full_file_path_and_name, cache=False, mmap_mode=None):
+    """Load a .tsf file with load_from_tsf_file, through the binary cache if cache.
+
+    The series are cached concatenated, and only if none of them have missing
+    values, which load_from_tsf_file stores as strings.
+    """
+    if cache:
+        arrays, metadata = read_cache(full_file_path_and_name, mmap_mode=mmap_mode)
+        if arrays is not None:
+            columns = metadata.pop("columns")
+            data = {col: arrays[f"column{i}"] for i, col in enumerate(columns[:-1])}
+            data[columns[-1]] = [
+                pd.Series(series).array
+                for series in np.split(
+                    arrays["values"], np.cumsum(arrays["lengths"])[:-1]
+                )
+            ]
+            return pd.DataFrame(data), metadata
+
+    data, metadata = load_from_tsf_file(full_file_path_and_name)
+    all_series = [np.asarray(series) for series in data.iloc[:, -1]]
+    if cache and all(series.dtype == np.float64 for series in all_series):
+        arrays = {
+            f"column{i}": data[col].to_numpy(
+                dtype=str if data[col].dtype == object else None
+            )
+            for i, col in enumerate(data.columns[:-1])
+        }
+        arrays["values"] = np.concatenate(all_series)
+        arrays["lengths"] = np.array([len(series) for series in all_series])
+        write_cache(
+            full_file_path_and_name,
+            arrays,
+            dict(metadata, columns=list(data.columns)),
+        )
+    return data, metadata
+
+
 def _load_saved_dataset(
     name,
     split=None,
@@ -247,6 +484,8 @@ def _load_saved_dataset(
     local_module=MODULE,
     local_dirname=DIRNAME,
     return_meta=False,
+    cache=False,
+    mmap_mode=None,
 ):
     """Load baked in time series classification datasets (helper function).
 
@@ -270,6 +509,12 @@ def _load_saved_dataset(
         will not necessarily be supported longterm.
     local_module: default = os.path.dirname(__file__),
     local_dirname: default = "data"
+    cache : bool, default=False
+        Load the .ts files from a binary cache saved next to them, written on the
+        first load.
+    mmap_mode : None or str{"r", "r+", "c"}, default=None
+        Memory map the cached arrays with this mode of ``np.load``. Only used if
+        cache is True.
 
     Raises
     ------
@@ -292,18 +537,16 @@ def _load_saved_dataset(
     if split in ("TRAIN", "TEST"):
         fname = name + "_" + split + ".ts"
         abspath = os.path.join(local_module, local_dirname, name, fname)
-        X, y, meta_data = load_from_tsfile(abspath, return_meta_data=True)
+        X, y, meta_data = _load_tsfile_cached(abspath, cache, mmap_mode)
     # if split is None, load both train and test set
     elif split is None:
         fname = name + "_TRAIN.ts"
         abspath = os.path.join(local_module, local_dirname, name, fname)
-        X_train, y_train, meta_data = load_from_tsfile(abspath, return_meta_data=True)
+        X_train, y_train, meta_data = _load_tsfile_cached(abspath, cache, mmap_mode)
 
         fname = name + "_TEST.ts"
         abspath = os.path.join(local_module, local_dirname, name, fname)
-        X_test, y_test, meta_data_test = load_from_tsfile(
-            abspath, return_meta_data=True
-        )
+        X_test, y_test, meta_data_test = _load_tsfile_cached(abspath, cache, mmap_mode)
         if meta_data["equallength"]:
             X = np.concatenate([X_train, X_test])
         else:
@@ -391,7 +634,14 @@ def _download_and_extract(url, extract_path=None):
 
 
 def _load_tsc_dataset(
-    name, split, return_X_y=True, return_type=None, extract_path=None, return_meta=False
+    name,
+    split,
+    return_X_y=True,
+    return_type=None,
+    extract_path=None,
+    return_meta=False,
+    cache=False,
+    mmap_mode=None,
 ):
     """Load time series classification datasets (helper function).
 
@@ -414,6 +664,12 @@ def _load_tsc_dataset(
     extract_path : optional (default = None)
         Path of the location for the data file. If none, data is written to
         os.path.dirname(__file__)/data/
+    cache : bool, default=False
+        Load the .ts files from a binary cache saved next to them, written on the
+        first load.
+    mmap_mode : None or str{"r", "r+", "c"}, default=None
+        Memory map the cached arrays with this mode of ``np.load``. Only used if
+        cache is True.
 
     Raises
     ------
@@ -470,6 +726,8 @@ def _load_tsc_dataset(
         local_module=local_module,
         local_dirname=local_dirname,
         return_meta=return_meta,
+        cache=cache,
+        mmap_mode=mmap_mode,
     )
 
 
@@ -515,183 +773,25 @@ def load_tsf_to_dataframe(
         "frequency", "forecast_horizon", "contain_missing_values",
         "contain_equal_length"
     """
-    col_names = []
-    col_types = []
-    all_data = {}
-    line_count = 0
-    frequency = None
-    forecast_horizon = None
-    contain_missing_values = None
-    contain_equal_length = None
-    found_data_tag = False
-    found_data_section = False
-    started_reading_data_section = False
-
-    with open(full_file_path_and_name, "r", encoding="cp1252") as file:
-        for line in file:
-            # Strip white space from start/end of line
-            line = line.strip()
-
-            if line:
-                if line.startswith("@"):  # Read meta-data
-                    if not line.startswith("@data"):
-                        line_content = line.split(" ")
-                        if line.startswith("@attribute"):
-                            if (
-                                len(line_content) != 3
-                            ):  # Attributes have both name and type
-                                raise Exception("Invalid meta-data specification.")
-
-                            col_names.append(line_content[1])
-                            col_types.append(line_content[2])
-                        else:
-                            if (
-                                len(line_content) != 2
-                            ):  # Other meta-data have only values
-                                raise Exception("Invalid meta-data specification.")
-
-                            if line.startswith("@frequency"):
-                                frequency = line_content[1]
-                            elif line.startswith("@horizon"):
-                                forecast_horizon = int(line_content[1])
-                            elif line.startswith("@missing"):
-                                contain_missing_values = bool(
-                                    strtobool(line_content[1])
-                                )
-                            elif line.startswith("@equallength"):
-                                contain_equal_length = bool(strtobool(line_content[1]))
-
-                    else:
-                        if len(col_names) == 0:
-                            raise Exception(
-                                "Missing attribute section. "
-                                "Attribute section must come before data."
-                            )
-
-                        found_data_tag = True
-                elif not line.startswith("#"):
-                    if len(col_names) == 0:
-                        raise Exception(
-                            "Missing attribute section. "
-                            "Attribute section must come before data."
-                        )
-                    elif not found_data_tag:
-                        raise Exception("Missing @data tag.")
-                    else:
-                        if not started_reading_data_section:
-                            started_reading_data_section = True
-                            found_data_section = True
-                            all_series = []
-
-                            for col in col_names:
-                                all_data[col] = []
-
-                        full_info = line.split(":")
-
-                        if len(full_info) != (len(col_names) + 1):
-                            raise Exception("Missing attributes/values in series.")
-
-                        series = full_info[len(full_info) - 1]
-                        series = series.split(",")
-
-                        if len(series) == 0:
-                            raise Exception(
-                                "A given series should contains a set "
-                                "of comma separated numeric values."
-                                "At least one numeric value should be there "
-                                "in a series. "
-                                "Missing values should be indicated with ? symbol"
-                            )
-
-                        numeric_series = []
-
-                        for val in series:
-                            if val == "?":
-                                numeric_series.append(replace_missing_vals_with)
-                            else:
-                                numeric_series.append(float(val))
-
-                        if numeric_series.count(replace_missing_vals_with) == len(
-                            numeric_series
-                        ):
-                            raise Exception(
-                                "All series values are missing. "
-                                "A given series should contains a set "
-                                "of comma separated numeric values."
-                                "At least one numeric value should be there "
-                                "in a series."
-                            )
-
-                        all_series.append(pd.Series(numeric_series).array)
-
-                        for i in range(len(col_names)):
-                            att_val = None
-                            if col_types[i] == "numeric":
-                                att_val = int(full_info[i])
-                            elif col_types[i] == "string":
-                                att_val = str(full_info[i])
-                            elif col_types[i] == "date":
-                                att_val = datetime.strptime(
-                                    full_info[i], "%Y-%m-%d %H-%M-%S"
-                                )
-                            else:
-                                # Currently, the code supports only
-                                # numeric, string and date types.
-                                # Extend this as required.
-                                raise Exception("Invalid attribute type.")
-
-                            if att_val is None:
-                                raise Exception("Invalid attribute value.")
-                            else:
-                                all_data[col_names[i]].append(att_val)
-
-                line_count = line_count + 1
-
-        if line_count == 0:
-            raise Exception("Empty file.")
-        if len(col_names) == 0:
-            raise Exception("Missing attribute section.")
-        if not found_data_section:
-            raise Exception("Missing series information under data section.")
-
-        all_data[value_column_name] = all_series
-        loaded_data = pd.DataFrame(all_data)
-
-        # metadata dict
-        metadata = dict(
-            zip(
-                (
-                    "frequency",
-                    "forecast_horizon",
-                    "contain_missing_values",
-                    "contain_equal_length",
-                ),
-                (
-                    frequency,
-                    forecast_horizon,
-                    contain_missing_values,
-                    contain_equal_length,
-                ),
-            )
+    if return_type in ["default_tsf", "tsf_default"]:
+        return load_from_tsf_file(
+            full_file_path_and_name, replace_missing_vals_with, value_column_name
         )
-
-        if return_type != "default_tsf":
-            loaded_data = _convert_tsf_to_hierarchical(
-                loaded_data, metadata, value_column_name=value_column_name
-            )
-            if (
-                loaded_data.index.nlevels == 2
-                and return_type not in MTYPE_LIST_HIERARCHICAL
-            ):
-                loaded_data = convert(
-                    loaded_data, from_type="pd-multiindex", to_type=return_type
-                )
-            else:
-                loaded_data = convert(
-                    loaded_data, from_type="pd_multiindex_hier", to_type=return_type
-                )
-
-        return loaded_data, metadata
+    loaded_data, metadata = load_from_tsf_file(
+        full_file_path_and_name,
+        replace_missing_vals_with,
+        value_column_name,
+        return_type="pd_multiindex_hier",
+    )
+    if loaded_data.index.nlevels == 2 and return_type not in MTYPE_LIST_HIERARCHICAL:
+        loaded_data = convert(
+            loaded_data, from_type="pd-multiindex", to_type=return_type
+        )
+    else:
+        loaded_data = convert(
+            loaded_data, from_type="pd_multiindex_hier", to_type=return_type
+        )
+    return loaded_data, metadata
 
 
 def load_from_arff_file(
@@ -864,10 +964,220 @@ def _convert_tsf_to_hierarchical(
     return df
 
 
+# Pandas frequencies of the .tsf frequencies, to index series with a start timestamp
+_TSF_FREQUENCIES = {
+    "4_seconds": "4S",
+    "minutely": "min",
+    "10_minutes": "10min",
+    "half_hourly": "30min",
+    "hourly": "H",
+    "daily": "D",
+    "weekly": "W",
+    "monthly": "MS",
+    "quarterly": "QS",
+    "yearly": "YS",
+}
+_TSF_RETURN_TYPES = ["tsf_default", "pd_multiindex_hier", "np-list"]
+
+
+def _load_tsf_header(file):
+    """Load the meta data from a .tsf file and advance file to the data.
+
+    Parameters
+    ----------
+    file : stream.
+        input file to read header from, assumed to be just opened
+
+    Returns
+    -------
+    col_names : list of str
+        names of the attributes of each series
+    col_types : list of str
+        types of the attributes of each series, "numeric", "string" or "date"
+    metadata : dict
+        "frequency", "forecast_horizon", "contain_missing_values" and
+        "contain_equal_length" in the header, None if missing
+    """
+    col_names = []
+    col_types = []
+    metadata = {
+        "frequency": None,
+        "forecast_horizon": None,
+        "contain_missing_values": None,
+        "contain_equal_length": None,
+    }
+    line_count = 0
+    for line in file:
+        line = line.strip()
+        if not line:
+            continue
+        line_count += 1
+        if line.startswith("@data"):
+            if len(col_names) == 0:
+                raise Exception(
+                    "Missing attribute section. "
+                    "Attribute section must come before data."
+                )
+            return col_names, col_types, metadata
+        elif line.startswith("@"):
+            line_content = line.split(" ")
+            if line.startswith("@attribute"):
+                # Attributes have both name and type
+                if len(line_content) != 3:
+                    raise Exception("Invalid meta-data specification.")
+                if line_content[2] not in ["numeric", "string", "date"]:
+                    # Currently, the code supports only numeric, string and date
+                    # types. Extend this as required.
+                    raise Exception("Invalid attribute type.")
+                col_names.append(line_content[1])
+                col_types.append(line_content[2])
+            else:
+                # Other meta-data have only values
+                if len(line_content) != 2:
+                    raise Exception("Invalid meta-data specification.")
+                if line.startswith("@frequency"):
+                    metadata["frequency"] = line_content[1]
+                elif line.startswith("@horizon"):
+                    metadata["forecast_horizon"] = int(line_content[1])
+                elif line.startswith("@missing"):
+                    metadata["contain_missing_values"] = bool(
+                        strtobool(line_content[1])
+                    )
+                elif line.startswith("@equallength"):
+                    metadata["contain_equal_length"] = bool(strtobool(line_content[1]))
+        elif not line.startswith("#"):
+            if len(col_names) == 0:
+                raise Exception(
+                    "Missing attribute section. "
+                    "Attribute section must come before data."
+                )
+            raise Exception("Missing @data tag.")
+    if line_count == 0:
+        raise Exception("Empty file.")
+    if len(col_names) == 0:
+        raise Exception("Missing attribute section.")
+    raise Exception("Missing series information under data section.")
+
+
+def _parse_tsf_lines(lines, col_names, col_types):
+    """Parse lines of the data section of a .tsf file.
+
+    The values of all the series in lines are parsed with a single
+    ``np.fromstring`` call. If any cannot be parsed, they are parsed again one value
+    at a time so that the error raised names the offending value.
+
+    Returns
+    -------
+    attributes : dict
+        numpy array of the attribute of each series, by attribute name
+    values : np.ndarray
+        the values of the series concatenated, with missing values as NaN
+    lengths : np.ndarray
+        the length of each series
+    """
+    n_cols = len(col_names)
+    parts = [line.split(":") for line in lines]
+    if any(len(part) != n_cols + 1 for part in parts):
+        raise Exception("Missing attributes/values in series.")
+    series = [part[n_cols] for part in parts]
+    lengths = np.array([s.count(",") + 1 for s in series])
+
+    values = None
+    try:
+        with warnings.catch_warnings():
+            # Values that cannot be parsed only warn in np.fromstring
+            warnings.simplefilter("error", DeprecationWarning)
+            values = np.fromstring(",".join(series).replace("?", "nan"), sep=",")
+    except (DeprecationWarning, ValueError):
+        pass
+    if values is None or len(values) != lengths.sum():
+        values = np.array(
+            [np.nan if v == "?" else float(v) for s in series for v in s.split(",")]
+        )
+    starts = np.cumsum(lengths) - lengths
+    if np.any(np.add.reduceat(~np.isnan(values), starts) == 0):
+        raise Exception(
+            "All series values are missing. "
+            "A given series should contains a set "
+            "of comma separated numeric values."
+            "At least one numeric value should be there "
+            "in a series."
+        )
+
+    attributes = {}
+    for i, (col_name, col_type) in enumerate(zip(col_names, col_types)):
+        column = [part[i] for part in parts]
+        if col_type == "numeric":
+            attributes[col_name] = np.array(column).astype(np.int64)
+        elif col_type == "string":
+            attributes[col_name] = np.array(column, dtype=object)
+        else:
+            attributes[col_name] = pd.to_datetime(
+                column, format="%Y-%m-%d %H-%M-%S"
+            ).values
+    return attributes, values, lengths
+
+
+def _tsf_series_to_return_type(
+    attributes,
+    values,
+    lengths,
+    metadata,
+    replace_missing_vals_with,
+    value_column_name,
+    return_type,
+):
+    """Convert the parsed series of a .tsf file to the return type."""
+    if return_type == "np-list":
+        return [s.reshape((1, -1)) for s in np.split(values, np.cumsum(lengths)[:-1])]
+
+    if return_type == "tsf_default":
+        all_series = []
+        for s in np.split(values, np.cumsum(lengths)[:-1]):
+            missing = np.isnan(s)
+            if missing.any():
+                s = s.astype(object)
+                s[missing] = replace_missing_vals_with
+            all_series.append(pd.array(s, dtype=s.dtype, copy=False))
+        data = dict(attributes)
+        data[value_column_name] = all_series
+        return pd.DataFrame(data)
+
+    # pd_multiindex_hier, indexed by the attributes and the time stamps
+    if "start_timestamp" in attributes:
+        if metadata["frequency"] not in _TSF_FREQUENCIES:
+            raise ValueError(
+                f"Cannot create time stamps for frequency {metadata['frequency']}"
+            )
+        freq = _TSF_FREQUENCIES[metadata["frequency"]]
+        # One date range for each distinct start, long enough for its longest series
+        starts, inverse = np.unique(attributes["start_timestamp"], return_inverse=True)
+        max_lengths = np.zeros(len(starts), dtype=int)
+        np.maximum.at(max_lengths, inverse, lengths)
+        ranges = [
+            pd.date_range(start=start, periods=length, freq=freq).values
+            for start, length in zip(starts, max_lengths)
+        ]
+        timestamps = np.concatenate(
+            [ranges[i][:length] for i, length in zip(inverse, lengths)]
+        )
+    else:
+        timestamps = np.arange(len(values)) - np.repeat(
+            np.cumsum(lengths) - lengths, lengths
+        )
+    names = [name for name in attributes.keys() if name != "start_timestamp"]
+    index = pd.MultiIndex.from_arrays(
+        [np.repeat(attributes[name], lengths) for name in names] + [timestamps],
+        names=names + ["timestamp"],
+    )
+    return pd.DataFrame({value_column_name: values}, index=index)
+
+
 def load_from_tsf_file(
     full_file_path_and_name,
     replace_missing_vals_with="NaN",
     value_column_name="series_value",
+    return_type="tsf_default",
 ):
     """
     Convert the contents in a .tsf file into a dataframe.
@@ -884,179 +1194,132 @@ def load_from_tsf_file(
     value_column_name: str, default="series_value"
         Any name that is preferred to have as the name of the column containing series
         values in the returning dataframe.
+    return_type : str, default="tsf_default"
+        The container of the series:
+        - "tsf_default" = pd.DataFrame with a column for each attribute and a column
+            of the series values, as in the original implementation.
+        - "pd_multiindex_hier" = pd.DataFrame of aeon type `pd_multiindex_hier`,
+            indexed by the attributes and the time stamps, with missing values as
+            NaN.
+        - "np-list" = list of np.ndarray of shape (1, n_timepoints), with missing
+            values as NaN.
 
     Returns
     -------
-    loaded_data: pd.DataFrame
+    loaded_data: pd.DataFrame or list of np.ndarray
         The converted dataframe containing the time series.
     metadata: dict
         The metadata for the forecasting problem. The dictionary keys are:
         "frequency", "forecast_horizon", "contain_missing_values",
         "contain_equal_length"
     """
-    col_names = []
-    col_types = []
-    all_data = {}
-    line_count = 0
-    frequency = None
-    forecast_horizon = None
-    contain_missing_values = None
-    contain_equal_length = None
-    found_data_tag = False
-    found_data_section = False
-    started_reading_data_section = False
-
+    if return_type not in _TSF_RETURN_TYPES:
+        raise ValueError(
+            f"return_type must be one of {_TSF_RETURN_TYPES}, but found {return_type}"
+        )
     with open(full_file_path_and_name, "r", encoding="cp1252") as file:
-        for line in file:
-            # Strip white space from start/end of line
-            line = line.strip()
-
-            if line:
-                if line.startswith("@"):  # Read meta-data
-                    if not line.startswith("@data"):
-                        line_content = line.split(" ")
-                        if line.startswith("@attribute"):
-                            if (
-                                len(line_content) != 3
-                            ):  # Attributes have both name and type
-                                raise Exception("Invalid meta-data specification.")
-
-                            col_names.append(line_content[1])
-                            col_types.append(line_content[2])
-                        else:
-                            if (
-                                len(line_content) != 2
-                            ):  # Other meta-data have only values
-                                raise Exception("Invalid meta-data specification.")
-
-                            if line.startswith("@frequency"):
-                                frequency = line_content[1]
-                            elif line.startswith("@horizon"):
-                                forecast_horizon = int(line_content[1])
-                            elif line.startswith("@missing"):
-                                contain_missing_values = bool(
-                                    strtobool(line_content[1])
-                                )
-                            elif line.startswith("@equallength"):
-                                contain_equal_length = bool(strtobool(line_content[1]))
-
-                    else:
-                        if len(col_names) == 0:
-                            raise Exception(
-                                "Missing attribute section. "
-                                "Attribute section must come before data."
-                            )
-
-                        found_data_tag = True
-                elif not line.startswith("#"):
-                    if len(col_names) == 0:
-                        raise Exception(
-                            "Missing attribute section. "
-                            "Attribute section must come before data."
-                        )
-                    elif not found_data_tag:
-                        raise Exception("Missing @data tag.")
-                    else:
-                        if not started_reading_data_section:
-                            started_reading_data_section = True
-                            found_data_section = True
-                            all_series = []
-
-                            for col in col_names:
-                                all_data[col] = []
+        col_names, col_types, metadata = _load_tsf_header(file)
+        lines = [
+            line
+            for line in (line.strip() for line in file)
+            if line and not line.startswith(("#", "@"))
+        ]
+    if not lines:
+        raise Exception("Missing series information under data section.")
+    loaded_data = _tsf_series_to_return_type(
+        *_parse_tsf_lines(lines, col_names, col_types),
+        metadata,
+        replace_missing_vals_with,
+        value_column_name,
+        return_type,
+    )
+    return loaded_data, metadata
 
-                        full_info = line.split(":")
 
-                        if len(full_info) != (len(col_names) + 1):
-                            raise Exception("Missing attributes/values in series.")
+def load_from_tsf_file_in_batches(
+    full_file_path_and_name,
+    batch_size=1000,
+    replace_missing_vals_with="NaN",
+    value_column_name="series_value",
+    return_type="tsf_default",
+):
+    """Load a .tsf file as a stream of batches of series.
 
-                        series = full_info[len(full_info) - 1]
-                        series = series.split(",")
+    Only one batch of series is held in memory at a time, so files larger than
+    memory can be processed.
 
-                        if len(series) == 0:
-                            raise Exception(
-                                "A given series should contains a set "
-                                "of comma separated numeric values."
-                                "At least one numeric value should be there "
-                                "in a series. "
-                                "Missing values should be indicated with ? symbol"
-                            )
+    Parameters
+    ----------
+    full_file_path_and_name: str
+        The full path to the .tsf file.
+    batch_size : int, default=1000
+        maximum number of series in each batch. The last batch may be smaller.
+    replace_missing_vals_with: str, default="NAN"
+        A term to indicate the missing values in series in the returning dataframe.
+    value_column_name: str, default="series_value"
+        Any name that is preferred to have as the name of the column containing series
+        values in the returning dataframe.
+    return_type : str, default="tsf_default"
+        The container of the series of each batch, "tsf_default",
+        "pd_multiindex_hier" or "np-list". See :func:`load_from_tsf_file`.
 
-                        numeric_series = []
-
-                        for val in series:
-                            if val == "?":
-                                numeric_series.append(replace_missing_vals_with)
-                            else:
-                                numeric_series.append(float(val))
-
-                        if numeric_series.count(replace_missing_vals_with) == len(
-                            numeric_series
-                        ):
-                            raise Exception(
-                                "All series values are missing. "
-                                "A given series should contains a set "
-                                "of comma separated numeric values."
-                                "At least one numeric value should be there "
-                                "in a series."
-                            )
+    Yields
+    ------
+    loaded_data: pd.DataFrame or list of np.ndarray
+        The series of the batch.
+    metadata: dict
+        The metadata for the forecasting problem. The dictionary keys are:
+        "frequency", "forecast_horizon", "contain_missing_values",
+        "contain_equal_length"
 
-                        all_series.append(pd.Series(numeric_series).array)
-
-                        for i in range(len(col_names)):
-                            att_val = None
-                            if col_types[i] == "numeric":
-                                att_val = int(full_info[i])
-                            elif col_types[i] == "string":
-                                att_val = str(full_info[i])
-                            elif col_types[i] == "date":
-                                att_val = datetime.strptime(
-                                    full_info[i], "%Y-%m-%d %H-%M-%S"
-                                )
-                            else:
-                                # Currently, the code supports only
-                                # numeric, string and date types.
-                                # Extend this as required.
-                                raise Exception("Invalid attribute type.")
-
-                            if att_val is None:
-                                raise Exception("Invalid attribute value.")
-                            else:
-                                all_data[col_names[i]].append(att_val)
-
-                line_count = line_count + 1
-
-        if line_count == 0:
-            raise Exception("Empty file.")
-        if len(col_names) == 0:
-            raise Exception("Missing attribute section.")
-        if not found_data_section:
-            raise Exception("Missing series information under data section.")
-
-        all_data[value_column_name] = all_series
-        loaded_data = pd.DataFrame(all_data)
-
-        # metadata dict
-        metadata = dict(
-            zip(
-                (
-                    "frequency",
-                    "forecast_horizon",
-                    "contain_missing_values",
-                    "contain_equal_length",
-                ),
-                (
-                    frequency,
-                    forecast_horizon,
-                    contain_missing_values,
-                    contain_equal_length,
-                ),
-            )
+    Examples
+    --------
+    >>> import os
+    >>> import aeon
+    >>> from aeon.datasets import load_from_tsf_file_in_batches
+    >>> path = os.path.join(
+    ...     os.path.dirname(aeon.__file__),
+    ...     "datasets/data/UnitTest/UnitTest_Tsf_Loader.tsf",
+    ... )
+    >>> for X, _ in load_from_tsf_file_in_batches(path, 2, return_type="np-list"):
+    ...     print([x.shape for x in X])
+    [(1, 7), (1, 3)]
+    [(1, 5)]
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, but found {batch_size}")
+    if return_type not in _TSF_RETURN_TYPES:
+        raise ValueError(
+            f"return_type must be one of {_TSF_RETURN_TYPES}, but found {return_type}"
         )
-        return loaded_data, metadata
+    with open(full_file_path_and_name, "r", encoding="cp1252") as file:
+        col_names, col_types, metadata = _load_tsf_header(file)
+        lines_iter = (
+            line
+            for line in (line.strip() for line in file)
+            if line and not line.startswith(("#", "@"))
+        )
+        n_series = 0
+        while True:
+            lines = list(itertools.islice(lines_iter, batch_size))
+            if not lines:
+                break
+            n_series += len(lines)
+            loaded_data = _tsf_series_to_return_type(
+                *_parse_tsf_lines(lines, col_names, col_types),
+                metadata,
+                replace_missing_vals_with,
+                value_column_name,
+                return_type,
+            )
+            yield loaded_data, metadata
+    if n_series == 0:
+        raise Exception("Missing series information under data section.")
 
 
-def load_forecasting(name, extract_path=None, return_metadata=True):
+def load_forecasting(
+    name, extract_path=None, return_metadata=True, cache=False, mmap_mode=None
+):
     """Download/load forecasting problem from https://forecastingdata.org/.
 
     Parameters
@@ -1067,6 +1330,12 @@ def load_forecasting(name, extract_path=None, return_metadata=True):
         os.path.dirname(__file__)/data/
     return_metadata : boolean, default = True
         If True, returns a tuple (data, metadata)
+    cache : bool, default=False
+        Load the .tsf file from a binary cache saved next to it, written on the
+        first load. Problems with missing values are not cached.
+    mmap_mode : None or str{"r", "r+", "c"}, default=None
+        Memory map the cached arrays with this mode of ``np.load``. Only used if
+        cache is True.
 
     Raises
     ------
@@ -1131,13 +1400,20 @@ def load_forecasting(name, extract_path=None, return_metadata=True):
                 z = zipfile.ZipFile(file_save, "r")
                 z.extractall(f"{local_module}/{local_dirname}/{name}/")
     full_name = f"{local_module}/{local_dirname}/{name}/{name}.tsf"
-    data, meta = load_from_tsf_file(full_file_path_and_name=full_name)
+    data, meta = _load_tsf_cached(full_name, cache, mmap_mode)
     if return_metadata:
         return data, meta
     return data
 
 
-def load_regression(name, split=None, extract_path=None, return_metadata=True):
+def load_regression(
+    name,
+    split=None,
+    extract_path=None,
+    return_metadata=True,
+    cache=False,
+    mmap_mode=None,
+):
     """Download/load forecasting problem from https://forecastingdata.org/.
 
     Parameters
@@ -1152,6 +1428,14 @@ def load_regression(name, split=None, extract_path=None, return_metadata=True):
         format <name>_TRAIN.ts or <name>_TEST.ts.
     return_metadata : boolean, default = True
         If True, returns a tuple (X, y, metadata)
+    cache : bool, default=False
+        Load the .ts files from a binary cache of numpy .npy files saved next to
+        them, written on the first load. The cache is rewritten if the .ts files
+        change.
+    mmap_mode : None or str{"r", "r+", "c"}, default=None
+        Memory map the cached arrays with this mode of ``np.load`` instead of reading
+        them into memory. Only used if cache is True. Loading both splits
+        concatenates them into memory.
 
     Raises
     ------
@@ -1229,10 +1513,19 @@ def load_regression(name, split=None, extract_path=None, return_metadata=True):
         local_module=local_module,
         local_dirname=local_dirname,
         return_meta=return_metadata,
+        cache=cache,
+        mmap_mode=mmap_mode,
     )
 
 
-def load_classification(name, split=None, extract_path=None, return_metadata=True):
+def load_classification(
+    name,
+    split=None,
+    extract_path=None,
+    return_metadata=True,
+    cache=False,
+    mmap_mode=None,
+):
     """Load a classification dataset.
 
     Loads a TSC dataset from extract_path, or from timeseriesclassification.com,
@@ -1265,6 +1558,14 @@ def load_classification(name, split=None, extract_path=None, return_metadata=Tru
         e.g. C:/Temp/ or relative, e.g. Temp/ or ./Temp/.
     return_metadata : boolean, default = True
         If True, returns a tuple (X, y, metadata)
+    cache : bool, default=False
+        Load the .ts files from a binary cache of numpy .npy files saved next to
+        them, written on the first load. The cache is rewritten if the .ts files
+        change.
+    mmap_mode : None or str{"r", "r+", "c"}, default=None
+        Memory map the cached arrays with this mode of ``np.load`` instead of reading
+        them into memory. Only used if cache is True. Loading both splits
+        concatenates them into memory.
 
     Returns
     -------
@@ -1287,6 +1588,8 @@ def load_classification(name, split=None, extract_path=None, return_metadata=Tru
         return_X_y=True,
         extract_path=extract_path,
         return_meta=return_metadata,
+        cache=cache,
+        mmap_mode=mmap_mode,
     )
 
 
@@ -1325,3 +1628,176 @@ def download_all_regression(extract_path=None):
                 f"Unable to download {file_save} from {url}",
             )
     zipfile.ZipFile(file_save, "r").extractall(f"{local_module}/{local_dirname}/")
+
+
+def _download_file(url, file_save, sha256=None):
+    """Download url to file_save, checking the SHA-256 digest if given."""
+    urlretrieve(url, file_save)
+    if sha256 is not None:
+        digest = hashlib.sha256()
+        with open(file_save, "rb") as file:
+            for block in iter(lambda: file.read(1 << 20), b""):
+                digest.update(block)
+        if digest.hexdigest() != sha256.lower():
+            raise ValueError(
+                f"Checksum of {os.path.basename(file_save)} downloaded from {url} is "
+                f"{digest.hexdigest()}, expected {sha256}"
+            )
+
+
+def _download_dataset(name, urls, data_dir, checksums):
+    """Download the files of a dataset and install them in data_dir/name.
+
+    Files are downloaded and extracted into a temporary directory in data_dir that
+    is renamed when complete, so an interrupted download never leaves a partial
+    dataset behind. Returns None, or the exception raised.
+    """
+    tmp_dir = tempfile.mkdtemp(dir=data_dir, prefix=f".{name}_")
+    try:
+        files_dir = os.path.join(tmp_dir, name)
+        os.makedirs(files_dir)
+        for url in urls:
+            file_name = os.path.basename(url)
+            if file_name.endswith(".zip"):
+                file_save = os.path.join(tmp_dir, file_name)
+                _download_file(url, file_save, checksums.get(file_name))
+                with zipfile.ZipFile(file_save, "r") as z:
+                    if z.testzip() is not None:
+                        raise zipfile.BadZipFile(f"Corrupt archive {file_name}")
+                    z.extractall(files_dir)
+            else:
+                file_save = os.path.join(files_dir, file_name)
+                _download_file(url, file_save, checksums.get(file_name))
+        if os.path.exists(os.path.join(data_dir, name)):
+            shutil.rmtree(os.path.join(data_dir, name))
+        os.replace(files_dir, os.path.join(data_dir, name))
+    except Exception as e:
+        return e
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return None
+
+
+def download_datasets(
+    names,
+    problem_type="classification",
+    extract_path=None,
+    n_jobs=8,
+    checksums=None,
+    base_url=None,
+    overwrite=False,
+):
+    """Download and extract a collection of datasets concurrently.
+
+    Fetches the datasets that are not already in extract_path, with up to n_jobs
+    downloads at a time, so that later calls to ``load_classification``,
+    ``load_regression`` or ``load_forecasting`` with the same extract_path load them
+    without downloading.
+
+    Parameters
+    ----------
+    names : iterable of str
+        Names of the datasets, for example ``tsc_data_lists.univariate``.
+    problem_type : str{"classification", "regression", "forecasting"},
+            default="classification"
+        The archive to download from. Classification datasets are downloaded from
+        https://timeseriesclassification.com, regression datasets from the Monash
+        TSER archive and forecasting datasets from https://forecastingdata.org/.
+    extract_path : str, default=None
+        The directory to install the datasets in, each in a subdirectory with its
+        name. If None, the datasets go in ``aeon/datasets/local_data``.
+    n_jobs : int, default=8
+        The maximum number of datasets downloaded at the same time.
+    checksums : dict, default=None
+        SHA-256 hex digests of the downloaded files by file name, for example
+        ``{"ArrowHead.zip": "..."}`` or ``{"Covid3Month_TRAIN.ts": "..."}``.
+        Files without a digest are not checked.
+    base_url : str, default=None
+        URL of a mirror of the archive to download from instead. The files are
+        expected at ``<base_url>/<name>.zip`` for classification and forecasting,
+        and ``<base_url>/<name>_TRAIN.ts`` and ``<base_url>/<name>_TEST.ts`` for
+        regression.
+    overwrite : bool, default=False
+        Download datasets that are already in extract_path again.
+
+    Returns
+    -------
+    list of str
+        The names of the datasets downloaded.
+
+    Raises
+    ------
+    ValueError
+        If problem_type is invalid, a name is not in the list of datasets of the
+        archive when base_url is None, or any download fails or has the wrong
+        checksum. Datasets that downloaded correctly are kept.
+
+    Examples
+    --------
+    >>> from aeon.datasets import download_datasets
+    >>> from aeon.datasets.tsc_data_lists import univariate
+    >>> download_datasets(univariate, extract_path="data/")  # doctest: +SKIP
+    """
+    from aeon.datasets.tsc_data_lists import whole_set
+    from aeon.datasets.tser_data_lists import tser_all
+    from aeon.datasets.tsf_data_lists import tsf_all
+
+    if problem_type == "classification":
+        valid_names = whole_set
+        list_downloaded = list_downloaded_tsc_tsr_datasets
+    elif problem_type == "regression":
+        valid_names = tser_all
+        list_downloaded = list_downloaded_tsc_tsr_datasets
+    elif problem_type == "forecasting":
+        valid_names = tsf_all
+        list_downloaded = list_downloaded_tsf_datasets
+    else:
+        raise ValueError(
+            f"problem_type must be 'classification', 'regression' or 'forecasting', "
+            f"but found {problem_type}"
+        )
+    if base_url is None:
+        invalid = [name for name in names if name not in valid_names]
+        if invalid:
+            raise ValueError(
+                f"Datasets {invalid} are not in the list of valid {problem_type} "
+                f"datasets to download"
+            )
+    if checksums is None:
+        checksums = {}
+
+    if extract_path is None:
+        data_dir = os.path.join(MODULE, "local_data")
+    else:
+        data_dir = extract_path
+    os.makedirs(data_dir, exist_ok=True)
+    # List the directory once rather than for each dataset
+    downloaded = set() if overwrite else set(list_downloaded(data_dir))
+    names = [name for name in dict.fromkeys(names) if name not in downloaded]
+
+    def _urls(name):
+        if problem_type == "regression":
+            if base_url is None:
+                base = f"https://zenodo.org/record/{tser_all[name]}/files"
+            else:
+                base = base_url.rstrip("/")
+            return [f"{base}/{name}_TRAIN.ts", f"{base}/{name}_TEST.ts"]
+        if base_url is not None:
+            base = base_url.rstrip("/")
+        elif problem_type == "classification":
+            base = "https://timeseriesclassification.com/aeon-toolkit"
+        else:
+            base = f"https://zenodo.org/record/{tsf_all[name]}/files"
+        return [f"{base}/{name}.zip"]
+
+    errors = Parallel(n_jobs=n_jobs, backend="threading")(
+        delayed(_download_dataset)(name, _urls(name), data_dir, checksums)
+        for name in names
+    )
+    failed = {name: e for name, e in zip(names, errors) if e is not None}
+    if failed:
+        raise ValueError(
+            f"Failed to download {len(failed)} of {len(names)} datasets: "
+            + "; ".join(f"{name}: {e}" for name, e in failed.items())
+        )
+    return names
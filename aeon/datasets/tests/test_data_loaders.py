@@ -4,8 +4,13 @@ __author__ = ["SebasKoel", "Emiliathewolf", "TonyBagnall", "jasonlines", "achiev
 
 __all__ = []
 
+import hashlib
 import os
 import shutil
+import threading
+import zipfile
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 
 import numpy as np
 import pandas as pd
@@ -14,12 +19,15 @@ from pandas.testing import assert_frame_equal
 
 import aeon
 from aeon.datasets import (
+    download_datasets,
     load_classification,
     load_forecasting,
     load_from_arff_file,
     load_from_long_to_dataframe,
     load_from_tsf_file,
+    load_from_tsf_file_in_batches,
     load_from_tsfile,
+    load_from_tsfile_in_batches,
     load_from_tsv_file,
     load_regression,
     load_tsf_to_dataframe,
@@ -36,6 +44,7 @@ from aeon.datasets._data_loaders import (
     _load_data,
     _load_header_info,
     _load_saved_dataset,
+    _parse_lines,
 )
 from aeon.tests._config import PR_TESTING
 
@@ -256,6 +265,59 @@ def test_load_from_tsfile():
     assert len(X) == 270 and y.shape == (270,)
 
 
+@pytest.mark.parametrize(
+    "problem", ["UnitTest", "BasicMotions", "JapaneseVowels", "Covid3Month"]
+)
+def test_load_from_tsfile_in_batches(problem):
+    """Test the batches of a .ts file are the cases parsed one at a time."""
+    path = os.path.join(MODULE, DIRNAME, problem, f"{problem}_TRAIN.ts")
+    X, y = load_from_tsfile(path)
+    batches = list(load_from_tsfile_in_batches(path, batch_size=7))
+    assert all(len(batch_X) == 7 for batch_X, _ in batches[:-1])
+    np.testing.assert_array_equal(np.concatenate([b[1] for b in batches]), y)
+    if isinstance(X, np.ndarray):
+        np.testing.assert_array_equal(np.concatenate([b[0] for b in batches]), X)
+    else:
+        batch_X = [x for b in batches for x in b[0]]
+        assert len(batch_X) == len(X)
+        for x, expected in zip(batch_X, X):
+            np.testing.assert_array_equal(x, expected)
+
+    with open(path, "r", encoding="utf-8") as file:
+        meta_data = _load_header_info(file)
+        lines = [line.strip().lower() for line in file]
+    first = lines[0].split(":")
+    expected_X, expected_y = _parse_lines(
+        lines, meta_data, 0, len(first) - 1, len(first[0].split(","))
+    )
+    np.testing.assert_array_equal(expected_y.astype(y.dtype), y)
+    if isinstance(X, np.ndarray):
+        np.testing.assert_array_equal(expected_X, X)
+
+
+def test_load_from_tsfile_in_batches_missing(tmpdir):
+    """Test missing values and malformed cases in the batched parser."""
+    header = "@problemName test\n@missing true\n@univariate false\n"
+    header += "@equalLength true\n@classLabel true a b\n@data\n"
+    path = os.path.join(tmpdir, "test.ts")
+    with open(path, "w") as file:
+        file.write(header + "1,?,3:4,5,6:a\n7,8,9:?,11,12:b\n")
+    X, y = load_from_tsfile(path)
+    np.testing.assert_array_equal(
+        X, [[[1, np.nan, 3], [4, 5, 6]], [[7, 8, 9], [np.nan, 11, 12]]]
+    )
+    np.testing.assert_array_equal(y, ["a", "b"])
+    X, y = next(load_from_tsfile_in_batches(path, batch_size=1))
+    assert X.shape == (1, 2, 3) and y[0] == "a"
+
+    with open(path, "w") as file:
+        file.write(header + "1,2,3:4,5,6:a\n7,8,9,10:11,12:b\n")
+    with pytest.raises(IOError, match="Unequal length series, in case 2"):
+        load_from_tsfile(path)
+    with pytest.raises(ValueError, match="batch_size must be"):
+        next(load_from_tsfile_in_batches(path, batch_size=0))
+
+
 _CHECKS = {
     "uschange": {
         "columns": ["Income", "Production", "Savings", "Unemployment"],
@@ -562,6 +624,38 @@ def test_load_from_tsf_file():
     assert df.shape == (3, 3)
 
 
+@pytest.mark.parametrize("return_type", ["tsf_default", "pd_multiindex_hier"])
+def test_load_from_tsf_file_in_batches(return_type, tmpdir):
+    """Test loading tsf files in batches, with missing values."""
+    path = os.path.join(tmpdir, "missing.tsf")
+    with open(
+        os.path.join(MODULE, DIRNAME, "UnitTest/UnitTest_Tsf_Loader_hierarchical.tsf")
+    ) as file:
+        text = file.read()
+    with open(path, "w") as file:
+        file.write(text.replace("24271.5134", "?").replace("230995", "?"))
+    df, metadata = load_from_tsf_file(path, return_type=return_type)
+    batches = list(load_from_tsf_file_in_batches(path, 2, return_type=return_type))
+    assert [meta for _, meta in batches] == [metadata, metadata]
+    assert_frame_equal(
+        pd.concat([batch for batch, _ in batches], ignore_index=True),
+        df.reset_index(drop=True),
+    )
+    if return_type == "tsf_default":
+        assert list(df.iloc[0, -1][:2]) == [25092.2284, "NaN"]
+    else:
+        assert df.index.names == ["series_group", "series_name", "timestamp"]
+        assert np.isnan(df.iloc[1, 0]) and np.isnan(df.iloc[11, 0])
+
+    X, _ = load_from_tsf_file(path, return_type="np-list")
+    assert [x.shape for x in X] == [(1, 7), (1, 3), (1, 5)]
+    assert np.isnan(X[0][0, 1])
+    with pytest.raises(ValueError, match="batch_size must be"):
+        next(load_from_tsf_file_in_batches(path, batch_size=0))
+    with pytest.raises(ValueError, match="return_type must be"):
+        load_from_tsf_file(path, return_type="numpy3D")
+
+
 def test_load_forecasting():
     """Test load forecasting for baked in data."""
     expected_metadata = {
@@ -617,6 +711,127 @@ def test_load_classification():
     assert y.shape == (42,)
 
 
+@pytest.mark.parametrize("name", ["UnitTest", "JapaneseVowels"])
+def test_load_classification_cached(name, tmpdir):
+    """Test loading classification problems through the binary cache."""
+    shutil.copytree(os.path.join(MODULE, DIRNAME, name), os.path.join(tmpdir, name))
+    X, y, meta = load_classification(name, split="train", extract_path=str(tmpdir))
+    for mmap_mode in [None, None, "r"]:
+        X_cached, y_cached, meta_cached = load_classification(
+            name,
+            split="train",
+            extract_path=str(tmpdir),
+            cache=True,
+            mmap_mode=mmap_mode,
+        )
+        assert meta_cached == meta
+        np.testing.assert_array_equal(y_cached, y)
+        assert len(X_cached) == len(X)
+        for x, x_cached in zip(X, X_cached):
+            np.testing.assert_array_equal(x, x_cached)
+    assert os.path.exists(os.path.join(tmpdir, name, f"{name}_TRAIN_cache.json"))
+    assert isinstance(X_cached, np.memmap) or isinstance(X_cached[0].base, np.memmap)
+
+    # The cache is rewritten when the file changes
+    path = os.path.join(tmpdir, name, f"{name}_TRAIN.ts")
+    with open(path, "r") as file:
+        lines = file.readlines()
+    with open(path, "w") as file:
+        file.writelines(lines[:-1])
+    for _ in range(2):
+        X_cached, y_cached, _ = load_classification(
+            name, split="train", extract_path=str(tmpdir), cache=True
+        )
+        assert len(X_cached) == len(y_cached) == len(y) - 1
+
+
+def test_load_forecasting_cached(tmpdir):
+    """Test loading a forecasting problem through the binary cache."""
+    name = "m1_yearly_dataset"
+    shutil.copytree(os.path.join(MODULE, DIRNAME, name), os.path.join(tmpdir, name))
+    df, meta = load_forecasting(name, extract_path=str(tmpdir))
+    for _ in range(2):
+        df_cached, meta_cached = load_forecasting(
+            name, extract_path=str(tmpdir), cache=True, mmap_mode="r"
+        )
+        assert meta_cached == meta
+        assert_frame_equal(df_cached.iloc[:, :-1], df.iloc[:, :-1])
+        for series, series_cached in zip(df.iloc[:, -1], df_cached.iloc[:, -1]):
+            np.testing.assert_array_equal(series, series_cached)
+    assert os.path.exists(os.path.join(tmpdir, name, f"{name}_cache.json"))
+
+
+def test_download_datasets(tmpdir):
+    """Test downloading datasets from a local mirror."""
+    mirror = os.path.join(tmpdir, "mirror")
+    os.makedirs(mirror)
+    for name in ["UnitTest", "ArrowHead"]:
+        with zipfile.ZipFile(os.path.join(mirror, f"{name}.zip"), "w") as z:
+            for split in ["TRAIN", "TEST"]:
+                z.write(
+                    os.path.join(MODULE, DIRNAME, name, f"{name}_{split}.ts"),
+                    f"{name}_{split}.ts",
+                )
+        for split in ["TRAIN", "TEST"]:
+            shutil.copy(
+                os.path.join(MODULE, DIRNAME, name, f"{name}_{split}.ts"), mirror
+            )
+    with open(os.path.join(mirror, "UnitTest.zip"), "rb") as file:
+        checksum = hashlib.sha256(file.read()).hexdigest()
+
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), partial(SimpleHTTPRequestHandler, directory=mirror)
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    try:
+        extract_path = os.path.join(tmpdir, "data")
+        downloaded = download_datasets(
+            ["UnitTest", "ArrowHead"],
+            extract_path=extract_path,
+            base_url=base_url,
+            checksums={"UnitTest.zip": checksum},
+            n_jobs=2,
+        )
+        assert downloaded == ["UnitTest", "ArrowHead"]
+        X, y, _ = load_classification("UnitTest", extract_path=extract_path)
+        assert X.shape == (42, 1, 24)
+        assert (
+            download_datasets(
+                ["UnitTest"], extract_path=extract_path, base_url=base_url
+            )
+            == []
+        )
+
+        # Regression problems are downloaded as .ts files
+        assert download_datasets(
+            ["UnitTest"],
+            problem_type="regression",
+            extract_path=os.path.join(tmpdir, "regression"),
+            base_url=base_url,
+        ) == ["UnitTest"]
+
+        with pytest.raises(ValueError, match="Checksum of UnitTest.zip"):
+            download_datasets(
+                ["UnitTest", "ArrowHead"],
+                extract_path=os.path.join(tmpdir, "bad"),
+                base_url=base_url,
+                checksums={"UnitTest.zip": "0" * 64},
+            )
+        assert os.listdir(os.path.join(tmpdir, "bad")) == ["ArrowHead"]
+        with pytest.raises(ValueError, match="Failed to download 1 of 1"):
+            download_datasets(
+                ["FOO"], extract_path=os.path.join(tmpdir, "bad"), base_url=base_url
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+    with pytest.raises(ValueError, match="not in the list of valid"):
+        download_datasets(["FOO"], extract_path=extract_path)
+    with pytest.raises(ValueError, match="problem_type must be"):
+        download_datasets(["UnitTest"], problem_type="FOO")
+
+
 @pytest.mark.parametrize("freq", [None, "YS"])
 def test_convert_tsf_to_multiindex(freq):
     input_df = pd.DataFrame(
@@ -4,6 +4,7 @@ __author__ = ["chrisholder", "TonyBagnall", "baraline"]
 
 __all__ = [
     "create_bounding_matrix",
+    "create_bounding_band",
     "squared_distance",
     "squared_pairwise_distance",
     "euclidean_distance",
@@ -52,6 +53,10 @@ __all__ = [
     "msm_pairwise_distance",
     "distance",
     "pairwise_distance",
+    "blocked_pairwise_distance",
+    "nearest_neighbors",
+    "distance_profile",
+    "subsequence_search",
     "alignment_path",
     "cost_matrix",
     "get_cost_matrix_function",
@@ -62,6 +67,12 @@ __all__ = [
     "shape_dtw_cost_matrix",
     "shape_dtw_alignment_path",
     "shape_dtw_pairwise_distance",
+    "create_envelope",
+    "lb_kim",
+    "lb_keogh",
+    "lb_improved",
+    "lb_enhanced",
+    "lb_cascade",
 ]
 
 
@@ -71,7 +82,8 @@ from aeon.distances._adtw import (
     adtw_distance,
     adtw_pairwise_distance,
 )
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._blocked_pairwise import blocked_pairwise_distance
+from aeon.distances._bounding_matrix import create_bounding_band, create_bounding_matrix
 from aeon.distances._ddtw import (
     ddtw_alignment_path,
     ddtw_cost_matrix,
@@ -113,6 +125,14 @@ from aeon.distances._lcss import (
     lcss_distance,
     lcss_pairwise_distance,
 )
+from aeon.distances._lower_bounds import (
+    create_envelope,
+    lb_cascade,
+    lb_enhanced,
+    lb_improved,
+    lb_keogh,
+    lb_kim,
+)
 from aeon.distances._manhattan import manhattan_distance, manhattan_pairwise_distance
 from aeon.distances._msm import (
     msm_alignment_path,
@@ -120,6 +140,7 @@ from aeon.distances._msm import (
     msm_distance,
     msm_pairwise_distance,
 )
+from aeon.distances._nearest_neighbors import nearest_neighbors
 from aeon.distances._shape_dtw import (
     shape_dtw_alignment_path,
     shape_dtw_cost_matrix,
@@ -127,6 +148,7 @@ from aeon.distances._shape_dtw import (
     shape_dtw_pairwise_distance,
 )
 from aeon.distances._squared import squared_distance, squared_pairwise_distance
+from aeon.distances._subsequence_search import distance_profile, subsequence_search
 from aeon.distances._twe import (
     twe_alignment_path,
     twe_cost_matrix,
@@ -4,12 +4,12 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import compute_min_return_path
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import create_bounding_band
 from aeon.distances._squared import _univariate_squared_distance
-from aeon.distances._utils import reshape_pairwise_to_multiple
+from aeon.distances._utils import _run_with_n_jobs, reshape_pairwise_to_multiple
 
 
 @njit(cache=True, fastmath=True)
@@ -19,6 +19,7 @@ def adtw_distance(
     window: float = None,
     itakura_max_slope: float = None,
     warp_penalty: float = 1.0,
+    upper_bound: float = np.inf,
 ) -> float:
     r"""Compute the ADTW distance between two time series.
 
@@ -46,11 +47,16 @@ def adtw_distance(
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
     warp_penalty: float, default=1.0
         Penalty for warping. A high value will mean less warping.
+    upper_bound : float, default=np.inf
+        Early abandoning threshold. The calculation stops as soon as the minimum of a
+        row of the cost matrix exceeds ``upper_bound``, in which case ``np.inf`` is
+        returned. Distances not greater than ``upper_bound`` are exact.
 
     Returns
     -------
     float
-        ADTW distance between x and y, minimum value 0.
+        ADTW distance between x and y, minimum value 0. ``np.inf`` if the distance
+        exceeds ``upper_bound``.
 
     Raises
     ------
@@ -79,15 +85,15 @@ def adtw_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _adtw_distance(_x, _y, bounding_matrix, warp_penalty)
+        return _adtw_distance(_x, _y, starts, ends, warp_penalty, upper_bound)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _adtw_distance(x, y, bounding_matrix, warp_penalty)
+        return _adtw_distance(x, y, starts, ends, warp_penalty, upper_bound)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -152,30 +158,67 @@ def adtw_cost_matrix(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _adtw_cost_matrix(_x, _y, bounding_matrix, warp_penalty)
+        return _adtw_cost_matrix(_x, _y, starts, ends, warp_penalty)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _adtw_cost_matrix(x, y, bounding_matrix, warp_penalty)
+        return _adtw_cost_matrix(x, y, starts, ends, warp_penalty)
     raise ValueError("x and y must be 1D or 2D")
 
 
 @njit(cache=True, fastmath=True)
 def _adtw_distance(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, warp_penalty: float
+    x: np.ndarray,
+    y: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    warp_penalty: float,
+    upper_bound: float = np.inf,
 ) -> float:
-    return _adtw_cost_matrix(x, y, bounding_matrix, warp_penalty)[
-        x.shape[1] - 1, y.shape[1] - 1
-    ]
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+
+    # Only two rows of the cost matrix are kept, and only the in-band columns
+    # [starts[i], ends[i]) of row i are visited. Column j of the cost matrix is held
+    # at index j + 1, so index 0 is the boundary column. Cells outside the band stay
+    # at infinity, which is restored over the last written range before reuse.
+    prev = np.full(y_size + 1, np.inf)
+    curr = np.full(y_size + 1, np.inf)
+    prev[0] = 0.0
+    prev_start, prev_end = 0, 1
+    curr_start, curr_end = 0, 0
+    for i in range(x_size):
+        curr[curr_start:curr_end] = np.inf
+        row_min = np.inf
+        for j in range(starts[i], ends[i]):
+            curr[j + 1] = _univariate_squared_distance(x[:, i], y[:, j]) + min(
+                prev[j + 1] + warp_penalty,
+                curr[j] + warp_penalty,
+                prev[j],
+            )
+            row_min = min(row_min, curr[j + 1])
+        if row_min > upper_bound:
+            return np.inf
+        prev, curr = curr, prev
+        prev_start, curr_start = starts[i] + 1, prev_start
+        prev_end, curr_end = ends[i] + 1, prev_end
+
+    if prev[y_size] > upper_bound:
+        return np.inf
+    return prev[y_size]
 
 
 @njit(cache=True, fastmath=True)
 def _adtw_cost_matrix(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, warp_penalty: float
+    x: np.ndarray,
+    y: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    warp_penalty: float,
 ) -> np.ndarray:
     x_size = x.shape[1]
     y_size = y.shape[1]
@@ -183,26 +226,25 @@ def _adtw_cost_matrix(
     cost_matrix[0, 0] = 0.0
 
     for i in range(x_size):
-        for j in range(y_size):
-            if bounding_matrix[i, j]:
-                cost_matrix[i + 1, j + 1] = _univariate_squared_distance(
-                    x[:, i], y[:, j]
-                ) + min(
-                    cost_matrix[i, j + 1] + warp_penalty,
-                    cost_matrix[i + 1, j] + warp_penalty,
-                    cost_matrix[i, j],
-                )
+        for j in range(starts[i], ends[i]):
+            cost_matrix[i + 1, j + 1] = _univariate_squared_distance(
+                x[:, i], y[:, j]
+            ) + min(
+                cost_matrix[i, j + 1] + warp_penalty,
+                cost_matrix[i + 1, j] + warp_penalty,
+                cost_matrix[i, j],
+            )
 
     return cost_matrix[1:, 1:]
 
 
-@njit(cache=True, fastmath=True)
 def adtw_pairwise_distance(
     X: np.ndarray,
     y: np.ndarray = None,
     window: float = None,
     itakura_max_slope: float = None,
     warp_penalty: float = 1.0,
+    n_jobs: int = 1,
 ) -> np.ndarray:
     r"""Compute the ADTW pairwise distance between a set of time series.
 
@@ -224,6 +266,10 @@ def adtw_pairwise_distance(
         Penalty for warping. A high value will mean less warping.
         warp less and if value is low then will encourage algorithm to warp
         more.
+    n_jobs : int, default=1
+        The number of jobs to run in parallel. If -1, then the number of jobs is set
+        to the number of CPU cores. If 1, then the function is executed in a single
+        thread. If greater than 1, then the function is executed in parallel.
 
     Returns
     -------
@@ -266,36 +312,56 @@ def adtw_pairwise_distance(
     if y is None:
         # To self
         if X.ndim == 3:
-            return _adtw_pairwise_distance(X, window, itakura_max_slope, warp_penalty)
+            return _run_with_n_jobs(
+                n_jobs,
+                _adtw_pairwise_distance,
+                X,
+                window,
+                itakura_max_slope,
+                warp_penalty,
+            )
         if X.ndim == 2:
             _X = X.reshape((X.shape[0], 1, X.shape[1]))
-            return _adtw_pairwise_distance(_X, window, itakura_max_slope, warp_penalty)
+            return _run_with_n_jobs(
+                n_jobs,
+                _adtw_pairwise_distance,
+                _X,
+                window,
+                itakura_max_slope,
+                warp_penalty,
+            )
         raise ValueError("x and y must be 2D or 3D arrays")
     _x, _y = reshape_pairwise_to_multiple(X, y)
-    return _adtw_from_multiple_to_multiple_distance(
-        _x, _y, window, itakura_max_slope, warp_penalty
+    return _run_with_n_jobs(
+        n_jobs,
+        _adtw_from_multiple_to_multiple_distance,
+        _x,
+        _y,
+        window,
+        itakura_max_slope,
+        warp_penalty,
     )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _adtw_pairwise_distance(
     X: np.ndarray, window: float, itakura_max_slope: float, warp_penalty: float
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
+    starts, ends = create_bounding_band(
         X.shape[2], X.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(i + 1, n_instances):
-            distances[i, j] = _adtw_distance(X[i], X[j], bounding_matrix, warp_penalty)
+            distances[i, j] = _adtw_distance(X[i], X[j], starts, ends, warp_penalty)
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _adtw_from_multiple_to_multiple_distance(
     x: np.ndarray,
     y: np.ndarray,
@@ -306,13 +372,13 @@ def _adtw_from_multiple_to_multiple_distance(
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
+    starts, ends = create_bounding_band(
         x.shape[2], y.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(m_instances):
-            distances[i, j] = _adtw_distance(x[i], y[j], bounding_matrix, warp_penalty)
+            distances[i, j] = _adtw_distance(x[i], y[j], starts, ends, warp_penalty)
     return distances
 
 
@@ -60,7 +60,8 @@ def compute_lcss_return_path(
     x: np.ndarray,
     y: np.ndarray,
     epsilon: float,
-    bounding_matrix: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
     cost_matrix: np.ndarray,
 ) -> List[Tuple]:
     """Compute the return path through a cost matrix for the LCSS algorithm.
@@ -73,8 +74,10 @@ def compute_lcss_return_path(
         Second time series.
     epsilon : float
         Threshold for the LCSS algorithm.
-    bounding_matrix : np.ndarray (n_timepoints_x, n_timepoints_y)
-        Bounding matrix for the LCSS algorithm.
+    starts : np.ndarray (n_timepoints_x,)
+        First column in bound for each row, from ``create_bounding_band``.
+    ends : np.ndarray (n_timepoints_x,)
+        One past the last column in bound for each row.
     cost_matrix : np.ndarray (n_timepoints_x, n_timepoints_y)
         Cost matrix for the LCSS algorithm.
 
@@ -90,7 +93,7 @@ def compute_lcss_return_path(
     path = []
 
     while i > 0 and j > 0:
-        if bounding_matrix[i - 1, j - 1]:
+        if starts[i - 1] <= j - 1 < ends[i - 1]:
             if _univariate_euclidean_distance(x[:, i - 1], y[:, j - 1]) <= epsilon:
                 path.append((i - 1, j - 1))
                 i, j = (i - 1, j - 1)
@@ -0,0 +1,214 @@
+"""Blocked pairwise distance computation for matrices larger than memory."""
+
+import os
+from typing import Any, Union
+
+import joblib
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from aeon.distances._distance import DistanceFunction, pairwise_distance
+from aeon.distances._utils import reshape_pairwise_to_multiple
+
+
+def blocked_pairwise_distance(
+    X: np.ndarray,
+    y: np.ndarray = None,
+    metric: Union[str, DistanceFunction] = None,
+    out: Union[str, os.PathLike, np.ndarray] = None,
+    block_size: int = 256,
+    resume: bool = False,
+    n_jobs: int = 1,
+    **kwargs: Any,
+) -> np.ndarray:
+    """Compute the pairwise distance matrix in blocks, optionally on disk.
+
+    The matrix is computed one ``(block_size, block_size)`` tile at a time with
+    :func:`aeon.distances.pairwise_distance`, and each tile is written to ``out`` as
+    soon as it is complete. When ``out`` is a path the matrix is stored as a ``.npy``
+    file backed by ``np.memmap``, so matrices larger than memory can be computed
+    once and reloaded with ``np.load(path, mmap_mode="r")``. When ``y`` is None only
+    the tiles in the upper triangle are computed and mirrored.
+
+    While the file is being written the completed tiles are recorded in a
+    ``<out>.progress.npy`` file, together with a hash of the data, metric, kwargs
+    and block_size. The progress file is created before the output file and only
+    removed once every tile is written. If the computation is interrupted, calling
+    the function again with the same arguments and ``resume=True`` only computes the
+    tiles that are missing.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        A collection of time series instances  of shape ``(n_instances, n_timepoints)``
+        or ``(n_instances, n_channels, n_timepoints)``.
+    y : np.ndarray or None, default=None
+        A single series or a collection of time series of shape ``(m_timepoints,)`` or
+        ``(m_instances, m_timepoints)`` or ``(m_instances, m_channels, m_timepoints)``.
+    metric : str or Callable
+        The distance metric to use.
+        A list of valid pairwise distance metrics can be found in the documentation for
+        :func:`aeon.distances.get_pairwise_distance_function`.
+    out : str, os.PathLike, np.ndarray or None, default=None
+        Where to write the distance matrix. If a path, the matrix is written to a
+        ``.npy`` file at that path. If a np.ndarray (or np.memmap), it must be of shape
+        ``(n_instances, n_instances)`` or ``(n_instances, m_instances)`` and is filled
+        in place. If None, a new array is allocated in memory.
+    block_size : int, default=256
+        Number of time series in each side of a tile.
+    resume : bool, default=False
+        If True and ``out`` is a path with a progress file left by an interrupted
+        call with the same arguments, only the tiles not recorded as complete are
+        computed. Otherwise any existing file is overwritten.
+    n_jobs : int, default=1
+        The number of jobs to run in parallel for each tile. If -1, then the number
+        of jobs is set to the number of CPU cores. If 1, then the function is
+        executed in a single thread. If greater than 1, then the function is executed
+        in parallel. Ignored if metric is a callable or "mpdist".
+    kwargs : Any
+        Extra arguments for metric. Refer to each metric documentation for a list of
+        possible arguments.
+
+    Returns
+    -------
+    np.ndarray (n_instances, n_instances) or (n_instances, m_instances)
+        Pairwise matrix between the instances of X, or between X and y. This is
+        ``out`` if an array was passed, and a np.memmap of the file if a path was
+        passed.
+
+    Raises
+    ------
+    ValueError
+        If X is not 2D or 3D array when only passing X.
+        If X and y are not 1D, 2D or 3D arrays when passing both X and y.
+        If block_size is less than 1.
+        If out is an array with the wrong shape.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import blocked_pairwise_distance
+    >>> X = np.array([[[1, 2, 3]],[[4, 5, 6]], [[7, 8, 9]]])
+    >>> blocked_pairwise_distance(X, metric='dtw', block_size=2)
+    array([[  0.,  26., 108.],
+           [ 26.,   0.,  26.],
+           [108.,  26.,   0.]])
+    """
+    if block_size < 1:
+        raise ValueError(f"block_size must be at least 1, but found {block_size}")
+    if y is None:
+        if X.ndim == 2:
+            X = X.reshape((X.shape[0], 1, X.shape[1]))
+        elif X.ndim != 3:
+            raise ValueError("x and y must be 2D or 3D arrays")
+        shape = (X.shape[0], X.shape[0])
+    else:
+        X, y = reshape_pairwise_to_multiple(X, y)
+        shape = (X.shape[0], y.shape[0])
+
+    n_row_blocks = -(-shape[0] // block_size)
+    n_col_blocks = -(-shape[1] // block_size)
+    progress = None
+    progress_path = None
+    if out is None:
+        out = np.zeros(shape)
+    elif isinstance(out, np.ndarray):
+        if out.shape != shape:
+            raise ValueError(
+                f"out must be of shape {shape}, but found shape {out.shape}"
+            )
+    else:
+        progress_path = f"{os.fspath(out)}.progress.npy"
+        fingerprint = _blocked_fingerprint(X, y, metric, kwargs, block_size)
+        out, progress = _open_blocked_output(
+            out,
+            progress_path,
+            shape,
+            (n_row_blocks, n_col_blocks),
+            fingerprint,
+            resume,
+        )
+        progress = progress["tiles"]
+
+    for i in range(n_row_blocks):
+        row_start = i * block_size
+        row_end = min(row_start + block_size, shape[0])
+        for j in range(i if y is None else 0, n_col_blocks):
+            if progress is not None and progress[i, j]:
+                continue
+            col_start = j * block_size
+            col_end = min(col_start + block_size, shape[1])
+            if y is None and i == j:
+                out[row_start:row_end, col_start:col_end] = pairwise_distance(
+                    X[row_start:row_end], metric=metric, n_jobs=n_jobs, **kwargs
+                )
+            else:
+                tile = pairwise_distance(
+                    X[row_start:row_end],
+                    X[col_start:col_end] if y is None else y[col_start:col_end],
+                    metric=metric,
+                    n_jobs=n_jobs,
+                    **kwargs,
+                )
+                out[row_start:row_end, col_start:col_end] = tile
+                if y is None:
+                    out[col_start:col_end, row_start:row_end] = tile.T
+            if progress is not None:
+                # Only record the tile once its distances are on disk
+                out.flush()
+                progress[i, j] = True
+                progress.flush()
+
+    if progress is not None:
+        del progress
+        os.remove(progress_path)
+    return out
+
+
+def _blocked_fingerprint(X, y, metric, kwargs, block_size) -> bytes:
+    """Hash the arguments that determine the distances of a blocked computation."""
+    if callable(metric):
+        # Hashes of functions are not stable between processes, so they are
+        # replaced by the name of the python function
+        func = getattr(metric, "py_func", metric)
+        metric = f"{func.__module__}.{func.__qualname__}"
+    return joblib.hash((X, y, metric, kwargs, block_size)).encode()
+
+
+def _open_blocked_output(
+    path: Union[str, os.PathLike],
+    progress_path: str,
+    shape: tuple,
+    progress_shape: tuple,
+    fingerprint: bytes,
+    resume: bool,
+):
+    """Open the ``.npy`` output and progress files for a blocked computation.
+
+    The existing output is only resumed if its progress file was written for the
+    same arguments. Otherwise the progress file is created before the output file,
+    so an output file without a progress file is never taken as complete.
+    """
+    if resume and os.path.exists(progress_path) and os.path.exists(path):
+        progress = open_memmap(progress_path, mode="r+")
+        out = open_memmap(path, mode="r+")
+        if (
+            progress.dtype.names == ("fingerprint", "tiles")
+            and progress["fingerprint"] == fingerprint
+            and progress["tiles"].shape == progress_shape
+            and out.shape == shape
+        ):
+            return out, progress
+        # Written for other arguments, start again
+        del progress, out
+
+    progress = open_memmap(
+        progress_path,
+        mode="w+",
+        dtype=[("fingerprint", "S32"), ("tiles", np.bool_, progress_shape)],
+        shape=(),
+    )
+    progress["fingerprint"] = fingerprint
+    progress.flush()
+    out = open_memmap(path, mode="w+", dtype=np.float64, shape=shape)
+    return out, progress
@@ -1,6 +1,7 @@
 __author__ = ["chrisholder"]
 
 import math
+from typing import Tuple
 
 import numpy as np
 from numba import njit
@@ -61,6 +62,18 @@ def _itakura_parallelogram(x_size: int, y_size: int, max_slope_percent: float):
     This code was adapted from tslearn. This link to the orginal code line 974:
     https://github.com/tslearn-team/tslearn/blob/main/tslearn/metrics/dtw_variants.py
     """
+    lower_bound_, upper_bound_ = _itakura_column_bounds(
+        x_size, y_size, max_slope_percent
+    )
+
+    bounding_matrix = np.full((x_size, y_size), False)
+    for i in range(y_size):
+        bounding_matrix[int(lower_bound_[i]) : int(upper_bound_[i]), i] = True
+    return bounding_matrix
+
+
+@njit(cache=True)
+def _itakura_column_bounds(x_size: int, y_size: int, max_slope_percent: float):
     one_percent = min(x_size, y_size) / 100
     max_slope = math.floor(((max_slope_percent * one_percent) * 100))
     min_slope = 1 / float(max_slope)
@@ -86,11 +99,7 @@ def _itakura_parallelogram(x_size: int, y_size: int, max_slope_percent: float):
     for i in range(y_size):
         upper_bound_[i] = min(round(upper_bound[0, i], 2), round(upper_bound[1, i], 2))
     upper_bound_ = np.floor(upper_bound_ + 1)
-
-    bounding_matrix = np.full((x_size, y_size), False)
-    for i in range(y_size):
-        bounding_matrix[int(lower_bound_[i]) : int(upper_bound_[i]), i] = True
-    return bounding_matrix
+    return lower_bound_, upper_bound_
 
 
 @njit(cache=True)
@@ -111,3 +120,119 @@ def _sakoe_chiba_bounding(
         bounding_matrix[i, lower:upper] = True
 
     return bounding_matrix
+
+
+@njit(cache=True)
+def create_bounding_band(
+    x_size: int, y_size: int, window: float = None, itakura_max_slope: float = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Create a bounding band for an elastic distance.
+
+    The band is a compact form of the bounding matrix from
+    :func:`create_bounding_matrix`. The cells in bound in row ``i`` are the columns
+    ``starts[i]`` to ``ends[i] - 1``, so distance calculations can visit only the
+    cells in bound without allocating a dense ``(x_size, y_size)`` matrix. Rows
+    with no cells in bound have ``starts[i] == ends[i]``.
+
+    Parameters
+    ----------
+    x_size : int
+        Size of the first time series.
+    y_size : int
+        Size of the second time series.
+    window : float, default=None
+        Window size as a percentage of the smallest time series.
+        If None, the bounding band will be full.
+    itakura_max_slope : float, default=None
+        Maximum slope as a proportion of the number of time points used to create
+        Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+
+    Returns
+    -------
+    starts : np.ndarray of shape (x_size,)
+        First column in bound for each row.
+    ends : np.ndarray of shape (x_size,)
+        One past the last column in bound for each row.
+
+    Examples
+    --------
+    >>> create_bounding_band(8, 8, window=0.5)
+    (array([0, 0, 0, 0, 0, 1, 2, 3]), array([5, 6, 7, 8, 8, 8, 8, 8]))
+    """
+    starts = np.zeros(x_size, dtype=np.int64)
+    ends = np.zeros(x_size, dtype=np.int64)
+    if itakura_max_slope is not None:
+        if itakura_max_slope < 0 or itakura_max_slope > 1:
+            raise ValueError("itakura_max_slope must be between 0 and 1")
+        lower, upper = _itakura_column_bounds(x_size, y_size, itakura_max_slope)
+        # Both column bounds are non-decreasing, so the columns in band for a row
+        # form a contiguous range found by two pointers over the columns.
+        first = 0
+        last = 0
+        for i in range(x_size):
+            while first < y_size and min(int(upper[first]), x_size) <= i:
+                first += 1
+            while last < y_size and int(lower[last]) <= i:
+                last += 1
+            starts[i] = first
+            ends[i] = max(first, last)
+        return starts, ends
+    if window is not None:
+        if window < 0 or window > 1:
+            raise ValueError("window must be between 0 and 1")
+        one_percent = min(x_size, y_size) / 100
+        radius = math.floor(((window * one_percent) * 100))
+        smallest_size = min(x_size, y_size)
+        largest_size = max(x_size, y_size)
+        width = largest_size - smallest_size + radius
+        for i in range(smallest_size):
+            starts[i] = min(max(0, i - radius), y_size)
+            ends[i] = max(starts[i], min(min(largest_size, i + width) + 1, y_size))
+        return starts, ends
+    ends[:] = y_size
+    return starts, ends
+
+
+@njit(cache=True)
+def _bounding_band_columns(
+    x_size: int, y_size: int, window: float = None, itakura_max_slope: float = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the bounding matrix as a start and end row for each column.
+
+    The transpose of ``create_bounding_band``: the cells in band for column ``j``
+    are rows ``[starts[j], ends[j])`` of the matrix from
+    ``create_bounding_matrix(x_size, y_size, window, itakura_max_slope)``.
+    """
+    starts = np.zeros(y_size, dtype=np.int64)
+    ends = np.zeros(y_size, dtype=np.int64)
+    if itakura_max_slope is not None:
+        if itakura_max_slope < 0 or itakura_max_slope > 1:
+            raise ValueError("itakura_max_slope must be between 0 and 1")
+        lower, upper = _itakura_column_bounds(x_size, y_size, itakura_max_slope)
+        for j in range(y_size):
+            starts[j] = min(int(lower[j]), x_size)
+            ends[j] = max(starts[j], min(int(upper[j]), x_size))
+        return starts, ends
+    if window is not None:
+        if window < 0 or window > 1:
+            raise ValueError("window must be between 0 and 1")
+        one_percent = min(x_size, y_size) / 100
+        radius = math.floor(((window * one_percent) * 100))
+        smallest_size = min(x_size, y_size)
+        largest_size = max(x_size, y_size)
+        width = largest_size - smallest_size + radius
+        for j in range(y_size):
+            starts[j] = min(max(0, j - width), smallest_size)
+            ends[j] = max(starts[j], min(smallest_size, j + radius + 1))
+        return starts, ends
+    ends[:] = x_size
+    return starts, ends
+
+
+@njit(cache=True)
+def _is_full_band(starts: np.ndarray, ends: np.ndarray, y_size: int) -> bool:
+    """Check whether a band from ``create_bounding_band`` covers every cell."""
+    for i in range(starts.shape[0]):
+        if starts[i] != 0 or ends[i] != y_size:
+            return False
+    return True
@@ -4,16 +4,21 @@ __author__ = ["chrisholder", "tonybagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import compute_min_return_path
-from aeon.distances._dtw import _dtw_cost_matrix, _dtw_distance, create_bounding_matrix
-from aeon.distances._utils import reshape_pairwise_to_multiple
+from aeon.distances._bounding_matrix import create_bounding_band
+from aeon.distances._dtw import _dtw_cost_matrix, _dtw_distance
+from aeon.distances._utils import _run_with_n_jobs, reshape_pairwise_to_multiple
 
 
 @njit(cache=True, fastmath=True)
 def ddtw_distance(
-    x: np.ndarray, y: np.ndarray, window: float = None, itakura_max_slope: float = None
+    x: np.ndarray,
+    y: np.ndarray,
+    window: float = None,
+    itakura_max_slope: float = None,
+    upper_bound: float = np.inf,
 ) -> float:
     r"""Compute the DDTW distance between two time series.
 
@@ -42,11 +47,16 @@ def ddtw_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    upper_bound : float, default=np.inf
+        Early abandoning threshold. The calculation stops as soon as the minimum of a
+        row of the cost matrix exceeds ``upper_bound``, in which case ``np.inf`` is
+        returned. Distances not greater than ``upper_bound`` are exact.
 
     Returns
     -------
     float
-        ddtw distance between x and y.
+        ddtw distance between x and y. ``np.inf`` if the distance exceeds
+        ``upper_bound``.
 
     Raises
     ------
@@ -72,17 +82,17 @@ def ddtw_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = average_of_slope(x.reshape((1, x.shape[0])))
         _y = average_of_slope(y.reshape((1, y.shape[0])))
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _dtw_distance(_x, _y, bounding_matrix)
+        return _dtw_distance(_x, _y, starts, ends, upper_bound)
     if x.ndim == 2 and y.ndim == 2:
         _x = average_of_slope(x)
         _y = average_of_slope(y)
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _dtw_distance(_x, _y, bounding_matrix)
+        return _dtw_distance(_x, _y, starts, ends, upper_bound)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -140,26 +150,26 @@ def ddtw_cost_matrix(
     if x.ndim == 1 and y.ndim == 1:
         _x = average_of_slope(x.reshape((1, x.shape[0])))
         _y = average_of_slope(y.reshape((1, y.shape[0])))
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _dtw_cost_matrix(_x, _y, bounding_matrix)
+        return _dtw_cost_matrix(_x, _y, starts, ends)
     if x.ndim == 2 and y.ndim == 2:
         _x = average_of_slope(x)
         _y = average_of_slope(y)
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _dtw_cost_matrix(_x, _y, bounding_matrix)
+        return _dtw_cost_matrix(_x, _y, starts, ends)
     raise ValueError("x and y must be 1D or 2D")
 
 
-@njit(cache=True, fastmath=True)
 def ddtw_pairwise_distance(
     X: np.ndarray,
     y: np.ndarray = None,
     window: float = None,
     itakura_max_slope: float = None,
+    n_jobs: int = 1,
 ) -> np.ndarray:
     """Compute the DDTW pairwise distance between a set of time series.
 
@@ -177,6 +187,10 @@ def ddtw_pairwise_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    n_jobs : int, default=1
+        The number of jobs to run in parallel. If -1, then the number of jobs is set
+        to the number of CPU cores. If 1, then the function is executed in a single
+        thread. If greater than 1, then the function is executed in parallel.
 
     Returns
     -------
@@ -219,62 +233,73 @@ def ddtw_pairwise_distance(
     if y is None:
         # To self
         if X.ndim == 3:
-            return _ddtw_pairwise_distance(X, window, itakura_max_slope)
+            return _run_with_n_jobs(
+                n_jobs, _ddtw_pairwise_distance, X, window, itakura_max_slope
+            )
         if X.ndim == 2:
             _X = X.reshape((X.shape[0], 1, X.shape[1]))
-            return _ddtw_pairwise_distance(_X, window, itakura_max_slope)
+            return _run_with_n_jobs(
+                n_jobs, _ddtw_pairwise_distance, _X, window, itakura_max_slope
+            )
         raise ValueError("x and y must be 2D or 3D arrays")
     _x, _y = reshape_pairwise_to_multiple(X, y)
-    return _ddtw_from_multiple_to_multiple_distance(_x, _y, window, itakura_max_slope)
+    return _run_with_n_jobs(
+        n_jobs,
+        _ddtw_from_multiple_to_multiple_distance,
+        _x,
+        _y,
+        window,
+        itakura_max_slope,
+    )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _ddtw_pairwise_distance(
     X: np.ndarray, window: float, itakura_max_slope: float
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
+    starts, ends = create_bounding_band(
         X.shape[2] - 2, X.shape[2] - 2, window, itakura_max_slope
     )
 
     X_average_of_slope = np.zeros((n_instances, X.shape[1], X.shape[2] - 2))
-    for i in range(n_instances):
+    for i in prange(n_instances):
         X_average_of_slope[i] = average_of_slope(X[i])
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(i + 1, n_instances):
             distances[i, j] = _dtw_distance(
-                X_average_of_slope[i], X_average_of_slope[j], bounding_matrix
+                X_average_of_slope[i], X_average_of_slope[j], starts, ends
             )
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _ddtw_from_multiple_to_multiple_distance(
     x: np.ndarray, y: np.ndarray, window: float, itakura_max_slope: float
 ) -> np.ndarray:
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
-        x.shape[2], y.shape[2], window, itakura_max_slope
+    starts, ends = create_bounding_band(
+        x.shape[2] - 2, y.shape[2] - 2, window, itakura_max_slope
     )
 
     # Derive the arrays before so that we dont have to redo every iteration
     derive_x = np.zeros((x.shape[0], x.shape[1], x.shape[2] - 2))
-    for i in range(x.shape[0]):
+    for i in prange(x.shape[0]):
         derive_x[i] = average_of_slope(x[i])
 
     derive_y = np.zeros((y.shape[0], y.shape[1], y.shape[2] - 2))
-    for i in range(y.shape[0]):
+    for i in prange(y.shape[0]):
         derive_y[i] = average_of_slope(y[i])
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(m_instances):
-            distances[i, j] = _dtw_distance(derive_x[i], derive_y[j], bounding_matrix)
+            distances[i, j] = _dtw_distance(derive_x[i], derive_y[j], starts, ends)
     return distances
 
 
@@ -106,7 +106,9 @@ def distance(
         :func:`aeon.distances.get_distance_function`.
     kwargs : Any
         Arguments for metric. Refer to each metrics documentation for a list of
-        possible arguments.
+        possible arguments. Elastic distances other than ``shape_dtw`` accept an
+        ``upper_bound`` above which computation is abandoned and ``np.inf``
+        returned.
 
     Returns
     -------
@@ -135,10 +137,20 @@ def distance(
     elif metric == "manhattan":
         return manhattan_distance(x, y)
     elif metric == "dtw":
-        return dtw_distance(x, y, kwargs.get("window"), kwargs.get("itakura_max_slope"))
+        return dtw_distance(
+            x,
+            y,
+            kwargs.get("window"),
+            kwargs.get("itakura_max_slope"),
+            kwargs.get("upper_bound", np.inf),
+        )
     elif metric == "ddtw":
         return ddtw_distance(
-            x, y, kwargs.get("window"), kwargs.get("itakura_max_slope")
+            x,
+            y,
+            kwargs.get("window"),
+            kwargs.get("itakura_max_slope"),
+            kwargs.get("upper_bound", np.inf),
         )
     elif metric == "wdtw":
         return wdtw_distance(
@@ -147,6 +159,7 @@ def distance(
             kwargs.get("window"),
             kwargs.get("g", 0.05),
             kwargs.get("itakura_max_slope"),
+            kwargs.get("upper_bound", np.inf),
         )
     elif metric == "shape_dtw":
         return shape_dtw_distance(
@@ -164,6 +177,7 @@ def distance(
             kwargs.get("window"),
             kwargs.get("g", 0.05),
             kwargs.get("itakura_max_slope"),
+            kwargs.get("upper_bound", np.inf),
         )
     elif metric == "lcss":
         return lcss_distance(
@@ -172,6 +186,7 @@ def distance(
             kwargs.get("window"),
             kwargs.get("epsilon", 1.0),
             kwargs.get("itakura_max_slope"),
+            kwargs.get("upper_bound", np.inf),
         )
     elif metric == "erp":
         return erp_distance(
@@ -181,6 +196,7 @@ def distance(
             kwargs.get("g", 0.0),
             kwargs.get("g_arr", None),
             kwargs.get("itakura_max_slope"),
+            kwargs.get("upper_bound", np.inf),
         )
     elif metric == "edr":
         return edr_distance(
@@ -189,6 +205,7 @@ def distance(
             kwargs.get("window"),
             kwargs.get("epsilon"),
             kwargs.get("itakura_max_slope"),
+            kwargs.get("upper_bound", np.inf),
         )
     elif metric == "twe":
         return twe_distance(
@@ -198,6 +215,7 @@ def distance(
             kwargs.get("nu", 0.001),
             kwargs.get("lmbda", 1.0),
             kwargs.get("itakura_max_slope"),
+            kwargs.get("upper_bound", np.inf),
         )
     elif metric == "msm":
         return msm_distance(
@@ -207,6 +225,7 @@ def distance(
             kwargs.get("independent", True),
             kwargs.get("c", 1.0),
             kwargs.get("itakura_max_slope"),
+            kwargs.get("upper_bound", np.inf),
         )
     elif metric == "mpdist":
         return mpdist(x, y, **kwargs)
@@ -217,6 +236,7 @@ def distance(
             kwargs.get("window"),
             kwargs.get("itakura_max_slope"),
             kwargs.get("warp_penalty", 1.0),
+            kwargs.get("upper_bound", np.inf),
         )
     else:
         if isinstance(metric, Callable):
@@ -228,6 +248,7 @@ def pairwise_distance(
     x: np.ndarray,
     y: np.ndarray = None,
     metric: Union[str, DistanceFunction] = None,
+    n_jobs: int = 1,
     **kwargs: Any,
 ) -> np.ndarray:
     """Compute the pairwise distance matrix between two time series.
@@ -244,6 +265,11 @@ def pairwise_distance(
         The distance metric to use.
         A list of valid pairwise distance metrics can be found in the documentation for
         :func:`aeon.distances.get_pairwise_distance_function`.
+    n_jobs : int, default=1
+        The number of jobs to run in parallel. If -1, then the number of jobs is set
+        to the number of CPU cores. If 1, then the function is executed in a single
+        thread. If greater than 1, then the function is executed in parallel.
+        Ignored if metric is a callable or "mpdist".
     kwargs : Any
         Extra arguments for metric. Refer to each metric documentation for a list of
         possible arguments.
@@ -287,14 +313,18 @@ def pairwise_distance(
            [ 48.]])
     """
     if metric == "squared":
-        return squared_pairwise_distance(x, y)
+        return squared_pairwise_distance(x, y, n_jobs=n_jobs)
     elif metric == "euclidean":
-        return euclidean_pairwise_distance(x, y)
+        return euclidean_pairwise_distance(x, y, n_jobs=n_jobs)
     elif metric == "manhattan":
-        return manhattan_pairwise_distance(x, y)
+        return manhattan_pairwise_distance(x, y, n_jobs=n_jobs)
     elif metric == "dtw":
         return dtw_pairwise_distance(
-            x, y, kwargs.get("window"), kwargs.get("itakura_max_slope")
+            x,
+            y,
+            kwargs.get("window"),
+            kwargs.get("itakura_max_slope"),
+            n_jobs=n_jobs,
         )
     elif metric == "shape_dtw":
         return shape_dtw_pairwise_distance(
@@ -304,10 +334,15 @@ def pairwise_distance(
             itakura_max_slope=kwargs.get("itakura_max_slope"),
             descriptor=kwargs.get("descriptor", "identity"),
             reach=kwargs.get("reach", 30),
+            n_jobs=n_jobs,
         )
     elif metric == "ddtw":
         return ddtw_pairwise_distance(
-            x, y, kwargs.get("window"), kwargs.get("itakura_max_slope")
+            x,
+            y,
+            kwargs.get("window"),
+            kwargs.get("itakura_max_slope"),
+            n_jobs=n_jobs,
         )
     elif metric == "wdtw":
         return wdtw_pairwise_distance(
@@ -316,6 +351,7 @@ def pairwise_distance(
             kwargs.get("window"),
             kwargs.get("g", 0.05),
             kwargs.get("itakura_max_slope"),
+            n_jobs=n_jobs,
         )
     elif metric == "wddtw":
         return wddtw_pairwise_distance(
@@ -324,6 +360,7 @@ def pairwise_distance(
             kwargs.get("window"),
             kwargs.get("g", 0.05),
             kwargs.get("itakura_max_slope"),
+            n_jobs=n_jobs,
         )
     elif metric == "lcss":
         return lcss_pairwise_distance(
@@ -332,6 +369,7 @@ def pairwise_distance(
             kwargs.get("window"),
             kwargs.get("epsilon", 1.0),
             kwargs.get("itakura_max_slope"),
+            n_jobs=n_jobs,
         )
     elif metric == "erp":
         return erp_pairwise_distance(
@@ -341,6 +379,7 @@ def pairwise_distance(
             kwargs.get("g", 0.0),
             kwargs.get("g_arr", None),
             kwargs.get("itakura_max_slope"),
+            n_jobs=n_jobs,
         )
     elif metric == "edr":
         return edr_pairwise_distance(
@@ -349,6 +388,7 @@ def pairwise_distance(
             kwargs.get("window"),
             kwargs.get("epsilon"),
             kwargs.get("itakura_max_slope"),
+            n_jobs=n_jobs,
         )
     elif metric == "twe":
         return twe_pairwise_distance(
@@ -358,6 +398,7 @@ def pairwise_distance(
             kwargs.get("nu", 0.001),
             kwargs.get("lmbda", 1.0),
             kwargs.get("itakura_max_slope"),
+            n_jobs=n_jobs,
         )
     elif metric == "msm":
         return msm_pairwise_distance(
@@ -367,6 +408,7 @@ def pairwise_distance(
             kwargs.get("independent", True),
             kwargs.get("c", 1.0),
             kwargs.get("itakura_max_slope"),
+            n_jobs=n_jobs,
         )
     elif metric == "mpdist":
         return _custom_func_pairwise(x, y, mpdist, **kwargs)
@@ -377,6 +419,7 @@ def pairwise_distance(
             kwargs.get("window"),
             kwargs.get("itakura_max_slope"),
             kwargs.get("warp_penalty", 1.0),
+            n_jobs=n_jobs,
         )
     else:
         if isinstance(metric, Callable):
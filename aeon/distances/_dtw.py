@@ -4,17 +4,21 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import compute_min_return_path
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import create_bounding_band
 from aeon.distances._squared import _univariate_squared_distance
-from aeon.distances._utils import reshape_pairwise_to_multiple
+from aeon.distances._utils import _run_with_n_jobs, reshape_pairwise_to_multiple
 
 
 @njit(cache=True, fastmath=True)
 def dtw_distance(
-    x: np.ndarray, y: np.ndarray, window: float = None, itakura_max_slope: float = None
+    x: np.ndarray,
+    y: np.ndarray,
+    window: float = None,
+    itakura_max_slope: float = None,
+    upper_bound: float = np.inf,
 ) -> float:
     r"""Compute the DTW distance between two time series.
 
@@ -74,11 +78,16 @@ def dtw_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    upper_bound : float, default=np.inf
+        Early abandoning threshold. The calculation stops as soon as the minimum of
+        a row of the cost matrix exceeds ``upper_bound``, in which case ``np.inf`` is
+        returned. Distances not greater than ``upper_bound`` are exact.
 
     Returns
     -------
     float
-        DTW distance between x and y, minimum value 0.
+        DTW distance between x and y, minimum value 0. ``np.inf`` if the distance
+        exceeds ``upper_bound``.
 
     Raises
     ------
@@ -110,15 +119,15 @@ def dtw_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _dtw_distance(_x, _y, bounding_matrix)
+        return _dtw_distance(_x, _y, starts, ends, upper_bound)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _dtw_distance(x, y, bounding_matrix)
+        return _dtw_distance(x, y, starts, ends, upper_bound)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -179,26 +188,60 @@ def dtw_cost_matrix(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _dtw_cost_matrix(_x, _y, bounding_matrix)
+        return _dtw_cost_matrix(_x, _y, starts, ends)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _dtw_cost_matrix(x, y, bounding_matrix)
+        return _dtw_cost_matrix(x, y, starts, ends)
     raise ValueError("x and y must be 1D or 2D")
 
 
 @njit(cache=True, fastmath=True)
-def _dtw_distance(x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray) -> float:
-    return _dtw_cost_matrix(x, y, bounding_matrix)[x.shape[1] - 1, y.shape[1] - 1]
+def _dtw_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    upper_bound: float = np.inf,
+) -> float:
+    # Only two rows of the cost matrix are kept, and only the in-band columns
+    # [starts[i], ends[i]) of row i are visited. Column j of the cost matrix is held
+    # at index j + 1, so index 0 is the boundary column. Cells outside the band stay
+    # at infinity, which is restored over the last written range before reuse.
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    prev = np.full(y_size + 1, np.inf)
+    curr = np.full(y_size + 1, np.inf)
+    prev[0] = 0.0
+    prev_start, prev_end = 0, 1
+    curr_start, curr_end = 0, 0
+    for i in range(x_size):
+        curr[curr_start:curr_end] = np.inf
+        row_min = np.inf
+        for j in range(starts[i], ends[i]):
+            curr[j + 1] = _univariate_squared_distance(x[:, i], y[:, j]) + min(
+                prev[j + 1], curr[j], prev[j]
+            )
+            row_min = min(row_min, curr[j + 1])
+        # Every warping path crosses each row and costs are non-negative, so the
+        # distance can be no smaller than the row minimum.
+        if row_min > upper_bound:
+            return np.inf
+        prev, curr = curr, prev
+        prev_start, curr_start = starts[i] + 1, prev_start
+        prev_end, curr_end = ends[i] + 1, prev_end
+    if prev[y_size] > upper_bound:
+        return np.inf
+    return prev[y_size]
 
 
 @njit(cache=True, fastmath=True)
 def _dtw_cost_matrix(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray
+    x: np.ndarray, y: np.ndarray, starts: np.ndarray, ends: np.ndarray
 ) -> np.ndarray:
     x_size = x.shape[1]
     y_size = y.shape[1]
@@ -206,25 +249,24 @@ def _dtw_cost_matrix(
     cost_matrix[0, 0] = 0.0
 
     for i in range(x_size):
-        for j in range(y_size):
-            if bounding_matrix[i, j]:
-                cost_matrix[i + 1, j + 1] = _univariate_squared_distance(
-                    x[:, i], y[:, j]
-                ) + min(
-                    cost_matrix[i, j + 1],
-                    cost_matrix[i + 1, j],
-                    cost_matrix[i, j],
-                )
+        for j in range(starts[i], ends[i]):
+            cost_matrix[i + 1, j + 1] = _univariate_squared_distance(
+                x[:, i], y[:, j]
+            ) + min(
+                cost_matrix[i, j + 1],
+                cost_matrix[i + 1, j],
+                cost_matrix[i, j],
+            )
 
     return cost_matrix[1:, 1:]
 
 
-@njit(cache=True, fastmath=True)
 def dtw_pairwise_distance(
     X: np.ndarray,
     y: np.ndarray = None,
     window: float = None,
     itakura_max_slope: float = None,
+    n_jobs: int = 1,
 ) -> np.ndarray:
     r"""Compute the DTW pairwise distance between a set of time series.
 
@@ -258,6 +300,10 @@ def dtw_pairwise_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    n_jobs : int, default=1
+        The number of jobs to run in parallel. If -1, then the number of jobs is set
+        to the number of CPU cores. If 1, then the function is executed in a single
+        thread. If greater than 1, then the function is executed in parallel.
 
     Returns
     -------
@@ -300,47 +346,58 @@ def dtw_pairwise_distance(
     if y is None:
         # To self
         if X.ndim == 3:
-            return _dtw_pairwise_distance(X, window, itakura_max_slope)
+            return _run_with_n_jobs(
+                n_jobs, _dtw_pairwise_distance, X, window, itakura_max_slope
+            )
         if X.ndim == 2:
             _X = X.reshape((X.shape[0], 1, X.shape[1]))
-            return _dtw_pairwise_distance(_X, window, itakura_max_slope)
+            return _run_with_n_jobs(
+                n_jobs, _dtw_pairwise_distance, _X, window, itakura_max_slope
+            )
         raise ValueError("x and y must be 2D or 3D arrays")
     _x, _y = reshape_pairwise_to_multiple(X, y)
-    return _dtw_from_multiple_to_multiple_distance(_x, _y, window, itakura_max_slope)
+    return _run_with_n_jobs(
+        n_jobs,
+        _dtw_from_multiple_to_multiple_distance,
+        _x,
+        _y,
+        window,
+        itakura_max_slope,
+    )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _dtw_pairwise_distance(
     X: np.ndarray, window: float, itakura_max_slope: float
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
+    starts, ends = create_bounding_band(
         X.shape[2], X.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(i + 1, n_instances):
-            distances[i, j] = _dtw_distance(X[i], X[j], bounding_matrix)
+            distances[i, j] = _dtw_distance(X[i], X[j], starts, ends)
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _dtw_from_multiple_to_multiple_distance(
     x: np.ndarray, y: np.ndarray, window: float, itakura_max_slope: float
 ) -> np.ndarray:
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
+    starts, ends = create_bounding_band(
         x.shape[2], y.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(m_instances):
-            distances[i, j] = _dtw_distance(x[i], y[j], bounding_matrix)
+            distances[i, j] = _dtw_distance(x[i], y[j], starts, ends)
     return distances
 
 
@@ -4,15 +4,15 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import (
     _add_inf_to_out_of_bounds_cost_matrix,
     compute_min_return_path,
 )
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import create_bounding_band, create_bounding_matrix
 from aeon.distances._euclidean import _univariate_euclidean_distance
-from aeon.distances._utils import reshape_pairwise_to_multiple
+from aeon.distances._utils import _run_with_n_jobs, reshape_pairwise_to_multiple
 
 
 @njit(cache=True, fastmath=True)
@@ -22,6 +22,7 @@ def edr_distance(
     window: float = None,
     epsilon: float = None,
     itakura_max_slope: float = None,
+    upper_bound: float = np.inf,
 ) -> float:
     r"""Compute the EDR distance between two time series.
 
@@ -68,11 +69,16 @@ def edr_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    upper_bound : float, default=np.inf
+        Early abandoning threshold. ``np.inf`` is returned if the distance exceeds
+        ``upper_bound``. The first column of the EDR cost matrix is zero, so no row
+        minimum can exceed the threshold and the full cost matrix is always computed.
 
     Returns
     -------
     float
-        EDR distance between x and y.
+        EDR distance between x and y. ``np.inf`` if the distance exceeds
+        ``upper_bound``.
 
     Raises
     ------
@@ -98,15 +104,15 @@ def edr_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _edr_distance(_x, _y, bounding_matrix, epsilon)
+        return _edr_distance(_x, _y, starts, ends, epsilon, upper_bound)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _edr_distance(x, y, bounding_matrix, epsilon)
+        return _edr_distance(x, y, starts, ends, epsilon, upper_bound)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -167,31 +173,66 @@ def edr_cost_matrix(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _edr_cost_matrix(_x, _y, bounding_matrix, epsilon)
+        return _edr_cost_matrix(_x, _y, starts, ends, epsilon)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _edr_cost_matrix(x, y, bounding_matrix, epsilon)
+        return _edr_cost_matrix(x, y, starts, ends, epsilon)
     raise ValueError("x and y must be 1D or 2D")
 
 
 @njit(cache=True, fastmath=True)
 def _edr_distance(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, epsilon: float = None
+    x: np.ndarray,
+    y: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    epsilon: float = None,
+    upper_bound: float = np.inf,
 ) -> float:
-    distance = _edr_cost_matrix(x, y, bounding_matrix, epsilon)[
-        x.shape[1] - 1, y.shape[1] - 1
-    ]
-    return float(distance / max(x.shape[1], y.shape[1]))
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    if epsilon is None:
+        epsilon = max(np.std(x), np.std(y)) / 4
+
+    # Only two rows of the cost matrix are kept, and only the in-band columns
+    # [starts[i], ends[i]) of row i are visited. Column j of the cost matrix is held
+    # at index j + 1, so index 0 is the boundary column. Cells outside the band stay
+    # at zero, which is restored over the last written range before reuse.
+    prev = np.zeros(y_size + 1)
+    curr = np.zeros(y_size + 1)
+    prev_start, prev_end = 0, 0
+    curr_start, curr_end = 0, 0
+
+    for i in range(x_size):
+        curr[curr_start:curr_end] = 0.0
+        for j in range(starts[i], ends[i]):
+            if _univariate_euclidean_distance(x[:, i], y[:, j]) < epsilon:
+                cost = 0
+            else:
+                cost = 1
+            curr[j + 1] = min(prev[j] + cost, prev[j + 1] + 1, curr[j] + 1)
+        prev, curr = curr, prev
+        prev_start, curr_start = starts[i] + 1, prev_start
+        prev_end, curr_end = ends[i] + 1, prev_end
+
+    distance = float(prev[y_size] / max(x_size, y_size))
+    if distance > upper_bound:
+        return np.inf
+    return distance
 
 
 @njit(cache=True, fastmath=True)
 def _edr_cost_matrix(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, epsilon: float = None
+    x: np.ndarray,
+    y: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    epsilon: float = None,
 ) -> np.ndarray:
     x_size = x.shape[1]
     y_size = y.shape[1]
@@ -201,27 +242,26 @@ def _edr_cost_matrix(
     cost_matrix = np.zeros((x_size + 1, y_size + 1))
 
     for i in range(1, x_size + 1):
-        for j in range(1, y_size + 1):
-            if bounding_matrix[i - 1, j - 1]:
-                if _univariate_euclidean_distance(x[:, i - 1], y[:, j - 1]) < epsilon:
-                    cost = 0
-                else:
-                    cost = 1
-                cost_matrix[i, j] = min(
-                    cost_matrix[i - 1, j - 1] + cost,
-                    cost_matrix[i - 1, j] + 1,
-                    cost_matrix[i, j - 1] + 1,
-                )
+        for j in range(starts[i - 1] + 1, ends[i - 1] + 1):
+            if _univariate_euclidean_distance(x[:, i - 1], y[:, j - 1]) < epsilon:
+                cost = 0
+            else:
+                cost = 1
+            cost_matrix[i, j] = min(
+                cost_matrix[i - 1, j - 1] + cost,
+                cost_matrix[i - 1, j] + 1,
+                cost_matrix[i, j - 1] + 1,
+            )
     return cost_matrix[1:, 1:]
 
 
-@njit(cache=True, fastmath=True)
 def edr_pairwise_distance(
     X: np.ndarray,
     y: np.ndarray = None,
     window: float = None,
     epsilon: float = None,
     itakura_max_slope: float = None,
+    n_jobs: int = 1,
 ) -> np.ndarray:
     """Compute the pairwise EDR distance between a set of time series.
 
@@ -243,6 +283,10 @@ def edr_pairwise_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    n_jobs : int, default=1
+        The number of jobs to run in parallel. If -1, then the number of jobs is set
+        to the number of CPU cores. If 1, then the function is executed in a single
+        thread. If greater than 1, then the function is executed in parallel.
 
     Returns
     -------
@@ -284,36 +328,46 @@ def edr_pairwise_distance(
     if y is None:
         # To self
         if X.ndim == 3:
-            return _edr_pairwise_distance(X, window, epsilon, itakura_max_slope)
+            return _run_with_n_jobs(
+                n_jobs, _edr_pairwise_distance, X, window, epsilon, itakura_max_slope
+            )
         if X.ndim == 2:
             _X = X.reshape((X.shape[0], 1, X.shape[1]))
-            return _edr_pairwise_distance(_X, window, epsilon, itakura_max_slope)
+            return _run_with_n_jobs(
+                n_jobs, _edr_pairwise_distance, _X, window, epsilon, itakura_max_slope
+            )
         raise ValueError("x and y must be 2D or 3D arrays")
     _x, _y = reshape_pairwise_to_multiple(X, y)
-    return _edr_from_multiple_to_multiple_distance(
-        _x, _y, window, epsilon, itakura_max_slope
+    return _run_with_n_jobs(
+        n_jobs,
+        _edr_from_multiple_to_multiple_distance,
+        _x,
+        _y,
+        window,
+        epsilon,
+        itakura_max_slope,
     )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _edr_pairwise_distance(
     X: np.ndarray, window: float, epsilon: float = None, itakura_max_slope: float = None
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
+    starts, ends = create_bounding_band(
         X.shape[2], X.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(i + 1, n_instances):
-            distances[i, j] = _edr_distance(X[i], X[j], bounding_matrix, epsilon)
+            distances[i, j] = _edr_distance(X[i], X[j], starts, ends, epsilon)
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _edr_from_multiple_to_multiple_distance(
     x: np.ndarray,
     y: np.ndarray,
@@ -324,13 +378,13 @@ def _edr_from_multiple_to_multiple_distance(
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
+    starts, ends = create_bounding_band(
         x.shape[2], y.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(m_instances):
-            distances[i, j] = _edr_distance(x[i], y[j], bounding_matrix, epsilon)
+            distances[i, j] = _edr_distance(x[i], y[j], starts, ends, epsilon)
     return distances
 
 
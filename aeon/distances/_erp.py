@@ -4,15 +4,19 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import List, Tuple, Union
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import (
     _add_inf_to_out_of_bounds_cost_matrix,
     compute_min_return_path,
 )
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import (
+    _is_full_band,
+    create_bounding_band,
+    create_bounding_matrix,
+)
 from aeon.distances._euclidean import _univariate_euclidean_distance
-from aeon.distances._utils import reshape_pairwise_to_multiple
+from aeon.distances._utils import _run_with_n_jobs, reshape_pairwise_to_multiple
 
 
 @njit(cache=True, fastmath=True)
@@ -23,6 +27,7 @@ def erp_distance(
     g: float = 0.0,
     g_arr: np.ndarray = None,
     itakura_max_slope: float = None,
+    upper_bound: float = np.inf,
 ) -> float:
     r"""Compute the ERP distance between two time series.
 
@@ -69,11 +74,18 @@ def erp_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    upper_bound : float, default=np.inf
+        Early abandoning threshold. The calculation stops as soon as the minimum of a
+        row of the cost matrix exceeds ``upper_bound``, in which case ``np.inf`` is
+        returned. Out of band cells of the cost matrix are zero, so rows are only
+        abandoned when the bounding matrix is full. Distances not greater than
+        ``upper_bound`` are exact.
 
     Returns
     -------
     float
-        ERP distance between x and y.
+        ERP distance between x and y. ``np.inf`` if the distance exceeds
+        ``upper_bound``.
 
     Raises
     ------
@@ -98,15 +110,15 @@ def erp_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _erp_distance(_x, _y, bounding_matrix, g, g_arr)
+        return _erp_distance(_x, _y, starts, ends, g, g_arr, upper_bound)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _erp_distance(x, y, bounding_matrix, g, g_arr)
+        return _erp_distance(x, y, starts, ends, g, g_arr, upper_bound)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -171,15 +183,15 @@ def erp_cost_matrix(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _erp_cost_matrix(_x, _y, bounding_matrix, g, g_arr)
+        return _erp_cost_matrix(_x, _y, starts, ends, g, g_arr)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _erp_cost_matrix(x, y, bounding_matrix, g, g_arr)
+        return _erp_cost_matrix(x, y, starts, ends, g, g_arr)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -187,20 +199,62 @@ def erp_cost_matrix(
 def _erp_distance(
     x: np.ndarray,
     y: np.ndarray,
-    bounding_matrix: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
     g: float,
     g_arr: np.ndarray,
+    upper_bound: float = np.inf,
 ) -> float:
-    return _erp_cost_matrix(x, y, bounding_matrix, g, g_arr)[
-        x.shape[1] - 1, y.shape[1] - 1
-    ]
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+
+    gx_distance, x_sum = _precompute_g(x, g, g_arr)
+    gy_distance, y_sum = _precompute_g(y, g, g_arr)
+
+    # Only two rows of the cost matrix are kept, and only the in-band columns
+    # [starts[i], ends[i]) of row i are visited. Column j of the cost matrix is held
+    # at index j + 1, so index 0 is the boundary column. Cells outside the band stay
+    # at zero, which is restored over the last written range before reuse.
+    prev = np.full(y_size + 1, y_sum)
+    curr = np.zeros(y_size + 1)
+    prev[0] = 0.0
+    prev_start, prev_end = 0, y_size + 1
+    curr_start, curr_end = 0, 0
+
+    # Out of band cells stay at zero and a constrained path can step onto them, so
+    # the row minimum is only a lower bound on the distance for a full band.
+    row_bound = upper_bound
+    if not _is_full_band(starts, ends, y_size):
+        row_bound = np.inf
+
+    for i in range(x_size):
+        curr[curr_start:curr_end] = 0.0
+        curr[0] = x_sum
+        row_min = x_sum
+        for j in range(starts[i], ends[i]):
+            curr[j + 1] = min(
+                prev[j] + _univariate_euclidean_distance(x[:, i], y[:, j]),
+                prev[j + 1] + gx_distance[i],
+                curr[j] + gy_distance[j],
+            )
+            row_min = min(row_min, curr[j + 1])
+        if row_min > row_bound:
+            return np.inf
+        prev, curr = curr, prev
+        prev_start, curr_start = starts[i] + 1, prev_start
+        prev_end, curr_end = ends[i] + 1, prev_end
+
+    if prev[y_size] > upper_bound:
+        return np.inf
+    return prev[y_size]
 
 
 @njit(cache=True, fastmath=True)
 def _erp_cost_matrix(
     x: np.ndarray,
     y: np.ndarray,
-    bounding_matrix: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
     g: float,
     g_arr: np.ndarray,
 ) -> np.ndarray:
@@ -216,14 +270,13 @@ def _erp_cost_matrix(
     cost_matrix[0, 1:] = y_sum
 
     for i in range(1, x_size + 1):
-        for j in range(1, y_size + 1):
-            if bounding_matrix[i - 1, j - 1]:
-                cost_matrix[i, j] = min(
-                    cost_matrix[i - 1, j - 1]
-                    + _univariate_euclidean_distance(x[:, i - 1], y[:, j - 1]),
-                    cost_matrix[i - 1, j] + gx_distance[i - 1],
-                    cost_matrix[i, j - 1] + gy_distance[j - 1],
-                )
+        for j in range(starts[i - 1] + 1, ends[i - 1] + 1):
+            cost_matrix[i, j] = min(
+                cost_matrix[i - 1, j - 1]
+                + _univariate_euclidean_distance(x[:, i - 1], y[:, j - 1]),
+                cost_matrix[i - 1, j] + gx_distance[i - 1],
+                cost_matrix[i, j - 1] + gy_distance[j - 1],
+            )
 
     return cost_matrix[1:, 1:]
 
@@ -248,7 +301,6 @@ def _precompute_g(
     return gx_distance, x_sum
 
 
-@njit(cache=True, fastmath=True)
 def erp_pairwise_distance(
     X: np.ndarray,
     y: np.ndarray = None,
@@ -256,6 +308,7 @@ def erp_pairwise_distance(
     g: float = 0.0,
     g_arr: np.ndarray = None,
     itakura_max_slope: float = None,
+    n_jobs: int = 1,
 ) -> np.ndarray:
     """Compute the ERP pairwise distance between a set of time series.
 
@@ -282,6 +335,10 @@ def erp_pairwise_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    n_jobs : int, default=1
+        The number of jobs to run in parallel. If -1, then the number of jobs is set
+        to the number of CPU cores. If 1, then the function is executed in a single
+        thread. If greater than 1, then the function is executed in parallel.
 
     Returns
     -------
@@ -324,18 +381,29 @@ def erp_pairwise_distance(
     if y is None:
         # To self
         if X.ndim == 3:
-            return _erp_pairwise_distance(X, window, g, g_arr, itakura_max_slope)
+            return _run_with_n_jobs(
+                n_jobs, _erp_pairwise_distance, X, window, g, g_arr, itakura_max_slope
+            )
         if X.ndim == 2:
             _X = X.reshape((X.shape[0], 1, X.shape[1]))
-            return _erp_pairwise_distance(_X, window, g, g_arr, itakura_max_slope)
+            return _run_with_n_jobs(
+                n_jobs, _erp_pairwise_distance, _X, window, g, g_arr, itakura_max_slope
+            )
         raise ValueError("x and y must be 2D or 3D arrays")
     _x, _y = reshape_pairwise_to_multiple(X, y)
-    return _erp_from_multiple_to_multiple_distance(
-        _x, _y, window, g, g_arr, itakura_max_slope
+    return _run_with_n_jobs(
+        n_jobs,
+        _erp_from_multiple_to_multiple_distance,
+        _x,
+        _y,
+        window,
+        g,
+        g_arr,
+        itakura_max_slope,
     )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _erp_pairwise_distance(
     X: np.ndarray,
     window: float,
@@ -345,19 +413,19 @@ def _erp_pairwise_distance(
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
+    starts, ends = create_bounding_band(
         X.shape[2], X.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(i + 1, n_instances):
-            distances[i, j] = _erp_distance(X[i], X[j], bounding_matrix, g, g_arr)
+            distances[i, j] = _erp_distance(X[i], X[j], starts, ends, g, g_arr)
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _erp_from_multiple_to_multiple_distance(
     x: np.ndarray,
     y: np.ndarray,
@@ -369,13 +437,13 @@ def _erp_from_multiple_to_multiple_distance(
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
+    starts, ends = create_bounding_band(
         x.shape[2], y.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(m_instances):
-            distances[i, j] = _erp_distance(x[i], y[j], bounding_matrix, g, g_arr)
+            distances[i, j] = _erp_distance(x[i], y[j], starts, ends, g, g_arr)
     return distances
 
 
@@ -1,10 +1,10 @@
 __author__ = ["chrisholder", "tonybagnall"]
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._squared import _univariate_squared_distance, squared_distance
-from aeon.distances._utils import reshape_pairwise_to_multiple
+from aeon.distances._utils import _run_with_n_jobs, reshape_pairwise_to_multiple
 
 
 @njit(cache=True, fastmath=True)
@@ -61,8 +61,9 @@ def _univariate_euclidean_distance(x: np.ndarray, y: np.ndarray) -> float:
     return np.sqrt(_univariate_squared_distance(x, y))
 
 
-@njit(cache=True, fastmath=True)
-def euclidean_pairwise_distance(X: np.ndarray, y: np.ndarray = None) -> np.ndarray:
+def euclidean_pairwise_distance(
+    X: np.ndarray, y: np.ndarray = None, n_jobs: int = 1
+) -> np.ndarray:
     """Compute the euclidean pairwise distance between a set of time series.
 
     Parameters
@@ -73,7 +74,10 @@ def euclidean_pairwise_distance(X: np.ndarray, y: np.ndarray = None) -> np.ndarr
     y : np.ndarray, of shape (m_instances, m_channels, m_timepoints) or
             (m_instances, m_timepoints) or (m_timepoints,), default=None
         A collection of time series instances.
-
+    n_jobs : int, default=1
+        The number of jobs to run in parallel. If -1, then the number of jobs is set
+        to the number of CPU cores. If 1, then the function is executed in a single
+        thread. If greater than 1, then the function is executed in parallel.
 
     Returns
     -------
@@ -113,21 +117,23 @@ def euclidean_pairwise_distance(X: np.ndarray, y: np.ndarray = None) -> np.ndarr
     if y is None:
         # To self
         if X.ndim == 3:
-            return _euclidean_pairwise_distance(X)
+            return _run_with_n_jobs(n_jobs, _euclidean_pairwise_distance, X)
         elif X.ndim == 2:
             _X = X.reshape((X.shape[0], 1, X.shape[1]))
-            return _euclidean_pairwise_distance(_X)
+            return _run_with_n_jobs(n_jobs, _euclidean_pairwise_distance, _X)
         raise ValueError("X must be 2D or 3D array")
     _x, _y = reshape_pairwise_to_multiple(X, y)
-    return _euclidean_from_multiple_to_multiple_distance(_x, _y)
+    return _run_with_n_jobs(
+        n_jobs, _euclidean_from_multiple_to_multiple_distance, _x, _y
+    )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _euclidean_pairwise_distance(X: np.ndarray) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(i + 1, n_instances):
             distances[i, j] = euclidean_distance(X[i], X[j])
             distances[j, i] = distances[i, j]
@@ -135,7 +141,7 @@ def _euclidean_pairwise_distance(X: np.ndarray) -> np.ndarray:
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _euclidean_from_multiple_to_multiple_distance(
     x: np.ndarray, y: np.ndarray
 ) -> np.ndarray:
@@ -143,7 +149,7 @@ def _euclidean_from_multiple_to_multiple_distance(
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(m_instances):
             distances[i, j] = euclidean_distance(x[i], y[j])
     return distances
@@ -0,0 +1,645 @@
+r"""Lower bounds for dynamic time warping (DTW) distances.
+
+A lower bound is a cheap function :math:`LB(\mathbf{x}, \mathbf{y})` with
+:math:`LB(\mathbf{x}, \mathbf{y}) \leq d_{dtw}(\mathbf{x}, \mathbf{y})`. Nearest
+neighbour searches use them to discard candidates without computing the full DTW
+distance. All bounds here use the same ``window`` and ``itakura_max_slope``
+semantics as :func:`aeon.distances.create_bounding_matrix`, and are valid for any
+distance that is at least the DTW distance with the same constraint, such as ADTW.
+"""
+
+from typing import Tuple
+
+import numpy as np
+from numba import njit
+
+from aeon.distances._bounding_matrix import _bounding_band_columns, create_bounding_band
+from aeon.distances._squared import _univariate_squared_distance
+
+
+@njit(cache=True, fastmath=True)
+def create_envelope(
+    y: np.ndarray,
+    x_size: int = None,
+    window: float = None,
+    itakura_max_slope: float = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the lower and upper envelope of a time series.
+
+    The envelope of ``y`` at position ``i`` is the minimum and maximum of the values
+    of ``y`` that position ``i`` of a series of length ``x_size`` may be aligned to
+    under the bounding constraint. Envelopes only depend on ``y`` and the
+    constraint, so they can be computed once per series and passed to
+    :func:`lb_keogh` and :func:`lb_cascade`.
+
+    Parameters
+    ----------
+    y : np.ndarray
+        Time series, either univariate, shape ``(n_timepoints,)``, or multivariate,
+        shape ``(n_channels, n_timepoints)``.
+    x_size : int or None, default=None
+        Length of the series the envelope will be compared to. If None, the length
+        of ``y`` is used.
+    window : float or None, default=None
+        The window to use for the bounding matrix. If None, no bounding matrix
+        is used.
+    itakura_max_slope : float, default=None
+        Maximum slope as a proportion of the number of time points used to create
+        Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+
+    Returns
+    -------
+    lower : np.ndarray
+        Lower envelope, shape ``(x_size,)`` if ``y`` is univariate or
+        ``(n_channels, x_size)`` if multivariate.
+    upper : np.ndarray
+        Upper envelope of the same shape as ``lower``.
+
+    Raises
+    ------
+    ValueError
+        If y is not a 1D or 2D array.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import create_envelope
+    >>> y = np.array([1.0, 3.0, 2.0, 5.0, 4.0])
+    >>> create_envelope(y, window=0.2)
+    (array([1., 1., 2., 2., 4.]), array([3., 3., 5., 5., 5.]))
+    """
+    if x_size is None:
+        _x_size = y.shape[-1]
+    else:
+        _x_size = x_size
+    if y.ndim == 1:
+        starts, ends = create_bounding_band(
+            _x_size, y.shape[0], window, itakura_max_slope
+        )
+        lower, upper = _create_envelope(y.reshape((1, y.shape[0])), starts, ends)
+        return lower[0], upper[0]
+    if y.ndim == 2:
+        starts, ends = create_bounding_band(
+            _x_size, y.shape[1], window, itakura_max_slope
+        )
+        return _create_envelope(y, starts, ends)
+    raise ValueError("y must be 1D or 2D")
+
+
+@njit(cache=True, fastmath=True)
+def _create_envelope(
+    y: np.ndarray, starts: np.ndarray, ends: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    lower = np.zeros((y.shape[0], starts.shape[0]))
+    upper = np.zeros((y.shape[0], starts.shape[0]))
+    for c in range(y.shape[0]):
+        _sliding_min_max(y[c], starts, ends, lower[c], upper[c])
+    return lower, upper
+
+
+@njit(cache=True, fastmath=True)
+def _sliding_min_max(
+    values: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+):
+    # Monotonic queues of indices into values, as the non-empty windows of a
+    # bounding band only ever move right.
+    min_queue = np.empty(values.shape[0], dtype=np.int64)
+    max_queue = np.empty(values.shape[0], dtype=np.int64)
+    min_head, min_tail, max_head, max_tail = 0, 0, 0, 0
+    added = 0
+    for i in range(starts.shape[0]):
+        # Rows with no cells in band make the DTW distance infinite, so any envelope
+        # is a valid bound. They are skipped and left at zero.
+        if starts[i] >= ends[i]:
+            continue
+        while added < ends[i]:
+            while (
+                min_tail > min_head and values[min_queue[min_tail - 1]] >= values[added]
+            ):
+                min_tail -= 1
+            min_queue[min_tail] = added
+            min_tail += 1
+            while (
+                max_tail > max_head and values[max_queue[max_tail - 1]] <= values[added]
+            ):
+                max_tail -= 1
+            max_queue[max_tail] = added
+            max_tail += 1
+            added += 1
+        while min_queue[min_head] < starts[i]:
+            min_head += 1
+        while max_queue[max_head] < starts[i]:
+            max_head += 1
+        lower[i] = values[min_queue[min_head]]
+        upper[i] = values[max_queue[max_head]]
+
+
+@njit(cache=True, fastmath=True)
+def lb_kim(x: np.ndarray, y: np.ndarray) -> float:
+    r"""Compute the LB_Kim lower bound of the DTW distance between two time series.
+
+    Every warping path starts by aligning the first points and ends by aligning the
+    last points of the two series, so the cost of these two cells is a lower
+    bound [1]_. It is computed in constant time and is typically the first step of
+    a lower bound cascade.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        First time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+    y : np.ndarray
+        Second time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+
+    Returns
+    -------
+    float
+        LB_Kim lower bound of the DTW distance between x and y.
+
+    Raises
+    ------
+    ValueError
+        If x and y are not 1D or 2D arrays.
+
+    References
+    ----------
+    .. [1] Rakthanmanon T, Campana B, Mueen A, Batista G, Westover B, Zhu Q, Zakaria
+    J and Keogh E.: Searching and mining trillions of time series subsequences under
+    dynamic time warping, Proceedings of the 18th ACM SIGKDD, 2012.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import lb_kim
+    >>> x = np.array([1.0, 2.0, 3.0, 4.0])
+    >>> y = np.array([2.0, 2.0, 3.0, 6.0])
+    >>> lb_kim(x, y)
+    5.0
+    """
+    if x.ndim == 1 and y.ndim == 1:
+        return _lb_kim(x.reshape((1, x.shape[0])), y.reshape((1, y.shape[0])))
+    if x.ndim == 2 and y.ndim == 2:
+        return _lb_kim(x, y)
+    raise ValueError("x and y must be 1D or 2D")
+
+
+@njit(cache=True, fastmath=True)
+def _lb_kim(x: np.ndarray, y: np.ndarray) -> float:
+    lb = _univariate_squared_distance(x[:, 0], y[:, 0])
+    if x.shape[1] > 1 or y.shape[1] > 1:
+        lb += _univariate_squared_distance(x[:, x.shape[1] - 1], y[:, y.shape[1] - 1])
+    return lb
+
+
+@njit(cache=True, fastmath=True)
+def lb_keogh(
+    x: np.ndarray,
+    y: np.ndarray,
+    window: float = None,
+    itakura_max_slope: float = None,
+    upper_bound: float = np.inf,
+    lower: np.ndarray = None,
+    upper: np.ndarray = None,
+) -> float:
+    r"""Compute the LB_Keogh lower bound of the DTW distance between two series.
+
+    Each point :math:`x_i` has to be aligned to at least one point of :math:`y`
+    within the bounding constraint, so its cost is at least the squared distance
+    from :math:`x_i` to the envelope :math:`[L_i, U_i]` of :math:`y` [1]_
+
+    .. math::
+        LB\_Keogh(\mathbf{x}, \mathbf{y}) = \sum_{i=1}^n \begin{cases}
+        (x_i - U_i)^2 & x_i > U_i \\ (x_i - L_i)^2 & x_i < L_i \\ 0 & otherwise
+        \end{cases}
+
+    Parameters
+    ----------
+    x : np.ndarray
+        First time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+    y : np.ndarray
+        Second time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+    window : float or None, default=None
+        The window to use for the bounding matrix. If None, no bounding matrix
+        is used.
+    itakura_max_slope : float, default=None
+        Maximum slope as a proportion of the number of time points used to create
+        Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    upper_bound : float, default=np.inf
+        The calculation stops as soon as the partial bound exceeds ``upper_bound``
+        and the partial bound is returned.
+    lower : np.ndarray or None, default=None
+        Precomputed lower envelope of ``y`` from :func:`create_envelope` with
+        ``x_size`` equal to the length of ``x``. If None, it is computed.
+    upper : np.ndarray or None, default=None
+        Precomputed upper envelope of ``y``. Must be given with ``lower``.
+
+    Returns
+    -------
+    float
+        LB_Keogh lower bound of the DTW distance between x and y.
+
+    Raises
+    ------
+    ValueError
+        If x and y are not 1D or 2D arrays.
+
+    References
+    ----------
+    .. [1] Keogh E and Ratanamahatana C.: Exact indexing of dynamic time warping,
+    Knowledge and Information Systems 7(3):358–386, 2005.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import lb_keogh
+    >>> x = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    >>> y = np.array([3.0, 4.0, 5.0, 6.0, 7.0])
+    >>> lb_keogh(x, y, window=0.2)
+    8.0
+    """
+    if x.ndim == 1 and y.ndim == 1:
+        _x = x.reshape((1, x.shape[0]))
+        _y = y.reshape((1, y.shape[0]))
+    elif x.ndim == 2 and y.ndim == 2:
+        _x = x
+        _y = y
+    else:
+        raise ValueError("x and y must be 1D or 2D")
+    if lower is None or upper is None:
+        starts, ends = create_bounding_band(
+            _x.shape[1], _y.shape[1], window, itakura_max_slope
+        )
+        _lower, _upper = _create_envelope(_y, starts, ends)
+    else:
+        _lower = lower.reshape((_x.shape[0], _x.shape[1]))
+        _upper = upper.reshape((_x.shape[0], _x.shape[1]))
+    return _lb_keogh(_x, _lower, _upper, 0, _x.shape[1], upper_bound, 0.0)
+
+
+@njit(cache=True, fastmath=True)
+def _lb_keogh(
+    x: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    start: int,
+    end: int,
+    upper_bound: float,
+    lb: float,
+) -> float:
+    # Adds the LB_Keogh terms of positions [start, end) of x to lb.
+    for i in range(start, end):
+        for c in range(x.shape[0]):
+            if x[c, i] > upper[c, i]:
+                lb += (x[c, i] - upper[c, i]) ** 2
+            elif x[c, i] < lower[c, i]:
+                lb += (x[c, i] - lower[c, i]) ** 2
+        if lb > upper_bound:
+            return lb
+    return lb
+
+
+@njit(cache=True, fastmath=True)
+def lb_improved(
+    x: np.ndarray,
+    y: np.ndarray,
+    window: float = None,
+    itakura_max_slope: float = None,
+    upper_bound: float = np.inf,
+    lower: np.ndarray = None,
+    upper: np.ndarray = None,
+) -> float:
+    r"""Compute the LB_Improved lower bound of the DTW distance between two series.
+
+    LB_Improved [1]_ adds a second pass to LB_Keogh. Each point of :math:`x` is
+    projected onto the envelope of :math:`y`, giving the series :math:`H`, and the
+    LB_Keogh of :math:`y` against the envelope of :math:`H` is added, so that
+
+    .. math::
+        LB\_Improved(\mathbf{x}, \mathbf{y}) = LB\_Keogh(\mathbf{x}, \mathbf{y}) +
+        LB\_Keogh(\mathbf{y}, H).
+
+    It is never smaller than LB_Keogh and takes linear time.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        First time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+    y : np.ndarray
+        Second time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+    window : float or None, default=None
+        The window to use for the bounding matrix. If None, no bounding matrix
+        is used.
+    itakura_max_slope : float, default=None
+        Maximum slope as a proportion of the number of time points used to create
+        Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    upper_bound : float, default=np.inf
+        The calculation stops as soon as the partial bound exceeds ``upper_bound``
+        and the partial bound is returned.
+    lower : np.ndarray or None, default=None
+        Precomputed lower envelope of ``y`` from :func:`create_envelope` with
+        ``x_size`` equal to the length of ``x``. If None, it is computed.
+    upper : np.ndarray or None, default=None
+        Precomputed upper envelope of ``y``. Must be given with ``lower``.
+
+    Returns
+    -------
+    float
+        LB_Improved lower bound of the DTW distance between x and y.
+
+    Raises
+    ------
+    ValueError
+        If x and y are not 1D or 2D arrays.
+
+    References
+    ----------
+    .. [1] Lemire D.: Faster retrieval with a two-pass dynamic-time-warping lower
+    bound, Pattern Recognition 42(9):2169–2180, 2009.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import lb_improved
+    >>> x = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    >>> y = np.array([3.0, 4.0, 5.0, 6.0, 7.0])
+    >>> lb_improved(x, y, window=0.2)
+    9.0
+    """
+    if x.ndim == 1 and y.ndim == 1:
+        _x = x.reshape((1, x.shape[0]))
+        _y = y.reshape((1, y.shape[0]))
+    elif x.ndim == 2 and y.ndim == 2:
+        _x = x
+        _y = y
+    else:
+        raise ValueError("x and y must be 1D or 2D")
+    if lower is None or upper is None:
+        starts, ends = create_bounding_band(
+            _x.shape[1], _y.shape[1], window, itakura_max_slope
+        )
+        _lower, _upper = _create_envelope(_y, starts, ends)
+    else:
+        _lower = lower.reshape((_x.shape[0], _x.shape[1]))
+        _upper = upper.reshape((_x.shape[0], _x.shape[1]))
+    column_starts, column_ends = _bounding_band_columns(
+        _x.shape[1], _y.shape[1], window, itakura_max_slope
+    )
+    return _lb_improved(
+        _x, _y, _lower, _upper, column_starts, column_ends, upper_bound, 0.0
+    )
+
+
+@njit(cache=True, fastmath=True)
+def _lb_improved(
+    x: np.ndarray,
+    y: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    column_starts: np.ndarray,
+    column_ends: np.ndarray,
+    upper_bound: float,
+    lb: float,
+) -> float:
+    lb = _lb_keogh(x, lower, upper, 0, x.shape[1], upper_bound, lb)
+    if lb > upper_bound:
+        return lb
+    projection = np.minimum(np.maximum(x, lower), upper)
+    projection_lower, projection_upper = _create_envelope(
+        projection, column_starts, column_ends
+    )
+    return _lb_keogh(
+        y, projection_lower, projection_upper, 0, y.shape[1], upper_bound, lb
+    )
+
+
+@njit(cache=True, fastmath=True)
+def lb_enhanced(
+    x: np.ndarray,
+    y: np.ndarray,
+    window: float = None,
+    itakura_max_slope: float = None,
+    n_bands: int = 5,
+    upper_bound: float = np.inf,
+    lower: np.ndarray = None,
+    upper: np.ndarray = None,
+) -> float:
+    r"""Compute the LB_Enhanced lower bound of the DTW distance between two series.
+
+    LB_Enhanced [1]_ combines the left and right ends of the cost matrix with
+    LB_Keogh in the middle. Every warping path crosses each of the ``n_bands``
+    L-shaped bands at the start and the end of the cost matrix, so the minimum cost
+    within each band is added to the bound. The remaining positions contribute
+    their LB_Keogh terms.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        First time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+    y : np.ndarray
+        Second time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+    window : float or None, default=None
+        The window to use for the bounding matrix. If None, no bounding matrix
+        is used.
+    itakura_max_slope : float, default=None
+        Maximum slope as a proportion of the number of time points used to create
+        Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    n_bands : int, default=5
+        Number of bands at each end of the cost matrix. Limited to half the length
+        of the shortest series.
+    upper_bound : float, default=np.inf
+        The calculation stops as soon as the partial bound exceeds ``upper_bound``
+        and the partial bound is returned.
+    lower : np.ndarray or None, default=None
+        Precomputed lower envelope of ``y`` from :func:`create_envelope` with
+        ``x_size`` equal to the length of ``x``. If None, it is computed.
+    upper : np.ndarray or None, default=None
+        Precomputed upper envelope of ``y``. Must be given with ``lower``.
+
+    Returns
+    -------
+    float
+        LB_Enhanced lower bound of the DTW distance between x and y.
+
+    Raises
+    ------
+    ValueError
+        If x and y are not 1D or 2D arrays.
+
+    References
+    ----------
+    .. [1] Tan C, Petitjean F and Webb G.: Elastic bands across the path: a new
+    framework and method to lower bound DTW, Proceedings of the 2019 SIAM
+    International Conference on Data Mining, 2019.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import lb_enhanced
+    >>> x = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    >>> y = np.array([3.0, 4.0, 5.0, 6.0, 7.0])
+    >>> lb_enhanced(x, y, window=0.2, n_bands=2)
+    11.0
+    """
+    if x.ndim == 1 and y.ndim == 1:
+        _x = x.reshape((1, x.shape[0]))
+        _y = y.reshape((1, y.shape[0]))
+    elif x.ndim == 2 and y.ndim == 2:
+        _x = x
+        _y = y
+    else:
+        raise ValueError("x and y must be 1D or 2D")
+    starts, ends = create_bounding_band(
+        _x.shape[1], _y.shape[1], window, itakura_max_slope
+    )
+    if lower is None or upper is None:
+        _lower, _upper = _create_envelope(_y, starts, ends)
+    else:
+        _lower = lower.reshape((_x.shape[0], _x.shape[1]))
+        _upper = upper.reshape((_x.shape[0], _x.shape[1]))
+    return _lb_enhanced(_x, _y, _lower, _upper, starts, ends, n_bands, upper_bound, 0.0)
+
+
+@njit(cache=True, fastmath=True)
+def _lb_enhanced(
+    x: np.ndarray,
+    y: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    n_bands: int,
+    upper_bound: float,
+    lb: float,
+) -> float:
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    # Keeping the bands within half of each series keeps the left bands, the right
+    # bands and the LB_Keogh rows in between disjoint.
+    n_bands = min(n_bands, x_size // 2, y_size // 2)
+    for i in range(n_bands):
+        # Band i on the left holds the cells (i, j) and (j, i) with j <= i.
+        left = np.inf
+        for j in range(starts[i], min(ends[i], i + 1)):
+            left = min(left, _univariate_squared_distance(x[:, i], y[:, j]))
+        for k in range(i):
+            if starts[k] <= i < ends[k]:
+                left = min(left, _univariate_squared_distance(x[:, k], y[:, i]))
+        # The mirror image of band i, counting back from the last cells.
+        row = x_size - 1 - i
+        column = y_size - 1 - i
+        right = np.inf
+        for j in range(max(starts[row], column), ends[row]):
+            right = min(right, _univariate_squared_distance(x[:, row], y[:, j]))
+        for k in range(row + 1, x_size):
+            if starts[k] <= column < ends[k]:
+                right = min(right, _univariate_squared_distance(x[:, k], y[:, column]))
+        lb += left + right
+        if lb > upper_bound:
+            return lb
+    return _lb_keogh(x, lower, upper, n_bands, x_size - n_bands, upper_bound, lb)
+
+
+@njit(cache=True, fastmath=True)
+def lb_cascade(
+    x: np.ndarray,
+    y: np.ndarray,
+    window: float = None,
+    itakura_max_slope: float = None,
+    upper_bound: float = np.inf,
+    lower: np.ndarray = None,
+    upper: np.ndarray = None,
+) -> float:
+    """Compute a cascade of lower bounds of the DTW distance between two series.
+
+    The bounds are evaluated from cheapest to tightest: :func:`lb_kim`,
+    :func:`lb_enhanced` and :func:`lb_improved`. The cascade stops at the first bound
+    that exceeds ``upper_bound``, so a return value greater than ``upper_bound``
+    means the DTW distance is also greater and the full distance need not be
+    computed. Otherwise the tightest bound found is returned.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        First time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+    y : np.ndarray
+        Second time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+    window : float or None, default=None
+        The window to use for the bounding matrix. If None, no bounding matrix
+        is used.
+    itakura_max_slope : float, default=None
+        Maximum slope as a proportion of the number of time points used to create
+        Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    upper_bound : float, default=np.inf
+        Best distance so far, typically the distance to the current nearest
+        neighbour.
+    lower : np.ndarray or None, default=None
+        Precomputed lower envelope of ``y`` from :func:`create_envelope` with
+        ``x_size`` equal to the length of ``x``. If None, it is computed.
+    upper : np.ndarray or None, default=None
+        Precomputed upper envelope of ``y``. Must be given with ``lower``.
+
+    Returns
+    -------
+    float
+        Lower bound of the DTW distance between x and y.
+
+    Raises
+    ------
+    ValueError
+        If x and y are not 1D or 2D arrays.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import dtw_distance, lb_cascade
+    >>> x = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    >>> y = np.array([3.0, 4.0, 5.0, 6.0, 7.0])
+    >>> lb_cascade(x, y, window=0.2) <= dtw_distance(x, y, window=0.2)
+    True
+    """
+    if x.ndim == 1 and y.ndim == 1:
+        _x = x.reshape((1, x.shape[0]))
+        _y = y.reshape((1, y.shape[0]))
+    elif x.ndim == 2 and y.ndim == 2:
+        _x = x
+        _y = y
+    else:
+        raise ValueError("x and y must be 1D or 2D")
+    lb = _lb_kim(_x, _y)
+    if lb > upper_bound:
+        return lb
+    starts, ends = create_bounding_band(
+        _x.shape[1], _y.shape[1], window, itakura_max_slope
+    )
+    if lower is None or upper is None:
+        _lower, _upper = _create_envelope(_y, starts, ends)
+    else:
+        _lower = lower.reshape((_x.shape[0], _x.shape[1]))
+        _upper = upper.reshape((_x.shape[0], _x.shape[1]))
+    lb = max(
+        lb, _lb_enhanced(_x, _y, _lower, _upper, starts, ends, 5, upper_bound, 0.0)
+    )
+    if lb > upper_bound:
+        return lb
+    column_starts, column_ends = _bounding_band_columns(
+        _x.shape[1], _y.shape[1], window, itakura_max_slope
+    )
+    return max(
+        lb,
+        _lb_improved(
+            _x, _y, _lower, _upper, column_starts, column_ends, upper_bound, 0.0
+        ),
+    )
@@ -4,15 +4,19 @@ __author__ = ["chrisholder", "jlines", "TonyBagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import (
     _add_inf_to_out_of_bounds_cost_matrix,
     compute_min_return_path,
 )
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import (
+    _is_full_band,
+    create_bounding_band,
+    create_bounding_matrix,
+)
 from aeon.distances._squared import _univariate_squared_distance
-from aeon.distances._utils import reshape_pairwise_to_multiple
+from aeon.distances._utils import _run_with_n_jobs, reshape_pairwise_to_multiple
 
 
 @njit(cache=True, fastmath=True)
@@ -23,6 +27,7 @@ def msm_distance(
     independent: bool = True,
     c: float = 1.0,
     itakura_max_slope: float = None,
+    upper_bound: float = np.inf,
 ) -> float:
     r"""Compute the MSM distance between two time series.
 
@@ -85,11 +90,18 @@ def msm_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    upper_bound : float, default=np.inf
+        Early abandoning threshold. The calculation stops as soon as the minimum of a
+        row of the cost matrix exceeds ``upper_bound``, in which case ``np.inf`` is
+        returned. Out of band cells of the cost matrix are zero, so rows are only
+        abandoned when the bounding matrix is full. Distances not greater than
+        ``upper_bound`` are exact.
 
     Returns
     -------
     float
-        MSM distance between x and y.
+        MSM distance between x and y. ``np.inf`` if the distance exceeds
+        ``upper_bound``.
 
     Raises
     ------
@@ -115,15 +127,15 @@ def msm_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _msm_distance(_x, _y, bounding_matrix, independent, c)
+        return _msm_distance(_x, _y, starts, ends, independent, c, upper_bound)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _msm_distance(x, y, bounding_matrix, independent, c)
+        return _msm_distance(x, y, starts, ends, independent, c, upper_bound)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -206,19 +218,19 @@ def msm_cost_matrix(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
         if independent:
-            return _msm_independent_cost_matrix(_x, _y, bounding_matrix, c)
-        return _msm_dependent_cost_matrix(_x, _y, bounding_matrix, c)
+            return _msm_independent_cost_matrix(_x, _y, starts, ends, c)
+        return _msm_dependent_cost_matrix(_x, _y, starts, ends, c)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
         if independent:
-            return _msm_independent_cost_matrix(x, y, bounding_matrix, c)
-        return _msm_dependent_cost_matrix(x, y, bounding_matrix, c)
+            return _msm_independent_cost_matrix(x, y, starts, ends, c)
+        return _msm_dependent_cost_matrix(x, y, starts, ends, c)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -226,29 +238,132 @@ def msm_cost_matrix(
 def _msm_distance(
     x: np.ndarray,
     y: np.ndarray,
-    bounding_matrix: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
     independent: bool,
     c: float,
+    upper_bound: float = np.inf,
 ) -> float:
+    # Out of band cells stay at zero and a constrained path can step onto them, so
+    # the row minimum is only a lower bound on the distance for a full band.
+    row_bound = upper_bound
+    if not _is_full_band(starts, ends, y.shape[1]):
+        row_bound = np.inf
+
     if independent:
-        return _msm_independent_cost_matrix(x, y, bounding_matrix, c)[
-            x.shape[1] - 1, y.shape[1] - 1
-        ]
-    return _msm_dependent_cost_matrix(x, y, bounding_matrix, c)[
-        x.shape[1] - 1, y.shape[1] - 1
-    ]
+        distance = 0.0
+        for i in range(x.shape[0]):
+            distance += _independent_distance(
+                x[i], y[i], starts, ends, c, row_bound, distance
+            )
+            if distance > upper_bound:
+                return np.inf
+        return distance
+
+    distance = _dependent_distance(x, y, starts, ends, c, row_bound, 0.0)
+    if distance > upper_bound:
+        return np.inf
+    return distance
+
+
+@njit(cache=True, fastmath=True)
+def _independent_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    c: float,
+    row_bound: float,
+    offset: float,
+) -> float:
+    # Only two rows of the cost matrix are kept, and only the in-band columns
+    # [starts[i], ends[i]) of row i are visited. Cells outside the band stay at
+    # zero, which is restored over the last written range before reuse.
+    x_size = x.shape[0]
+    y_size = y.shape[0]
+    prev = np.zeros(y_size)
+    curr = np.zeros(y_size)
+    prev[0] = np.abs(x[0] - y[0])
+    for j in range(max(1, starts[0]), ends[0]):
+        prev[j] = prev[j - 1] + _cost_independent(y[j], y[j - 1], x[0], c)
+    prev_start, prev_end = 0, max(1, ends[0])
+    curr_start, curr_end = 0, 0
+
+    for i in range(1, x_size):
+        curr[curr_start:curr_end] = 0.0
+        if starts[i] == 0 < ends[i]:
+            curr[0] = prev[0] + _cost_independent(x[i], x[i - 1], y[0], c)
+        row_min = curr[0]
+        for j in range(max(1, starts[i]), ends[i]):
+            d1 = prev[j - 1] + np.abs(x[i] - y[j])
+            d2 = prev[j] + _cost_independent(x[i], x[i - 1], y[j], c)
+            d3 = curr[j - 1] + _cost_independent(y[j], x[i], y[j - 1], c)
+
+            curr[j] = min(d1, d2, d3)
+            row_min = min(row_min, curr[j])
+        if offset + row_min > row_bound:
+            return np.inf
+        prev, curr = curr, prev
+        prev_start, curr_start = starts[i], prev_start
+        prev_end, curr_end = ends[i], prev_end
+
+    return prev[y_size - 1]
+
+
+@njit(cache=True, fastmath=True)
+def _dependent_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    c: float,
+    row_bound: float,
+    offset: float,
+) -> float:
+    # Only two rows of the cost matrix are kept, and only the in-band columns
+    # [starts[i], ends[i]) of row i are visited. Cells outside the band stay at
+    # zero, which is restored over the last written range before reuse.
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    prev = np.zeros(y_size)
+    curr = np.zeros(y_size)
+    prev[0] = np.sum(np.abs(x[:, 0] - y[:, 0]))
+    for j in range(max(1, starts[0]), ends[0]):
+        prev[j] = prev[j - 1] + _cost_dependent(y[:, j], y[:, j - 1], x[:, 0], c)
+    prev_start, prev_end = 0, max(1, ends[0])
+    curr_start, curr_end = 0, 0
+
+    for i in range(1, x_size):
+        curr[curr_start:curr_end] = 0.0
+        if starts[i] == 0 < ends[i]:
+            curr[0] = prev[0] + _cost_dependent(x[:, i], x[:, i - 1], y[:, 0], c)
+        row_min = curr[0]
+        for j in range(max(1, starts[i]), ends[i]):
+            d1 = prev[j - 1] + np.sum(np.abs(x[:, i] - y[:, j]))
+            d2 = prev[j] + _cost_dependent(x[:, i], x[:, i - 1], y[:, j], c)
+            d3 = curr[j - 1] + _cost_dependent(y[:, j], x[:, i], y[:, j - 1], c)
+
+            curr[j] = min(d1, d2, d3)
+            row_min = min(row_min, curr[j])
+        if offset + row_min > row_bound:
+            return np.inf
+        prev, curr = curr, prev
+        prev_start, curr_start = starts[i], prev_start
+        prev_end, curr_end = ends[i], prev_end
+
+    return prev[y_size - 1]
 
 
 @njit(cache=True, fastmath=True)
 def _msm_independent_cost_matrix(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, c: float
+    x: np.ndarray, y: np.ndarray, starts: np.ndarray, ends: np.ndarray, c: float
 ) -> np.ndarray:
     x_size = x.shape[1]
     y_size = y.shape[1]
     cost_matrix = np.zeros((x_size, y_size))
     distance = 0
     for i in range(x.shape[0]):
-        curr_cost_matrix = _independent_cost_matrix(x[i], y[i], bounding_matrix, c)
+        curr_cost_matrix = _independent_cost_matrix(x[i], y[i], starts, ends, c)
         cost_matrix = np.add(cost_matrix, curr_cost_matrix)
         distance += curr_cost_matrix[-1, -1]
     return cost_matrix
@@ -256,7 +371,7 @@ def _msm_independent_cost_matrix(
 
 @njit(cache=True, fastmath=True)
 def _independent_cost_matrix(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, c: float
+    x: np.ndarray, y: np.ndarray, starts: np.ndarray, ends: np.ndarray, c: float
 ) -> np.ndarray:
     x_size = x.shape[0]
     y_size = y.shape[0]
@@ -264,30 +379,28 @@ def _independent_cost_matrix(
     cost_matrix[0, 0] = np.abs(x[0] - y[0])
 
     for i in range(1, x_size):
-        if bounding_matrix[i, 0]:
+        if starts[i] == 0 < ends[i]:
             cost = _cost_independent(x[i], x[i - 1], y[0], c)
             cost_matrix[i][0] = cost_matrix[i - 1][0] + cost
 
-    for i in range(1, y_size):
-        if bounding_matrix[0, i]:
-            cost = _cost_independent(y[i], y[i - 1], x[0], c)
-            cost_matrix[0][i] = cost_matrix[0][i - 1] + cost
+    for i in range(max(1, starts[0]), ends[0]):
+        cost = _cost_independent(y[i], y[i - 1], x[0], c)
+        cost_matrix[0][i] = cost_matrix[0][i - 1] + cost
 
     for i in range(1, x_size):
-        for j in range(1, y_size):
-            if bounding_matrix[i, j]:
-                d1 = cost_matrix[i - 1][j - 1] + np.abs(x[i] - y[j])
-                d2 = cost_matrix[i - 1][j] + _cost_independent(x[i], x[i - 1], y[j], c)
-                d3 = cost_matrix[i][j - 1] + _cost_independent(y[j], x[i], y[j - 1], c)
+        for j in range(max(1, starts[i]), ends[i]):
+            d1 = cost_matrix[i - 1][j - 1] + np.abs(x[i] - y[j])
+            d2 = cost_matrix[i - 1][j] + _cost_independent(x[i], x[i - 1], y[j], c)
+            d3 = cost_matrix[i][j - 1] + _cost_independent(y[j], x[i], y[j - 1], c)
 
-                cost_matrix[i, j] = min(d1, d2, d3)
+            cost_matrix[i, j] = min(d1, d2, d3)
 
     return cost_matrix
 
 
 @njit(cache=True, fastmath=True)
 def _msm_dependent_cost_matrix(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, c: float
+    x: np.ndarray, y: np.ndarray, starts: np.ndarray, ends: np.ndarray, c: float
 ) -> np.ndarray:
     x_size = x.shape[1]
     y_size = y.shape[1]
@@ -295,26 +408,24 @@ def _msm_dependent_cost_matrix(
     cost_matrix[0, 0] = np.sum(np.abs(x[:, 0] - y[:, 0]))
 
     for i in range(1, x_size):
-        if bounding_matrix[i, 0]:
+        if starts[i] == 0 < ends[i]:
             cost = _cost_dependent(x[:, i], x[:, i - 1], y[:, 0], c)
             cost_matrix[i][0] = cost_matrix[i - 1][0] + cost
-    for i in range(1, y_size):
-        if bounding_matrix[0, i]:
-            cost = _cost_dependent(y[:, i], y[:, i - 1], x[:, 0], c)
-            cost_matrix[0][i] = cost_matrix[0][i - 1] + cost
+    for i in range(max(1, starts[0]), ends[0]):
+        cost = _cost_dependent(y[:, i], y[:, i - 1], x[:, 0], c)
+        cost_matrix[0][i] = cost_matrix[0][i - 1] + cost
 
     for i in range(1, x_size):
-        for j in range(1, y_size):
-            if bounding_matrix[i, j]:
-                d1 = cost_matrix[i - 1][j - 1] + np.sum(np.abs(x[:, i] - y[:, j]))
-                d2 = cost_matrix[i - 1][j] + _cost_dependent(
-                    x[:, i], x[:, i - 1], y[:, j], c
-                )
-                d3 = cost_matrix[i][j - 1] + _cost_dependent(
-                    y[:, j], x[:, i], y[:, j - 1], c
-                )
-
-                cost_matrix[i, j] = min(d1, d2, d3)
+        for j in range(max(1, starts[i]), ends[i]):
+            d1 = cost_matrix[i - 1][j - 1] + np.sum(np.abs(x[:, i] - y[:, j]))
+            d2 = cost_matrix[i - 1][j] + _cost_dependent(
+                x[:, i], x[:, i - 1], y[:, j], c
+            )
+            d3 = cost_matrix[i][j - 1] + _cost_dependent(
+                y[:, j], x[:, i], y[:, j - 1], c
+            )
+
+            cost_matrix[i, j] = min(d1, d2, d3)
     return cost_matrix
 
 
@@ -342,7 +453,6 @@ def _cost_independent(x: float, y: float, z: float, c: float) -> float:
     return c + min(abs(x - y), abs(x - z))
 
 
-@njit(cache=True, fastmath=True)
 def msm_pairwise_distance(
     X: np.ndarray,
     y: np.ndarray = None,
@@ -350,6 +460,7 @@ def msm_pairwise_distance(
     independent: bool = True,
     c: float = 1.0,
     itakura_max_slope: float = None,
+    n_jobs: int = 1,
 ) -> np.ndarray:
     """Compute the msm pairwise distance between a set of time series.
 
@@ -372,6 +483,10 @@ def msm_pairwise_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    n_jobs : int, default=1
+        The number of jobs to run in parallel. If -1, then the number of jobs is set
+        to the number of CPU cores. If 1, then the function is executed in a single
+        thread. If greater than 1, then the function is executed in parallel.
 
     Returns
     -------
@@ -414,37 +529,81 @@ def msm_pairwise_distance(
     if y is None:
         # To self
         if X.ndim == 3:
-            return _msm_pairwise_distance(X, window, independent, c, itakura_max_slope)
+            return _run_with_n_jobs(
+                n_jobs,
+                _msm_pairwise_distance,
+                X,
+                window,
+                independent,
+                c,
+                itakura_max_slope,
+            )
         if X.ndim == 2:
             _X = X.reshape((X.shape[0], 1, X.shape[1]))
-            return _msm_pairwise_distance(_X, window, independent, c, itakura_max_slope)
+            return _run_with_n_jobs(
+                n_jobs,
+                _msm_pairwise_distance,
+                _X,
+                window,
+                independent,
+                c,
+                itakura_max_slope,
+            )
         raise ValueError("x and y must be 2D or 3D arrays")
     elif y.ndim == X.ndim:
         # Multiple to multiple
         if y.ndim == 3 and X.ndim == 3:
-            return _msm_from_multiple_to_multiple_distance(
-                X, y, window, independent, c, itakura_max_slope
+            return _run_with_n_jobs(
+                n_jobs,
+                _msm_from_multiple_to_multiple_distance,
+                X,
+                y,
+                window,
+                independent,
+                c,
+                itakura_max_slope,
             )
         if y.ndim == 2 and X.ndim == 2:
             _x = X.reshape((X.shape[0], 1, X.shape[1]))
             _y = y.reshape((y.shape[0], 1, y.shape[1]))
-            return _msm_from_multiple_to_multiple_distance(
-                _x, _y, window, independent, c, itakura_max_slope
+            return _run_with_n_jobs(
+                n_jobs,
+                _msm_from_multiple_to_multiple_distance,
+                _x,
+                _y,
+                window,
+                independent,
+                c,
+                itakura_max_slope,
             )
         if y.ndim == 1 and X.ndim == 1:
             _x = X.reshape((1, 1, X.shape[0]))
             _y = y.reshape((1, 1, y.shape[0]))
-            return _msm_from_multiple_to_multiple_distance(
-                _x, _y, window, independent, c, itakura_max_slope
+            return _run_with_n_jobs(
+                n_jobs,
+                _msm_from_multiple_to_multiple_distance,
+                _x,
+                _y,
+                window,
+                independent,
+                c,
+                itakura_max_slope,
             )
         raise ValueError("x and y must be 1D, 2D, or 3D arrays")
     _x, _y = reshape_pairwise_to_multiple(X, y)
-    return _msm_from_multiple_to_multiple_distance(
-        _x, _y, window, independent, c, itakura_max_slope
+    return _run_with_n_jobs(
+        n_jobs,
+        _msm_from_multiple_to_multiple_distance,
+        _x,
+        _y,
+        window,
+        independent,
+        c,
+        itakura_max_slope,
     )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _msm_pairwise_distance(
     X: np.ndarray,
     window: float,
@@ -454,19 +613,19 @@ def _msm_pairwise_distance(
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
+    starts, ends = create_bounding_band(
         X.shape[2], X.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(i + 1, n_instances):
-            distances[i, j] = _msm_distance(X[i], X[j], bounding_matrix, independent, c)
+            distances[i, j] = _msm_distance(X[i], X[j], starts, ends, independent, c)
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _msm_from_multiple_to_multiple_distance(
     x: np.ndarray,
     y: np.ndarray,
@@ -478,13 +637,13 @@ def _msm_from_multiple_to_multiple_distance(
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
+    starts, ends = create_bounding_band(
         x.shape[2], y.shape[2], window, itakura_max_slope
     )
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(m_instances):
-            distances[i, j] = _msm_distance(x[i], y[j], bounding_matrix, independent, c)
+            distances[i, j] = _msm_distance(x[i], y[j], starts, ends, independent, c)
     return distances
 
 
@@ -0,0 +1,270 @@
+r"""Exact nearest neighbour search with lower bounds and early abandoning.
+
+The search follows the UCR suite [1]_. For each query the candidates are visited in
+increasing order of :func:`aeon.distances.lb_kim`, so close candidates are found
+early and the distance to the current k-th nearest neighbour is small. Candidates
+are then discarded with a cascade of increasingly tight lower bounds, and the
+distance is only computed for those left, abandoning it as soon as it exceeds the
+distance to the k-th nearest neighbour.
+"""
+
+from typing import Any, Tuple, Union
+
+import numpy as np
+from numba import njit, prange
+
+from aeon.distances._adtw import _adtw_distance
+from aeon.distances._bounding_matrix import _bounding_band_columns, create_bounding_band
+from aeon.distances._ddtw import average_of_slope
+from aeon.distances._distance import DistanceFunction, pairwise_distance
+from aeon.distances._dtw import _dtw_distance
+from aeon.distances._lower_bounds import (
+    _create_envelope,
+    _lb_enhanced,
+    _lb_improved,
+    _lb_kim,
+)
+from aeon.distances._utils import _run_with_n_jobs, reshape_pairwise_to_multiple
+from aeon.utils.numba.general import z_normalise_series_3d
+
+# Metrics that are at least the DTW distance with the same bounding, so the DTW
+# lower bounds can be used to prune the search.
+_PRUNED_METRICS = ["dtw", "ddtw", "adtw", "squared", "euclidean"]
+
+
+def nearest_neighbors(
+    X: np.ndarray,
+    y: np.ndarray,
+    n_neighbors: int = 1,
+    metric: Union[str, DistanceFunction] = "dtw",
+    normalise: bool = False,
+    n_jobs: int = 1,
+    **kwargs: Any,
+) -> Tuple[np.ndarray, np.ndarray]:
+    r"""Find the k nearest neighbours in y of each series in X.
+
+    For the ``"dtw"``, ``"ddtw"``, ``"adtw"``, ``"squared"`` and ``"euclidean"``
+    metrics the search is exact but avoids most distance computations, following
+    the UCR suite [1]_:
+
+    - candidates are visited in increasing order of LB_Kim, so the k-th nearest
+      neighbour distance, used as the pruning threshold, shrinks quickly;
+    - candidates are discarded with the cascade LB_Kim, LB_Enhanced and
+      LB_Improved, see :func:`aeon.distances.lb_cascade`, using envelopes of
+      the candidates computed once for all queries;
+    - the distance of the remaining candidates is early abandoned once it exceeds
+      the threshold.
+
+    For the ``"squared"`` and ``"euclidean"`` metrics only LB_Kim is used, as the
+    other bounds cost as much as the distance itself. For any
+    other metric the distances are computed with
+    :func:`aeon.distances.pairwise_distance`. The queries are searched in parallel
+    with ``n_jobs`` threads.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        A single series or a collection of query series of shape ``(n_timepoints,)``
+        or ``(n_instances, n_timepoints)`` or
+        ``(n_instances, n_channels, n_timepoints)``.
+    y : np.ndarray
+        A collection of candidate series of shape ``(m_instances, m_timepoints)`` or
+        ``(m_instances, m_channels, m_timepoints)``.
+    n_neighbors : int, default=1
+        Number of neighbours to find for each query.
+    metric : str or Callable, default="dtw"
+        The distance metric to use.
+        A list of valid pairwise distance metrics can be found in the documentation for
+        :func:`aeon.distances.get_pairwise_distance_function`.
+    normalise : bool, default=False
+        If True, each channel of the queries and the candidates is z-normalised
+        before the search, and the distances returned are between the normalised
+        series.
+    n_jobs : int, default=1
+        The number of jobs to run in parallel. If -1, then the number of jobs is set
+        to the number of CPU cores. If 1, then the function is executed in a single
+        thread. If greater than 1, then the function is executed in parallel.
+    kwargs : Any
+        Extra arguments for metric. Refer to each metric documentation for a list of
+        possible arguments.
+
+    Returns
+    -------
+    distances : np.ndarray of shape (n_instances, n_neighbors)
+        Distances from each query to its nearest neighbours, in increasing order.
+    indices : np.ndarray of shape (n_instances, n_neighbors)
+        Indices in y of the nearest neighbours of each query.
+
+    Raises
+    ------
+    ValueError
+        If X and y are not 1D, 2D or 3D arrays.
+        If n_neighbors is not between 1 and the number of series in y.
+        If metric is "squared" or "euclidean" and the series have different lengths.
+
+    References
+    ----------
+    .. [1] Rakthanmanon T, Campana B, Mueen A, Batista G, Westover B, Zhu Q,
+    Zakaria J, Keogh E. Searching and mining trillions of time series subsequences
+    under dynamic time warping. In proceedings of the 18th ACM SIGKDD international
+    conference on Knowledge discovery and data mining 2012 (pp. 262-270).
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import nearest_neighbors
+    >>> X = np.array([[1, 2, 3, 4], [8, 8, 9, 9]])
+    >>> y = np.array([[9, 8, 9, 8], [1, 1, 2, 3], [5, 5, 5, 5]])
+    >>> nearest_neighbors(X, y, n_neighbors=2, metric="dtw")
+    (array([[ 1., 30.],
+           [ 2., 50.]]), array([[1, 2],
+           [0, 2]]))
+    """
+    _X, _y = reshape_pairwise_to_multiple(X, y)
+    if n_neighbors < 1 or n_neighbors > _y.shape[0]:
+        raise ValueError(
+            f"n_neighbors must be between 1 and the number of series in y "
+            f"({_y.shape[0]}), but found {n_neighbors}"
+        )
+    if normalise:
+        _X = z_normalise_series_3d(_X)
+        _y = z_normalise_series_3d(_y)
+
+    if not isinstance(metric, str) or metric not in _PRUNED_METRICS:
+        distances = pairwise_distance(_X, _y, metric=metric, n_jobs=n_jobs, **kwargs)
+        indices = np.argsort(distances, axis=1, kind="stable")[:, :n_neighbors]
+        return np.take_along_axis(distances, indices, axis=1), indices
+
+    window = kwargs.get("window")
+    itakura_max_slope = kwargs.get("itakura_max_slope")
+    warp_penalty = kwargs.get("warp_penalty", 1.0) if metric == "adtw" else 0.0
+    if metric == "squared" or metric == "euclidean":
+        if _X.shape[2] != _y.shape[2]:
+            raise ValueError(
+                f"The {metric} distance needs series of the same length, but found "
+                f"lengths {_X.shape[2]} and {_y.shape[2]}"
+            )
+        window = 0.0
+        itakura_max_slope = None
+    elif metric == "ddtw":
+        _X = _average_of_slope_3d(_X)
+        _y = _average_of_slope_3d(_y)
+
+    starts, ends = create_bounding_band(
+        _X.shape[2], _y.shape[2], window, itakura_max_slope
+    )
+    column_starts, column_ends = _bounding_band_columns(
+        _X.shape[2], _y.shape[2], window, itakura_max_slope
+    )
+    distances, indices = _run_with_n_jobs(
+        n_jobs,
+        _nearest_neighbors,
+        _X,
+        _y,
+        n_neighbors,
+        starts,
+        ends,
+        column_starts,
+        column_ends,
+        metric == "adtw",
+        warp_penalty,
+        metric != "squared" and metric != "euclidean",
+    )
+    if metric == "euclidean":
+        distances = np.sqrt(distances)
+    return distances, indices
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _nearest_neighbors(
+    X: np.ndarray,
+    y: np.ndarray,
+    n_neighbors: int,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    column_starts: np.ndarray,
+    column_ends: np.ndarray,
+    adtw: bool,
+    warp_penalty: float,
+    elastic: bool,
+) -> Tuple[np.ndarray, np.ndarray]:
+    n_queries = X.shape[0]
+    n_cases = y.shape[0]
+    lower = np.zeros((n_cases, y.shape[1], X.shape[2]))
+    upper = np.zeros((n_cases, y.shape[1], X.shape[2]))
+    if elastic:
+        for j in prange(n_cases):
+            lower[j], upper[j] = _create_envelope(y[j], starts, ends)
+
+    distances = np.full((n_queries, n_neighbors), np.inf)
+    indices = np.zeros((n_queries, n_neighbors), dtype=np.int64)
+    for i in prange(n_queries):
+        kim = np.zeros(n_cases)
+        for j in range(n_cases):
+            kim[j] = _lb_kim(X[i], y[j])
+        n_found = 0
+        upper_bound = np.inf
+        for j in np.argsort(kim):
+            # Candidates are in increasing LB_Kim order, none of the rest can be
+            # closer than the current neighbours.
+            if kim[j] > upper_bound:
+                break
+            if elastic:
+                lb = _lb_enhanced(
+                    X[i], y[j], lower[j], upper[j], starts, ends, 5, upper_bound, 0.0
+                )
+                if lb > upper_bound:
+                    continue
+                lb = _lb_improved(
+                    X[i],
+                    y[j],
+                    lower[j],
+                    upper[j],
+                    column_starts,
+                    column_ends,
+                    upper_bound,
+                    0.0,
+                )
+                if lb > upper_bound:
+                    continue
+            if not elastic:
+                dist = _squared_distance(X[i], y[j], upper_bound)
+            elif adtw:
+                dist = _adtw_distance(
+                    X[i], y[j], starts, ends, warp_penalty, upper_bound
+                )
+            else:
+                dist = _dtw_distance(X[i], y[j], starts, ends, upper_bound)
+            if n_found < n_neighbors or dist < upper_bound:
+                # Insert into the neighbours, kept sorted by distance
+                k = min(n_found, n_neighbors - 1)
+                while k > 0 and distances[i, k - 1] > dist:
+                    distances[i, k] = distances[i, k - 1]
+                    indices[i, k] = indices[i, k - 1]
+                    k -= 1
+                distances[i, k] = dist
+                indices[i, k] = j
+                n_found = min(n_found + 1, n_neighbors)
+                if n_found == n_neighbors:
+                    upper_bound = distances[i, n_neighbors - 1]
+    return distances, indices
+
+
+@njit(cache=True, fastmath=True)
+def _average_of_slope_3d(X: np.ndarray) -> np.ndarray:
+    derivative = np.zeros((X.shape[0], X.shape[1], X.shape[2] - 2))
+    for i in range(X.shape[0]):
+        derivative[i] = average_of_slope(X[i])
+    return derivative
+
+
+@njit(cache=True, fastmath=True)
+def _squared_distance(x: np.ndarray, y: np.ndarray, upper_bound: float) -> float:
+    distance = 0.0
+    for t in range(x.shape[1]):
+        for c in range(x.shape[0]):
+            difference = x[c, t] - y[c, t]
+            distance += difference * difference
+        if distance > upper_bound:
+            return np.inf
+    return distance
@@ -4,13 +4,13 @@ __author__ = ["hadifawaz1999"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import compute_min_return_path
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import create_bounding_band
 from aeon.distances._dtw import _dtw_cost_matrix
 from aeon.distances._squared import _univariate_squared_distance
-from aeon.distances._utils import reshape_pairwise_to_multiple
+from aeon.distances._utils import _run_with_n_jobs, reshape_pairwise_to_multiple
 
 
 @njit(cache=True, fastmath=True)
@@ -181,7 +181,7 @@ def shape_dtw_distance(
         x_pad = _pad_ts_edges(x=_x, reach=reach)
         y_pad = _pad_ts_edges(x=_y, reach=reach)
 
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
 
@@ -190,13 +190,14 @@ def shape_dtw_distance(
             y=y_pad,
             descriptor=descriptor,
             reach=reach,
-            bounding_matrix=bounding_matrix,
+            starts=starts,
+            ends=ends,
         )
     if x.ndim == 2 and y.ndim == 2:
         x_pad = _pad_ts_edges(x=x, reach=reach)
         y_pad = _pad_ts_edges(x=y, reach=reach)
 
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
 
@@ -205,7 +206,8 @@ def shape_dtw_distance(
             y=y_pad,
             descriptor=descriptor,
             reach=reach,
-            bounding_matrix=bounding_matrix,
+            starts=starts,
+            ends=ends,
         )
 
     raise ValueError("x and y must be 1D or 2D")
@@ -215,16 +217,15 @@ def shape_dtw_distance(
 def _shape_dtw_distance(
     x: np.ndarray,
     y: np.ndarray,
-    bounding_matrix: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
     descriptor: str = "identity",
     reach: int = 30,
 ) -> float:
     new_x = _transform_subsequences(x=x, descriptor=descriptor, reach=reach)
     new_y = _transform_subsequences(x=y, descriptor=descriptor, reach=reach)
 
-    shape_dtw_cost_mat = _dtw_cost_matrix(
-        x=new_x, y=new_y, bounding_matrix=bounding_matrix
-    )
+    shape_dtw_cost_mat = _dtw_cost_matrix(x=new_x, y=new_y, starts=starts, ends=ends)
 
     return _get_shape_dtw_distance_from_cost_mat(
         x=x, y=y, reach=reach, shape_dtw_cost_mat=shape_dtw_cost_mat
@@ -313,7 +314,7 @@ def shape_dtw_cost_matrix(
         x_pad = _pad_ts_edges(x=_x, reach=reach)
         y_pad = _pad_ts_edges(x=_y, reach=reach)
 
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
 
@@ -322,13 +323,14 @@ def shape_dtw_cost_matrix(
             y=y_pad,
             descriptor=descriptor,
             reach=reach,
-            bounding_matrix=bounding_matrix,
+            starts=starts,
+            ends=ends,
         )
     if x.ndim == 2 and y.ndim == 2:
         x_pad = _pad_ts_edges(x=x, reach=reach)
         y_pad = _pad_ts_edges(x=y, reach=reach)
 
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
 
@@ -337,7 +339,8 @@ def shape_dtw_cost_matrix(
             y=y_pad,
             descriptor=descriptor,
             reach=reach,
-            bounding_matrix=bounding_matrix,
+            starts=starts,
+            ends=ends,
         )
 
     raise ValueError("x and y must be 1D or 2D")
@@ -347,16 +350,15 @@ def shape_dtw_cost_matrix(
 def _shape_dtw_cost_matrix(
     x: np.ndarray,
     y: np.ndarray,
-    bounding_matrix: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
     descriptor: str = "identity",
     reach: int = 30,
 ) -> float:
     new_x = _transform_subsequences(x=x, descriptor=descriptor, reach=reach)
     new_y = _transform_subsequences(x=y, descriptor=descriptor, reach=reach)
 
-    shapedtw_cost_mat = _dtw_cost_matrix(
-        x=new_x, y=new_y, bounding_matrix=bounding_matrix
-    )
+    shapedtw_cost_mat = _dtw_cost_matrix(x=new_x, y=new_y, starts=starts, ends=ends)
 
     return shapedtw_cost_mat
 
@@ -439,7 +441,6 @@ def shape_dtw_alignment_path(
     return (compute_min_return_path(cost_matrix), shapedtw_dist)
 
 
-@njit(cache=True, fastmath=True)
 def shape_dtw_pairwise_distance(
     X: np.ndarray,
     y: np.ndarray = None,
@@ -447,6 +448,7 @@ def shape_dtw_pairwise_distance(
     descriptor: str = "identity",
     reach: int = 30,
     itakura_max_slope: float = None,
+    n_jobs: int = 1,
 ) -> np.ndarray:
     """Compute the ShapeDTW pairwise distance among a set of series.
 
@@ -477,6 +479,10 @@ def shape_dtw_pairwise_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    n_jobs : int, default=1
+        The number of jobs to run in parallel. If -1, then the number of jobs is set
+        to the number of CPU cores. If 1, then the function is executed in a single
+        thread. If greater than 1, then the function is executed in parallel.
 
     Returns
     -------
@@ -493,7 +499,9 @@ def shape_dtw_pairwise_distance(
     if y is None:
         if X.ndim == 3:
             X_pad = _pad_ts_edges(x=X, reach=reach)
-            return _shape_dtw_pairwise_distance(
+            return _run_with_n_jobs(
+                n_jobs,
+                _shape_dtw_pairwise_distance,
                 X=X_pad,
                 window=window,
                 descriptor=descriptor,
@@ -503,7 +511,9 @@ def shape_dtw_pairwise_distance(
         if X.ndim == 2:
             _X = X.reshape((X.shape[0], 1, X.shape[1]))
             X_pad = _pad_ts_edges(x=_X, reach=reach)
-            return _shape_dtw_pairwise_distance(
+            return _run_with_n_jobs(
+                n_jobs,
+                _shape_dtw_pairwise_distance,
                 X=X_pad,
                 window=window,
                 descriptor=descriptor,
@@ -516,7 +526,9 @@ def shape_dtw_pairwise_distance(
         X_pad = _pad_ts_edges(x=_X, reach=reach)
         y_pad = _pad_ts_edges(x=_y, reach=reach)
 
-        return _shape_dtw_pairwise_distance(
+        return _run_with_n_jobs(
+            n_jobs,
+            _shape_dtw_pairwise_distance,
             X=X_pad,
             y=y_pad,
             window=window,
@@ -526,7 +538,7 @@ def shape_dtw_pairwise_distance(
         )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _shape_dtw_pairwise_distance(
     X: np.ndarray,
     y: np.ndarray = None,
@@ -539,18 +551,19 @@ def _shape_dtw_pairwise_distance(
         y = np.copy(X)
 
     distances = np.zeros(shape=(len(X), len(y)))
-    bounding_matrix = create_bounding_matrix(
+    starts, ends = create_bounding_band(
         X.shape[2] - 2 * reach, y.shape[2] - 2 * reach, window, itakura_max_slope
     )
 
-    for i in range(len(X)):
+    for i in prange(len(X)):
         for j in range(len(y)):
             distances[i, j] = _shape_dtw_distance(
                 x=X[i],
                 y=y[j],
                 descriptor=descriptor,
                 reach=reach,
-                bounding_matrix=bounding_matrix,
+                starts=starts,
+                ends=ends,
             )
 
     return distances
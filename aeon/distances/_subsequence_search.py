@@ -0,0 +1,404 @@
+r"""Search for the subsequences of long series closest to a query.
+
+The Euclidean distance profile, the distance from a query to every subsequence of a
+series, is computed with the MASS algorithm: the dot products of the query with all
+subsequences come from a single FFT convolution, and the sliding means and standard
+deviations of the series give the z-normalised distances in linear time. DTW matches
+are found with the UCR suite pruning of LB_Keogh and early abandoning.
+"""
+
+from typing import List, Tuple, Union
+
+import numpy as np
+from numba import njit
+
+from aeon.distances._bounding_matrix import create_bounding_band
+from aeon.distances._dtw import _dtw_distance
+from aeon.distances._lower_bounds import _create_envelope
+from aeon.utils.numba.general import (
+    sliding_mean_std_one_series,
+    z_normalise_series_2d,
+)
+
+
+def distance_profile(
+    q: np.ndarray, x: np.ndarray, normalise: bool = True
+) -> np.ndarray:
+    r"""Compute the Euclidean distance from a query to every subsequence of a series.
+
+    Uses the MASS algorithm [1]_. The dot products between the query and all the
+    subsequences of ``x`` of the same length are computed with one FFT convolution
+    in :math:`O(n \log n)`, and the distances follow from the sliding means and
+    standard deviations of ``x``. For multivariate series the squared distances of
+    the channels are summed.
+
+    If ``normalise`` is True, both the query and each subsequence are z-normalised,
+    so that for a query of length :math:`m`
+
+    .. math::
+        d_i = \sqrt{2m\left(1 - \frac{QT_i - m\mu_q\mu_i}{m\sigma_q\sigma_i}\right)}
+
+    where :math:`QT_i` is the dot product of the query with the subsequence at
+    :math:`i`. A constant query or subsequence normalises to all zeros.
+
+    Parameters
+    ----------
+    q : np.ndarray
+        Query of shape ``(m_timepoints,)`` or ``(n_channels, m_timepoints)``.
+    x : np.ndarray
+        Series to search of shape ``(n_timepoints,)`` or
+        ``(n_channels, n_timepoints)``.
+    normalise : bool, default=True
+        Whether to z-normalise the query and the subsequences.
+
+    Returns
+    -------
+    np.ndarray of shape (n_timepoints - m_timepoints + 1,)
+        Distance from the query to the subsequence starting at each time point.
+
+    Raises
+    ------
+    ValueError
+        If q and x are not 1D or 2D arrays with the same number of channels.
+        If the query is longer than the series.
+
+    References
+    ----------
+    .. [1] Mueen A, Zhu Y, Yeh M, Kamgar K, Viswanathan K, Gupta C, Keogh E. The
+    fastest similarity search algorithm for time series subsequences under
+    Euclidean distance. 2022.
+    https://www.cs.unm.edu/~mueen/FastestSimilaritySearch.html
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import distance_profile
+    >>> q = np.array([1.0, 2.0, 3.0])
+    >>> x = np.array([0.0, 5.0, 6.0, 7.0, 1.0, 1.0, 2.0])
+    >>> np.round(distance_profile(q, x), 4)
+    array([0.6328, 0.    , 3.2659, 3.3461, 0.8966])
+    """
+    q, x = _check_query_and_series(q, x)
+    return np.sqrt(_squared_distance_profile(q, x, normalise))
+
+
+def subsequence_search(
+    q: np.ndarray,
+    X: Union[np.ndarray, List[np.ndarray]],
+    k: int = 1,
+    metric: str = "euclidean",
+    normalise: bool = True,
+    exclusion_factor: float = 0.5,
+    window: float = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    r"""Find the k subsequences of a series or collection closest to a query.
+
+    Matches are selected greedily: the closest subsequence is taken, then every
+    subsequence of the same series starting within ``exclusion_factor`` times the
+    query length of it is excluded, and so on, so the matches returned do not
+    trivially overlap.
+
+    For ``metric="euclidean"`` the distance profile of each series is computed with
+    :func:`aeon.distances.distance_profile`. For ``metric="dtw"`` the subsequences
+    are visited in increasing order of their LB_Keogh bound with the envelope of
+    the query, and the DTW distance is only computed for those that can still be a
+    match [1]_. Each match excludes at most ``2 * exclusion - 1`` subsequences, so
+    the ``k * (2 * exclusion - 1)``-th smallest distance found so far bounds the
+    distance of all k matches, where ``exclusion`` is the exclusion zone in time
+    points. The DTW distances are early abandoned at this bound. The result is exact
+    in both cases.
+
+    Parameters
+    ----------
+    q : np.ndarray
+        Query of shape ``(m_timepoints,)`` or ``(n_channels, m_timepoints)``.
+    X : np.ndarray or list of np.ndarray
+        A single series of shape ``(n_timepoints,)`` or ``(n_channels, n_timepoints)``,
+        or a collection of shape ``(n_instances, n_channels, n_timepoints)`` or a list
+        of 2D arrays of shape ``(n_channels, n_timepoints_i)``.
+    k : int, default=1
+        Number of matches to find.
+    metric : str, default="euclidean"
+        Either ``"euclidean"`` or ``"dtw"``.
+    normalise : bool, default=True
+        Whether to z-normalise the query and the subsequences.
+    exclusion_factor : float, default=0.5
+        Matches of the same series must start at least
+        ``ceil(exclusion_factor * m_timepoints)`` time points apart. If 0, the
+        matches may be any distinct subsequences.
+    window : float, default=None
+        The window of the DTW distance as a proportion of the query length. Ignored
+        if metric is "euclidean".
+
+    Returns
+    -------
+    distances : np.ndarray of shape (n_matches,)
+        Distances of the matches, in increasing order. Euclidean distances for the
+        ``"euclidean"`` metric and values of :func:`aeon.distances.dtw_distance` for
+        the ``"dtw"`` metric. Fewer than ``k`` matches are returned if the series do
+        not contain ``k`` non overlapping subsequences.
+    indices : np.ndarray of shape (n_matches,) or (n_matches, 2)
+        Start of each match in a single series, or the index of the series and the
+        start of each match in a collection.
+
+    Raises
+    ------
+    ValueError
+        If the query and series have different numbers of channels.
+        If the query is longer than any of the series.
+        If metric is not "euclidean" or "dtw".
+
+    References
+    ----------
+    .. [1] Rakthanmanon T, Campana B, Mueen A, Batista G, Westover B, Zhu Q,
+    Zakaria J, Keogh E. Searching and mining trillions of time series subsequences
+    under dynamic time warping. In proceedings of the 18th ACM SIGKDD international
+    conference on Knowledge discovery and data mining 2012 (pp. 262-270).
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import subsequence_search
+    >>> q = np.array([1.0, 2.0, 3.0])
+    >>> x = np.array([0.0, 5.0, 6.0, 7.0, 1.0, 1.0, 2.0, 3.0])
+    >>> distances, starts = subsequence_search(q, x, k=2)
+    >>> np.round(distances, 4), starts
+    (array([0., 0.]), array([1, 5]))
+    >>> X = np.array([[[3.0, 2.0, 1.0, 0.0]], [[4.0, 2.0, 4.0, 6.0]]])
+    >>> distances, indices = subsequence_search(q, X, k=2, metric="dtw")
+    >>> np.round(distances, 4), indices
+    (array([ 0., 12.]), array([[1, 1],
+           [0, 0]]))
+    """
+    if metric != "euclidean" and metric != "dtw":
+        raise ValueError(f"metric must be 'euclidean' or 'dtw', but found {metric}")
+    single_series = isinstance(X, np.ndarray) and X.ndim < 3
+    if single_series:
+        X = [X]
+    if q.ndim == 1:
+        q = q.reshape((1, q.shape[0]))
+    X = [_check_query_and_series(q, x)[1] for x in X]
+    q = q.astype(np.float64)
+    query_length = q.shape[1]
+    exclusion = int(np.ceil(exclusion_factor * query_length))
+
+    if metric == "dtw":
+        if normalise:
+            q = z_normalise_series_2d(q)
+        starts, ends = create_bounding_band(query_length, query_length, window, None)
+        lower, upper = _create_envelope(q, starts, ends)
+
+    # Exclusion zones only apply within a series, so the best matches of the
+    # collection are the best of the greedy matches of each series.
+    distances = np.zeros(0)
+    indices = np.zeros((0, 2), dtype=np.int64)
+    for i, x in enumerate(X):
+        upper_bound = distances[k - 1] if len(distances) == k else np.inf
+        if metric == "euclidean":
+            profile = _squared_distance_profile(q, x, normalise)
+            dists, starts_found = _top_k_matches(
+                profile, np.argsort(profile, kind="stable"), k, exclusion
+            )
+        else:
+            mean, std = _sliding_mean_std(x, query_length)
+            dists, starts_found = _dtw_subsequence_search(
+                q,
+                x,
+                mean,
+                std,
+                lower,
+                upper,
+                starts,
+                ends,
+                k,
+                exclusion,
+                normalise,
+                upper_bound,
+            )
+        distances = np.concatenate((distances, dists))
+        found = np.column_stack((np.full(len(starts_found), i), starts_found))
+        indices = np.concatenate((indices, found.astype(np.int64)))
+        order = np.argsort(distances, kind="stable")[:k]
+        distances, indices = distances[order], indices[order]
+
+    if metric == "euclidean":
+        distances = np.sqrt(distances)
+    if single_series:
+        return distances, indices[:, 1]
+    return distances, indices
+
+
+def _check_query_and_series(q: np.ndarray, x: np.ndarray):
+    if q.ndim == 1:
+        q = q.reshape((1, q.shape[0]))
+    if x.ndim == 1:
+        x = x.reshape((1, x.shape[0]))
+    if q.ndim != 2 or x.ndim != 2:
+        raise ValueError("The query and series must be 1D or 2D arrays")
+    if q.shape[0] != x.shape[0]:
+        raise ValueError(
+            f"The query and series must have the same number of channels, but found "
+            f"{q.shape[0]} and {x.shape[0]}"
+        )
+    if q.shape[1] > x.shape[1]:
+        raise ValueError(
+            f"The query of length {q.shape[1]} is longer than a series of length "
+            f"{x.shape[1]}"
+        )
+    return q.astype(np.float64), x.astype(np.float64)
+
+
+def _sliding_dot_products(q: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Dot products of each channel of q with every subsequence of x, by FFT."""
+    m = q.shape[1]
+    n = x.shape[1]
+    size = 1 << int(np.ceil(np.log2(n + m)))
+    x_fft = np.fft.rfft(x, size, axis=1)
+    q_fft = np.fft.rfft(q[:, ::-1], size, axis=1)
+    return np.fft.irfft(x_fft * q_fft, size, axis=1)[:, m - 1 : n]
+
+
+def _squared_distance_profile(
+    q: np.ndarray, x: np.ndarray, normalise: bool
+) -> np.ndarray:
+    dot_products = _sliding_dot_products(q, x)
+    mean, std = _sliding_mean_std(x, q.shape[1])
+    return _profile_from_dot_products(
+        dot_products, q.mean(axis=1), q.std(axis=1), mean, std, q.shape[1], normalise
+    )
+
+
+def _sliding_mean_std(x: np.ndarray, length: int) -> Tuple[np.ndarray, np.ndarray]:
+    mean, std = sliding_mean_std_one_series(x, length, 1)
+    # The rolling sums leave rounding errors relative to the magnitude of the
+    # values, which must not make constant subsequences non-constant.
+    std[std * std <= 1e-10 * (mean * mean + std * std)] = 0
+    return mean, std
+
+
+@njit(cache=True, fastmath=True)
+def _profile_from_dot_products(
+    dot_products: np.ndarray,
+    q_mean: np.ndarray,
+    q_std: np.ndarray,
+    mean: np.ndarray,
+    std: np.ndarray,
+    length: int,
+    normalise: bool,
+) -> np.ndarray:
+    n_channels, n_subs = dot_products.shape
+    profile = np.zeros(n_subs)
+    for c in range(n_channels):
+        q_sum_squares = length * (q_std[c] ** 2 + q_mean[c] ** 2)
+        for i in range(n_subs):
+            if not normalise:
+                dist = (
+                    q_sum_squares
+                    - 2 * dot_products[c, i]
+                    + length * (std[c, i] ** 2 + mean[c, i] ** 2)
+                )
+            elif q_std[c] > 0 and std[c, i] > 0:
+                correlation = (dot_products[c, i] - length * q_mean[c] * mean[c, i]) / (
+                    length * q_std[c] * std[c, i]
+                )
+                dist = 2 * length * (1 - correlation)
+            elif q_std[c] > 0 or std[c, i] > 0:
+                dist = length
+            else:
+                dist = 0.0
+            # Rounding can make distances between near equal series negative
+            profile[i] += max(dist, 0.0)
+    return profile
+
+
+@njit(cache=True)
+def _top_k_matches(
+    profile: np.ndarray, order: np.ndarray, k: int, exclusion: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    # Greedy selection of the smallest distances outside the exclusion zone of the
+    # matches already taken. Entries of order with an infinite distance are ignored.
+    distances = np.zeros(k)
+    starts = np.zeros(k, dtype=np.int64)
+    n_matches = 0
+    for i in order:
+        if n_matches == k or profile[i] == np.inf:
+            break
+        excluded = False
+        for j in range(n_matches):
+            if abs(i - starts[j]) < max(exclusion, 1):
+                excluded = True
+                break
+        if not excluded:
+            distances[n_matches] = profile[i]
+            starts[n_matches] = i
+            n_matches += 1
+    return distances[:n_matches], starts[:n_matches]
+
+
+@njit(cache=True, fastmath=True)
+def _dtw_subsequence_search(
+    q: np.ndarray,
+    x: np.ndarray,
+    mean: np.ndarray,
+    std: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    k: int,
+    exclusion: int,
+    normalise: bool,
+    upper_bound: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    n_channels, length = q.shape
+    n_subs = mean.shape[1]
+
+    # LB_Keogh of every subsequence with the envelope of the query
+    lb = np.zeros(n_subs)
+    for i in range(n_subs):
+        for c in range(n_channels):
+            for t in range(length):
+                value = x[c, i + t]
+                if normalise:
+                    value = (value - mean[c, i]) / std[c, i] if std[c, i] > 0 else 0.0
+                if value > upper[c, t]:
+                    lb[i] += (value - upper[c, t]) ** 2
+                elif value < lower[c, t]:
+                    lb[i] += (value - lower[c, t]) ** 2
+
+    # Subsequences are visited in increasing LB_Keogh order. Each greedy match
+    # excludes at most 2 * exclusion - 1 subsequences, so once n_bound of them have
+    # a distance of at most d, all k matches have a distance of at most d. The k-th
+    # match of the greedy selection so far is not a bound, a later subsequence can
+    # exclude one of its matches. Subsequences pruned or abandoned above the bound
+    # keep an infinite distance without changing the matches.
+    n_bound = k * (2 * max(exclusion, 1) - 1)
+    profile = np.full(n_subs, np.inf)
+    computed = np.zeros(n_subs, dtype=np.int64)
+    n_computed = 0
+    threshold = upper_bound
+    subsequence = np.zeros((n_channels, length))
+    for i in np.argsort(lb):
+        if lb[i] > threshold:
+            break
+        for c in range(n_channels):
+            for t in range(length):
+                value = x[c, i + t]
+                if normalise:
+                    value = (value - mean[c, i]) / std[c, i] if std[c, i] > 0 else 0.0
+                subsequence[c, t] = value
+        dist = _dtw_distance(subsequence, q, starts, ends, threshold)
+        if dist > threshold:
+            continue
+        profile[i] = dist
+        computed[n_computed] = i
+        n_computed += 1
+        if n_computed >= n_bound:
+            bound = np.partition(profile[computed[:n_computed]], n_bound - 1)
+            threshold = min(threshold, bound[n_bound - 1])
+
+    found = computed[:n_computed]
+    order = found[np.argsort(profile[found])]
+    distances, matches = _top_k_matches(profile, order, k, exclusion)
+    keep = distances <= threshold
+    return distances[keep], matches[keep]
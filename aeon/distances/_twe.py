@@ -4,15 +4,19 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import (
     _add_inf_to_out_of_bounds_cost_matrix,
     compute_min_return_path,
 )
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import (
+    _is_full_band,
+    create_bounding_band,
+    create_bounding_matrix,
+)
 from aeon.distances._euclidean import _univariate_euclidean_distance
-from aeon.distances._utils import reshape_pairwise_to_multiple
+from aeon.distances._utils import _run_with_n_jobs, reshape_pairwise_to_multiple
 
 
 @njit(cache=True, fastmath=True)
@@ -23,6 +27,7 @@ def twe_distance(
     nu: float = 0.001,
     lmbda: float = 1.0,
     itakura_max_slope: float = None,
+    upper_bound: float = np.inf,
 ) -> float:
     r"""Compute the TWE distance between two time series.
 
@@ -68,11 +73,18 @@ def twe_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    upper_bound : float, default=np.inf
+        Early abandoning threshold. The calculation stops as soon as the minimum of a
+        row of the cost matrix exceeds ``upper_bound``, in which case ``np.inf`` is
+        returned. Out of band cells of the cost matrix are zero, so rows are only
+        abandoned when the bounding matrix is full. Distances not greater than
+        ``upper_bound`` are exact.
 
     Returns
     -------
     float
-        TWE distance between x and y.
+        TWE distance between x and y. ``np.inf`` if the distance exceeds
+        ``upper_bound``.
 
     Raises
     ------
@@ -97,15 +109,19 @@ def twe_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _twe_distance(_pad_arrs(_x), _pad_arrs(_y), bounding_matrix, nu, lmbda)
+        return _twe_distance(
+            _pad_arrs(_x), _pad_arrs(_y), starts, ends, nu, lmbda, upper_bound
+        )
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _twe_distance(_pad_arrs(x), _pad_arrs(y), bounding_matrix, nu, lmbda)
+        return _twe_distance(
+            _pad_arrs(x), _pad_arrs(y), starts, ends, nu, lmbda, upper_bound
+        )
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -169,32 +185,88 @@ def twe_cost_matrix(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _twe_cost_matrix(
-            _pad_arrs(_x), _pad_arrs(_y), bounding_matrix, nu, lmbda
-        )
+        return _twe_cost_matrix(_pad_arrs(_x), _pad_arrs(_y), starts, ends, nu, lmbda)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
+        starts, ends = create_bounding_band(
             x.shape[1], y.shape[1], window, itakura_max_slope
         )
-        return _twe_cost_matrix(_pad_arrs(x), _pad_arrs(y), bounding_matrix, nu, lmbda)
+        return _twe_cost_matrix(_pad_arrs(x), _pad_arrs(y), starts, ends, nu, lmbda)
     raise ValueError("x and y must be 1D or 2D")
 
 
 @njit(cache=True, fastmath=True)
 def _twe_distance(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, nu: float, lmbda: float
+    x: np.ndarray,
+    y: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    nu: float,
+    lmbda: float,
+    upper_bound: float = np.inf,
 ) -> float:
-    return _twe_cost_matrix(x, y, bounding_matrix, nu, lmbda)[
-        x.shape[1] - 2, y.shape[1] - 2
-    ]
+    # Only two rows of the cost matrix are kept. Row i of the padded series uses the
+    # in-band columns of row i - 1 of the band, shifted by one for the padding.
+    # Cells outside the band stay at zero, which is restored over the last written
+    # range before reuse.
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    prev = np.full(y_size, np.inf)
+    curr = np.zeros(y_size)
+    prev[0] = 0.0
+    prev_start, prev_end = 0, y_size
+    curr_start, curr_end = 0, 0
+
+    # Out of band cells stay at zero and a constrained path can step onto them, so
+    # the row minimum is only a lower bound on the distance for a full band.
+    row_bound = upper_bound
+    if not _is_full_band(starts, ends, y_size - 1):
+        row_bound = np.inf
+
+    del_add = nu + lmbda
+
+    for i in range(1, x_size):
+        curr[curr_start:curr_end] = 0.0
+        curr[0] = np.inf
+        row_min = np.inf
+        for j in range(starts[i - 1] + 1, ends[i - 1] + 1):
+            del_x = (
+                prev[j] + _univariate_euclidean_distance(x[:, i - 1], x[:, i]) + del_add
+            )
+            del_y = (
+                curr[j - 1]
+                + _univariate_euclidean_distance(y[:, j - 1], y[:, j])
+                + del_add
+            )
+            match = (
+                prev[j - 1]
+                + _univariate_euclidean_distance(x[:, i], y[:, j])
+                + _univariate_euclidean_distance(x[:, i - 1], y[:, j - 1])
+                + nu * (abs(i - j) + abs((i - 1) - (j - 1)))
+            )
+            curr[j] = min(del_x, del_y, match)
+            row_min = min(row_min, curr[j])
+        if row_min > row_bound:
+            return np.inf
+        prev, curr = curr, prev
+        prev_start, curr_start = starts[i - 1] + 1, prev_start
+        prev_end, curr_end = ends[i - 1] + 1, prev_end
+
+    if prev[y_size - 1] > upper_bound:
+        return np.inf
+    return prev[y_size - 1]
 
 
 @njit(cache=True, fastmath=True)
 def _twe_cost_matrix(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, nu: float, lmbda: float
+    x: np.ndarray,
+    y: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    nu: float,
+    lmbda: float,
 ) -> np.ndarray:
     x_size = x.shape[1]
     y_size = y.shape[1]
@@ -205,32 +277,27 @@ def _twe_cost_matrix(
     del_add = nu + lmbda
 
     for i in range(1, x_size):
-        for j in range(1, y_size):
-            if bounding_matrix[i - 1, j - 1]:
-                # Deletion in x
-                del_x_squared_dist = _univariate_euclidean_distance(
-                    x[:, i - 1], x[:, i]
-                )
-                del_x = cost_matrix[i - 1, j] + del_x_squared_dist + del_add
-                # Deletion in y
-                del_y_squared_dist = _univariate_euclidean_distance(
-                    y[:, j - 1], y[:, j]
-                )
-                del_y = cost_matrix[i, j - 1] + del_y_squared_dist + del_add
-
-                # Match
-                match_same_squared_d = _univariate_euclidean_distance(x[:, i], y[:, j])
-                match_prev_squared_d = _univariate_euclidean_distance(
-                    x[:, i - 1], y[:, j - 1]
-                )
-                match = (
-                    cost_matrix[i - 1, j - 1]
-                    + match_same_squared_d
-                    + match_prev_squared_d
-                    + nu * (abs(i - j) + abs((i - 1) - (j - 1)))
-                )
-
-                cost_matrix[i, j] = min(del_x, del_y, match)
+        for j in range(starts[i - 1] + 1, ends[i - 1] + 1):
+            # Deletion in x
+            del_x_squared_dist = _univariate_euclidean_distance(x[:, i - 1], x[:, i])
+            del_x = cost_matrix[i - 1, j] + del_x_squared_dist + del_add
+            # Deletion in y
+            del_y_squared_dist = _univariate_euclidean_distance(y[:, j - 1], y[:, j])
+            del_y = cost_matrix[i, j - 1] + del_y_squared_dist + del_add
+
+            # Match
+            match_same_squared_d = _univariate_euclidean_distance(x[:, i], y[:, j])
+            match_prev_squared_d = _univariate_euclidean_distance(
+                x[:, i - 1], y[:, j - 1]
+            )
+            match = (
+                cost_matrix[i - 1, j - 1]
+                + match_same_squared_d
+                + match_prev_squared_d
+                + nu * (abs(i - j) + abs((i - 1) - (j - 1)))
+            )
+
+            cost_matrix[i, j] = min(del_x, del_y, match)
 
     return cost_matrix[1:, 1:]
 
@@ -244,7 +311,6 @@ def _pad_arrs(x: np.ndarray) -> np.ndarray:
     return padded_x
 
 
-@njit(cache=True, fastmath=True)
 def twe_pairwise_distance(
     X: np.ndarray,
     y: np.ndarray = None,
@@ -252,6 +318,7 @@ def twe_pairwise_distance(
     nu: float = 0.001,
     lmbda: float = 1.0,
     itakura_max_slope: float = None,
+    n_jobs: int = 1,
 ) -> np.ndarray:
     """Compute the TWE pairwise distance between a set of time series.
 
@@ -274,6 +341,10 @@ def twe_pairwise_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    n_jobs : int, default=1
+        The number of jobs to run in parallel. If -1, then the number of jobs is set
+        to the number of CPU cores. If 1, then the function is executed in a single
+        thread. If greater than 1, then the function is executed in parallel.
 
     Returns
     -------
@@ -315,18 +386,29 @@ def twe_pairwise_distance(
     if y is None:
         # To self
         if X.ndim == 3:
-            return _twe_pairwise_distance(X, window, nu, lmbda, itakura_max_slope)
+            return _run_with_n_jobs(
+                n_jobs, _twe_pairwise_distance, X, window, nu, lmbda, itakura_max_slope
+            )
         if X.ndim == 2:
             _X = X.reshape((X.shape[0], 1, X.shape[1]))
-            return _twe_pairwise_distance(_X, window, nu, lmbda, itakura_max_slope)
+            return _run_with_n_jobs(
+                n_jobs, _twe_pairwise_distance, _X, window, nu, lmbda, itakura_max_slope
+            )
         raise ValueError("x and y must be 2D or 3D arrays")
     _x, _y = reshape_pairwise_to_multiple(X, y)
-    return _twe_from_multiple_to_multiple_distance(
-        _x, _y, window, nu, lmbda, itakura_max_slope
+    return _run_with_n_jobs(
+        n_jobs,
+        _twe_from_multiple_to_multiple_distance,
+        _x,
+        _y,
+        window,
+        nu,
+        lmbda,
+        itakura_max_slope,
     )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _twe_pairwise_distance(
     X: np.ndarray,
     window: float,
@@ -336,26 +418,26 @@ def _twe_pairwise_distance(
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
+    starts, ends = create_bounding_band(
         X.shape[2], X.shape[2], window, itakura_max_slope
     )
 
     # Pad the arrays before so that we don't have to redo every iteration
     padded_X = np.zeros((X.shape[0], X.shape[1], X.shape[2] + 1))
-    for i in range(X.shape[0]):
+    for i in prange(X.shape[0]):
         padded_X[i] = _pad_arrs(X[i])
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(i + 1, n_instances):
             distances[i, j] = _twe_distance(
-                padded_X[i], padded_X[j], bounding_matrix, nu, lmbda
+                padded_X[i], padded_X[j], starts, ends, nu, lmbda
             )
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _twe_from_multiple_to_multiple_distance(
     x: np.ndarray,
     y: np.ndarray,
@@ -367,23 +449,23 @@ def _twe_from_multiple_to_multiple_distance(
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
+    starts, ends = create_bounding_band(
         x.shape[2], y.shape[2], window, itakura_max_slope
     )
 
     # Pad the arrays before so that we dont have to redo every iteration
     padded_x = np.zeros((x.shape[0], x.shape[1], x.shape[2] + 1))
-    for i in range(x.shape[0]):
+    for i in prange(x.shape[0]):
         padded_x[i] = _pad_arrs(x[i])
 
     padded_y = np.zeros((y.shape[0], y.shape[1], y.shape[2] + 1))
-    for i in range(y.shape[0]):
+    for i in prange(y.shape[0]):
         padded_y[i] = _pad_arrs(y[i])
 
-    for i in range(n_instances):
+    for i in prange(n_instances):
         for j in range(m_instances):
             distances[i, j] = _twe_distance(
-                padded_x[i], padded_y[j], bounding_matrix, nu, lmbda
+                padded_x[i], padded_y[j], starts, ends, nu, lmbda
             )
     return distances
 
@@ -1,7 +1,9 @@
-from typing import Tuple
+from typing import Any, Callable, Tuple
 
 import numpy as np
-from numba import njit
+from numba import config, get_num_threads, njit, set_num_threads
+
+from aeon.utils.validation import check_n_jobs
 
 
 @njit(cache=True, fastmath=True)
@@ -59,3 +61,19 @@ def reshape_pairwise_to_multiple(
             _y = y.reshape((y.shape[0], 1, y.shape[1]))
             return _x, _y
         raise ValueError("x and y must be 2D or 3D arrays")
+
+
+def _run_with_n_jobs(n_jobs: int, func: Callable, *args: Any, **kwargs: Any) -> Any:
+    """Call a numba function with ``n_jobs`` threads for its ``prange`` loops.
+
+    ``n_jobs`` follows the scikit-learn convention (see
+    :func:`aeon.utils.validation.check_n_jobs`) and is capped at the number of
+    threads numba was launched with. The previous number of threads is restored
+    after the call.
+    """
+    prev_threads = get_num_threads()
+    set_num_threads(min(check_n_jobs(n_jobs), config.NUMBA_NUM_THREADS))
+    try:
+        return func(*args, **kwargs)
+    finally:
+        set_num_threads(prev_threads)
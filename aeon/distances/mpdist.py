@@ -1,5 +1,8 @@
 """Matrix Profile Distances."""
 import numpy as np
+from numba import njit
+
+from aeon.utils.numba.general import sliding_mean_std_one_series
 
 
 def sliding_dot_products(q, t, q_len, t_len):
@@ -70,19 +73,20 @@ def calculate_distance_profile(dot_prod, q_mean, q_std, t_mean, t_std, q_len, n_
         d: numpy.array
             Distance profile of query q.
     """
-    d = [
+    t_mean = np.asarray(t_mean)[:n_t_subs]
+    t_std = np.asarray(t_std)[:n_t_subs]
+    d = (
         2
         * q_len
         * (
             1
-            - ((dot_prod[i] - q_len * q_mean * t_mean[i]) / (q_len * q_std * t_std[i]))
+            - (
+                (dot_prod[:n_t_subs] - q_len * q_mean * t_mean)
+                / (q_len * q_std * t_std)
+            )
         )
-        for i in range(0, n_t_subs)
-    ]
-    d = np.absolute(d)
-    d = np.sqrt(d)
-
-    return d
+    )
+    return np.sqrt(np.absolute(d))
 
 
 def stomp_ab(ts1, ts2, m):
@@ -106,57 +110,71 @@ def stomp_ab(ts1, ts2, m):
         ip: numpy.array
             Array with the index of the nearest neighbor of ts1 in ts2.
     """
+    ts1 = ts1.flatten().astype(np.float64)
+    ts2 = ts2.flatten().astype(np.float64)
     len1 = len(ts1)
     len2 = len(ts2)
+    m = int(m)
 
-    ts1 = ts1.flatten()
-    ts2 = ts2.flatten()
-
-    # Number of subsequences
-    n_ts1_subs = len1 - m + 1
-    n_ts2_subs = len2 - m + 1
-
-    # Compute the mean and standard deviation
-    ts1_mean = [np.mean(ts1[i : i + m]) for i in range(0, n_ts1_subs)]
-    ts1_std = [np.std(ts1[i : i + m]) for i in range(0, n_ts1_subs)]
-
-    ts2_mean = [np.mean(ts2[i : i + m]) for i in range(0, n_ts2_subs)]
-    ts2_std = [np.std(ts2[i : i + m]) for i in range(0, n_ts2_subs)]
+    # Compute the mean and standard deviation of every subsequence
+    ts1_mean, ts1_std = sliding_mean_std_one_series(ts1.reshape((1, len1)), m, 1)
+    ts2_mean, ts2_std = sliding_mean_std_one_series(ts2.reshape((1, len2)), m, 1)
 
     # Compute the dot products between the first ts2 subsequence and every
     # ts1 subsequence
-    dot_prod = sliding_dot_products(ts2[0:m], ts1, m, len1)
-    first_dot_prod = np.copy(dot_prod)
+    first_dot_prod = sliding_dot_products(ts2[0:m], ts1, m, len1)
 
-    # Initialization
-    mp = np.full(n_ts1_subs, float("inf"))  # matrix profile
-    ip = np.zeros(n_ts1_subs)  # index profile
-
-    # Compute the distance profile for the first ts1 subsequence
+    # Compute the dot products between the first ts1 subsequence and every
+    # ts2 subsequence
     dot_prod = sliding_dot_products(ts1[0:m], ts2, m, len2)
-    dp = calculate_distance_profile(
-        dot_prod, ts1_mean[0], ts1_std[0], ts2_mean, ts2_std, m, n_ts2_subs
+
+    return _stomp_ab(
+        ts1,
+        ts2,
+        m,
+        dot_prod,
+        first_dot_prod,
+        ts1_mean[0],
+        ts1_std[0],
+        ts2_mean[0],
+        ts2_std[0],
     )
 
-    # Updates the matrix profile
-    mp[0] = np.amin(dp)
-    ip[0] = np.argmin(dp)
-
-    for i in range(1, n_ts1_subs):
-        for j in range(n_ts2_subs - 1, 0, -1):
-            dot_prod[j] = (
-                dot_prod[j - 1]
-                - ts2[j - 1] * ts1[i - 1]
-                + ts2[j - 1 + m] * ts1[i - 1 + m]
-            )  # compute the next dot products
-            # using the previous ones
-        dot_prod[0] = first_dot_prod[i]
-        dp = calculate_distance_profile(
-            dot_prod, ts1_mean[i], ts1_std[i], ts2_mean, ts2_std, m, n_ts2_subs
-        )
-        mp[i] = np.amin(dp)
-        ip[i] = np.argmin(dp)
 
+@njit(cache=True, fastmath=True)
+def _stomp_ab(
+    ts1, ts2, m, dot_prod, first_dot_prod, ts1_mean, ts1_std, ts2_mean, ts2_std
+):
+    n_ts1_subs = ts1_mean.shape[0]
+    n_ts2_subs = ts2_mean.shape[0]
+    mp = np.full(n_ts1_subs, np.inf)  # matrix profile
+    ip = np.zeros(n_ts1_subs)  # index profile
+    for i in range(n_ts1_subs):
+        if i > 0:
+            # Compute the next dot products using the previous ones
+            for j in range(n_ts2_subs - 1, 0, -1):
+                dot_prod[j] = (
+                    dot_prod[j - 1]
+                    - ts2[j - 1] * ts1[i - 1]
+                    + ts2[j - 1 + m] * ts1[i - 1 + m]
+                )
+            dot_prod[0] = first_dot_prod[i]
+        # Update the matrix profile with the distance profile of subsequence i
+        for j in range(n_ts2_subs):
+            d = np.sqrt(
+                abs(
+                    2
+                    * m
+                    * (
+                        1
+                        - (dot_prod[j] - m * ts1_mean[i] * ts2_mean[j])
+                        / (m * ts1_std[i] * ts2_std[j])
+                    )
+                )
+            )
+            if d < mp[i]:
+                mp[i] = d
+                ip[i] = j
     return mp, ip
 
 
@@ -1,8 +1,9 @@
 __author__ = ["chrisholder"]
 
 import numpy as np
+import pytest
 
-from aeon.distances import create_bounding_matrix
+from aeon.distances import create_bounding_band, create_bounding_matrix
 
 
 def test_full_bounding():
@@ -28,3 +29,18 @@ def test_window_bounding():
 def test_itakura_parallelogram():
     matrix = create_bounding_matrix(10, 10, itakura_max_slope=0.2)
     assert isinstance(matrix, np.ndarray)
+
+
+@pytest.mark.parametrize(
+    "bounding", [{}, {"window": 0.0}, {"window": 0.3}, {"itakura_max_slope": 0.4}]
+)
+@pytest.mark.parametrize("x_size, y_size", [(10, 10), (7, 12), (12, 7), (3, 5)])
+def test_bounding_band(bounding, x_size, y_size):
+    """Test the bounding band holds the same cells as the bounding matrix."""
+    matrix = create_bounding_matrix(x_size, y_size, **bounding)
+    starts, ends = create_bounding_band(x_size, y_size, **bounding)
+    assert starts.shape == ends.shape == (x_size,)
+    band = np.zeros((x_size, y_size), dtype=bool)
+    for i in range(x_size):
+        band[i, starts[i] : ends[i]] = True
+    np.testing.assert_array_equal(band, matrix)
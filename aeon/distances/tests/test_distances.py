@@ -68,3 +68,71 @@ def test_distances(dist):
         dist["distance"],
         _expected_distance_results[dist["name"]][4],
     )
+
+
+EARLY_ABANDON_DISTANCES = [
+    "dtw",
+    "ddtw",
+    "wdtw",
+    "wddtw",
+    "adtw",
+    "erp",
+    "edr",
+    "lcss",
+    "twe",
+    "msm",
+]
+
+# Distances computed with linear memory over the band rather than the full cost
+# matrix, whose value is the last cell of their cost matrix.
+BANDED_DISTANCES = ["dtw", "ddtw", "wdtw", "wddtw", "adtw", "erp", "twe", "msm"]
+
+
+@pytest.mark.parametrize("dist", DISTANCES)
+@pytest.mark.parametrize("bounding", [{}, {"window": 0.2}, {"itakura_max_slope": 0.5}])
+@pytest.mark.parametrize("y_size", [10, 13])
+def test_distance_matches_cost_matrix(dist, bounding, y_size):
+    """Test banded distances equal the last cell of the cost matrix."""
+    if dist["name"] not in BANDED_DISTANCES:
+        return
+    x = create_test_distance_numpy(2, 10)
+    y = create_test_distance_numpy(2, y_size, random_state=2)
+    assert_almost_equal(
+        dist["distance"](x, y, **bounding),
+        dist["cost_matrix"](x, y, **bounding)[-1, -1],
+    )
+
+
+@pytest.mark.parametrize("dist", DISTANCES)
+@pytest.mark.parametrize("bounding", [{}, {"window": 0.2}])
+def test_distance_upper_bound(dist, bounding):
+    """Test distances are exact below upper_bound and np.inf above it."""
+    if dist["name"] not in EARLY_ABANDON_DISTANCES:
+        return
+    x = create_test_distance_numpy(10, 10)
+    y = create_test_distance_numpy(10, 10, random_state=2)
+
+    full = dist["distance"](x, y, **bounding)
+    assert dist["distance"](x, y, upper_bound=full, **bounding) == full
+    assert (
+        compute_distance(x, y, metric=dist["name"], upper_bound=full, **bounding)
+        == full
+    )
+    if full > 0:
+        assert dist["distance"](x, y, upper_bound=full * 0.5, **bounding) == np.inf
+        assert (
+            compute_distance(
+                x, y, metric=dist["name"], upper_bound=full * 0.5, **bounding
+            )
+            == np.inf
+        )
+    assert dist["distance"](x, y, upper_bound=-1.0, **bounding) == np.inf
+
+    if dist["name"] == "msm":
+        dependent = dist["distance"](x, y, independent=False, **bounding)
+        assert (
+            dist["distance"](
+                x, y, independent=False, upper_bound=dependent * 0.5, **bounding
+            )
+            == np.inf
+        )
@@ -0,0 +1,75 @@
+"""Tests for DTW lower bounds."""
+import numpy as np
+import pytest
+
+from aeon.distances import (
+    create_bounding_matrix,
+    create_envelope,
+    dtw_distance,
+    lb_cascade,
+    lb_enhanced,
+    lb_improved,
+    lb_keogh,
+    lb_kim,
+)
+from aeon.distances.tests._utils import create_test_distance_numpy
+
+BOUNDING_PARAMS = [{}, {"window": 0.1}, {"window": 0.3}, {"itakura_max_slope": 0.5}]
+
+
+def _lower_bounds(x, y, params):
+    lower, upper = create_envelope(y, x.shape[-1], **params)
+    return {
+        "kim": lb_kim(x, y),
+        "keogh": lb_keogh(x, y, **params),
+        "improved": lb_improved(x, y, **params),
+        "enhanced": lb_enhanced(x, y, **params),
+        "cascade": lb_cascade(x, y, **params),
+        "cascade_envelope": lb_cascade(x, y, lower=lower, upper=upper, **params),
+    }
+
+
+@pytest.mark.parametrize("params", BOUNDING_PARAMS)
+@pytest.mark.parametrize(
+    "x_shape, y_shape",
+    [((10,), (10,)), ((3, 10), (3, 10)), ((15,), (12,)), ((2, 9), (2, 13))],
+)
+def test_lower_bounds(params, x_shape, y_shape):
+    """Test the lower bounds never exceed the DTW distance."""
+    for seed in range(10):
+        x = create_test_distance_numpy(1, *x_shape, random_state=seed)[0]
+        y = create_test_distance_numpy(1, *y_shape, random_state=seed + 100)[0]
+        dist = dtw_distance(x, y, **params)
+        bounds = _lower_bounds(x, y, params)
+        for name, bound in bounds.items():
+            assert 0 <= bound <= dist + 1e-10, name
+        assert bounds["improved"] >= bounds["keogh"]
+        assert bounds["cascade"] == pytest.approx(bounds["cascade_envelope"])
+
+
+@pytest.mark.parametrize("params", BOUNDING_PARAMS)
+def test_create_envelope(params):
+    """Test envelopes match the bounding matrix."""
+    y = create_test_distance_numpy(1, 2, 12)[0]
+    for x_size in [8, 12, 16]:
+        lower, upper = create_envelope(y, x_size, **params)
+        assert lower.shape == upper.shape == (2, x_size)
+        bounding_matrix = create_bounding_matrix(x_size, 12, **params)
+        for i in range(x_size):
+            columns = np.where(bounding_matrix[i])[0]
+            if len(columns) > 0:
+                np.testing.assert_array_equal(lower[:, i], y[:, columns].min(axis=1))
+                np.testing.assert_array_equal(upper[:, i], y[:, columns].max(axis=1))
+    lower, upper = create_envelope(y[0], **params)
+    assert lower.shape == upper.shape == (12,)
+
+
+def test_lower_bounds_upper_bound():
+    """Test the lower bounds exceed a small upper bound."""
+    x = np.zeros(20)
+    y = np.ones(20)
+    for lb in [lb_keogh, lb_improved, lb_enhanced, lb_cascade]:
+        assert lb(x, y, window=0.1) == 20.0
+        assert 1.0 < lb(x, y, window=0.1, upper_bound=1.0) < 20.0
+    with pytest.raises(ValueError, match="x and y must be 1D or 2D"):
+        lb_keogh(np.zeros((2, 2, 2)), np.zeros((2, 2, 2)))
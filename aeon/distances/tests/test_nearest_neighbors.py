@@ -0,0 +1,57 @@
+"""Tests for the pruned nearest neighbour search."""
+import numpy as np
+import pytest
+
+from aeon.distances import nearest_neighbors, pairwise_distance
+from aeon.distances.tests._utils import create_test_distance_numpy
+from aeon.utils.numba.general import z_normalise_series_3d
+
+SEARCH_PARAMS = [
+    ("dtw", {}),
+    ("dtw", {"window": 0.1}),
+    ("dtw", {"itakura_max_slope": 0.5}),
+    ("ddtw", {"window": 0.2}),
+    ("adtw", {"warp_penalty": 0.5}),
+    ("squared", {}),
+    ("euclidean", {}),
+    ("msm", {}),
+]
+
+
+@pytest.mark.parametrize("metric, params", SEARCH_PARAMS)
+@pytest.mark.parametrize("n_channels", [1, 3])
+@pytest.mark.parametrize("n_neighbors", [1, 4])
+def test_nearest_neighbors(metric, params, n_channels, n_neighbors):
+    """Test the pruned search finds the same neighbours as a brute force search."""
+    X = create_test_distance_numpy(6, n_channels, 30, random_state=1).cumsum(axis=-1)
+    y = create_test_distance_numpy(40, n_channels, 30, random_state=2).cumsum(axis=-1)
+    expected = pairwise_distance(X, y, metric=metric, **params)
+    expected_ind = np.argsort(expected, axis=1, kind="stable")[:, :n_neighbors]
+
+    distances, indices = nearest_neighbors(
+        X, y, n_neighbors, metric=metric, n_jobs=2, **params
+    )
+    np.testing.assert_array_equal(indices, expected_ind)
+    np.testing.assert_array_almost_equal(
+        distances, np.take_along_axis(expected, expected_ind, axis=1)
+    )
+
+
+def test_nearest_neighbors_normalise():
+    """Test the normalised search is the search on normalised series."""
+    X = create_test_distance_numpy(5, 2, 20, random_state=1)
+    y = create_test_distance_numpy(10, 2, 20, random_state=2) * 3 + 1
+    distances, indices = nearest_neighbors(X, y, 2, normalise=True)
+    expected = nearest_neighbors(z_normalise_series_3d(X), z_normalise_series_3d(y), 2)
+    np.testing.assert_array_almost_equal(distances, expected[0])
+    np.testing.assert_array_equal(indices, expected[1])
+
+
+def test_nearest_neighbors_errors():
+    """Test the errors raised by nearest_neighbors."""
+    X = create_test_distance_numpy(5, 1, 10)
+    y = create_test_distance_numpy(5, 1, 12)
+    with pytest.raises(ValueError, match="n_neighbors must be between"):
+        nearest_neighbors(X, y, n_neighbors=6)
+    with pytest.raises(ValueError, match="same length"):
+        nearest_neighbors(X, y, metric="euclidean")
@@ -1,7 +1,11 @@
+import os
+import tempfile
+
 import numpy as np
 import pytest
 from numpy.testing import assert_almost_equal
 
+from aeon.distances import blocked_pairwise_distance, euclidean_distance
 from aeon.distances import pairwise_distance as compute_pairwise_distance
 from aeon.distances._distance import DISTANCES
 from aeon.distances.tests._utils import _make_3d_series, create_test_distance_numpy
@@ -274,3 +278,121 @@ def test_new_single_to_multiple_distances(dist):
         dist["distance"],
         dist["pairwise_distance"],
     )
+
+
+@pytest.mark.parametrize("dist", DISTANCES)
+def test_pairwise_distance_n_jobs(dist):
+    """Test parallel pairwise distances match the single threaded result."""
+    X = create_test_distance_numpy(10, 2, 8)
+    y = create_test_distance_numpy(6, 2, 8, random_state=2)
+    pairwise_distance = dist["pairwise_distance"]
+
+    expected = pairwise_distance(X)
+    assert_almost_equal(pairwise_distance(X, n_jobs=2), expected)
+    assert_almost_equal(
+        compute_pairwise_distance(X, metric=dist["name"], n_jobs=-1), expected
+    )
+    assert_almost_equal(np.diag(expected), np.zeros(len(X)))
+    assert_almost_equal(expected, expected.T)
+
+    expected = pairwise_distance(X, y)
+    assert_almost_equal(pairwise_distance(X, y, n_jobs=2), expected)
+    assert_almost_equal(
+        compute_pairwise_distance(X, y, metric=dist["name"], n_jobs=-1), expected
+    )
+
+
+@pytest.mark.parametrize("dist", DISTANCES)
+def test_blocked_pairwise_distance(dist):
+    """Test blocked pairwise distances match the pairwise distance."""
+    X = create_test_distance_numpy(11, 2, 8)
+    y = create_test_distance_numpy(7, 2, 8, random_state=2)
+
+    expected = compute_pairwise_distance(X, metric=dist["name"])
+    for block_size in [1, 4, 20]:
+        assert_almost_equal(
+            blocked_pairwise_distance(X, metric=dist["name"], block_size=block_size),
+            expected,
+        )
+    out = np.full((11, 11), -1.0)
+    blocked_pairwise_distance(X, metric=dist["distance"], out=out, block_size=3)
+    assert_almost_equal(out, expected)
+
+    expected = compute_pairwise_distance(X, y, metric=dist["name"])
+    assert_almost_equal(
+        blocked_pairwise_distance(X, y, metric=dist["name"], block_size=3), expected
+    )
+
+
+def test_blocked_pairwise_distance_resume():
+    """Test a blocked pairwise distance file is resumed from its missing tiles."""
+    X = create_test_distance_numpy(10, 1, 6)
+    expected = compute_pairwise_distance(X, metric="euclidean")
+    n_calls = []
+    fail_after = [np.inf]
+
+    def _counted_euclidean(x, y):
+        if len(n_calls) >= fail_after[0]:
+            raise KeyboardInterrupt
+        n_calls.append(1)
+        return euclidean_distance(x, y)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "distances.npy")
+        progress_path = f"{path}.progress.npy"
+        out = blocked_pairwise_distance(
+            X, metric=_counted_euclidean, out=path, block_size=4
+        )
+        assert_almost_equal(out, expected)
+        assert len(n_calls) == 45
+        assert not os.path.exists(progress_path)
+        del out
+        assert_almost_equal(np.load(path), expected)
+
+        # Without a progress file the existing file is not taken as complete
+        n_calls.clear()
+        out = blocked_pairwise_distance(
+            X, metric=_counted_euclidean, out=path, block_size=4, resume=True
+        )
+        assert len(n_calls) == 45
+        del out
+
+        # Interrupt a run in the last tile, after the 44 distances of the others
+        n_calls.clear()
+        fail_after[0] = 44
+        with pytest.raises(KeyboardInterrupt):
+            blocked_pairwise_distance(
+                X, metric=_counted_euclidean, out=path, block_size=4
+            )
+        assert os.path.exists(progress_path)
+        fail_after[0] = np.inf
+
+        # A progress file of other arguments is not resumed
+        n_calls.clear()
+        out = blocked_pairwise_distance(
+            X, metric=_counted_euclidean, out=path, block_size=3, resume=True
+        )
+        assert len(n_calls) == 45
+        assert_almost_equal(out, expected)
+        del out
+
+        n_calls.clear()
+        fail_after[0] = 44
+        with pytest.raises(KeyboardInterrupt):
+            blocked_pairwise_distance(
+                X, metric=_counted_euclidean, out=path, block_size=4
+            )
+        fail_after[0] = np.inf
+        n_calls.clear()
+        out = blocked_pairwise_distance(
+            X, metric=_counted_euclidean, out=path, block_size=4, resume=True
+        )
+        assert len(n_calls) == 1
+        assert_almost_equal(out, expected)
+        assert not os.path.exists(progress_path)
+        del out
+
+    with pytest.raises(ValueError, match="out must be of shape"):
+        blocked_pairwise_distance(X, metric="euclidean", out=np.zeros((3, 3)))
+    with pytest.raises(ValueError, match="block_size must be at least 1"):
+        blocked_pairwise_distance(X, metric="euclidean", block_size=0)
@@ -0,0 +1,112 @@
+"""Tests for the subsequence search functions."""
+import numpy as np
+import pytest
+
+from aeon.distances import distance_profile, dtw_distance, subsequence_search
+from aeon.utils.numba.general import z_normalise_series_2d
+
+
+def _brute_force_profile(q, x, normalise, metric="euclidean", window=None):
+    length = q.shape[1]
+    if normalise:
+        q = z_normalise_series_2d(q)
+    profile = np.zeros(x.shape[1] - length + 1)
+    for i in range(len(profile)):
+        subsequence = x[:, i : i + length]
+        if normalise:
+            subsequence = z_normalise_series_2d(subsequence)
+        if metric == "euclidean":
+            profile[i] = np.sqrt(np.sum((q - subsequence) ** 2))
+        else:
+            profile[i] = dtw_distance(subsequence, q, window=window)
+    return profile
+
+
+def _greedy_matches(profile, k, exclusion):
+    distances, starts = [], []
+    for i in np.argsort(profile, kind="stable"):
+        if len(starts) == k:
+            break
+        if all(abs(i - j) >= exclusion for j in starts):
+            distances.append(profile[i])
+            starts.append(i)
+    return np.array(distances), np.array(starts)
+
+
+@pytest.mark.parametrize("n_channels", [1, 2])
+@pytest.mark.parametrize("normalise", [True, False])
+def test_distance_profile(n_channels, normalise):
+    """Test the MASS distance profile against a brute force computation."""
+    rng = np.random.RandomState(0)
+    q = rng.randn(n_channels, 15).cumsum(axis=1)
+    x = rng.randn(n_channels, 100).cumsum(axis=1)
+    # Constant subsequences normalise to zeros
+    x[:, 40:60] = 2.0
+    np.testing.assert_array_almost_equal(
+        distance_profile(q, x, normalise=normalise),
+        _brute_force_profile(q, x, normalise),
+    )
+
+
+@pytest.mark.parametrize(
+    "metric, window", [("euclidean", None), ("dtw", None), ("dtw", 0.2)]
+)
+@pytest.mark.parametrize("normalise", [True, False])
+def test_subsequence_search(metric, window, normalise):
+    """Test the top k matches of a series and a collection are exact."""
+    rng = np.random.RandomState(1)
+    q = rng.randn(1, 12).cumsum(axis=1)
+    x = rng.randn(1, 150).cumsum(axis=1)
+    profile = _brute_force_profile(q, x, normalise, metric, window)
+    expected = _greedy_matches(profile, 4, 6)
+    distances, starts = subsequence_search(
+        q[0], x[0], k=4, metric=metric, normalise=normalise, window=window
+    )
+    np.testing.assert_array_almost_equal(distances, expected[0])
+    np.testing.assert_array_equal(starts, expected[1])
+
+    X = [rng.randn(1, 60).cumsum(axis=1) for _ in range(3)] + [x]
+    distances, indices = subsequence_search(
+        q, X, k=4, metric=metric, normalise=normalise, window=window
+    )
+    matches = []
+    for i, series in enumerate(X):
+        profile = _brute_force_profile(q, series, normalise, metric, window)
+        for dist, start in zip(*_greedy_matches(profile, 4, 6)):
+            matches.append((dist, i, start))
+    matches.sort(key=lambda match: match[0])
+    np.testing.assert_array_almost_equal(distances, [match[0] for match in matches[:4]])
+    np.testing.assert_array_equal(indices, [match[1:] for match in matches[:4]])
+
+
+@pytest.mark.parametrize("exclusion_factor", [0.5, 1.0, 1.5])
+def test_dtw_subsequence_search_exclusion(exclusion_factor):
+    """Test the DTW top k matches are exact with large exclusion zones."""
+    rng = np.random.RandomState(0)
+    exclusion = int(np.ceil(exclusion_factor * 8))
+    for _ in range(150):
+        q = rng.randn(1, 8).cumsum(axis=1)
+        x = rng.randn(1, 40).cumsum(axis=1)
+        profile = _brute_force_profile(q, x, True, "dtw", 0.3)
+        expected = _greedy_matches(profile, 3, exclusion)
+        distances, starts = subsequence_search(
+            q,
+            x,
+            k=3,
+            metric="dtw",
+            exclusion_factor=exclusion_factor,
+            window=0.3,
+        )
+        np.testing.assert_array_almost_equal(distances, expected[0])
+        np.testing.assert_array_equal(starts, expected[1])
+
+
+def test_subsequence_search_errors():
+    """Test the errors raised by the subsequence search."""
+    q = np.zeros(10)
+    with pytest.raises(ValueError, match="longer than a series"):
+        subsequence_search(q, np.zeros(5))
+    with pytest.raises(ValueError, match="number of channels"):
+        distance_profile(q, np.zeros((2, 20)))
+    with pytest.raises(ValueError, match="metric must be"):
+        subsequence_search(q, np.zeros(20), metric="msm")
@@ -10,7 +10,7 @@ __all__ = ["KNeighborsTimeSeriesRegressor"]
 
 import numpy as np
 
-from aeon.distances import get_distance_function
+from aeon.distances import get_distance_function, nearest_neighbors
 from aeon.regression.base import BaseRegressor
 
 WEIGHTS_SUPPORTED = ["uniform", "distance"]
@@ -46,6 +46,10 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
             output must be mxn array if X is array of m Series, X2 of n Series.
     distance_params : dict, default = None
         Dictionary for metric parameters , in case that distance is a str.
+    n_jobs : int, default = 1
+        The number of parallel jobs to run for neighbors search. The neighbours of
+        the test cases are searched in parallel. ``-1`` means using all processors.
+        See :term:`Glossary <n_jobs>` for more details.
 
     Examples
     --------
@@ -63,6 +67,7 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
         "capability:multivariate": True,
         "capability:unequal_length": True,
         "X_inner_mtype": ["np-list", "numpy3D"],
+        "capability:multithreading": True,
         "algorithm_type": "distance",
     }
 
@@ -72,10 +77,12 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
         distance_params=None,
         n_neighbors=1,
         weights="uniform",
+        n_jobs=1,
     ):
         self.distance = distance
         self.distance_params = distance_params
         self.n_neighbors = n_neighbors
+        self.n_jobs = n_jobs
 
         if weights not in WEIGHTS_SUPPORTED:
             raise ValueError(
@@ -105,6 +112,8 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
         """
         if isinstance(self.distance, str):
             self.metric_ = get_distance_function(metric=self.distance)
+        else:
+            self.metric_ = self.distance
 
         self.X_ = X
         self.y_ = y
@@ -128,17 +137,16 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
         """
         self.check_is_fitted()
 
+        distances, idx = self._kneighbors(X, self.n_neighbors)
+        weights = self._weights(distances)
         preds = np.empty(len(X))
         for i in range(len(X)):
-            idx, weights = self._kneighbors(X[i])
-            preds[i] = np.average(self.y_[idx], weights=weights)
+            preds[i] = np.average(self.y_[idx[i]], weights=weights[i])
 
         return preds
 
-    def _kneighbors(self, X):
-        """Find the K-neighbors of a point.
-
-        Returns indices and weights of each point.
+    def _kneighbors(self, X, n_neighbors):
+        """Find the K-neighbors of each series in a collection.
 
         Parameters
         ----------
@@ -147,18 +155,41 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
                 If the series are all equal length, a numpy3D will be passed. If
                 unequal, a list of 2D numpy arrays is passed, which may have
                 different lengths.
+        n_neighbors : int
+            Number of neighbours to find for each series.
 
         Returns
         -------
-        ind : array
-            Indices of the nearest points in the population matrix.
-        ws : array
-            Array representing the weights of each neighbor.
+        distances : np.ndarray of shape (n_cases, n_neighbors)
+            Distances to the nearest training series, in no particular order.
+        ind : np.ndarray of shape (n_cases, n_neighbors)
+            Indices of the nearest training series.
         """
+        if (
+            isinstance(self.distance, str)
+            and isinstance(X, np.ndarray)
+            and isinstance(self.X_, np.ndarray)
+            and X.shape[1:] == self.X_.shape[1:]
+        ):
+            # Searched with lower bounds and early abandoning for the metrics that
+            # support it, and with the numba pairwise functions otherwise, in
+            # parallel over the test cases.
+            return nearest_neighbors(
+                X,
+                self.X_,
+                n_neighbors,
+                metric=self.distance,
+                n_jobs=self._n_jobs,
+                **self._distance_params,
+            )
+
         distances = np.array(
             [
-                self.metric_(X, self.X_[j], **self._distance_params)
-                for j in range(len(self.X_))
+                [
+                    self.metric_(x, self.X_[j], **self._distance_params)
+                    for j in range(len(self.X_))
+                ]
+                for x in X
             ]
         )
 
@@ -167,18 +198,20 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
         # They might not be ordered within themselves,
         # but it is not necessary and partitioning is
         # O(n) while sorting is O(nlogn)
-        closest_idx = np.argpartition(distances, self.n_neighbors)
-        closest_idx = closest_idx[: self.n_neighbors]
+        closest_idx = np.argpartition(
+            distances, min(n_neighbors, len(self.X_) - 1), axis=1
+        )
+        closest_idx = closest_idx[:, :n_neighbors]
+        return np.take_along_axis(distances, closest_idx, axis=1), closest_idx
 
+    def _weights(self, distances):
+        """Return the weights of the neighbours at the given distances."""
         if self.weights == "distance":
-            ws = distances[closest_idx]
-            ws = ws**2
+            ws = distances**2
 
             # Using epsilon ~= 0 to avoid division by zero
-            ws = 1 / (ws + np.finfo(float).eps)
+            return 1 / (ws + np.finfo(float).eps)
         elif self.weights == "uniform":
-            ws = np.repeat(1.0, self.n_neighbors)
+            return np.ones(distances.shape)
         else:
             raise Exception(f"Invalid kNN weights: {self.weights}")
-
-        return closest_idx, ws
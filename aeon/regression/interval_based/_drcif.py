@@ -102,6 +102,10 @@ class DrCIFRegressor(BaseIntervalForest, BaseRegressor):
         package to be installed.
     save_transformed_data : bool, default=False
         Save the data transformed in fit for use in _get_train_preds.
+    memory : str, joblib.Memory or None, default=None
+        Used to cache the first order differences and periodograms of the series in
+        fit and predict. If a string is given, it is the path to the caching
+        directory. If None, no caching is performed.
     random_state : int, RandomState instance or None, default=None
         If `int`, random_state is the seed used by the random number generator;
         If `RandomState` instance, random_state is the random number generator;
@@ -182,6 +186,7 @@ class DrCIFRegressor(BaseIntervalForest, BaseRegressor):
         use_pycatch22=False,
         use_pyfftw=False,
         save_transformed_data=False,
+        memory=None,
         random_state=None,
         n_jobs=1,
         parallel_backend=None,
@@ -228,6 +233,7 @@ class DrCIFRegressor(BaseIntervalForest, BaseRegressor):
             time_limit_in_minutes=time_limit_in_minutes,
             contract_max_n_estimators=contract_max_n_estimators,
             save_transformed_data=save_transformed_data,
+            memory=memory,
             random_state=random_state,
             n_jobs=n_jobs,
             parallel_backend=parallel_backend,
@@ -174,12 +174,10 @@ class RandomIntervals(BaseCollectionTransformer):
             else:
                 removed_idx.append(i)
 
-        Xt = transformed_intervals[0]
-        for i in range(1, self.n_intervals):
-            if i not in removed_idx:
-                Xt = np.hstack((Xt, transformed_intervals[i]))
-
-        return Xt
+        removed_idx = set(removed_idx)
+        return np.hstack(
+            [t for i, t in enumerate(transformed_intervals) if i not in removed_idx]
+        )
 
     def _fit(self, X, y=None):
         X, rng = self._fit_setup(X)
@@ -241,11 +239,7 @@ class RandomIntervals(BaseCollectionTransformer):
             for i in range(len(self.intervals_))
         )
 
-        Xt = transform[0]
-        for i in range(1, len(self.intervals_)):
-            Xt = np.hstack((Xt, transform[i]))
-
-        return Xt
+        return np.hstack(transform)
 
     def _fit_setup(self, X):
         self.intervals_ = []
@@ -380,10 +374,9 @@ class RandomIntervals(BaseCollectionTransformer):
                         y,
                     )
             elif transform:
-                t = [
-                    [f]
-                    for f in feature(X[:, dim, interval_start:interval_end:dilation])
-                ]
+                t = np.reshape(
+                    feature(X[:, dim, interval_start:interval_end:dilation]), (-1, 1)
+                )
                 Xt = np.hstack((Xt, t))
 
             intervals.append((interval_start, interval_end, dim, feature, dilation))
@@ -400,7 +393,7 @@ class RandomIntervals(BaseCollectionTransformer):
                         setattr(feature, n, keep_transform)
                         break
             elif not keep_transform:
-                return [[0] for _ in range(X.shape[0])]
+                return np.zeros((X.shape[0], 1))
 
         if isinstance(feature, BaseTransformer):
             Xt = feature.transform(
@@ -410,7 +403,9 @@ class RandomIntervals(BaseCollectionTransformer):
             if Xt.ndim == 3:
                 Xt = Xt.reshape((Xt.shape[0], Xt.shape[2]))
         else:
-            Xt = [[f] for f in feature(X[:, dim, interval_start:interval_end:dilation])]
+            Xt = np.reshape(
+                feature(X[:, dim, interval_start:interval_end:dilation]), (-1, 1)
+            )
 
         return Xt
 
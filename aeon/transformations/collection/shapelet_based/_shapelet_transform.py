@@ -12,11 +12,12 @@ import time
 
 import numpy as np
 from joblib import Parallel, delayed
-from numba import njit
+from numba import njit, prange
 from numba.typed.typedlist import List
 from sklearn import preprocessing
 from sklearn.utils._random import check_random_state
 
+from aeon.distances._utils import _run_with_n_jobs
 from aeon.transformations.collection.base import BaseCollectionTransformer
 from aeon.utils.numba.general import z_normalise_series
 from aeon.utils.validation import check_n_jobs
@@ -353,25 +354,27 @@ class RandomShapeletTransform(BaseCollectionTransformer):
         output : 2D np.array of shape = (n_instances, n_shapelets)
             The transformed data.
         """
-        output = np.zeros((len(X), len(self.shapelets)))
-
-        for i, series in enumerate(X):
-            dists = Parallel(
-                n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
-            )(
-                delayed(_online_shapelet_distance)(
-                    series[shapelet[3]],
-                    shapelet[6],
-                    self._sorted_indicies[n],
-                    shapelet[2],
-                    shapelet[1],
-                )
-                for n, shapelet in enumerate(self.shapelets)
-            )
-
-            output[i] = dists
-
-        return output
+        if len(self.shapelets) == 0:
+            return np.zeros((len(X), 0))
+
+        # Pack the shapelets into arrays padded to the longest shapelet
+        lengths = np.array([s[1] for s in self.shapelets])
+        shapelets = np.zeros((len(self.shapelets), lengths.max()))
+        sorted_indicies = np.zeros((len(self.shapelets), lengths.max()), dtype=int)
+        for n, shapelet in enumerate(self.shapelets):
+            shapelets[n, : shapelet[1]] = shapelet[6]
+            sorted_indicies[n, : shapelet[1]] = self._sorted_indicies[n]
+
+        return _run_with_n_jobs(
+            self.n_jobs,
+            _transform_shapelets,
+            X,
+            shapelets,
+            lengths,
+            np.array([s[2] for s in self.shapelets]),
+            np.array([s[3] for s in self.shapelets]),
+            sorted_indicies,
+        )
 
     @classmethod
     def get_test_params(cls, parameter_set="default"):
@@ -551,6 +554,29 @@ class RandomShapeletTransform(BaseCollectionTransformer):
         return to_keep
 
 
+@njit(fastmath=True, cache=True, parallel=True)
+def _transform_shapelets(X, shapelets, lengths, positions, dims, sorted_indicies):
+    """Distances of each series of X to each shapelet, for all pairs in parallel.
+
+    Shapelet n is shapelets[n, :lengths[n]], with its indices sorted by decreasing
+    absolute value in sorted_indicies[n, :lengths[n]].
+    """
+    n_instances = X.shape[0]
+    n_shapelets = len(lengths)
+    output = np.zeros((n_instances, n_shapelets))
+    for k in prange(n_instances * n_shapelets):
+        i = k // n_shapelets
+        n = k % n_shapelets
+        output[i, n] = _online_shapelet_distance(
+            X[i, dims[n]],
+            shapelets[n, : lengths[n]],
+            sorted_indicies[n, : lengths[n]],
+            positions[n],
+            lengths[n],
+        )
+    return output
+
+
 @njit(fastmath=True, cache=True)
 def _online_shapelet_distance(series, shapelet, sorted_indicies, position, length):
     subseq = series[position : position + length]
@@ -568,44 +594,57 @@ def _online_shapelet_distance(series, shapelet, sorted_indicies, position, lengt
     else:
         subseq = np.zeros(length)
 
-    best_dist = 0
+    best_dist = 0.0
     for i, n in zip(shapelet, subseq):
         temp = i - n
         best_dist += temp * temp
 
+    # Search outwards from position, to the left and right alternately, updating
+    # the sums of each window from those of the previous one
     i = 1
-    traverse = [True, True]
-    sums = [sum, sum]
-    sums2 = [sum2, sum2]
-
-    while traverse[0] or traverse[1]:
-        for n in range(2):
-            mod = -1 if n == 0 else 1
-            pos = position + mod * i
-            traverse[n] = pos >= 0 if n == 0 else pos <= len(series) - length
-
-            if not traverse[n]:
-                continue
-
-            start = series[pos - n]
-            end = series[pos - n + length]
-
-            sums[n] += mod * end - mod * start
-            sums2[n] += mod * end * end - mod * start * start
-
-            mean = sums[n] / length
-            std = math.sqrt((sums2[n] - mean * mean * length) / length)
-
-            dist = 0
-            use_std = std != 0
-            for j in range(length):
-                val = (series[pos + sorted_indicies[j]] - mean) / std if use_std else 0
-                temp = shapelet[sorted_indicies[j]] - val
-                dist += temp * temp
-
-                if dist > best_dist:
-                    break
+    traverse_left = True
+    traverse_right = True
+    left_sum = right_sum = sum
+    left_sum2 = right_sum2 = sum2
+
+    while traverse_left or traverse_right:
+        pos = position - i
+        traverse_left = pos >= 0
+        if traverse_left:
+            start = series[pos]
+            end = series[pos + length]
+            left_sum += start - end
+            left_sum2 += start * start - end * end
+            dist = _window_distance(
+                series,
+                shapelet,
+                sorted_indicies,
+                pos,
+                length,
+                left_sum,
+                left_sum2,
+                best_dist,
+            )
+            if dist < best_dist:
+                best_dist = dist
 
+        pos = position + i
+        traverse_right = pos <= len(series) - length
+        if traverse_right:
+            start = series[pos - 1]
+            end = series[pos - 1 + length]
+            right_sum += end - start
+            right_sum2 += end * end - start * start
+            dist = _window_distance(
+                series,
+                shapelet,
+                sorted_indicies,
+                pos,
+                length,
+                right_sum,
+                right_sum2,
+                best_dist,
+            )
             if dist < best_dist:
                 best_dist = dist
 
@@ -614,6 +653,27 @@ def _online_shapelet_distance(series, shapelet, sorted_indicies, position, lengt
     return best_dist if best_dist == 0 else 1 / length * best_dist
 
 
+@njit(fastmath=True, cache=True)
+def _window_distance(
+    series, shapelet, sorted_indicies, pos, length, sum, sum2, best_dist
+):
+    # Visit the shapelet values in sorted_indicies order, largest absolute value
+    # first, so that the distance exceeds best_dist as early as possible
+    mean = sum / length
+    std = math.sqrt((sum2 - mean * mean * length) / length)
+
+    dist = 0.0
+    use_std = std != 0
+    for j in range(length):
+        val = (series[pos + sorted_indicies[j]] - mean) / std if use_std else 0
+        temp = shapelet[sorted_indicies[j]] - val
+        dist += temp * temp
+
+        if dist > best_dist:
+            break
+    return dist
+
+
 @njit(fastmath=True, cache=True)
 def _calc_early_binary_ig(
     orderline,
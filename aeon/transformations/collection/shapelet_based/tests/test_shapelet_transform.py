@@ -0,0 +1,39 @@
+"""Tests for the random shapelet transform."""
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from aeon.datasets import load_basic_motions
+from aeon.transformations.collection.shapelet_based import RandomShapeletTransform
+from aeon.transformations.collection.shapelet_based._shapelet_transform import (
+    _online_shapelet_distance,
+)
+
+
+def test_shapelet_transform_matches_shapelet_distances():
+    """Test the batched transform matches the distance to each shapelet."""
+    X, y = load_basic_motions(split="train")
+    st = RandomShapeletTransform(
+        n_shapelet_samples=100, max_shapelets=10, random_state=0, n_jobs=2
+    ).fit(X, y)
+    X_test, _ = load_basic_motions(split="test")
+    X_t = st.transform(X_test)
+
+    expected = np.array(
+        [
+            [
+                _online_shapelet_distance(
+                    series[shapelet[3]],
+                    shapelet[6],
+                    st._sorted_indicies[n],
+                    shapelet[2],
+                    shapelet[1],
+                )
+                for n, shapelet in enumerate(st.shapelets)
+            ]
+            for series in X_test
+        ]
+    )
+    assert len(st.shapelets) > 1
+    assert len({s[1] for s in st.shapelets}) > 1
+    assert_array_equal(X_t, expected)